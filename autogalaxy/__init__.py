@@ -1,3 +1,5 @@
+import importlib
+
 from autoconf.dictable import from_dict, from_json, output_to_json, to_dict
 from autoarray.dataset import preprocess  # noqa
 from autoarray.dataset.imaging.dataset import Imaging  # noqa
@@ -46,41 +48,17 @@ from autoarray.structures.arrays.kernel_2d import Kernel2D  # noqa
 from autoarray.structures.visibilities import Visibilities  # noqa
 from autoarray.structures.visibilities import VisibilitiesNoiseMap  # noqa
 
-from .analysis.adapt_images.adapt_images import AdaptImages
-from .analysis.adapt_images.adapt_image_maker import AdaptImageMaker
-from .analysis.maker import FitMaker
-from .analysis.preloads import Preloads
-from . import aggregator as agg
 from . import exc
-from . import plot
 from . import util
-from .ellipse.dataset_interp import DatasetInterp
-from .ellipse.ellipse.ellipse import Ellipse
-from .ellipse.ellipse.ellipse_multipole import EllipseMultipole
-from .ellipse.fit_ellipse import FitEllipse
-from .ellipse.model.analysis import AnalysisEllipse
 from .operate.image import OperateImage
 from .operate.image import OperateImageList
 from .operate.image import OperateImageGalaxies
 from .operate.deflections import OperateDeflections
-from .gui.scribbler import Scribbler
-from .imaging.fit_imaging import FitImaging
-from .imaging.model.analysis import AnalysisImaging
-from .imaging.simulator import SimulatorImaging
-from .interferometer.simulator import SimulatorInterferometer
-from .interferometer.fit_interferometer import FitInterferometer
-from .interferometer.model.analysis import AnalysisInterferometer
-
-from .quantity.fit_quantity import FitQuantity
-from .quantity.model.analysis import AnalysisQuantity
-from .quantity.dataset_quantity import DatasetQuantity
 from .galaxy.galaxy import Galaxy
 from .galaxy.galaxies import Galaxies
 from .galaxy.redshift import Redshift
-from .galaxy.stellar_dark_decomp import StellarDarkDecomp
-from .galaxy.to_inversion import AbstractToInversion
-from .galaxy.to_inversion import GalaxiesToInversion
 from .profiles.geometry_profiles import EllProfile
+from .profiles.precision import profile_precision
 from .profiles import (
     point_sources as ps,
     mass as mp,
@@ -97,14 +75,92 @@ from .profiles.light import operated as lp_operated
 from .profiles.light import (
     linear_operated as lp_linear_operated,
 )
-from .profiles.light import snr as lp_snr
 from . import convert
-from . import mock as m  # noqa
 from .util.shear_field import ShearYX2D
 from .util.shear_field import ShearYX2DIrregular
 from . import cosmology as cosmo
-from .gui.clicker import Clicker
-from .gui.scribbler import Scribbler
+
+"""
+Attributes which are imported the first time they are accessed (e.g. `ag.plot` or `ag.FitImaging`), via the module
+`__getattr__` below (PEP 562), instead of when `autogalaxy` is imported.
+
+These are the parts of the API which import heavy dependencies (e.g. plotting, the aggregator, model-fitting) and
+are not needed to create and evaluate galaxies, such that short jobs which only compute galaxy quantities (e.g.
+cluster workers) do not pay their import time. Each entry maps the attribute name to the module it is imported from
+and the name of the attribute in that module, where `None` means the attribute is the module itself.
+"""
+_lazy_attribute_dict = {
+    "AdaptImages": ("autogalaxy.analysis.adapt_images.adapt_images", "AdaptImages"),
+    "AdaptImageMaker": (
+        "autogalaxy.analysis.adapt_images.adapt_image_maker",
+        "AdaptImageMaker",
+    ),
+    "FitMaker": ("autogalaxy.analysis.maker", "FitMaker"),
+    "InstanceFactory": ("autogalaxy.analysis.instance_factory", "InstanceFactory"),
+    "Preloads": ("autogalaxy.analysis.preloads", "Preloads"),
+    "agg": ("autogalaxy.aggregator", None),
+    "plot": ("autogalaxy.plot", None),
+    "DatasetInterp": ("autogalaxy.ellipse.dataset_interp", "DatasetInterp"),
+    "Ellipse": ("autogalaxy.ellipse.ellipse.ellipse", "Ellipse"),
+    "EllipseMultipole": (
+        "autogalaxy.ellipse.ellipse.ellipse_multipole",
+        "EllipseMultipole",
+    ),
+    "FitEllipse": ("autogalaxy.ellipse.fit_ellipse", "FitEllipse"),
+    "AnalysisEllipse": ("autogalaxy.ellipse.model.analysis", "AnalysisEllipse"),
+    "FitImaging": ("autogalaxy.imaging.fit_imaging", "FitImaging"),
+    "AnalysisImaging": ("autogalaxy.imaging.model.analysis", "AnalysisImaging"),
+    "SimulatorImaging": ("autogalaxy.imaging.simulator", "SimulatorImaging"),
+    "SimulatorInterferometer": (
+        "autogalaxy.interferometer.simulator",
+        "SimulatorInterferometer",
+    ),
+    "FitInterferometer": (
+        "autogalaxy.interferometer.fit_interferometer",
+        "FitInterferometer",
+    ),
+    "AnalysisInterferometer": (
+        "autogalaxy.interferometer.model.analysis",
+        "AnalysisInterferometer",
+    ),
+    "FitQuantity": ("autogalaxy.quantity.fit_quantity", "FitQuantity"),
+    "AnalysisQuantity": ("autogalaxy.quantity.model.analysis", "AnalysisQuantity"),
+    "DatasetQuantity": ("autogalaxy.quantity.dataset_quantity", "DatasetQuantity"),
+    "StellarDarkDecomp": (
+        "autogalaxy.galaxy.stellar_dark_decomp",
+        "StellarDarkDecomp",
+    ),
+    "AbstractToInversion": ("autogalaxy.galaxy.to_inversion", "AbstractToInversion"),
+    "GalaxiesToInversion": ("autogalaxy.galaxy.to_inversion", "GalaxiesToInversion"),
+    "lp_snr": ("autogalaxy.profiles.light.snr", None),
+    "m": ("autogalaxy.mock", None),
+    "Clicker": ("autogalaxy.gui.clicker", "Clicker"),
+    "Scribbler": ("autogalaxy.gui.scribbler", "Scribbler"),
+}
+
+
+def __getattr__(name: str):
+    """
+    Imports a lazy attribute of `autogalaxy` (see `_lazy_attribute_dict`) the first time it is accessed, after which
+    it is stored in the module's namespace and this function is not called for it again.
+    """
+    try:
+        module_name, attribute_name = _lazy_attribute_dict[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(module_name)
+
+    value = module if attribute_name is None else getattr(module, attribute_name)
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attribute_dict))
+
 
 from autoconf import conf
 
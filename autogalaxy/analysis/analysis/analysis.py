@@ -13,6 +13,7 @@ from autogalaxy.galaxy.galaxy import Galaxy
 from autogalaxy.galaxy.galaxies import Galaxies
 from autogalaxy.cosmology.lensing import LensingCosmology
 from autogalaxy.cosmology.wrap import Planck15
+from autogalaxy.util.profiler import LikelihoodProfiler
 
 logger = logging.getLogger(__name__)
 
@@ -127,6 +128,30 @@ class Analysis(af.Analysis):
             analysis=self,
         )
 
+    def figure_of_merit_from(
+        self, instance: af.ModelInstance, run_time_dict: Optional[Dict] = None
+    ) -> float:
+        """
+        Returns the figure of merit (e.g. the log likelihood) of a fit of a model instance to the dataset, which is
+        the value returned by the `log_likelihood_function`.
+
+        By default this is the `figure_of_merit` of the fit created by `fit_from`. Children `Analysis` classes
+        override it to compute the figure of merit without creating a fit (e.g. `AnalysisImaging` via its log
+        likelihood buffers), in which case the profiling functions below time this calculation, as it is the one
+        performed during a model-fit.
+
+        Parameters
+        ----------
+        instance
+            An instance of the model that is being fitted to the data by this analysis (whose parameters have been set
+            via a non-linear search).
+        run_time_dict
+            A dictionary which times functions called to fit the model to data, for profiling.
+        """
+        return self.fit_from(
+            instance=instance, run_time_dict=run_time_dict
+        ).figure_of_merit
+
     def profile_log_likelihood_function(
         self, instance: af.ModelInstance, paths: Optional[af.DirectoryPaths] = None
     ) -> Tuple[Dict, Dict]:
@@ -139,6 +164,11 @@ class Analysis(af.Analysis):
         An `info_dict` is also created which stores information on aspects of the model and dataset that dictate
         run times, so the profiled times can be interpreted with this context.
 
+        The log likelihood function is also profiled hierarchically via a `LikelihoodProfiler` (see
+        `likelihood_profiler_from`), whose call tree attributes run time and memory to every galaxy, light and
+        mass profile, convolution and inversion step. It is output alongside the `run_time_dict` as the files
+        `profile_tree.json` and `profile.folded`, the latter of which can be opened by flamegraph tools.
+
         The results of this profiling are then output to hard-disk in the `preloads` folder of the model-fit results,
         which they can be inspected to ensure run-times are as expected.
 
@@ -168,15 +198,13 @@ class Analysis(af.Analysis):
 
         # Ensure numba functions are compiled before profiling begins.
 
-        fit = self.fit_from(instance=instance)
-        fit.figure_of_merit
+        self.figure_of_merit_from(instance=instance)
 
         start = time.time()
 
         for _ in range(repeats):
             try:
-                fit = self.fit_from(instance=instance)
-                fit.figure_of_merit
+                self.figure_of_merit_from(instance=instance)
             except Exception:
                 logger.info(
                     "Profiling failed. Returning without outputting information."
@@ -223,9 +251,35 @@ class Analysis(af.Analysis):
         self.output_profiling_info(
             paths=paths, run_time_dict=run_time_dict, info_dict=info_dict
         )
+        self.output_likelihood_profiler(instance=instance, paths=paths)
 
         return run_time_dict, info_dict
 
+    def likelihood_profiler_from(
+        self, instance: af.ModelInstance, trace_memory: bool = True
+    ) -> LikelihoodProfiler:
+        """
+        Profiles the log likelihood function hierarchically, returning a `LikelihoodProfiler` whose call tree
+        attributes the time spent (and memory allocated) by the fit to its stages, for example every galaxy, every
+        light and mass profile of a galaxy, the transform of the grid to a profile's reference frame, PSF
+        convolution, Fourier transforms and the steps of an inversion.
+
+        The calculation profiled is `figure_of_merit_from`, which is the one performed by the log likelihood function.
+
+        Parameters
+        ----------
+        instance
+            An instance of the model that is being fitted to the data by this analysis (whose parameters have been set
+            via a non-linear search).
+        trace_memory
+            If `True`, the peak memory allocated by every stage is measured via `tracemalloc`.
+        """
+        with LikelihoodProfiler(trace_memory=trace_memory) as profiler:
+            with profiler.block(name="figure_of_merit_from"):
+                self.figure_of_merit_from(instance=instance)
+
+        return profiler
+
     def output_profiling_info(
         self, paths: Optional[af.DirectoryPaths], run_time_dict: Dict, info_dict: Dict
     ):
@@ -258,3 +312,30 @@ class Analysis(af.Analysis):
 
         with open(path.join(paths.profile_path, "info_dict.json"), "w+") as f:
             json.dump(info_dict, f, indent=4)
+
+    def output_likelihood_profiler(
+        self, instance: af.ModelInstance, paths: Optional[af.DirectoryPaths]
+    ):
+        """
+        Profile the log likelihood function hierarchically (see `likelihood_profiler_from`) and output its call tree
+        to hard-disk as the files `profile_tree.json` and `profile.folded`.
+
+        In the same way as `output_profiling_info`, this is separate from the `profile_log_likelihood_function`
+        function such that children `Analysis` classes which call it with `paths=None` output the call tree once,
+        after adding their extra information.
+
+        Parameters
+        ----------
+        instance
+            An instance of the model that is being fitted to the data by this analysis (whose parameters have been set
+            via a non-linear search).
+        paths
+            The paths object which manages all paths, e.g. where the non-linear search outputs are stored,
+            visualization and the pickled objects used by the aggregator output by this function.
+        """
+        if paths is None:
+            return
+
+        self.likelihood_profiler_from(instance=instance).output_to(
+            file_path=paths.profile_path
+        )
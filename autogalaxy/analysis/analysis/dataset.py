@@ -16,6 +16,7 @@ from autogalaxy.cosmology.lensing import LensingCosmology
 from autogalaxy.cosmology.wrap import Planck15
 from autogalaxy.analysis.analysis.analysis import Analysis
 from autogalaxy.analysis.result import ResultDataset
+from autogalaxy.analysis import visualizer_worker as visualizer_worker_util
 
 logger = logging.getLogger(__name__)
 
@@ -143,6 +144,51 @@ class AnalysisDataset(Analysis):
         os.makedirs(paths.profile_path, exist_ok=True)
         self.preloads.output_info_to_summary(file_path=paths.profile_path)
 
+    def visualize(
+        self,
+        paths: af.DirectoryPaths,
+        instance: af.ModelInstance,
+        during_analysis: bool,
+    ):
+        """
+        Output images of the maximum log likelihood model inferred by the model-fit, via the `visualize` method of
+        the analysis's `Visualizer`.
+
+        If the `analysis -> visualize_in_background` entry of the `general.yaml` config is `True`, visualization
+        performed during the non-linear search is sent to a background process (see `VisualizerWorker`), such that
+        the search continues sampling while the fit is rebuilt and its figures are rendered. Stale requests are
+        dropped if the process falls behind the search.
+
+        Visualization at the end of the search (`during_analysis=False`) waits for the background process to output
+        its images, so that the final images always correspond to the final maximum likelihood model.
+
+        Parameters
+        ----------
+        paths
+            The paths object which manages all paths, e.g. where the non-linear search outputs are stored,
+            visualization, and the pickled objects used by the aggregator output by this function.
+        instance
+            An instance of the model that is being fitted to the data by this analysis (whose parameters have been set
+            via a non-linear search).
+        during_analysis
+            If True the visualization is being performed midway through the non-linear search before it is finished,
+            which may change which images are output.
+        """
+        if not visualizer_worker_util.visualize_in_background():
+            return self.Visualizer.visualize(
+                analysis=self,
+                paths=paths,
+                instance=instance,
+                during_analysis=during_analysis,
+            )
+
+        visualizer_worker_util.visualizer_worker_from(analysis=self).submit(
+            paths=paths, instance=instance, during_analysis=during_analysis
+        )
+
+        if not during_analysis:
+            visualizer_worker_util.close_visualizer_worker(analysis=self)
+
     def save_attributes(self, paths: af.DirectoryPaths):
         """
         Before the model-fit via the non-linear search begins, this routine saves attributes of the `Analysis` object
@@ -0,0 +1,205 @@
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+import autofit as af
+
+logger = logging.getLogger(__name__)
+
+
+def is_equal(value_0, value_1) -> bool:
+    """
+    Returns whether two objects of a model instance (e.g. galaxies, profiles or their attributes) are equal, by
+    comparing every attribute of their `__dict__` recursively (excluding their PyAutoFit `id`).
+
+    Unlike comparing the constructor arguments of objects, this compares quantities an object computes from its
+    parameters in its `__init__` (e.g. the `kappa_s` of an NFW profile computed from its mass).
+    """
+    if type(value_0) is not type(value_1):
+        return False
+
+    if isinstance(value_0, np.ndarray):
+        return np.array_equal(value_0, value_1)
+
+    if isinstance(value_0, (list, tuple)):
+        return len(value_0) == len(value_1) and all(
+            is_equal(v_0, v_1) for v_0, v_1 in zip(value_0, value_1)
+        )
+
+    if isinstance(value_0, dict):
+        return value_0.keys() == value_1.keys() and all(
+            is_equal(value_0[key], value_1[key]) for key in value_0
+        )
+
+    if hasattr(value_0, "__dict__"):
+        return is_equal(
+            {key: value for key, value in vars(value_0).items() if key != "id"},
+            {key: value for key, value in vars(value_1).items() if key != "id"},
+        )
+
+    return value_0 == value_1
+
+
+class InstanceFactory:
+    def __init__(self, model: af.AbstractPriorModel):
+        """
+        Creates instances of a model (e.g. the galaxies fitted by an `Analysis`) from vectors of parameter values,
+        by updating the parameters of a single instance in place instead of creating a new instance for every vector.
+
+        PyAutoFit creates an instance from a vector by traversing the model, creating every galaxy and profile via
+        its `__init__` and wrapping them in `ModelInstance` objects. For models which are cheap to evaluate (e.g. a
+        few light profiles fitted to a small dataset) this takes as long as the log likelihood function itself.
+
+        The structure of a model is fixed during a model-fit, therefore this factory creates one instance when it is
+        created, and stores for every parameter the object and attribute (or element of a tuple attribute, e.g. the
+        `centre` of a profile) it sets. Creating an instance for a new vector then only sets these attributes.
+
+        This is only valid if every object of the model stores its parameters as attributes without computing
+        other quantities from them in its `__init__` (which is true of most light and mass profiles). The factory
+        checks this when it is created, by updating its instance to the parameters of a second vector and comparing
+        it to the instance PyAutoFit creates for that vector. If they differ, or the model has assertions, the
+        factory creates every instance via PyAutoFit instead.
+
+        The same instance is returned for every vector, meaning an instance is overwritten the next time an instance
+        is created, so it should not be stored (e.g. as the maximum likelihood instance of a fit) without being
+        copied. Quantities which profiles store after computing them from their parameters (see
+        `derived_property`) are reset when their parameters are set.
+
+        Parameters
+        ----------
+        model
+            The model whose instances are created, whose structure must not change after the factory is created.
+        """
+        self.model = model
+
+        self.prior_list = [prior for _, prior in model.prior_tuples_ordered_by_id]
+
+        self.instance = model.instance_from_vector(
+            vector=model.physical_values_from_prior_medians, ignore_prior_limits=True
+        )
+
+        self.attribute_setter_list, self.tuple_setter_list = self.setter_lists_from()
+
+        self.in_place = len(model.assertions) == 0 and self.is_in_place_valid
+
+        if not self.in_place:
+            logger.info(
+                "INSTANCE FACTORY - The model cannot be updated in place, instances are created via PyAutoFit."
+            )
+
+    def setter_lists_from(
+        self,
+    ) -> Tuple[List[Tuple[object, str, int]], List[Tuple[object, str, List, Dict]]]:
+        """
+        Returns the lists which describe how every parameter of a vector is set on the factory's instance:
+
+        - Attribute setters `(obj, name, vector_index)`, for parameters which are attributes of an object (e.g. the
+          `intensity` of a light profile).
+
+        - Tuple setters `(obj, name, values, index_dict)`, for parameters which are elements of a tuple attribute
+          (e.g. the `centre` of a light profile), where `values` are the values of the tuple's elements and
+          `index_dict` maps the index of every element which is a parameter to its index in the vector.
+
+        A parameter linked to multiple attributes (e.g. two profiles sharing a centre) has a setter for every
+        attribute.
+        """
+        vector_index_dict = {
+            prior: index for index, prior in enumerate(self.prior_list)
+        }
+
+        attribute_setter_list = []
+        tuple_setter_dict = {}
+
+        for prior_path, prior in self.model.path_priors_tuples:
+            obj = self.instance
+
+            for key in prior_path[:-2]:
+                obj = obj[key] if isinstance(key, int) else getattr(obj, key)
+
+            parent_key, key = prior_path[-2:]
+
+            parent = (
+                obj[parent_key]
+                if isinstance(parent_key, int)
+                else getattr(obj, parent_key)
+            )
+
+            if isinstance(parent, tuple):
+                try:
+                    tuple_setter = tuple_setter_dict[(id(obj), parent_key)]
+                except KeyError:
+                    tuple_setter = (obj, parent_key, list(parent), {})
+                    tuple_setter_dict[(id(obj), parent_key)] = tuple_setter
+
+                tuple_setter[3][int(key.split("_")[-1])] = vector_index_dict[prior]
+            else:
+                attribute_setter_list.append((parent, key, vector_index_dict[prior]))
+
+        return attribute_setter_list, list(tuple_setter_dict.values())
+
+    @property
+    def is_in_place_valid(self) -> bool:
+        """
+        Returns whether the factory's instance, updated in place to the parameters of a vector which differs from
+        the prior medians, is the same as the instance PyAutoFit creates from that vector.
+        """
+        vector = self.model.vector_from_unit_vector(
+            unit_vector=[0.3] * self.model.prior_count, ignore_prior_limits=True
+        )
+
+        try:
+            instance = self.model.instance_from_vector(
+                vector=vector, ignore_prior_limits=True
+            )
+            is_valid = is_equal(self._instance_in_place_from(vector=vector), instance)
+        except Exception:
+            is_valid = False
+
+        self._instance_in_place_from(
+            vector=self.model.physical_values_from_prior_medians
+        )
+
+        return is_valid
+
+    def _instance_in_place_from(self, vector: List[float]) -> af.ModelInstance:
+        for obj, name, vector_index in self.attribute_setter_list:
+            setattr(obj, name, vector[vector_index])
+
+        for obj, name, values, index_dict in self.tuple_setter_list:
+            for tuple_index, vector_index in index_dict.items():
+                values[tuple_index] = vector[vector_index]
+
+            setattr(obj, name, tuple(values))
+
+        return self.instance
+
+    def instance_from_vector(
+        self, vector: List[float], ignore_prior_limits: bool = False
+    ) -> af.ModelInstance:
+        """
+        Returns the instance of the model for a vector of physical parameter values, which has the same behaviour as
+        the model's `instance_from_vector` method.
+
+        Parameters
+        ----------
+        vector
+            The physical values of the model's parameters, in the same order as PyAutoFit's `instance_from_vector`.
+        ignore_prior_limits
+            If `True`, values outside the limits of their priors do not raise an exception.
+        """
+        if not self.in_place:
+            return self.model.instance_from_vector(
+                vector=vector, ignore_prior_limits=ignore_prior_limits
+            )
+
+        if len(vector) != len(self.prior_list):
+            raise AssertionError(
+                f"Vector length {len(vector)} != prior count {len(self.prior_list)}"
+            )
+
+        if not ignore_prior_limits:
+            for prior, value in zip(self.prior_list, vector):
+                prior.assert_within_limits(value)
+
+        return self._instance_in_place_from(vector=vector)
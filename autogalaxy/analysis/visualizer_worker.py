@@ -0,0 +1,226 @@
+import logging
+import multiprocessing
+import queue
+import weakref
+from typing import Dict, Tuple
+
+from autoconf import conf
+import autofit as af
+
+logger = logging.getLogger(__name__)
+
+logger.setLevel(level="INFO")
+
+
+def visualize_in_background() -> bool:
+    """
+    Returns whether visualization performed during a non-linear search is performed by a background process, set
+    via the `analysis -> visualize_in_background` entry of the `general.yaml` config (default `False`).
+    """
+    try:
+        return conf.instance["general"]["analysis"]["visualize_in_background"]
+    except KeyError:
+        return False
+
+
+def visualize_queue_size() -> int:
+    """
+    Returns the maximum number of visualization requests waiting for the background visualization process, set
+    via the `analysis -> visualize_queue_size` entry of the `general.yaml` config (default 1).
+    """
+    try:
+        return conf.instance["general"]["analysis"]["visualize_queue_size"]
+    except KeyError:
+        return 1
+
+
+def _visualize_loop(analysis, request_queue: multiprocessing.Queue):
+    """
+    The function run by the background visualization process, which performs visualization for every request
+    received on the queue until a `None` request is received.
+
+    Exceptions raised by visualization are logged and do not stop the process, so that a single failed
+    visualization does not stop all later visualization of the model-fit.
+
+    Parameters
+    ----------
+    analysis
+        The analysis whose `Visualizer` performs visualization, which rebuilds the fit of every requested instance.
+    request_queue
+        The queue of (paths, instance, during_analysis) visualization requests.
+    """
+    while True:
+        request = request_queue.get()
+
+        if request is None:
+            return
+
+        paths, instance, during_analysis = request
+
+        try:
+            analysis.Visualizer.visualize(
+                analysis=analysis,
+                paths=paths,
+                instance=instance,
+                during_analysis=during_analysis,
+            )
+        except Exception as e:
+            logger.exception(f"VISUALIZATION - Background visualization failed: {e}")
+
+
+class VisualizerWorker:
+    def __init__(self, analysis, queue_size: int = 1):
+        """
+        Performs the visualization of an analysis in a background process, such that rendering and writing
+        figures does not stall the non-linear search.
+
+        Every visualization request (the paths, the maximum likelihood instance and whether the search is still
+        running) is sent to the process via a bounded queue. The process rebuilds the fit of the instance and
+        outputs its images via the analysis's `Visualizer`, in the same way inline visualization does.
+
+        If the queue is full when a new request is submitted, because the process is still rendering a previous
+        request, the oldest waiting request is dropped. Its instance is stale, because the new request is for a more
+        recent maximum likelihood instance, so the images output always correspond to the latest result.
+
+        The process is started when the first request is submitted, which is midway through the non-linear search.
+        By then the search may be running threads (e.g. the thread pool galaxies are evaluated in, see
+        `operate.pool`, a threaded sampler calling the log likelihood function or numba's threads). Forking a
+        process which runs threads can deadlock the child, if another thread held a lock when the process was forked.
+        The process is therefore created via the `spawn` start method on every platform, which starts a new Python
+        interpreter and pickles the analysis (and every request) to send it to the process.
+
+        Parameters
+        ----------
+        analysis
+            The analysis whose `Visualizer` performs visualization, which must be picklable.
+        queue_size
+            The maximum number of requests waiting for the process, beyond which the oldest request is dropped.
+        """
+        context = multiprocessing.get_context("spawn")
+
+        self.request_queue = context.Queue(maxsize=queue_size)
+
+        self.process = context.Process(
+            target=_visualize_loop,
+            args=(analysis, self.request_queue),
+            daemon=True,
+        )
+
+        self.total_dropped = 0
+
+    def submit(
+        self,
+        paths: af.DirectoryPaths,
+        instance: af.ModelInstance,
+        during_analysis: bool,
+    ):
+        """
+        Submits a visualization request to the background process, dropping the oldest waiting request if the
+        queue is full, and returns immediately.
+
+        Parameters
+        ----------
+        paths
+            The paths object which manages all paths, e.g. where the non-linear search outputs are stored,
+            visualization, and the pickled objects used by the aggregator output by this function.
+        instance
+            An instance of the model that is being fitted to the data by this analysis (whose parameters have been set
+            via a non-linear search).
+        during_analysis
+            If True the visualization is being performed midway through the non-linear search before it is finished,
+            which may change which images are output.
+        """
+        if self.process.pid is None:
+            self.process.start()
+
+        request = (paths, instance, during_analysis)
+
+        while True:
+            try:
+                self.request_queue.put_nowait(request)
+                return
+            except queue.Full:
+                pass
+
+            try:
+                self.request_queue.get(timeout=0.1)
+                self.total_dropped += 1
+            except queue.Empty:
+                pass
+
+    def close(self, timeout: float = None):
+        """
+        Waits for the background process to perform all waiting visualization requests and then stops it.
+
+        If the process has already stopped, this does nothing.
+
+        Parameters
+        ----------
+        timeout
+            The maximum time in seconds waited for the process to perform the waiting requests and stop, after which
+            it is terminated. If `None`, this waits until every waiting request is performed.
+        """
+        if not self.process.is_alive():
+            return
+
+        self.request_queue.put(None)
+        self.process.join(timeout=timeout)
+
+        if self.process.is_alive():
+            self.process.terminate()
+
+
+_visualizer_worker_dict: Dict[int, Tuple[weakref.ref, VisualizerWorker]] = {}
+
+
+def visualizer_worker_from(analysis) -> VisualizerWorker:
+    """
+    Returns the `VisualizerWorker` of an analysis, which is created the first time it is requested and then reused
+    for as long as the analysis exists.
+
+    The worker is stored outside of the analysis, so that the analysis can still be pickled (e.g. to parallelize a
+    non-linear search) while it is used.
+
+    Parameters
+    ----------
+    analysis
+        The analysis whose `Visualizer` performs visualization.
+    """
+    key = id(analysis)
+
+    try:
+        analysis_ref, visualizer_worker = _visualizer_worker_dict[key]
+
+        if analysis_ref() is analysis:
+            return visualizer_worker
+    except KeyError:
+        pass
+
+    visualizer_worker = VisualizerWorker(
+        analysis=analysis, queue_size=visualize_queue_size()
+    )
+
+    _visualizer_worker_dict[key] = (weakref.ref(analysis), visualizer_worker)
+    weakref.finalize(analysis, _visualizer_worker_dict.pop, key, None)
+
+    return visualizer_worker
+
+
+def close_visualizer_worker(analysis, timeout: float = None):
+    """
+    Waits for the `VisualizerWorker` of an analysis to perform all waiting visualization requests and then stops
+    it, such that a new worker is created if the analysis is visualized again (e.g. by a later search).
+
+    Parameters
+    ----------
+    analysis
+        The analysis whose `Visualizer` performs visualization.
+    timeout
+        The maximum time in seconds waited for the worker to finish, after which it is terminated.
+    """
+    analysis_ref, visualizer_worker = _visualizer_worker_dict.pop(
+        id(analysis), (None, None)
+    )
+
+    if visualizer_worker is not None and analysis_ref() is analysis:
+        visualizer_worker.close(timeout=timeout)
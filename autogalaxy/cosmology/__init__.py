@@ -1,3 +1,4 @@
+from .distance_table import DistanceTable
 from .lensing import LensingCosmology
 from .wrap import Planck15
 from .model import LambdaCDMWrap
@@ -0,0 +1,217 @@
+import numpy as np
+from scipy.interpolate import CubicSpline
+from typing import Union
+
+from autogalaxy import exc
+
+"""
+The number of arcseconds in a radian, which converts angular diameter distances to kpc per arcsecond.
+"""
+arcsec_per_radian = 648000.0 / np.pi
+
+
+def value_from(value: np.ndarray) -> Union[float, np.ndarray]:
+    """
+    Returns a computed distance as a float if it is a scalar, or as an ndarray otherwise.
+    """
+    if np.ndim(value) == 0:
+        return float(value)
+    return value
+
+
+def angular_diameter_distance_between_from(
+    comoving_transverse_distance_0: np.ndarray,
+    comoving_transverse_distance_1: np.ndarray,
+    redshift_1: np.ndarray,
+    curvature: float,
+    hubble_distance_kpc: float,
+) -> np.ndarray:
+    """
+    Returns the angular diameter distance between two redshifts from their comoving transverse distances to
+    redshift zero.
+
+    This uses the same relation as astropy's `angular_diameter_distance_z1z2` method, which is valid for cosmologies
+    with zero or positive curvature (`Ok0` >= 0).
+
+    Parameters
+    ----------
+    comoving_transverse_distance_0
+        The comoving transverse distance(s) of the first redshift(s).
+    comoving_transverse_distance_1
+        The comoving transverse distance(s) of the second redshift(s), which are further away.
+    redshift_1
+        The second redshift(s).
+    curvature
+        The curvature density `Ok0` of the cosmology.
+    hubble_distance_kpc
+        The Hubble distance of the cosmology in kpc, in the same units as the comoving transverse distances.
+    """
+    if curvature != 0.0:
+        comoving_transverse_distance_0, comoving_transverse_distance_1 = (
+            comoving_transverse_distance_0
+            * np.sqrt(
+                1.0
+                + curvature
+                * (comoving_transverse_distance_1 / hubble_distance_kpc) ** 2
+            ),
+            comoving_transverse_distance_1
+            * np.sqrt(
+                1.0
+                + curvature
+                * (comoving_transverse_distance_0 / hubble_distance_kpc) ** 2
+            ),
+        )
+
+    return (comoving_transverse_distance_1 - comoving_transverse_distance_0) / (
+        1.0 + redshift_1
+    )
+
+
+class DistanceTable:
+    def __init__(
+        self, cosmology, redshift_max: float = 10.0, total_redshifts: int = 10001
+    ):
+        """
+        A table of the comoving transverse distance of a cosmology, computed via astropy on a fine grid of redshifts
+        once, which is interpolated via a cubic spline to compute distances at any redshift.
+
+        Every distance used for lensing calculations (angular diameter distances to Earth and between two redshifts,
+        kpc per arcsecond, critical surface densities, etc.) follows from the comoving transverse distance, without
+        the numerical integration astropy performs (and the unit conversions of its `Quantity` objects) every time a
+        distance is computed. This makes computing distances for many redshifts (e.g. thousands of redshift pairs of
+        a population of strong lenses) cheap.
+
+        Distances are computed for scalar and array redshifts, where arrays are broadcast against one another.
+
+        Parameters
+        ----------
+        cosmology
+            The astropy cosmology whose distances are tabulated.
+        redshift_max
+            The maximum redshift of the table, above which distances cannot be computed.
+        total_redshifts
+            The number of (uniformly spaced) redshifts at which distances are computed via astropy.
+        """
+        self.redshift_max = redshift_max
+
+        redshifts = np.linspace(0.0, redshift_max, total_redshifts)
+
+        comoving_transverse_distance_kpc = (
+            cosmology.comoving_transverse_distance(redshifts).to("kpc").value
+        )
+
+        self.spline = CubicSpline(redshifts, comoving_transverse_distance_kpc)
+
+        self.curvature = float(cosmology.Ok0)
+        self.hubble_distance_kpc = cosmology.hubble_distance.to("kpc").value
+
+    def redshift_checked_from(self, redshift: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Returns the input redshift(s) as an ndarray, checking they are within the range of the table.
+
+        Parameters
+        ----------
+        redshift
+            The redshift(s) at which distances are computed.
+        """
+        redshift = np.asarray(redshift, dtype="float")
+
+        if np.any(redshift < 0.0) or np.any(redshift > self.redshift_max):
+            raise exc.CosmologyException(
+                f"A redshift input into the tabulated distances of a cosmology is outside the range of the table, "
+                f"which is 0.0 to {self.redshift_max}. Create the table with a larger `redshift_max`."
+            )
+
+        return redshift
+
+    def _comoving_transverse_distance_in_kpc_from(
+        self, redshift: np.ndarray
+    ) -> np.ndarray:
+        return self.spline(redshift)
+
+    def comoving_transverse_distance_in_kpc_from(
+        self, redshift: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
+        """
+        The comoving transverse distance from the input `redshift` to redshift zero in kiloparsecs.
+
+        Parameters
+        ----------
+        redshift
+            The redshift(s) at which the distance is computed.
+        """
+        redshift = self.redshift_checked_from(redshift=redshift)
+
+        return value_from(
+            self._comoving_transverse_distance_in_kpc_from(redshift=redshift)
+        )
+
+    def angular_diameter_distance_to_earth_in_kpc_from(
+        self, redshift: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
+        """
+        Angular diameter distance from the input `redshift` to redshift zero (e.g. us, the observer on earth) in
+        kiloparsecs.
+
+        Parameters
+        ----------
+        redshift
+            The redshift(s) at which the distance is computed.
+        """
+        redshift = self.redshift_checked_from(redshift=redshift)
+
+        return value_from(
+            self._comoving_transverse_distance_in_kpc_from(redshift=redshift)
+            / (1.0 + redshift)
+        )
+
+    def angular_diameter_distance_between_redshifts_in_kpc_from(
+        self,
+        redshift_0: Union[float, np.ndarray],
+        redshift_1: Union[float, np.ndarray],
+    ) -> Union[float, np.ndarray]:
+        """
+        Angular diameter distance from an input `redshift_0` to another input `redshift_1` in kiloparsecs.
+
+        This uses the same relation between comoving transverse distances as astropy's `angular_diameter_distance_z1z2`
+        method (see `angular_diameter_distance_between_from`).
+
+        Parameters
+        ----------
+        redshift_0
+            Redshift(s) from which the angular diameter distance to the other redshift is calculated.
+        redshift_1
+            Redshift(s) to which the angular diameter distance from the other redshift is calculated.
+        """
+        redshift_0 = self.redshift_checked_from(redshift=redshift_0)
+        redshift_1 = self.redshift_checked_from(redshift=redshift_1)
+
+        return value_from(
+            angular_diameter_distance_between_from(
+                comoving_transverse_distance_0=self._comoving_transverse_distance_in_kpc_from(
+                    redshift=redshift_0
+                ),
+                comoving_transverse_distance_1=self._comoving_transverse_distance_in_kpc_from(
+                    redshift=redshift_1
+                ),
+                redshift_1=redshift_1,
+                curvature=self.curvature,
+                hubble_distance_kpc=self.hubble_distance_kpc,
+            )
+        )
+
+    def kpc_per_arcsec_from(
+        self, redshift: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
+        """
+        Separation in transverse proper kpc corresponding to an arcsecond at the input `redshift`.
+
+        Parameters
+        ----------
+        redshift
+            The redshift(s) at which the separation is computed.
+        """
+        return (
+            self.angular_diameter_distance_to_earth_in_kpc_from(redshift=redshift)
+            / arcsec_per_radian
+        )
@@ -2,6 +2,26 @@ from astropy import constants
 from astropy import cosmology as cosmo
 import math
 import numpy as np
+from typing import List, Optional, Tuple, Union
+
+from autogalaxy.cosmology.distance_table import DistanceTable
+from autogalaxy.cosmology.distance_table import angular_diameter_distance_between_from
+from autogalaxy.cosmology.distance_table import arcsec_per_radian
+from autogalaxy.cosmology.distance_table import value_from
+
+"""
+The constant c^2 / (4 * pi * G) of the critical surface density for lensing in units of solar masses per kpc, which is
+computed once because converting astropy's constants to these units is slow compared to a tabulated distance.
+"""
+critical_surface_density_constant = (
+    constants.c.to("kpc / s") ** 2.0
+    / (4 * math.pi * constants.G.to("kpc3 / (solMass s2)"))
+).value
+
+"""
+The speed of light in km / s, which converts velocity dispersions to km / s.
+"""
+speed_of_light_km_per_s = constants.c.to("km / s").value
 
 
 class LensingCosmology(cosmo.FLRW):
@@ -10,9 +30,168 @@ class LensingCosmology(cosmo.FLRW):
 
     By inheriting from the astropy `cosmo.FLRW` class this provides many additional methods for performing cosmological
     calculations.
+
+    Every method accepts NumPy arrays of redshifts as well as scalars, in which case the quantity is computed for
+    every redshift (or every pair of redshifts) in one batched calculation and an ndarray is returned. This is
+    used to compute derived quantities of many lenses at once, for example the masses of the lenses of every
+    sample of a model-fit.
+
+    All distances follow from the comoving transverse distance of every redshift (see
+    `comoving_transverse_distance_list_in_kpc_from`), which is computed via one astropy call for all
+    redshifts input into a method.
+
+    The distances used by lensing calculations can be tabulated via the `tabulate_distances` method, after which they
+    are interpolated from a table computed once, instead of being computed via astropy every time.
     """
 
-    def arcsec_per_kpc_from(self, redshift: float) -> float:
+    def tabulate_distances(
+        self, redshift_max: float = 10.0, total_redshifts: int = 10001
+    ) -> "LensingCosmology":
+        """
+        Tabulates the comoving transverse distance of the cosmology on a fine grid of redshifts, such that the
+        distances used by lensing calculations (e.g. `kpc_per_arcsec_from`,
+        `angular_diameter_distance_between_redshifts_in_kpc_from`,
+        `critical_surface_density_between_redshifts_solar_mass_per_kpc2_from` and
+        `scaling_factor_between_redshifts_from`) are computed via spline interpolation of the table (see
+        `DistanceTable`).
+
+        This is much faster than computing every distance via astropy, and these methods can be called with arrays of
+        redshifts (e.g. for a population of strong lenses). Interpolated distances agree with those of astropy to
+        a fractional precision of ~1e-8 for the default table.
+
+        Parameters
+        ----------
+        redshift_max
+            The maximum redshift of the table, above which distances cannot be computed.
+        total_redshifts
+            The number of (uniformly spaced) redshifts at which distances are computed via astropy.
+
+        Returns
+        -------
+        The cosmology, such that tabulation can be chained with its creation (e.g.
+        `cosmology = ag.cosmology.Planck15().tabulate_distances()`).
+        """
+        self._distance_table = DistanceTable(
+            cosmology=self, redshift_max=redshift_max, total_redshifts=total_redshifts
+        )
+
+        return self
+
+    @property
+    def distance_table(self) -> Optional[DistanceTable]:
+        """
+        The table of distances of the cosmology if its distances are tabulated, else `None`.
+        """
+        return self.__dict__.get("_distance_table")
+
+    def comoving_transverse_distance_list_in_kpc_from(
+        self, redshift_list: List[Union[float, np.ndarray]]
+    ) -> List[np.ndarray]:
+        """
+        Returns the comoving transverse distance in kpc of every redshift (or array of redshifts) in a list, as
+        ndarrays of the same shape as each input.
+
+        If the cosmology's distances are tabulated they are interpolated from the table. Otherwise, the distances
+        of all unique redshifts in the list are computed via a single astropy call, such that a method which uses
+        several redshifts (e.g. the lens and source redshifts of the critical surface density) does not compute the
+        same distance more than once.
+
+        Parameters
+        ----------
+        redshift_list
+            The redshifts (scalars or arrays) whose comoving transverse distances are computed.
+        """
+        redshift_list = [
+            np.asarray(redshift, dtype="float") for redshift in redshift_list
+        ]
+
+        if self.distance_table is not None:
+            return [
+                np.asarray(
+                    self.distance_table.comoving_transverse_distance_in_kpc_from(
+                        redshift=redshift
+                    )
+                )
+                for redshift in redshift_list
+            ]
+
+        unique_redshifts, inverse = np.unique(
+            np.concatenate([redshift.ravel() for redshift in redshift_list]),
+            return_inverse=True,
+        )
+
+        distances = (
+            self.comoving_transverse_distance(unique_redshifts).to("kpc").value
+        )[inverse.ravel()]
+
+        distance_list = np.split(
+            distances, np.cumsum([redshift.size for redshift in redshift_list])[:-1]
+        )
+
+        return [
+            distance.reshape(redshift.shape)
+            for distance, redshift in zip(distance_list, redshift_list)
+        ]
+
+    def _angular_diameter_distance_between_from(
+        self,
+        comoving_transverse_distance_0: np.ndarray,
+        comoving_transverse_distance_1: np.ndarray,
+        redshift_1: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Returns the angular diameter distance between two redshifts from their comoving transverse distances, which
+        accounts for the curvature of the cosmology.
+        """
+        curvature = float(self.Ok0)
+
+        return angular_diameter_distance_between_from(
+            comoving_transverse_distance_0=comoving_transverse_distance_0,
+            comoving_transverse_distance_1=comoving_transverse_distance_1,
+            redshift_1=redshift_1,
+            curvature=curvature,
+            hubble_distance_kpc=(
+                self.hubble_distance.to("kpc").value if curvature != 0.0 else 0.0
+            ),
+        )
+
+    def lensing_distances_in_kpc_from(
+        self,
+        redshift_0: Union[float, np.ndarray],
+        redshift_1: Union[float, np.ndarray],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the three angular diameter distances (in kpc) used by lensing calculations for a lens at `redshift_0`
+        and a source at `redshift_1`: the distance to the lens, the distance to the source and the distance between
+        the lens and source, computed together from one batched calculation of comoving transverse distances.
+
+        Parameters
+        ----------
+        redshift_0
+            The redshift(s) of the lens.
+        redshift_1
+            The redshift(s) of the source.
+        """
+        redshift_0 = np.asarray(redshift_0, dtype="float")
+        redshift_1 = np.asarray(redshift_1, dtype="float")
+
+        distance_0, distance_1 = self.comoving_transverse_distance_list_in_kpc_from(
+            redshift_list=[redshift_0, redshift_1]
+        )
+
+        return (
+            distance_0 / (1.0 + redshift_0),
+            distance_1 / (1.0 + redshift_1),
+            self._angular_diameter_distance_between_from(
+                comoving_transverse_distance_0=distance_0,
+                comoving_transverse_distance_1=distance_1,
+                redshift_1=redshift_1,
+            ),
+        )
+
+    def arcsec_per_kpc_from(
+        self, redshift: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
         """
         Angular separation in arcsec corresponding to a proper kpc at redshift `z`.
 
@@ -24,9 +203,11 @@ class LensingCosmology(cosmo.FLRW):
         redshift
             Input redshift from which the angular separation is calculated at.
         """
-        return self.arcsec_per_kpc_proper(z=redshift).value
+        return 1.0 / self.kpc_per_arcsec_from(redshift=redshift)
 
-    def kpc_per_arcsec_from(self, redshift: float) -> float:
+    def kpc_per_arcsec_from(
+        self, redshift: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
         """
         Separation in transverse proper kpc corresponding to an arcminute at redshift `z`.
 
@@ -38,9 +219,14 @@ class LensingCosmology(cosmo.FLRW):
         redshift
             Input redshift from which the transverse proper kpc value is calculated at.
         """
-        return 1.0 / self.arcsec_per_kpc_proper(z=redshift).value
+        return (
+            self.angular_diameter_distance_to_earth_in_kpc_from(redshift=redshift)
+            / arcsec_per_radian
+        )
 
-    def angular_diameter_distance_to_earth_in_kpc_from(self, redshift: float) -> float:
+    def angular_diameter_distance_to_earth_in_kpc_from(
+        self, redshift: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
         """
         Angular diameter distance from the input `redshift` to redshift zero (e.g. us, the observer on earth) in
         kiloparsecs.
@@ -58,15 +244,19 @@ class LensingCosmology(cosmo.FLRW):
         redshift
             Input redshift from which the angular diameter distance to Earth is calculated.
         """
-        angular_diameter_distance_kpc = self.angular_diameter_distance(z=redshift).to(
-            "kpc"
+        redshift = np.asarray(redshift, dtype="float")
+
+        (distance,) = self.comoving_transverse_distance_list_in_kpc_from(
+            redshift_list=[redshift]
         )
 
-        return angular_diameter_distance_kpc.value
+        return value_from(distance / (1.0 + redshift))
 
     def angular_diameter_distance_between_redshifts_in_kpc_from(
-        self, redshift_0: float, redshift_1: float
-    ) -> float:
+        self,
+        redshift_0: Union[float, np.ndarray],
+        redshift_1: Union[float, np.ndarray],
+    ) -> Union[float, np.ndarray]:
         """
         Angular diameter distance from an input `redshift_0` to another input `redshift_1`.
 
@@ -80,13 +270,19 @@ class LensingCosmology(cosmo.FLRW):
         redshift_1
             Redshift from which the angular diameter distance to the other redshift is calculated.
         """
-        angular_diameter_distance_between_redshifts_kpc = (
-            self.angular_diameter_distance_z1z2(redshift_0, redshift_1).to("kpc")
+        (
+            angular_diameter_distance_to_redshift_0_kpc,
+            angular_diameter_distance_to_redshift_1_kpc,
+            angular_diameter_distance_between_redshifts_kpc,
+        ) = self.lensing_distances_in_kpc_from(
+            redshift_0=redshift_0, redshift_1=redshift_1
         )
 
-        return angular_diameter_distance_between_redshifts_kpc.value
+        return value_from(angular_diameter_distance_between_redshifts_kpc)
 
-    def cosmic_average_density_from(self, redshift: float) -> float:
+    def cosmic_average_density_from(
+        self, redshift: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
         """
         Critical density of the Universe at an input `redshift` in units of solar masses.
 
@@ -107,7 +303,9 @@ class LensingCosmology(cosmo.FLRW):
 
         return cosmic_average_density_kpc * kpc_per_arcsec**3.0
 
-    def cosmic_average_density_solar_mass_per_kpc3_from(self, redshift: float) -> float:
+    def cosmic_average_density_solar_mass_per_kpc3_from(
+        self, redshift: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
         """
         Critical density of the Universe at an input `redshift` in units of solar masses per kiloparsecs**3.
 
@@ -126,8 +324,8 @@ class LensingCosmology(cosmo.FLRW):
         return cosmic_average_density_kpc
 
     def critical_surface_density_between_redshifts_from(
-        self, redshift_0: float, redshift_1: float
-    ) -> float:
+        self, redshift_0: Union[float, np.ndarray], redshift_1: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
         """
         The critical surface density for lensing, often written as $\sigma_{cr}$, is given by:
 
@@ -152,19 +350,32 @@ class LensingCosmology(cosmo.FLRW):
             The redshift of the second strong lens galaxy (E.g. the lens galaxy) for which the critical surface
             density is calculated.
         """
+        (
+            angular_diameter_distance_of_redshift_0_to_earth_kpc,
+            angular_diameter_distance_of_redshift_1_to_earth_kpc,
+            angular_diameter_distance_between_redshifts_kpc,
+        ) = self.lensing_distances_in_kpc_from(
+            redshift_0=redshift_0, redshift_1=redshift_1
+        )
+
         critical_surface_density_kpc = (
-            self.critical_surface_density_between_redshifts_solar_mass_per_kpc2_from(
-                redshift_0=redshift_0, redshift_1=redshift_1
+            critical_surface_density_constant
+            * angular_diameter_distance_of_redshift_1_to_earth_kpc
+            / (
+                angular_diameter_distance_between_redshifts_kpc
+                * angular_diameter_distance_of_redshift_0_to_earth_kpc
             )
         )
 
-        kpc_per_arcsec = self.kpc_per_arcsec_from(redshift=redshift_0)
+        kpc_per_arcsec = (
+            angular_diameter_distance_of_redshift_0_to_earth_kpc / arcsec_per_radian
+        )
 
-        return critical_surface_density_kpc * kpc_per_arcsec**2.0
+        return value_from(critical_surface_density_kpc * kpc_per_arcsec**2.0)
 
     def critical_surface_density_between_redshifts_solar_mass_per_kpc2_from(
-        self, redshift_0: float, redshift_1: float
-    ) -> float:
+        self, redshift_0: Union[float, np.ndarray], redshift_1: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
         """
         The critical surface density for lensing, often written as $\sigma_{cr}$, is given by:
 
@@ -189,36 +400,29 @@ class LensingCosmology(cosmo.FLRW):
             The redshift of the second strong lens galaxy (E.g. the lens galaxy) for which the critical surface
             density is calculated.
         """
-        const = constants.c.to("kpc / s") ** 2.0 / (
-            4 * math.pi * constants.G.to("kpc3 / (solMass s2)")
-        )
-
-        angular_diameter_distance_of_redshift_0_to_earth_kpc = (
-            self.angular_diameter_distance_to_earth_in_kpc_from(redshift=redshift_0)
+        (
+            angular_diameter_distance_of_redshift_0_to_earth_kpc,
+            angular_diameter_distance_of_redshift_1_to_earth_kpc,
+            angular_diameter_distance_between_redshifts_kpc,
+        ) = self.lensing_distances_in_kpc_from(
+            redshift_0=redshift_0, redshift_1=redshift_1
         )
 
-        angular_diameter_distance_of_redshift_1_to_earth_kpc = (
-            self.angular_diameter_distance_to_earth_in_kpc_from(redshift=redshift_1)
-        )
-
-        angular_diameter_distance_between_redshifts_kpc = (
-            self.angular_diameter_distance_between_redshifts_in_kpc_from(
-                redshift_0=redshift_0, redshift_1=redshift_1
-            )
-        )
-
-        return (
-            const
+        return value_from(
+            critical_surface_density_constant
             * angular_diameter_distance_of_redshift_1_to_earth_kpc
             / (
                 angular_diameter_distance_between_redshifts_kpc
                 * angular_diameter_distance_of_redshift_0_to_earth_kpc
             )
-        ).value
+        )
 
     def scaling_factor_between_redshifts_from(
-        self, redshift_0: float, redshift_1: float, redshift_final: float
-    ) -> float:
+        self,
+        redshift_0: Union[float, np.ndarray],
+        redshift_1: Union[float, np.ndarray],
+        redshift_final: Union[float, np.ndarray],
+    ) -> Union[float, np.ndarray]:
         """
         For strong lens systems with more than 2 planes, the deflection angles between different planes must be scaled
         by the angular diameter distances between the planes in order to properly perform multi-plane ray-tracing. This
@@ -254,37 +458,59 @@ class LensingCosmology(cosmo.FLRW):
         redshift_final
             The redshift of the source galaxy.
         """
+        redshift_0 = np.asarray(redshift_0, dtype="float")
+        redshift_1 = np.asarray(redshift_1, dtype="float")
+        redshift_final = np.asarray(redshift_final, dtype="float")
+
+        (
+            distance_0,
+            distance_1,
+            distance_final,
+        ) = self.comoving_transverse_distance_list_in_kpc_from(
+            redshift_list=[redshift_0, redshift_1, redshift_final]
+        )
+
         angular_diameter_distance_between_redshifts_0_and_1 = (
-            self.angular_diameter_distance_z1z2(z1=redshift_0, z2=redshift_1)
-            .to("kpc")
-            .value
+            self._angular_diameter_distance_between_from(
+                comoving_transverse_distance_0=distance_0,
+                comoving_transverse_distance_1=distance_1,
+                redshift_1=redshift_1,
+            )
         )
 
-        angular_diameter_distance_to_redshift_final = (
-            self.angular_diameter_distance(z=redshift_final).to("kpc").value
+        angular_diameter_distance_to_redshift_final = distance_final / (
+            1.0 + redshift_final
         )
 
-        angular_diameter_distance_of_redshift_1_to_earth = (
-            self.angular_diameter_distance(z=redshift_1).to("kpc").value
+        angular_diameter_distance_of_redshift_1_to_earth = distance_1 / (
+            1.0 + redshift_1
         )
 
         angular_diameter_distance_between_redshift_0_and_final = (
-            self.angular_diameter_distance_z1z2(z1=redshift_0, z2=redshift_final)
-            .to("kpc")
-            .value
+            self._angular_diameter_distance_between_from(
+                comoving_transverse_distance_0=distance_0,
+                comoving_transverse_distance_1=distance_final,
+                redshift_1=redshift_final,
+            )
         )
 
-        return (
-            angular_diameter_distance_between_redshifts_0_and_1
-            * angular_diameter_distance_to_redshift_final
-        ) / (
-            angular_diameter_distance_of_redshift_1_to_earth
-            * angular_diameter_distance_between_redshift_0_and_final
+        return value_from(
+            (
+                angular_diameter_distance_between_redshifts_0_and_1
+                * angular_diameter_distance_to_redshift_final
+            )
+            / (
+                angular_diameter_distance_of_redshift_1_to_earth
+                * angular_diameter_distance_between_redshift_0_and_final
+            )
         )
 
     def velocity_dispersion_from(
-        self, redshift_0: float, redshift_1: float, einstein_radius: float
-    ) -> float:
+        self,
+        redshift_0: Union[float, np.ndarray],
+        redshift_1: Union[float, np.ndarray],
+        einstein_radius: Union[float, np.ndarray],
+    ) -> Union[float, np.ndarray]:
         """
         For a strong lens galaxy with an Einstien radius in arcseconds, the corresponding velocity dispersion of the
         lens galaxy can be computed (assuming an isothermal mass distribution).
@@ -305,8 +531,6 @@ class LensingCosmology(cosmo.FLRW):
         redshift_1
             The redshift of the second strong lens galaxy (the source).
         """
-        const = constants.c.to("kpc / s")
-
         angular_diameter_distance_to_redshift_0_kpc = (
             self.angular_diameter_distance_to_earth_in_kpc_from(redshift=redshift_1)
         )
@@ -325,14 +549,15 @@ class LensingCosmology(cosmo.FLRW):
 
         einstein_radius_kpc = einstein_radius * kpc_per_arcsec
 
-        velocity_dispersion_kpc = const * np.sqrt(
-            (einstein_radius_kpc * angular_diameter_distance_to_redshift_1_kpc)
-            / (
-                4
-                * np.pi
-                * angular_diameter_distance_to_redshift_0_kpc
-                * angular_diameter_distance_between_redshifts_kpc
+        return value_from(
+            speed_of_light_km_per_s
+            * np.sqrt(
+                (einstein_radius_kpc * angular_diameter_distance_to_redshift_1_kpc)
+                / (
+                    4
+                    * np.pi
+                    * angular_diameter_distance_to_redshift_0_kpc
+                    * angular_diameter_distance_between_redshifts_kpc
+                )
             )
         )
-
-        return velocity_dispersion_kpc.to("km/s").value
@@ -108,3 +108,13 @@ def raise_linear_light_profile_in_plot(
         `fit.galaxies_linear_light_profiles_to_light_profiles`.
         """
     )
+
+
+class CosmologyException(Exception):
+    """
+    Raises exceptions associated with the `cosmology` modules and `LensingCosmology` classes.
+
+    For example if a redshift outside the range of a cosmology's tabulated distances is input.
+    """
+
+    pass
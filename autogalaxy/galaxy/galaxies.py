@@ -6,9 +6,13 @@ import autoarray as aa
 
 from autogalaxy.galaxy.galaxy import Galaxy
 from autogalaxy.profiles.basis import Basis
+from autogalaxy.profiles.light.decorators import truncation_tolerance
 from autogalaxy.profiles.light.linear import LightProfileLinear
+from autogalaxy.operate import cache
+from autogalaxy.operate import pool
 from autogalaxy.operate.image import OperateImageGalaxies
 from autogalaxy.operate.deflections import OperateDeflections
+from autogalaxy.util import profiler
 
 
 class Galaxies(List, OperateImageGalaxies, OperateDeflections):
@@ -54,6 +58,19 @@ class Galaxies(List, OperateImageGalaxies, OperateDeflections):
     def redshift(self):
         return self[0].redshift
 
+    @property
+    def fingerprint(self) -> Optional[Tuple]:
+        """
+        The fingerprint of the galaxies, a tuple of the fingerprints of every galaxy (see `Galaxy.fingerprint`),
+        which is `None` if any galaxy does not have a fingerprint.
+        """
+        fingerprint = tuple(galaxy.fingerprint for galaxy in self)
+
+        if None in fingerprint:
+            return None
+
+        return fingerprint
+
     def image_2d_list_from(
         self, grid: aa.type.Grid2DLike, operated_only: Optional[bool] = None
     ) -> List[aa.Array2D]:
@@ -69,6 +86,12 @@ class Galaxies(List, OperateImageGalaxies, OperateDeflections):
         The images output by this function do not include instrument operations, such as PSF convolution (for imaging
         data) or a Fourier transform (for interferometer data).
 
+        If caching is enabled (see the `operate -> cache_size` entry of the `general.yaml` config) the image of every
+        galaxy whose parameters were already evaluated on the grid is reused (see `image_2d_via_cache_from`).
+
+        If a thread pool is used (see the `operate -> pool_size` entry of the `general.yaml` config) the images of
+        the galaxies are evaluated in parallel.
+
         Inherited methods in the `autogalaxy.operate.image` package can apply these operations to the images.
         These functions may have the `operated_only` input passed to them, which is why this function includes
         the `operated_only` input.
@@ -91,10 +114,14 @@ class Galaxies(List, OperateImageGalaxies, OperateDeflections):
             apply these operations to the images, which may have the `operated_only` input passed to them. This input
             therefore is used to pass the `operated_only` input to these methods.
         """
-        return [
-            galaxy.image_2d_from(grid=grid, operated_only=operated_only)
-            for galaxy in self
-        ]
+
+        def image_2d_from(galaxy_index, galaxy):
+            with profiler.profile_block("galaxy", galaxy_index):
+                return galaxy.image_2d_via_cache_from(
+                    grid=grid, operated_only=operated_only
+                )
+
+        return list(pool.map_from(image_2d_from, range(len(self)), self))
 
     @aa.grid_dec.to_array
     def image_2d_from(
@@ -109,6 +136,12 @@ class Galaxies(List, OperateImageGalaxies, OperateDeflections):
         Refer to the function `image_2d_list_from` for a full description of the calculation and how the `operated_only`
         input is used.
 
+        If light profiles are truncated (see the `profiles -> truncation_tolerance` entry of the `general.yaml` config)
+        and a `Grid2D` is input, each light profile of every galaxy is only evaluated in, and added to, the pixels
+        within its truncation radius (see `Galaxy.image_2d_truncated_list_from`). For many compact galaxies in a wide
+        field (e.g. extra galaxies) the cost of the calculation therefore scales with the number of pixels, not the
+        number of galaxies multiplied by the number of pixels.
+
         Parameters
         ----------
         grid
@@ -119,8 +152,131 @@ class Galaxies(List, OperateImageGalaxies, OperateDeflections):
             apply these operations to the images, which may have the `operated_only` input passed to them. This input
             therefore is used to pass the `operated_only` input to these methods.
         """
+        tolerance = truncation_tolerance()
+
+        if tolerance is not None and isinstance(grid, aa.Grid2D):
+            image = np.zeros((grid.shape[0],))
+
+            for galaxy in self:
+                for indexes, image_truncated in galaxy.image_2d_truncated_list_from(
+                    grid=grid, tolerance=tolerance, operated_only=operated_only
+                ):
+                    image[indexes] += image_truncated
+
+            return image
+
         return sum(self.image_2d_list_from(grid=grid, operated_only=operated_only))
 
+    def image_2d_split_list_from(
+        self, grid: aa.Grid2D
+    ) -> Tuple[List[aa.Array2D], List[aa.Array2D]]:
+        """
+        Returns the list of 2D images of each galaxy split into two lists: the images of light profiles which are not
+        already operated on and the images of light profiles which are (e.g. `LightProfileOperated` objects).
+
+        Each galaxy fills both of its images in a single pass over its light profiles (see
+        `Galaxy.image_2d_split_from`).
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates where values of the image are evaluated.
+        """
+        image_2d_split_list = []
+
+        for galaxy_index, galaxy in enumerate(self):
+            with profiler.profile_block("galaxy", galaxy_index):
+                image_2d_split_list.append(galaxy.image_2d_split_from(grid=grid))
+
+        return (
+            [image_2d_split[0] for image_2d_split in image_2d_split_list],
+            [image_2d_split[1] for image_2d_split in image_2d_split_list],
+        )
+
+    def image_2d_split_from(self, grid: aa.Grid2D) -> Tuple[aa.Array2D, aa.Array2D]:
+        """
+        Returns the 2D image of all galaxies summed, split into the image of light profiles which are not already
+        operated on and the image of light profiles which are (e.g. `LightProfileOperated` objects).
+
+        The light profiles of every galaxy are added to the same two images in a single pass (see
+        `image_2d_split_add_to`).
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates where values of the image are evaluated.
+        """
+        image_2d_not_operated = np.zeros((grid.shape[0],))
+        image_2d_operated = np.zeros((grid.shape[0],))
+
+        self.image_2d_split_add_to(
+            grid=grid,
+            image_2d_not_operated=image_2d_not_operated,
+            image_2d_operated=image_2d_operated,
+        )
+
+        return (
+            aa.Array2D(values=image_2d_not_operated, mask=grid.mask),
+            aa.Array2D(values=image_2d_operated, mask=grid.mask),
+        )
+
+    def image_2d_split_add_to(
+        self,
+        grid: aa.Grid2D,
+        image_2d_not_operated: np.ndarray,
+        image_2d_operated: Optional[np.ndarray],
+    ):
+        """
+        Adds the 2D image of all galaxies to one of two input arrays, depending on whether each light profile is
+        already operated on (e.g. a `LightProfileOperated` object), evaluating every light profile once (see
+        `Galaxy.image_2d_split_add_to`).
+
+        If `image_2d_operated` is `None`, the images of light profiles which are already operated on are not added to
+        either array (e.g. for a blurring grid, whose images are only used for PSF convolution).
+
+        The arrays are ndarrays of the slim image rather than `Array2D` objects, such that the log likelihood function
+        can add images to arrays it allocates once per dataset (see `autogalaxy.imaging.log_likelihood_buffers`).
+
+        If caching is enabled (see the `operate -> cache_size` entry of the `general.yaml` config) the split images of
+        every galaxy are instead computed separately and cached, such that galaxies whose parameters were already
+        evaluated on the grid are not evaluated again (see `image_2d_split_via_cache_from`).
+
+        If a thread pool is used (see the `operate -> pool_size` entry of the `general.yaml` config) the split images
+        of every galaxy are also computed separately, in parallel, and then added to the two images.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates where values of the image are evaluated.
+        image_2d_not_operated
+            The array which the images of light profiles which are not already operated on are added to.
+        image_2d_operated
+            The array which the images of light profiles which are already operated on are added to, or `None` if
+            they are not added.
+        """
+        if cache.grid_cache_from(grid=grid) is None and not pool.is_active():
+            for galaxy_index, galaxy in enumerate(self):
+                with profiler.profile_block("galaxy", galaxy_index):
+                    galaxy.image_2d_split_add_to(
+                        grid=grid,
+                        image_2d_not_operated=image_2d_not_operated,
+                        image_2d_operated=image_2d_operated,
+                    )
+
+        else:
+
+            def image_2d_split_from(galaxy_index, galaxy):
+                with profiler.profile_block("galaxy", galaxy_index):
+                    return galaxy.image_2d_split_via_cache_from(grid=grid)
+
+            for image_2d_split in pool.map_from(
+                image_2d_split_from, range(len(self)), self
+            ):
+                image_2d_not_operated += np.asarray(image_2d_split[0])
+
+                if image_2d_operated is not None:
+                    image_2d_operated += np.asarray(image_2d_split[1])
+
     def galaxy_image_2d_dict_from(
         self, grid: aa.type.Grid2DLike, operated_only: Optional[bool] = None
     ) -> {Galaxy: np.ndarray}:
@@ -172,13 +328,28 @@ class Galaxies(List, OperateImageGalaxies, OperateDeflections):
 
         See the `autogalaxy.profiles.mass` package for details of how deflections are computed from a mass profile.
 
+        If a thread pool is used (see the `operate -> pool_size` entry of the `general.yaml` config) the deflections
+        of the galaxies are evaluated in parallel.
+
         Parameters
         ----------
         grid
             The 2D (y, x) coordinates where values of the deflections are evaluated.
         """
         if self:
-            return sum(map(lambda g: g.deflections_yx_2d_from(grid=grid), self))
+
+            def deflections_yx_2d_from(galaxy_index, galaxy):
+                with profiler.profile_block("galaxy", galaxy_index):
+                    return galaxy.deflections_yx_2d_via_cache_from(grid=grid)
+
+            deflections_yx_2d = 0.0
+
+            for deflections_yx_2d_galaxy in pool.map_from(
+                deflections_yx_2d_from, range(len(self)), self
+            ):
+                deflections_yx_2d += deflections_yx_2d_galaxy
+
+            return deflections_yx_2d
         return np.zeros(shape=(grid.shape[0], 2))
 
     @aa.grid_dec.to_grid
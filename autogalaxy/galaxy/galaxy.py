@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Type, Union
+from typing import Dict, List, Optional, Tuple, Type, Union
 
 import numpy as np
 
@@ -7,13 +7,19 @@ import autofit as af
 from autoconf.dictable import instance_as_dict, to_dict
 
 from autogalaxy import exc
+from autogalaxy.operate import cache
+from autogalaxy.operate import pool
 from autogalaxy.operate.deflections import OperateDeflections
 from autogalaxy.operate.image import OperateImageList
+from autogalaxy.profiles.basis import Basis
 from autogalaxy.profiles.geometry_profiles import GeometryProfile
 from autogalaxy.profiles.light.abstract import LightProfile
+from autogalaxy.profiles.light.decorators import truncation_tolerance
 from autogalaxy.profiles.light.linear import LightProfileLinear
+from autogalaxy.profiles.light.operated import LightProfileOperated
 from autogalaxy.profiles.light.snr.abstract import LightProfileSNR
 from autogalaxy.profiles.mass.abstract.abstract import MassProfile
+from autogalaxy.util import profiler
 
 
 class Galaxy(af.ModelObject, OperateImageList, OperateDeflections):
@@ -58,6 +64,17 @@ class Galaxy(af.ModelObject, OperateImageList, OperateDeflections):
     def __hash__(self):
         return int(self.id)
 
+    @property
+    def fingerprint(self) -> Optional[Tuple]:
+        """
+        The fingerprint of the galaxy, a tuple of its class, redshift and the fingerprints of its attributes (e.g.
+        its light and mass profiles), which is the same for every galaxy with the same redshift and profiles.
+
+        This is used as a key to cache the images and deflection angles of galaxies (see `autogalaxy.operate.cache`).
+        It is `None` if an attribute of the galaxy does not have a fingerprint (e.g. a pixelization).
+        """
+        return cache.fingerprint_from(obj=self)
+
     def __repr__(self):
         string = "Redshift: {}".format(self.redshift)
 
@@ -191,8 +208,180 @@ class Galaxy(af.ModelObject, OperateImageList, OperateDeflections):
             operated are included in the list, with the images of other light profiles created as a numpy array of
             zeros.
         """
+
+        def image_2d_from(light_profile):
+            with profiler.profile_profile_block(self, light_profile):
+                return light_profile.image_2d_from(
+                    grid=grid, operated_only=operated_only
+                )
+
+        return list(
+            pool.map_from(
+                image_2d_from,
+                self.cls_list_from(cls=LightProfile, cls_filtered=LightProfileLinear),
+            )
+        )
+
+    def image_2d_split_list_from(
+        self, grid: aa.Grid2D
+    ) -> Tuple[List[aa.Array2D], List[aa.Array2D]]:
+        """
+        Returns the list of 2D images of the galaxy's light profiles split into two lists: the images of light profiles
+        which are not already operated on and the images of light profiles which are (e.g. `LightProfileOperated`
+        objects).
+
+        Each light profile is evaluated once, with its image placed in one list and an array of zeros in the other,
+        such that both lists have an entry for every light profile in the same order as `image_2d_list_from`.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates where values of the image are evaluated.
+        """
+        image_2d_split_list = []
+
+        for light_profile in self.cls_list_from(
+            cls=LightProfile, cls_filtered=LightProfileLinear
+        ):
+            with profiler.profile_profile_block(self, light_profile):
+                image_2d_split_list.append(light_profile.image_2d_split_from(grid=grid))
+
+        return (
+            [image_2d_split[0] for image_2d_split in image_2d_split_list],
+            [image_2d_split[1] for image_2d_split in image_2d_split_list],
+        )
+
+    def image_2d_split_from(self, grid: aa.Grid2D) -> Tuple[aa.Array2D, aa.Array2D]:
+        """
+        Returns the 2D image of all galaxy light profiles summed, split into the image of light profiles which are not
+        already operated on and the image of light profiles which are (e.g. `LightProfileOperated` objects).
+
+        Both images are filled in a single pass over the galaxy's light profiles, with every light profile evaluated
+        once.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates where values of the image are evaluated.
+        """
+        image_2d_not_operated = np.zeros((grid.shape[0],))
+        image_2d_operated = np.zeros((grid.shape[0],))
+
+        self.image_2d_split_add_to(
+            grid=grid,
+            image_2d_not_operated=image_2d_not_operated,
+            image_2d_operated=image_2d_operated,
+        )
+
+        return (
+            aa.Array2D(values=image_2d_not_operated, mask=grid.mask),
+            aa.Array2D(values=image_2d_operated, mask=grid.mask),
+        )
+
+    def image_2d_split_add_to(
+        self,
+        grid: aa.Grid2D,
+        image_2d_not_operated: np.ndarray,
+        image_2d_operated: Optional[np.ndarray],
+    ):
+        """
+        Adds the 2D image of every galaxy light profile to one of two input arrays, depending on whether the light
+        profile is already operated on (e.g. a `LightProfileOperated` object), evaluating every light profile once.
+
+        If `image_2d_operated` is `None`, light profiles which are already operated on are not evaluated, which is
+        used for blurring grids, whose light profiles are only used for PSF convolution.
+
+        If light profiles are truncated (see the `profiles -> truncation_tolerance` entry of the `general.yaml`
+        config) each light profile is only evaluated in, and added to, the pixels within its truncation radius.
+
+        This is used by `Galaxies` to accumulate the images of all galaxies into the same two arrays.
+
+        If a thread pool is used (see the `operate -> pool_size` entry of the `general.yaml` config) the light
+        profiles are evaluated in parallel and their images added to the arrays in order.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates where values of the image are evaluated.
+        image_2d_not_operated
+            The array which the images of light profiles which are not already operated on are added to.
+        image_2d_operated
+            The array which the images of light profiles which are already operated on are added to, or `None` if
+            they are not evaluated.
+        """
+        tolerance = truncation_tolerance()
+
+        light_profile_list = self.cls_list_from(
+            cls=LightProfile, cls_filtered=LightProfileLinear
+        )
+
+        if image_2d_operated is None:
+            light_profile_list = [
+                light_profile
+                for light_profile in light_profile_list
+                if not isinstance(light_profile, LightProfileOperated)
+            ]
+
+        def image_2d_split_from(light_profile):
+            with profiler.profile_profile_block(self, light_profile):
+                if isinstance(light_profile, Basis):
+                    image_2d_split = light_profile.image_2d_split_from(grid=grid)
+
+                    return (
+                        slice(None),
+                        np.asarray(image_2d_split[0]),
+                        np.asarray(image_2d_split[1]),
+                    )
+
+                if tolerance is not None and getattr(
+                    light_profile.image_2d_from, "truncatable", False
+                ):
+                    indexes, image_2d = light_profile.image_2d_truncated_from(
+                        grid=grid, tolerance=tolerance
+                    )
+                else:
+                    indexes = slice(None)
+                    image_2d = np.asarray(light_profile.image_2d_from(grid=grid))
+
+                if isinstance(light_profile, LightProfileOperated):
+                    return indexes, None, image_2d
+
+                return indexes, image_2d, None
+
+        image_2d_split_iterator = pool.map_from(image_2d_split_from, light_profile_list)
+
+        for indexes, not_operated, operated in image_2d_split_iterator:
+            if not_operated is not None:
+                image_2d_not_operated[indexes] += not_operated
+
+            if operated is not None and image_2d_operated is not None:
+                image_2d_operated[indexes] += operated
+
+    def image_2d_truncated_list_from(
+        self,
+        grid: aa.Grid2D,
+        tolerance: float,
+        operated_only: Optional[bool] = None,
+    ) -> List[Tuple[Union[np.ndarray, slice], np.ndarray]]:
+        """
+        Returns a list of the 2D images of the galaxy's light profiles evaluated only in the pixels of a `Grid2D`
+        within each light profile's truncation radius, as the indexes of these pixels and the image values in them.
+
+        See `LightProfile.image_2d_truncated_from` for a full description of the calculation.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates where values of the image are evaluated.
+        tolerance
+            The surface brightness below which light profiles are truncated.
+        operated_only
+            Passed to the `image_2d_from` function of every light profile, see `image_2d_list_from`.
+        """
         return [
-            light_profile.image_2d_from(grid=grid, operated_only=operated_only)
+            light_profile.image_2d_truncated_from(
+                grid=grid, tolerance=tolerance, operated_only=operated_only
+            )
             for light_profile in self.cls_list_from(
                 cls=LightProfile, cls_filtered=LightProfileLinear
             )
@@ -211,6 +400,10 @@ class Galaxy(af.ModelObject, OperateImageList, OperateDeflections):
         Refer to the function `image_2d_list_from` for a full description of the calculation and how the `operated_only`
         input is used.
 
+        If light profiles are truncated (see the `profiles -> truncation_tolerance` entry of the `general.yaml` config)
+        and a `Grid2D` is input, each light profile is only evaluated in, and added to, the pixels within its
+        truncation radius (see the function `image_2d_truncated_list_from`).
+
         Parameters
         ----------
         grid
@@ -221,6 +414,17 @@ class Galaxy(af.ModelObject, OperateImageList, OperateDeflections):
             apply these operations to the images, which may have the `operated_only` input passed to them. This input
             therefore is used to pass the `operated_only` input to these methods.
         """
+        tolerance = truncation_tolerance()
+
+        if tolerance is not None and isinstance(grid, aa.Grid2D):
+            image = np.zeros((grid.shape[0],))
+
+            for indexes, image_truncated in self.image_2d_truncated_list_from(
+                grid=grid, tolerance=tolerance, operated_only=operated_only
+            ):
+                image[indexes] += image_truncated
+
+            return image
 
         if (
             len(self.cls_list_from(cls=LightProfile, cls_filtered=LightProfileLinear))
@@ -283,12 +487,19 @@ class Galaxy(af.ModelObject, OperateImageList, OperateDeflections):
             The 2D (y, x) coordinates where values of the deflection angles are evaluated.
         """
         if self.has(cls=MassProfile):
-            return sum(
-                map(
-                    lambda p: p.deflections_yx_2d_from(grid=grid),
-                    self.cls_list_from(cls=MassProfile),
-                )
-            )
+
+            def deflections_yx_2d_from(mass_profile):
+                with profiler.profile_profile_block(self, mass_profile):
+                    return mass_profile.deflections_yx_2d_from(grid=grid)
+
+            deflections_yx_2d = 0.0
+
+            for deflections_yx_2d_profile in pool.map_from(
+                deflections_yx_2d_from, self.cls_list_from(cls=MassProfile)
+            ):
+                deflections_yx_2d += deflections_yx_2d_profile
+
+            return deflections_yx_2d
         return np.zeros((grid.shape[0], 2))
 
     @aa.grid_dec.to_array
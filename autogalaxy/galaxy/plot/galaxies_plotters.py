@@ -11,6 +11,7 @@ from autogalaxy.plot.visuals.two_d import Visuals2D
 from autogalaxy.plot.include.one_d import Include1D
 from autogalaxy.plot.include.two_d import Include2D
 from autogalaxy.plot.mass_plotter import MassPlotter
+from autogalaxy.plot import cache as plot_cache_util
 from autogalaxy.galaxy.galaxy import Galaxy
 from autogalaxy.galaxy.galaxies import Galaxies
 from autogalaxy.galaxy.plot.galaxy_plotters import GalaxyPlotter
@@ -171,7 +172,12 @@ class GalaxiesPlotter(Plotter):
         """
         if image:
             self.mat_plot_2d.plot_array(
-                array=self.galaxies.image_2d_from(grid=self.grid),
+                array=plot_cache_util.value_from(
+                    obj=self.galaxies,
+                    grid=self.grid,
+                    quantity="image_2d",
+                    func=lambda: self.galaxies.image_2d_from(grid=self.grid),
+                ),
                 visuals_2d=self.get_visuals_2d(),
                 auto_labels=aplt.AutoLabels(
                     title=f"Image{title_suffix}", filename=f"image_2d{filename_suffix}"
@@ -13,6 +13,7 @@ from autogalaxy.plot.visuals.two_d import Visuals2D
 from autogalaxy.plot.include.one_d import Include1D
 from autogalaxy.plot.include.two_d import Include2D
 from autogalaxy.plot.mass_plotter import MassPlotter
+from autogalaxy.plot import cache as plot_cache_util
 
 from autogalaxy.profiles.light.abstract import LightProfile
 from autogalaxy.profiles.mass.abstract.abstract import MassProfile
@@ -437,7 +438,12 @@ class GalaxyPlotter(Plotter):
         """
         if image:
             self.mat_plot_2d.plot_array(
-                array=self.galaxy.image_2d_from(grid=self.grid),
+                array=plot_cache_util.value_from(
+                    obj=self.galaxy,
+                    grid=self.grid,
+                    quantity="image_2d",
+                    func=lambda: self.galaxy.image_2d_from(grid=self.grid),
+                ),
                 visuals_2d=self.get_visuals_2d(),
                 auto_labels=aplt.AutoLabels(
                     title=f"Image{title_suffix}", filename=f"image_2d{filename_suffix}"
@@ -16,6 +16,8 @@ from autogalaxy.profiles.light.linear import LightProfileLinear
 from autogalaxy.galaxy.galaxy import Galaxy
 from autogalaxy.galaxy.galaxies import Galaxies
 from autogalaxy.analysis.preloads import Preloads
+from autogalaxy.operate.convolver import convolver_from
+from autogalaxy.util import profiler
 
 
 class AbstractToInversion:
@@ -319,7 +321,7 @@ class GalaxiesToInversion(AbstractToInversion):
                         lp_linear_func = LightProfileLinearObjFuncList(
                             grid=self.dataset.grids.lp,
                             blurring_grid=self.dataset.grids.blurring,
-                            convolver=self.dataset.convolver,
+                            convolver=convolver_from(dataset=self.dataset),
                             light_profile_list=light_profile_list,
                             regularization=light_profile.regularization,
                         )
@@ -585,14 +587,20 @@ class GalaxiesToInversion(AbstractToInversion):
         -------
         The inversion object which fits the dataset using the galaxies.
         """
-        inversion = inversion_from(
-            dataset=self.dataset,
-            linear_obj_list=self.linear_obj_list,
-            settings=self.settings_inversion,
-            preloads=self.preloads,
-            run_time_dict=self.run_time_dict,
-        )
+        with profiler.profile_block("inversion"):
+            with profiler.profile_block("linear_obj_list"):
+                linear_obj_list = self.linear_obj_list
+
+            inversion = inversion_from(
+                dataset=self.dataset,
+                linear_obj_list=linear_obj_list,
+                settings=self.settings_inversion,
+                preloads=self.preloads,
+                run_time_dict=self.run_time_dict,
+            )
+
+            inversion.linear_obj_galaxy_dict = self.linear_obj_galaxy_dict
 
-        inversion.linear_obj_galaxy_dict = self.linear_obj_galaxy_dict
+            profiler.profile_inversion_steps(inversion=inversion)
 
         return inversion
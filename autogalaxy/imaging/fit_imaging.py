@@ -1,5 +1,5 @@
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 from autoconf import cached_property
 
@@ -11,6 +11,8 @@ from autogalaxy.analysis.preloads import Preloads
 from autogalaxy.galaxy.galaxy import Galaxy
 from autogalaxy.galaxy.galaxies import Galaxies
 from autogalaxy.galaxy.to_inversion import GalaxiesToInversion
+from autogalaxy.operate.convolver import ConvolverFFT
+from autogalaxy.operate.convolver import convolver_from
 from autogalaxy.profiles.light.abstract import LightProfile
 from autogalaxy.profiles.light.linear import LightProfileLinear
 from autogalaxy.profiles.light.operated.abstract import LightProfileOperated
@@ -28,6 +30,7 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
         settings_inversion: aa.SettingsInversion = aa.SettingsInversion(),
         preloads: aa.Preloads = Preloads(),
         run_time_dict: Optional[Dict] = None,
+        total_only: bool = True,
     ):
         """
         Fits an imaging dataset using a list of galaxies.
@@ -53,6 +56,17 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
         When performing a `model-fit`via an `AnalysisImaging` object the `figure_of_merit` of this `FitImaging` object
         is called and returned in the `log_likelihood_function`.
 
+        Convolution is linear, therefore the `blurred_image` can be computed either by summing the images of all
+        galaxies and convolving this image once (`total_only=True`) or by convolving the image of every galaxy
+        separately and summing the blurred images (`total_only=False`). Both give the same `blurred_image`
+        and `figure_of_merit`.
+
+        The default total-only mode performs a single convolution, which is optimal for the likelihood function where
+        only the summed model image is used. The blurred images of individual galaxies (e.g. the `galaxy_model_image_dict`
+        used for visualization and adapt images) are then only computed when they are requested. If these images are
+        going to be used (e.g. when visualizing a fit), `total_only=False` computes the `blurred_image` from them,
+        meaning every convolution is only performed once.
+
         Parameters
         ----------
         dataset
@@ -72,10 +86,14 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
         run_time_dict
             A dictionary which if passed to the fit records how long fucntion calls which have the `profile_func`
             decorator take to run.
+        total_only
+            If `True`, the `blurred_image` is computed by convolving the summed image of all galaxies once. If `False`,
+            it is computed by summing the blurred image of every galaxy, which are stored for visualization.
         """
 
         self.galaxies = Galaxies(galaxies=galaxies, run_time_dict=run_time_dict)
         self.preloads = preloads
+        self.total_only = total_only
 
         super().__init__(
             dataset=dataset,
@@ -91,13 +109,32 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
         self.adapt_images = adapt_images
         self.settings_inversion = settings_inversion
 
-    @property
+    @cached_property
+    def convolver(self) -> Union[aa.Convolver, ConvolverFFT]:
+        """
+        The convolver used to convolve the images of the galaxies with the imaging dataset's PSF, which uses either
+        real-space or FFT convolution depending on which is faster for the size of the PSF and mask (see
+        `operate.convolver.convolver_from`).
+
+        This convolver is only used to blur the images of light profiles. The inversion is always given the
+        dataset's real-space `Convolver` (see `galaxies_to_inversion`), whose attributes (e.g. its kernel and
+        frame indexes) are used by inversion calculations such as the w-tilde formalism.
+        """
+        return convolver_from(dataset=self.dataset)
+
+    @cached_property
     def blurred_image(self) -> aa.Array2D:
         """
         Returns the image of the light profiles of all galaxies in the fit, convolved with the imaging dataset's PSF.
 
         If the galaxies do not have any light profiles, the image is computed bypassing the convolution routine
         altogether.
+
+        In total-only mode the images of all galaxies are summed and convolved once. Otherwise, the blurred images of
+        every galaxy (see `galaxy_blurred_image_2d_dict`) are summed.
+
+        The image is computed once per fit, as it is used by both the inversion (via the `profile_subtracted_image`)
+        and the `model_data`.
         """
 
         if len(self.galaxies.cls_list_from(cls=LightProfile)) == len(
@@ -107,9 +144,12 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
                 grid=self.grids.lp,
             )
 
+        if not self.total_only:
+            return sum(self.galaxy_blurred_image_2d_dict.values())
+
         return self.galaxies.blurred_image_2d_from(
             grid=self.grids.lp,
-            convolver=self.dataset.convolver,
+            convolver=self.convolver,
             blurring_grid=self.grids.blurring,
         )
 
@@ -169,6 +209,21 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
 
         return self.blurred_image
 
+    @cached_property
+    def galaxy_blurred_image_2d_dict(self) -> Dict[Galaxy, aa.Array2D]:
+        """
+        A dictionary which associates every galaxy in the fit with the image of its light profiles convolved with the
+        imaging data's PSF.
+
+        Each galaxy's image is convolved separately, therefore this is only computed when it is used, for example
+        for visualization or by the `blurred_image` when the fit is not in total-only mode.
+        """
+        return self.galaxies.galaxy_blurred_image_2d_dict_from(
+            grid=self.grids.lp,
+            convolver=self.convolver,
+            blurring_grid=self.grids.blurring,
+        )
+
     @property
     def galaxy_model_image_dict(self) -> Dict[Galaxy, np.ndarray]:
         """
@@ -184,11 +239,7 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
         data being fitted.
         """
 
-        galaxy_blurred_image_2d_dict = self.galaxies.galaxy_blurred_image_2d_dict_from(
-            grid=self.grids.lp,
-            convolver=self.dataset.convolver,
-            blurring_grid=self.grids.blurring,
-        )
+        galaxy_blurred_image_2d_dict = self.galaxy_blurred_image_2d_dict
 
         galaxy_linear_obj_image_dict = self.galaxy_linear_obj_data_dict_from(
             use_image=True
@@ -245,7 +296,30 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
         """
         return list(self.subtracted_images_of_galaxies_dict.values())
 
-    @property
+    @cached_property
+    def padded_grid(self) -> aa.Grid2D:
+        """
+        The grid of the fit padded such that it encapsulates all surrounding pixels which blur light into the
+        unmasked image given the shape of the PSF, which is used to compute unmasked blurred images.
+        """
+        return self.grids.lp.padded_grid_from(
+            kernel_shape_native=self.dataset.psf.shape_native
+        )
+
+    @cached_property
+    def galaxy_padded_image_2d_split_list(
+        self,
+    ) -> Tuple[List[aa.Array2D], List[aa.Array2D]]:
+        """
+        The images of every galaxy evaluated on the padded grid, split into the images of light profiles which are
+        not already operated on and the images of light profiles which are (e.g. `LightProfileOperated` objects).
+
+        Visualization computes both the unmasked blurred image of all galaxies and that of every galaxy, which are
+        both computed from these images such that every padded image is evaluated once per fit.
+        """
+        return self.galaxies.image_2d_split_list_from(grid=self.padded_grid)
+
+    @cached_property
     def unmasked_blurred_image(self) -> aa.Array2D:
         """
         The blurred image of the overall fit that would be evaluated without a mask being used.
@@ -256,11 +330,18 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
         if self.galaxies.has(cls=LightProfileLinear):
             exc.raise_linear_light_profile_in_unmasked()
 
-        return self.galaxies.unmasked_blurred_image_2d_from(
-            grid=self.grids.lp, psf=self.dataset.psf
+        padded_image_2d_not_operated_list, padded_image_2d_operated_list = (
+            self.galaxy_padded_image_2d_split_list
         )
 
-    @property
+        return self.galaxies.unmasked_blurred_image_2d_via_padded_from(
+            padded_image_2d_not_operated=sum(padded_image_2d_not_operated_list),
+            padded_image_2d_operated=sum(padded_image_2d_operated_list),
+            psf=self.dataset.psf,
+            image_shape=self.grids.lp.mask.shape,
+        )
+
+    @cached_property
     def unmasked_blurred_image_of_galaxies_list(self) -> List[aa.Array2D]:
         """
         The blurred image of every galaxy in the fit, that would be evaluated without a mask being used.
@@ -271,8 +352,15 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
         if self.galaxies.has(cls=LightProfileLinear):
             exc.raise_linear_light_profile_in_unmasked()
 
-        return self.galaxies.unmasked_blurred_image_2d_list_from(
-            grid=self.grids.lp, psf=self.dataset.psf
+        padded_image_2d_not_operated_list, padded_image_2d_operated_list = (
+            self.galaxy_padded_image_2d_split_list
+        )
+
+        return self.galaxies.unmasked_blurred_image_2d_list_via_padded_from(
+            padded_image_2d_not_operated_list=padded_image_2d_not_operated_list,
+            padded_image_2d_operated_list=padded_image_2d_operated_list,
+            psf=self.dataset.psf,
+            image_shape=self.grids.lp.mask.shape,
         )
 
     @property
@@ -325,4 +413,5 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
             settings_inversion=settings_inversion,
             preloads=preloads,
             run_time_dict=run_time_dict,
+            total_only=self.total_only,
         )
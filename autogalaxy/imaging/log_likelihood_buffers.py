@@ -0,0 +1,251 @@
+import numpy as np
+import threading
+import weakref
+from typing import Dict, Optional, Tuple
+
+import autoarray as aa
+
+from autogalaxy.util import profiler
+from autogalaxy.galaxy.galaxies import Galaxies
+from autogalaxy.operate.convolver import convolved_image_from
+from autogalaxy.operate.convolver import convolver_from
+from autogalaxy.profiles.light.abstract import LightProfile
+from autogalaxy.profiles.light.operated.abstract import LightProfileOperated
+
+
+class LogLikelihoodBuffers:
+    def __init__(self, dataset: aa.Imaging):
+        """
+        The arrays used to compute the log likelihood of a fit of galaxies to an imaging dataset which does not
+        perform an inversion, which are allocated once per dataset (and thread) and reused by every evaluation of the
+        log likelihood function.
+
+        A `FitImaging` creates an `Array2D` for every quantity of the fit (e.g. the image of the galaxies, the blurred
+        image, model data, residual-map and chi-squared-map), which is required for results and visualization but
+        not by the log likelihood function of a model-fit. These buffers instead:
+
+        - Add the images of the galaxies' light profiles to 1D ndarrays of the slim image and blurring image
+          (see `Galaxies.image_2d_split_add_to`).
+
+        - Convolve the image with the PSF without wrapping the convolved image in an `Array2D`
+          (see `operate.convolver.convolved_image_from`).
+
+        - Compute the residuals and chi-squared in place in a single array, with the noise normalization, which only
+          depends on the dataset, computed once.
+
+        The log likelihood is the same as the `figure_of_merit` of a `FitImaging` of the same galaxies, up to the
+        floating point rounding of summing the images of the galaxies in a different order.
+
+        Every thread has its own buffers (see `buffer_from`), such that the log likelihood function can be called by
+        multiple threads at once (e.g. by a non-linear search which evaluates samples in a thread pool) without the
+        calls overwriting one another's images and chi-squared values.
+
+        The dataset is not stored, so that the buffers can be cached for as long as the dataset exists
+        (see `log_likelihood_buffers_from`).
+
+        Parameters
+        ----------
+        dataset
+            The imaging dataset whose log likelihood is computed.
+        """
+        self.data = np.asarray(dataset.data.slim)
+        self.noise_map = np.asarray(dataset.noise_map.slim)
+
+        self.noise_normalization = aa.util.fit.noise_normalization_from(
+            noise_map=self.noise_map
+        )
+
+        self.total_blurring_pixels = dataset.grids.blurring.shape[0]
+
+        self._local = threading.local()
+
+    def buffer_from(self, name: str, size: int) -> np.ndarray:
+        """
+        Returns the buffer of the calling thread with the input name, which is allocated the first time it is
+        requested by the thread and then reused by its later calls.
+
+        Parameters
+        ----------
+        name
+            The name of the buffer (e.g. `chi_squared_map`).
+        size
+            The number of values in the buffer.
+        """
+        try:
+            return getattr(self._local, name)
+        except AttributeError:
+            buffer = np.zeros(size)
+            setattr(self._local, name, buffer)
+            return buffer
+
+    @property
+    def image_2d_not_operated(self) -> np.ndarray:
+        return self.buffer_from(name="image_2d_not_operated", size=self.data.shape[0])
+
+    @property
+    def image_2d_operated(self) -> np.ndarray:
+        return self.buffer_from(name="image_2d_operated", size=self.data.shape[0])
+
+    @property
+    def blurring_image_2d(self) -> np.ndarray:
+        return self.buffer_from(
+            name="blurring_image_2d", size=self.total_blurring_pixels
+        )
+
+    @property
+    def chi_squared_map(self) -> np.ndarray:
+        return self.buffer_from(name="chi_squared_map", size=self.data.shape[0])
+
+    def model_data_from(self, dataset: aa.Imaging, galaxies: Galaxies) -> np.ndarray:
+        """
+        Returns the model data of a fit of galaxies to the imaging dataset, as a 1D ndarray of the slim image, which
+        is the image of the light profiles of all galaxies convolved with the PSF plus the image of light profiles
+        which are already operated on (e.g. `LightProfileOperated` objects).
+
+        This is the same calculation as the `blurred_image` of a `FitImaging`, with the images of the galaxies added
+        to this object's buffers.
+
+        Parameters
+        ----------
+        dataset
+            The imaging dataset, whose grids the images of the galaxies are evaluated on.
+        galaxies
+            The galaxies whose model data is computed.
+        """
+        self.image_2d_not_operated.fill(0.0)
+        self.image_2d_operated.fill(0.0)
+
+        galaxies.image_2d_split_add_to(
+            grid=dataset.grids.lp,
+            image_2d_not_operated=self.image_2d_not_operated,
+            image_2d_operated=self.image_2d_operated,
+        )
+
+        if not any(
+            galaxy.cls_list_from(cls=LightProfile, cls_filtered=LightProfileOperated)
+            for galaxy in galaxies
+        ):
+            return np.add(
+                self.image_2d_not_operated,
+                self.image_2d_operated,
+                out=self.image_2d_not_operated,
+            )
+
+        self.blurring_image_2d.fill(0.0)
+
+        galaxies.image_2d_split_add_to(
+            grid=dataset.grids.blurring,
+            image_2d_not_operated=self.blurring_image_2d,
+            image_2d_operated=None,
+        )
+
+        with profiler.profile_block("convolution"):
+            blurred_image_2d = convolved_image_from(
+                convolver=convolver_from(dataset=dataset),
+                image=self.image_2d_not_operated,
+                blurring_image=self.blurring_image_2d,
+            )
+
+        return np.add(blurred_image_2d, self.image_2d_operated, out=blurred_image_2d)
+
+    def log_likelihood_from(
+        self,
+        dataset: aa.Imaging,
+        galaxies: Galaxies,
+        dataset_model: Optional[aa.DatasetModel] = None,
+    ) -> float:
+        """
+        Returns the log likelihood of a fit of galaxies to the imaging dataset, which is the same as the
+        `figure_of_merit` of a `FitImaging` which does not perform an inversion.
+
+        Parameters
+        ----------
+        dataset
+            The imaging dataset whose log likelihood is computed, which these buffers were created for.
+        galaxies
+            The galaxies which fit the dataset.
+        dataset_model
+            Attributes which allow for parts of a dataset to be treated as a model (e.g. the background sky level).
+        """
+        model_data = self.model_data_from(dataset=dataset, galaxies=galaxies)
+
+        background_sky_level = getattr(dataset_model, "background_sky_level", 0.0)
+
+        chi_squared_map = self.chi_squared_map
+
+        np.subtract(self.data, background_sky_level, out=chi_squared_map)
+        np.subtract(chi_squared_map, model_data, out=chi_squared_map)
+        np.divide(chi_squared_map, self.noise_map, out=chi_squared_map)
+        np.square(chi_squared_map, out=chi_squared_map)
+
+        return aa.util.fit.log_likelihood_from(
+            chi_squared=aa.util.fit.chi_squared_from(chi_squared_map=chi_squared_map),
+            noise_normalization=self.noise_normalization,
+        )
+
+
+def use_log_likelihood_buffers_from(
+    dataset: aa.Imaging,
+    galaxies: Galaxies,
+    dataset_model: Optional[aa.DatasetModel] = None,
+) -> bool:
+    """
+    Returns whether the log likelihood of a fit of galaxies to an imaging dataset can be computed via
+    `LogLikelihoodBuffers`, as opposed to creating a `FitImaging`.
+
+    This is the case if the fit does not perform an inversion (e.g. the galaxies have no linear light profiles or
+    pixelizations), the dataset has a PSF and no noise covariance matrix and the dataset model does not offset the
+    grids.
+
+    Parameters
+    ----------
+    dataset
+        The imaging dataset which is fitted.
+    galaxies
+        The galaxies which fit the dataset.
+    dataset_model
+        Attributes which allow for parts of a dataset to be treated as a model (e.g. the background sky level).
+    """
+    if galaxies.perform_inversion:
+        return False
+
+    if dataset.psf is None or dataset.noise_covariance_matrix is not None:
+        return False
+
+    grid_offset = getattr(dataset_model, "grid_offset", (0.0, 0.0))
+
+    return grid_offset[0] == 0.0 and grid_offset[1] == 0.0
+
+
+_log_likelihood_buffers_dict: Dict[int, Tuple[weakref.ref, LogLikelihoodBuffers]] = {}
+
+
+def log_likelihood_buffers_from(dataset: aa.Imaging) -> LogLikelihoodBuffers:
+    """
+    Returns the `LogLikelihoodBuffers` of an imaging dataset, which are created the first time they are requested
+    and then reused for as long as the dataset exists.
+
+    This means the buffers are allocated once per model-fit, rather than for every evaluation of the log likelihood
+    function.
+
+    Parameters
+    ----------
+    dataset
+        The imaging dataset whose log likelihood is computed.
+    """
+    key = id(dataset)
+
+    try:
+        dataset_ref, log_likelihood_buffers = _log_likelihood_buffers_dict[key]
+
+        if dataset_ref() is dataset:
+            return log_likelihood_buffers
+    except KeyError:
+        pass
+
+    log_likelihood_buffers = LogLikelihoodBuffers(dataset=dataset)
+
+    _log_likelihood_buffers_dict[key] = (weakref.ref(dataset), log_likelihood_buffers)
+    weakref.finalize(dataset, _log_likelihood_buffers_dict.pop, key, None)
+
+    return log_likelihood_buffers
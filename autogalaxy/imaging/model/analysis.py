@@ -1,6 +1,6 @@
 import numpy as np
 
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import autofit as af
 import autoarray as aa
@@ -12,9 +12,12 @@ from autogalaxy.analysis.analysis.dataset import AnalysisDataset
 from autogalaxy.analysis.preloads import Preloads
 from autogalaxy.cosmology.lensing import LensingCosmology
 from autogalaxy.cosmology.wrap import Planck15
+from autogalaxy.galaxy.galaxy import Galaxy
 from autogalaxy.imaging.model.result import ResultImaging
 from autogalaxy.imaging.model.visualizer import VisualizerImaging
 from autogalaxy.imaging.fit_imaging import FitImaging
+from autogalaxy.imaging.log_likelihood_buffers import log_likelihood_buffers_from
+from autogalaxy.imaging.log_likelihood_buffers import use_log_likelihood_buffers_from
 
 from autogalaxy import exc
 
@@ -30,6 +33,7 @@ class AnalysisImaging(AnalysisDataset):
         cosmology: LensingCosmology = Planck15(),
         settings_inversion: aa.SettingsInversion = None,
         title_prefix: str = None,
+        use_log_likelihood_buffers: bool = True,
     ):
         """
         Fits a galaxy model to an imaging dataset via a non-linear search.
@@ -60,6 +64,10 @@ class AnalysisImaging(AnalysisDataset):
         title_prefix
             A string that is added before the title of all figures output by visualization, for example to
             put the name of the dataset and galaxy in the title.
+        use_log_likelihood_buffers
+            If `True`, the log likelihood of fits which do not perform an inversion (e.g. only parametric light
+            profiles) is computed with arrays allocated once per dataset, without creating a `FitImaging` and the
+            `Array2D` of every quantity of the fit (see `LogLikelihoodBuffers`).
         """
         super().__init__(
             dataset=dataset,
@@ -69,6 +77,8 @@ class AnalysisImaging(AnalysisDataset):
             title_prefix=title_prefix,
         )
 
+        self.use_log_likelihood_buffers = use_log_likelihood_buffers
+
     @property
     def imaging(self):
         return self.dataset
@@ -120,6 +130,11 @@ class AnalysisImaging(AnalysisDataset):
            model images of every galaxy, blurring them with the imaging dataset's PSF and computing residuals,
            a chi-squared statistic and the log likelihood.
 
+        If the fit does not perform an inversion, step 4) is instead performed by adding the images of the
+        galaxies to arrays allocated once per dataset and computing the log likelihood in place, such that no
+        `FitImaging` or `Array2D` of its quantities are created (see `figure_of_merit_from`). These are only created
+        for results and visualization, via the `fit_from` function.
+
         Certain models will fail to fit the dataset and raise an exception. For example if an `Inversion` is used, the
         linear algebra calculation may be invalid and raise an Exception. In such circumstances the model is discarded
         and its likelihood value is passed to the non-linear search in a way that it ignores it (for example, using a
@@ -138,7 +153,7 @@ class AnalysisImaging(AnalysisDataset):
         """
 
         try:
-            return self.fit_from(instance=instance).figure_of_merit
+            return self.figure_of_merit_from(instance=instance)
         except (
             PixelizationException,
             exc.PixelizationException,
@@ -150,11 +165,64 @@ class AnalysisImaging(AnalysisDataset):
         ) as e:
             raise exc.FitException from e
 
+    def figure_of_merit_from(
+        self, instance: af.ModelInstance, run_time_dict: Optional[Dict] = None
+    ) -> float:
+        """
+        Returns the log likelihood of a fit of a model instance to the imaging dataset, which is the value returned by
+        the `log_likelihood_function`.
+
+        If the fit does not perform an inversion, the log likelihood is computed via the `LogLikelihoodBuffers` of
+        the dataset, without creating a `FitImaging`. Otherwise, a `FitImaging` is created from the galaxies and
+        dataset model already created from the instance, such that these are only created once.
+
+        The buffers are not used if `use_log_likelihood_buffers` is `False`, or if a child class overrides `fit_from`
+        (e.g. to fit a different model object), in which case its fit is used.
+
+        Parameters
+        ----------
+        instance
+            An instance of the model that is being fitted to the data by this analysis (whose parameters have been set
+            via a non-linear search).
+        run_time_dict
+            A dictionary which times functions called to fit the model to data, for profiling.
+        """
+        if (
+            not self.use_log_likelihood_buffers
+            or type(self).fit_from is not AnalysisImaging.fit_from
+        ):
+            return super().figure_of_merit_from(
+                instance=instance, run_time_dict=run_time_dict
+            )
+
+        galaxies = self.galaxies_via_instance_from(
+            instance=instance, run_time_dict=run_time_dict
+        )
+
+        dataset_model = self.dataset_model_via_instance_from(instance=instance)
+
+        if use_log_likelihood_buffers_from(
+            dataset=self.dataset, galaxies=galaxies, dataset_model=dataset_model
+        ):
+            return log_likelihood_buffers_from(
+                dataset=self.dataset
+            ).log_likelihood_from(
+                dataset=self.dataset, galaxies=galaxies, dataset_model=dataset_model
+            )
+
+        return self.fit_via_galaxies_from(
+            instance=instance,
+            galaxies=galaxies,
+            dataset_model=dataset_model,
+            run_time_dict=run_time_dict,
+        ).figure_of_merit
+
     def fit_from(
         self,
         instance: af.ModelInstance,
         preload_overwrite: Optional[Preloads] = None,
         run_time_dict: Optional[Dict] = None,
+        total_only: bool = True,
     ) -> FitImaging:
         """
         Given a model instance create a `FitImaging` object.
@@ -171,6 +239,9 @@ class AnalysisImaging(AnalysisDataset):
             If a `Preload` object is input this is used instead of the preloads stored as an attribute in the analysis.
         run_time_dict
             A dictionary which times functions called to fit the model to data, for profiling.
+        total_only
+            If `False`, the fit computes its model image from the blurred image of every galaxy, which is used when
+            these images are visualized (see `FitImaging`).
 
         Returns
         -------
@@ -184,6 +255,44 @@ class AnalysisImaging(AnalysisDataset):
 
         dataset_model = self.dataset_model_via_instance_from(instance=instance)
 
+        return self.fit_via_galaxies_from(
+            instance=instance,
+            galaxies=galaxies,
+            dataset_model=dataset_model,
+            preload_overwrite=preload_overwrite,
+            run_time_dict=run_time_dict,
+            total_only=total_only,
+        )
+
+    def fit_via_galaxies_from(
+        self,
+        instance: af.ModelInstance,
+        galaxies: List[Galaxy],
+        dataset_model: Optional[aa.DatasetModel] = None,
+        preload_overwrite: Optional[Preloads] = None,
+        run_time_dict: Optional[Dict] = None,
+        total_only: bool = True,
+    ) -> FitImaging:
+        """
+        Given a model instance and the galaxies and dataset model created from it, create a `FitImaging` object.
+
+        Parameters
+        ----------
+        instance
+            An instance of the model that is being fitted to the data by this analysis, which the adapt images are
+            created from.
+        galaxies
+            The galaxies created from the instance, which are fitted to the imaging dataset.
+        dataset_model
+            The dataset model created from the instance (e.g. the background sky level).
+        preload_overwrite
+            If a `Preload` object is input this is used instead of the preloads stored as an attribute in the analysis.
+        run_time_dict
+            A dictionary which times functions called to fit the model to data, for profiling.
+        total_only
+            If `False`, the fit computes its model image from the blurred image of every galaxy, which is used when
+            these images are visualized (see `FitImaging`).
+        """
         adapt_images = self.adapt_images_via_instance_from(instance=instance)
 
         preloads = self.preloads if preload_overwrite is None else preload_overwrite
@@ -196,6 +305,7 @@ class AnalysisImaging(AnalysisDataset):
             settings_inversion=self.settings_inversion,
             preloads=preloads,
             run_time_dict=run_time_dict,
+            total_only=total_only,
         )
 
     def save_attributes(self, paths: af.DirectoryPaths):
@@ -270,8 +380,11 @@ class AnalysisImaging(AnalysisDataset):
         Two dictionaries, the profiling dictionary and info dictionary, which contain the profiling times of the
         `log_likelihood_function` and information on the model and dataset used to perform the profiling.
         """
+        if isinstance(paths, af.DatabasePaths):
+            return
+
         run_time_dict, info_dict = super().profile_log_likelihood_function(
-            instance=instance,
+            instance=instance
         )
 
         info_dict["psf_shape_2d"] = self.dataset.psf.shape_native
@@ -279,5 +392,6 @@ class AnalysisImaging(AnalysisDataset):
         self.output_profiling_info(
             paths=paths, run_time_dict=run_time_dict, info_dict=info_dict
         )
+        self.output_likelihood_profiler(instance=instance, paths=paths)
 
         return run_time_dict, info_dict
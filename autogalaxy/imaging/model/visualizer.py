@@ -3,6 +3,7 @@ import autofit as af
 from autoarray import exc
 
 from autogalaxy.imaging.model.plotter_interface import PlotterInterfaceImaging
+from autogalaxy.plot.cache import plot_cache
 
 
 class VisualizerImaging(af.Visualizer):
@@ -72,28 +73,31 @@ class VisualizerImaging(af.Visualizer):
             If True the visualization is being performed midway through the non-linear search before it is finished,
             which may change which images are output.
         """
-        fit = analysis.fit_from(instance=instance)
-
-        plotter = PlotterInterfaceImaging(
-            image_path=paths.image_path, title_prefix=analysis.title_prefix
-        )
-        plotter.imaging(dataset=analysis.dataset)
-
-        try:
-            plotter.fit_imaging(fit=fit, during_analysis=during_analysis)
-        except exc.InversionException:
-            pass
-
-        galaxies = fit.galaxies_linear_light_profiles_to_light_profiles
-
-        plotter.galaxies(
-            galaxies=galaxies, grid=fit.grids.lp, during_analysis=during_analysis
-        )
-        plotter.galaxies_1d(
-            galaxies=galaxies, grid=fit.grids.lp, during_analysis=during_analysis
-        )
-        if fit.inversion is not None:
-            plotter.inversion(inversion=fit.inversion, during_analysis=during_analysis)
+        fit = analysis.fit_from(instance=instance, total_only=False)
+
+        with plot_cache():
+            plotter = PlotterInterfaceImaging(
+                image_path=paths.image_path, title_prefix=analysis.title_prefix
+            )
+            plotter.imaging(dataset=analysis.dataset)
+
+            try:
+                plotter.fit_imaging(fit=fit, during_analysis=during_analysis)
+            except exc.InversionException:
+                pass
+
+            galaxies = fit.galaxies_linear_light_profiles_to_light_profiles
+
+            plotter.galaxies(
+                galaxies=galaxies, grid=fit.grids.lp, during_analysis=during_analysis
+            )
+            plotter.galaxies_1d(
+                galaxies=galaxies, grid=fit.grids.lp, during_analysis=during_analysis
+            )
+            if fit.inversion is not None:
+                plotter.inversion(
+                    inversion=fit.inversion, during_analysis=during_analysis
+                )
 
     @staticmethod
     def visualize_before_fit_combined(
@@ -11,6 +11,9 @@ from autogalaxy.analysis.preloads import Preloads
 from autogalaxy.galaxy.galaxy import Galaxy
 from autogalaxy.galaxy.galaxies import Galaxies
 from autogalaxy.galaxy.to_inversion import GalaxiesToInversion
+from autogalaxy.interferometer.image_plane_chi_squared import (
+    image_plane_chi_squared_from,
+)
 
 
 class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
@@ -23,6 +26,8 @@ class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
         settings_inversion: aa.SettingsInversion = aa.SettingsInversion(),
         preloads: aa.Preloads = Preloads(),
         run_time_dict: Optional[Dict] = None,
+        total_only: bool = True,
+        use_image_plane_chi_squared: bool = False,
     ):
         """
         Fits an interferometer dataset using a list of galaxies.
@@ -49,6 +54,12 @@ class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
         When performing a model-fit` via ` AnalysisInterferometer` object the `figure_of_merit` of
         this `FitInterferometer` object is called and returned in the `log_likelihood_function`.
 
+        The Fourier transform is linear, therefore the `profile_visibilities` can be computed either by transforming
+        the summed image of all galaxies once (`total_only=True`) or by transforming the image of every galaxy and
+        summing their visibilities (`total_only=False`), where the images of all galaxies are transformed by one
+        batched transform. Both give the same `profile_visibilities` and `figure_of_merit`, with the latter used when
+        the visibilities of every galaxy are also used (e.g. for visualization).
+
         Parameters
         ----------
         dataset
@@ -68,6 +79,14 @@ class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
         run_time_dict
             A dictionary which if passed to the fit records how long fucntion calls which have the `profile_func`
             decorator take to run.
+        total_only
+            If `True`, the `profile_visibilities` are computed by Fourier transforming the summed image of all galaxies
+            once. If `False`, they are computed by summing the visibilities of every galaxy, which are stored for
+            visualization.
+        use_image_plane_chi_squared
+            If `True` and the fit does not perform an inversion, the `chi_squared` is computed from the summed image
+            of all galaxies in real space, using a dirty image and dirty beam which are precomputed once per dataset
+            (see `ImagePlaneChiSquared`). Its cost is therefore independent of the number of visibilities.
         """
 
         try:
@@ -93,17 +112,52 @@ class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
         self.settings_inversion = settings_inversion
 
         self.preloads = preloads
+        self.total_only = total_only
+        self.use_image_plane_chi_squared = use_image_plane_chi_squared
 
-    @property
+    @cached_property
     def profile_visibilities(self) -> aa.Visibilities:
         """
         Returns the visibilities of every light profile of every galaxy, which are computed by performing
         a Fourier transform to the sum of light profile images.
+
+        If the fit is not in total-only mode, these are instead the sum of the visibilities of every galaxy
+        (see `galaxy_visibilities_dict`).
         """
+        if not self.total_only:
+            return sum(self.galaxy_visibilities_dict.values())
+
         return self.galaxies.visibilities_from(
             grid=self.grids.lp, transformer=self.dataset.transformer
         )
 
+    @cached_property
+    def galaxy_visibilities_dict(self) -> Dict[Galaxy, aa.Visibilities]:
+        """
+        A dictionary which associates every galaxy in the fit with the visibilities of its light profiles, where the
+        images of all galaxies are Fourier transformed by one batched transform.
+        """
+        return self.galaxies.galaxy_visibilities_dict_from(
+            grid=self.grids.lp, transformer=self.dataset.transformer
+        )
+
+    @property
+    def chi_squared(self) -> float:
+        """
+        Returns the chi-squared of the model data's fit to the visibilities.
+
+        If `use_image_plane_chi_squared` is `True` and the fit does not perform an inversion, this is computed
+        in real space from the summed image of all galaxies, without Fourier transforming the image to visibilities
+        (see `ImagePlaneChiSquared`). The `residual_map`, `chi_squared_map` and other quantities (e.g. for
+        visualization) are still computed in the uv-plane.
+        """
+        if self.use_image_plane_chi_squared and not self.perform_inversion:
+            return image_plane_chi_squared_from(
+                dataset=self.dataset
+            ).chi_squared_from(image=self.galaxies.image_2d_from(grid=self.grids.lp))
+
+        return super().chi_squared
+
     @property
     def profile_subtracted_visibilities(self) -> aa.Visibilities:
         """
@@ -196,9 +250,7 @@ class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
         For modeling, this dictionary is used to set up the `adapt_visibilities` that adapt certain pixelizations to the
         data being fitted.
         """
-        galaxy_model_visibilities_dict = self.galaxies.galaxy_visibilities_dict_from(
-            grid=self.grids.lp, transformer=self.dataset.transformer
-        )
+        galaxy_model_visibilities_dict = self.galaxy_visibilities_dict
 
         galaxy_linear_obj_data_dict = self.galaxy_linear_obj_data_dict_from(
             use_image=False
@@ -263,4 +315,6 @@ class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
             settings_inversion=settings_inversion,
             preloads=preloads,
             run_time_dict=run_time_dict,
+            total_only=self.total_only,
+            use_image_plane_chi_squared=self.use_image_plane_chi_squared,
         )
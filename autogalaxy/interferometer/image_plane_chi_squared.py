@@ -0,0 +1,251 @@
+import numpy as np
+import scipy.fft
+import weakref
+from typing import Dict, Tuple
+
+import autoarray as aa
+
+from autogalaxy.util import profiler
+
+
+class ImagePlaneChiSquared:
+    def __init__(self, dataset: aa.Interferometer, visibilities_chunk: int = 10000):
+        """
+        Precomputes the quantities which allow the chi-squared of a fit to an interferometer dataset to be computed
+        from the model image in real space, without Fourier transforming the image to the uv-plane.
+
+        For a model image `x`, whose Fourier transform (DFT) to visibilities is `A x`, the chi-squared of the fit to
+        visibilities `V` with noise-map `sigma` expands as:
+
+        chi_squared = sum(V**2 / sigma**2) - 2 * x . D + x . C x
+
+        Where:
+
+        - `sum(V**2 / sigma**2)` is a constant of the dataset.
+
+        - `D` is the noise-weighted dirty image of the visibilities (the data vector of the w-tilde formalism used by
+          inversions).
+
+        - `C` is the NUFFT-curvature matrix (the w-tilde matrix of inversions), whose entry for every pair of image
+          pixels only depends on the offset between the two pixels. It is therefore stored as a dirty beam evaluated
+          over every pixel offset, with `C x` a convolution of the model image with this beam.
+
+        The convolution is performed via an FFT of the image, such that the cost of computing the chi-squared of a
+        model image is independent of the number of visibilities, which is much faster than Fourier transforming the
+        image to the uv-plane for datasets with many visibilities.
+
+        If the real and imaginary noise-map values of a visibility differ, `C` also has a term which depends on
+        the sum of the positions of the two image pixels, which is evaluated via an FFT autoconvolution of the image.
+
+        The dirty image and dirty beam are computed once via direct Fourier transforms of all visibilities (which
+        are separable in y and x, and thus computed via matrix multiplications). The chi-squared is therefore that of
+        an exact DFT of the model image, as computed by a `TransformerDFT`, and it differs from that of a
+        `TransformerNUFFT` by the accuracy of the NUFFT.
+
+        Parameters
+        ----------
+        dataset
+            The interferometer dataset whose chi-squared is computed in real space.
+        visibilities_chunk
+            The number of visibilities Fourier transformed at once when the dirty image and dirty beam are computed,
+            which bounds the memory used.
+        """
+        mask_2d = np.array(dataset.real_space_mask)
+
+        image_indexes = np.argwhere(~mask_2d)
+
+        start = np.min(image_indexes, axis=0)
+        end = np.max(image_indexes, axis=0) + 1
+
+        self.shape = tuple(end - start)
+
+        image_indexes = image_indexes - start
+
+        self.image_flat_indexes = (
+            image_indexes[:, 0] * self.shape[1] + image_indexes[:, 1]
+        )
+
+        grid_radians = np.array(
+            aa.Grid2D.uniform(
+                shape_native=mask_2d.shape,
+                pixel_scales=dataset.real_space_mask.pixel_scales,
+                origin=dataset.real_space_mask.origin,
+            ).native
+        ) * (np.pi / 648000.0)
+
+        y = grid_radians[start[0] : end[0], 0, 0]
+        x = grid_radians[0, start[1] : end[1], 1]
+
+        pixel_scale_y = grid_radians[1, 0, 0] - grid_radians[0, 0, 0]
+        pixel_scale_x = grid_radians[0, 1, 1] - grid_radians[0, 0, 1]
+
+        offsets_y = np.arange(-(self.shape[0] - 1), self.shape[0]) * pixel_scale_y
+        offsets_x = np.arange(-(self.shape[1] - 1), self.shape[1]) * pixel_scale_x
+
+        sums_y = 2.0 * y[0] + np.arange(2 * self.shape[0] - 1) * pixel_scale_y
+        sums_x = 2.0 * x[0] + np.arange(2 * self.shape[1] - 1) * pixel_scale_x
+
+        data = np.asarray(dataset.data)
+        noise_map = np.asarray(dataset.noise_map)
+        uv_wavelengths = np.asarray(dataset.uv_wavelengths)
+
+        weights_real = 1.0 / noise_map.real**2
+        weights_imag = 1.0 / noise_map.imag**2
+
+        self.data_term = float(
+            np.sum(weights_real * data.real**2 + weights_imag * data.imag**2)
+        )
+
+        self.use_sum_term = not np.allclose(weights_real, weights_imag)
+
+        self.dirty_image = np.zeros(self.shape)
+        dirty_beam = np.zeros((2 * self.shape[0] - 1, 2 * self.shape[1] - 1))
+        sum_beam = np.zeros((2 * self.shape[0] - 1, 2 * self.shape[1] - 1))
+
+        for i in range(0, data.shape[0], visibilities_chunk):
+            chunk = slice(i, i + visibilities_chunk)
+
+            u = uv_wavelengths[chunk, 0]
+            v = uv_wavelengths[chunk, 1]
+
+            self.dirty_image += self.separable_transform_from(
+                weights=weights_real[chunk] * data.real[chunk]
+                + 1j * weights_imag[chunk] * data.imag[chunk],
+                y=y,
+                x=x,
+                u=u,
+                v=v,
+            )
+
+            dirty_beam += self.separable_transform_from(
+                weights=0.5 * (weights_real[chunk] + weights_imag[chunk]),
+                y=offsets_y,
+                x=offsets_x,
+                u=u,
+                v=v,
+            )
+
+            if self.use_sum_term:
+                sum_beam += self.separable_transform_from(
+                    weights=0.5 * (weights_real[chunk] - weights_imag[chunk]),
+                    y=sums_y,
+                    x=sums_x,
+                    u=u,
+                    v=v,
+                )
+
+        self.fft_shape = tuple(
+            scipy.fft.next_fast_len(2 * size - 1, real=True) for size in self.shape
+        )
+
+        dirty_beam_wrapped = np.zeros(self.fft_shape)
+        dirty_beam_wrapped[: dirty_beam.shape[0], : dirty_beam.shape[1]] = dirty_beam
+        dirty_beam_wrapped = np.roll(
+            dirty_beam_wrapped,
+            shift=(-(self.shape[0] - 1), -(self.shape[1] - 1)),
+            axis=(0, 1),
+        )
+
+        self.dirty_beam_fft = scipy.fft.rfft2(dirty_beam_wrapped)
+        self.sum_beam = sum_beam
+
+    @staticmethod
+    def separable_transform_from(
+        weights: np.ndarray, y: np.ndarray, x: np.ndarray, u: np.ndarray, v: np.ndarray
+    ) -> np.ndarray:
+        """
+        Returns the real part of the weighted sum over visibilities of exp(2 pi i (x * u + y * v)) for every (y,x)
+        coordinate on a rectangular grid, where the exponential is separable into a term for y and a term for x
+        such that the sum is a matrix multiplication.
+
+        Parameters
+        ----------
+        weights
+            The (complex) weight of every visibility.
+        y
+            The y coordinates (in radians) of the rows of the rectangular grid.
+        x
+            The x coordinates (in radians) of the columns of the rectangular grid.
+        u
+            The u wavelengths of the visibilities, which are paired with the x coordinates.
+        v
+            The v wavelengths of the visibilities, which are paired with the y coordinates.
+        """
+        exponential_y = np.exp(2.0j * np.pi * np.outer(v, y))
+        exponential_x = np.exp(2.0j * np.pi * np.outer(u, x))
+
+        return np.real((exponential_y * weights[:, None]).T @ exponential_x)
+
+    @profiler.profile_stage("image_plane_chi_squared")
+    def chi_squared_from(self, image: aa.Array2D) -> float:
+        """
+        Returns the chi-squared of the fit of the Fourier transform of a model image to the interferometer dataset,
+        computed in real space.
+
+        Parameters
+        ----------
+        image
+            The model image (e.g. the summed image of all galaxy light profiles) whose visibilities fit the data,
+            paired with the dataset's real space mask.
+        """
+        image_2d = np.zeros(self.shape[0] * self.shape[1])
+        image_2d[self.image_flat_indexes] = np.asarray(image.slim)
+        image_2d = image_2d.reshape(self.shape)
+
+        image_fft = scipy.fft.rfft2(image_2d, s=self.fft_shape)
+
+        curvature_image = scipy.fft.irfft2(
+            image_fft * self.dirty_beam_fft, s=self.fft_shape
+        )[: self.shape[0], : self.shape[1]]
+
+        chi_squared = (
+            self.data_term
+            - 2.0 * np.sum(image_2d * self.dirty_image)
+            + np.sum(image_2d * curvature_image)
+        )
+
+        if self.use_sum_term:
+            autoconvolution = scipy.fft.irfft2(image_fft**2, s=self.fft_shape)[
+                : self.sum_beam.shape[0], : self.sum_beam.shape[1]
+            ]
+
+            chi_squared += np.sum(autoconvolution * self.sum_beam)
+
+        return float(chi_squared)
+
+
+_image_plane_chi_squared_dict: Dict[int, Tuple[weakref.ref, ImagePlaneChiSquared]] = {}
+
+
+def image_plane_chi_squared_from(dataset: aa.Interferometer) -> ImagePlaneChiSquared:
+    """
+    Returns the `ImagePlaneChiSquared` of an interferometer dataset, which is computed the first time it is requested
+    and then reused for as long as the dataset exists.
+
+    This means its dirty image and dirty beam are computed once per model-fit, in the same way the w-tilde matrices
+    of an interferometer dataset used by inversions are.
+
+    Parameters
+    ----------
+    dataset
+        The interferometer dataset whose chi-squared is computed in real space.
+    """
+    key = id(dataset)
+
+    try:
+        dataset_ref, image_plane_chi_squared = _image_plane_chi_squared_dict[key]
+
+        if dataset_ref() is dataset:
+            return image_plane_chi_squared
+    except KeyError:
+        pass
+
+    image_plane_chi_squared = ImagePlaneChiSquared(dataset=dataset)
+
+    _image_plane_chi_squared_dict[key] = (
+        weakref.ref(dataset),
+        image_plane_chi_squared,
+    )
+    weakref.finalize(dataset, _image_plane_chi_squared_dict.pop, key, None)
+
+    return image_plane_chi_squared
@@ -35,6 +35,7 @@ class AnalysisInterferometer(AnalysisDataset):
         cosmology: LensingCosmology = Planck15(),
         settings_inversion: aa.SettingsInversion = None,
         title_prefix: str = None,
+        use_image_plane_chi_squared: bool = False,
     ):
         """
         Fits a galaxy model to an interferometer dataset via a non-linear search.
@@ -65,6 +66,10 @@ class AnalysisInterferometer(AnalysisDataset):
         title_prefix
             A string that is added before the title of all figures output by visualization, for example to
             put the name of the dataset and galaxy in the title.
+        use_image_plane_chi_squared
+            If `True`, the chi-squared of fits which do not perform an inversion (e.g. only parametric light profiles)
+            is computed in real space via a precomputed dirty image and dirty beam, such that the cost of the
+            log likelihood function is independent of the number of visibilities (see `FitInterferometer`).
         """
         super().__init__(
             dataset=dataset,
@@ -74,6 +79,8 @@ class AnalysisInterferometer(AnalysisDataset):
             title_prefix=title_prefix,
         )
 
+        self.use_image_plane_chi_squared = use_image_plane_chi_squared
+
     @property
     def interferometer(self):
         return self.dataset
@@ -146,7 +153,7 @@ class AnalysisInterferometer(AnalysisDataset):
         """
 
         try:
-            return self.fit_from(instance=instance).figure_of_merit
+            return self.figure_of_merit_from(instance=instance)
         except (
             PixelizationException,
             exc.PixelizationException,
@@ -163,6 +170,7 @@ class AnalysisInterferometer(AnalysisDataset):
         instance: af.ModelInstance,
         preload_overwrite: Optional[Preloads] = None,
         run_time_dict: Optional[Dict] = None,
+        total_only: bool = True,
     ) -> FitInterferometer:
         """
         Given a model instance create a `FitInterferometer` object.
@@ -179,6 +187,9 @@ class AnalysisInterferometer(AnalysisDataset):
             If a `Preload` object is input this is used instead of the preloads stored as an attribute in the analysis.
         run_time_dict
             A dictionary which times functions called to fit the model to data, for profiling.
+        total_only
+            If `False`, the fit computes its profile visibilities from the visibilities of every galaxy, which are
+            used when these are visualized (see `FitInterferometer`).
 
         Returns
         -------
@@ -200,6 +211,8 @@ class AnalysisInterferometer(AnalysisDataset):
             settings_inversion=self.settings_inversion,
             preloads=preloads,
             run_time_dict=run_time_dict,
+            total_only=total_only,
+            use_image_plane_chi_squared=self.use_image_plane_chi_squared,
         )
 
     def save_attributes(self, paths: af.DirectoryPaths):
@@ -276,8 +289,11 @@ class AnalysisInterferometer(AnalysisDataset):
         Two dictionaries, the profiling dictionary and info dictionary, which contain the profiling times of the
         `log_likelihood_function` and information on the model and dataset used to perform the profiling.
         """
+        if isinstance(paths, af.DatabasePaths):
+            return
+
         run_time_dict, info_dict = super().profile_log_likelihood_function(
-            instance=instance,
+            instance=instance
         )
 
         info_dict["number_of_visibilities"] = self.dataset.data.shape[0]
@@ -286,5 +302,6 @@ class AnalysisInterferometer(AnalysisDataset):
         self.output_profiling_info(
             paths=paths, run_time_dict=run_time_dict, info_dict=info_dict
         )
+        self.output_likelihood_profiler(instance=instance, paths=paths)
 
         return run_time_dict, info_dict
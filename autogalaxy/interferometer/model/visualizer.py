@@ -3,6 +3,7 @@ import autofit as af
 from autogalaxy.interferometer.model.plotter_interface import (
     PlotterInterfaceInterferometer,
 )
+from autogalaxy.plot.cache import plot_cache
 from autogalaxy import exc
 
 
@@ -76,33 +77,34 @@ class VisualizerInterferometer(af.Visualizer):
             If True the visualization is being performed midway through the non-linear search before it is finished,
             which may change which images are output.
         """
-        fit = analysis.fit_from(instance=instance)
+        fit = analysis.fit_from(instance=instance, total_only=False)
 
-        PlotterInterface = PlotterInterfaceInterferometer(
-            image_path=paths.image_path, title_prefix=analysis.title_prefix
-        )
-        PlotterInterface.interferometer(dataset=analysis.interferometer)
-
-        galaxies = fit.galaxies_linear_light_profiles_to_light_profiles
+        with plot_cache():
+            PlotterInterface = PlotterInterfaceInterferometer(
+                image_path=paths.image_path, title_prefix=analysis.title_prefix
+            )
+            PlotterInterface.interferometer(dataset=analysis.interferometer)
 
-        PlotterInterface.galaxies(
-            galaxies=galaxies, grid=fit.grids.lp, during_analysis=during_analysis
-        )
-        PlotterInterface.galaxies_1d(
-            galaxies=galaxies, grid=fit.grids.lp, during_analysis=during_analysis
-        )
+            galaxies = fit.galaxies_linear_light_profiles_to_light_profiles
 
-        try:
-            PlotterInterface.fit_interferometer(
-                fit=fit, during_analysis=during_analysis
+            PlotterInterface.galaxies(
+                galaxies=galaxies, grid=fit.grids.lp, during_analysis=during_analysis
+            )
+            PlotterInterface.galaxies_1d(
+                galaxies=galaxies, grid=fit.grids.lp, during_analysis=during_analysis
             )
-        except exc.InversionException:
-            pass
 
-        if fit.inversion is not None:
             try:
-                PlotterInterface.inversion(
-                    inversion=fit.inversion, during_analysis=during_analysis
+                PlotterInterface.fit_interferometer(
+                    fit=fit, during_analysis=during_analysis
                 )
-            except IndexError:
+            except exc.InversionException:
                 pass
+
+            if fit.inversion is not None:
+                try:
+                    PlotterInterface.inversion(
+                        inversion=fit.inversion, during_analysis=during_analysis
+                    )
+                except IndexError:
+                    pass
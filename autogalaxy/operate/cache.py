@@ -0,0 +1,246 @@
+import numpy as np
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from autoconf import conf
+
+
+class BoundedCache:
+    def __init__(self, max_size: int):
+        """
+        A cache of values which stores at most `max_size` values, where storing a value when the cache is full
+        removes the value which was least recently used.
+
+        This is used to store the images and deflection angles of galaxies and profiles keyed by their
+        fingerprint (see `fingerprint_from`), so that when a non-linear search samples parameters which were
+        already evaluated (e.g. a galaxy whose parameters are fixed, or a galaxy whose parameters did not change
+        between two samples) they are not recomputed.
+
+        Parameters
+        ----------
+        max_size
+            The maximum number of values stored in the cache.
+        """
+        self.max_size = max_size
+        self._value_dict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._value_dict)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._value_dict
+
+    def clear(self):
+        self._value_dict.clear()
+
+    def value_from(self, key: Hashable, func: Callable):
+        """
+        Returns the value stored in the cache for a key, which is computed via the input function and stored if it is
+        not already in the cache.
+
+        The cache can be used by multiple threads (see `autogalaxy.operate.pool`), with the value computed outside
+        the cache's lock.
+
+        Parameters
+        ----------
+        key
+            The key the value is stored under.
+        func
+            A function which computes the value.
+        """
+        with self._lock:
+            try:
+                value = self._value_dict[key]
+            except KeyError:
+                pass
+            else:
+                self._value_dict.move_to_end(key)
+                return value
+
+        value = read_only_from(value=func())
+
+        with self._lock:
+            self._value_dict[key] = value
+
+            while len(self._value_dict) > self.max_size:
+                self._value_dict.popitem(last=False)
+
+        return value
+
+
+def cache_size() -> int:
+    """
+    Returns the maximum number of images and deflection angles of galaxies stored per grid, set via
+    the `operate -> cache_size` entry of the `general.yaml` config.
+
+    If this entry is 0 (the default, or if it is not present) nothing is cached.
+    """
+    try:
+        return conf.instance["general"]["operate"]["cache_size"] or 0
+    except KeyError:
+        return 0
+
+
+_grid_cache_dict: Dict[int, Tuple[weakref.ref, BoundedCache]] = {}
+
+
+def grid_cache_from(grid) -> Optional[BoundedCache]:
+    """
+    Returns the `BoundedCache` of the values computed on a grid, which is created the first time it is requested and
+    then reused for as long as the grid exists.
+
+    The grids of a dataset are the same objects every likelihood evaluation, thus values stored for them are reused
+    by every evaluation.
+
+    If caching is disabled (see `cache_size`) `None` is returned.
+
+    Parameters
+    ----------
+    grid
+        The grid of (y,x) coordinates which the cached values are computed on.
+    """
+    max_size = cache_size()
+
+    if max_size <= 0:
+        return None
+
+    key = id(grid)
+
+    try:
+        grid_ref, cache = _grid_cache_dict[key]
+
+        if grid_ref() is grid:
+            cache.max_size = max_size
+            return cache
+    except KeyError:
+        pass
+
+    cache = BoundedCache(max_size=max_size)
+
+    _grid_cache_dict[key] = (weakref.ref(grid), cache)
+    weakref.finalize(grid, _grid_cache_dict.pop, key, None)
+
+    return cache
+
+
+def clear():
+    """
+    Clears the values cached for every grid.
+    """
+    for _, cache in _grid_cache_dict.values():
+        cache.clear()
+
+
+def fingerprint_from(obj) -> Optional[Tuple]:
+    """
+    Returns the fingerprint of an object (e.g. a light or mass profile), which is a tuple of its class and the name
+    and value of every attribute in its `__dict__` (excluding its PyAutoFit `id`).
+
+    Attributes which are objects with a `fingerprint` (e.g. the profiles of a galaxy) contribute their fingerprint
+    and tuples, lists and arrays contribute the fingerprints of their values.
+
+    Two objects have the same fingerprint if and only if they are of the same class with the same parameters,
+    therefore it is a key for values which are computed only from an object's parameters. The fingerprint is a
+    tuple rather than a hash of these values, such that two objects with different parameters can never have the
+    same key.
+
+    If an attribute does not have a fingerprint (e.g. a pixelization), `None` is returned and values computed
+    from the object are not cached.
+
+    Parameters
+    ----------
+    obj
+        The object whose fingerprint is returned.
+    """
+    try:
+        return (type(obj),) + tuple(
+            (key, _fingerprint_value_from(value=value))
+            for key, value in sorted(vars(obj).items())
+            if key != "id"
+        )
+    except TypeError:
+        return None
+
+
+def _fingerprint_value_from(value) -> Hashable:
+    if value is None or isinstance(value, (bool, int, float, complex, str, np.number)):
+        return value
+
+    if isinstance(value, (tuple, list)):
+        return tuple(_fingerprint_value_from(value=element) for element in value)
+
+    if isinstance(value, np.ndarray):
+        return value.shape, value.dtype.str, value.tobytes()
+
+    fingerprint = getattr(value, "fingerprint", None)
+
+    if fingerprint is None:
+        raise TypeError(f"An object of type {type(value)} does not have a fingerprint.")
+
+    return fingerprint
+
+
+def read_only_from(value):
+    """
+    Returns a value stored in a cache with its arrays set to read-only, such that a calculation which modifies a
+    cached value in place raises an exception instead of changing the value returned for later calls.
+
+    Parameters
+    ----------
+    value
+        The value (e.g. an `Array2D` or a tuple of arrays) which is stored in the cache.
+    """
+    if isinstance(value, tuple):
+        return tuple(read_only_from(value=element) for element in value)
+
+    array = getattr(value, "_array", value)
+
+    if isinstance(array, np.ndarray):
+        array.flags.writeable = False
+
+    return value
+
+
+def value_from(obj, grid, name: str, func: Callable, args: Tuple = ()):
+    """
+    Returns a value computed from an object (e.g. a `Galaxy`) on a grid, which is stored in the cache of the grid
+    keyed by the object's fingerprint if caching is enabled (see `cache_size`).
+
+    The key also includes the precision profiles are evaluated in and the truncation tolerance of light profiles,
+    which change the values computed from the same parameters.
+
+    If caching is disabled, or the object does not have a fingerprint, the value is computed via the input function.
+
+    Parameters
+    ----------
+    obj
+        The object whose value is computed, which has a `fingerprint` attribute.
+    grid
+        The grid of (y,x) coordinates the value is computed on.
+    name
+        The name of the quantity (e.g. `image_2d`), such that different quantities of the same object are stored
+        separately.
+    func
+        A function which computes the value.
+    args
+        Other inputs the value depends on (e.g. the `operated_only` input of an image).
+    """
+    cache = grid_cache_from(grid=grid)
+
+    if cache is None:
+        return func()
+
+    fingerprint = getattr(obj, "fingerprint", None)
+
+    if fingerprint is None:
+        return func()
+
+    from autogalaxy.profiles import precision
+    from autogalaxy.profiles.light.decorators import truncation_tolerance
+
+    key = (name, args, precision.dtype(), truncation_tolerance(), fingerprint)
+
+    return cache.value_from(key=key, func=func)
@@ -0,0 +1,149 @@
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+
+from autoconf import conf
+
+import autoarray as aa
+
+
+def default_chunk_size() -> int:
+    """
+    Returns the number of (y,x) coordinates evaluated per chunk by chunked evaluation (see `values_chunked_from`),
+    set via the `operate -> chunk_size` entry of the `general.yaml` config.
+    """
+    try:
+        return conf.instance["general"]["operate"]["chunk_size"]
+    except KeyError:
+        return 262144
+
+
+def chunk_indexes_from(
+    sub_end: np.ndarray, chunk_size: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the start and end indexes of the pixels of every chunk a grid is divided into, such that every chunk
+    contains approximately `chunk_size` (over-sampled) coordinates and at least one pixel.
+
+    Parameters
+    ----------
+    sub_end
+        The index one beyond the last (over-sampled) coordinate of every pixel, which is the cumulative sum of the
+        number of coordinates of every pixel.
+    chunk_size
+        The number of coordinates evaluated per chunk.
+    """
+    pixels = sub_end.shape[0]
+
+    boundaries = np.searchsorted(
+        sub_end, np.arange(chunk_size, sub_end[-1], chunk_size), side="right"
+    )
+
+    boundaries = np.unique(np.concatenate(([0], boundaries, [pixels])))
+
+    return boundaries[:-1], boundaries[1:]
+
+
+def values_chunked_from(
+    func: Callable,
+    grid: aa.type.Grid2DLike,
+    over_sample: bool = False,
+    out: Optional[np.ndarray] = None,
+    chunk_size: Optional[int] = None,
+    max_workers: int = 1,
+) -> np.ndarray:
+    """
+    Returns the values of a function of a grid (e.g. the image of a galaxy) evaluated in chunks of the grid's
+    (y,x) coordinates, which are written into a single output array.
+
+    Evaluating a light or mass profile allocates multiple temporary arrays the size of the grid (e.g. the
+    transformed coordinates, the elliptical radii and intermediate terms of the profile). For very large grids
+    (e.g. an unmasked grid of a 4000 x 4000 mosaic with over sampling) these can exceed the available memory. By
+    evaluating the function on chunks of `chunk_size` coordinates, the temporary arrays are the size of a chunk and
+    the only array the size of the grid is the output array.
+
+    The output array can be input, for example as a memory-mapped array (e.g. via `np.lib.format.open_memmap`)
+    such that the values are written to disk.
+
+    If `over_sample` is `True` and the grid is a `Grid2D`, the function is evaluated on the over-sampled
+    coordinates of every pixel and the values binned to the pixels (the same as the `over_sample` decorator), with
+    every chunk containing whole pixels.
+
+    Chunks can be evaluated in a pool of threads, which is faster than evaluating them sequentially because NumPy
+    releases the GIL during most array operations. Every chunk writes to a different slice of the output array.
+
+    Parameters
+    ----------
+    func
+        A function which evaluates values (e.g. an image or deflection angles) from a `Grid2DIrregular` of (y,x)
+        coordinates, returning an array of shape [total_coordinates] or [total_coordinates, 2].
+    grid
+        The 2D (y,x) coordinates where values are evaluated.
+    over_sample
+        If `True`, the values are evaluated on the over-sampled coordinates of a `Grid2D` and binned.
+    out
+        The array of shape [total_pixels] or [total_pixels, 2] the values are written to, which is created if not
+        input.
+    chunk_size
+        The number of coordinates evaluated per chunk, which is set via the `general.yaml` config if not input.
+    max_workers
+        The number of threads chunks are evaluated in.
+
+    Returns
+    -------
+        The output array containing the values of the function at every (y,x) coordinate of the grid.
+    """
+    chunk_size = chunk_size or default_chunk_size()
+
+    if over_sample and isinstance(grid, aa.Grid2D):
+        coordinates = np.asarray(grid.over_sampled)
+        sub_total = np.square(np.asarray(grid.over_sample_size)).astype("int")
+    else:
+        coordinates = np.asarray(grid)
+        sub_total = np.ones(coordinates.shape[0], dtype="int")
+
+    sub_end = np.cumsum(sub_total)
+    sub_start = sub_end - sub_total
+
+    is_over_sampled = sub_end[-1] > sub_end.shape[0]
+
+    pixel_start_list, pixel_end_list = chunk_indexes_from(
+        sub_end=sub_end, chunk_size=chunk_size
+    )
+
+    def values_from(pixel_start, pixel_end):
+        values = np.asarray(
+            func(
+                aa.Grid2DIrregular(
+                    values=coordinates[sub_start[pixel_start] : sub_end[pixel_end - 1]]
+                )
+            )
+        )
+
+        if not is_over_sampled:
+            return values
+
+        total = sub_total[pixel_start:pixel_end]
+
+        return np.add.reduceat(
+            values, sub_start[pixel_start:pixel_end] - sub_start[pixel_start], axis=0
+        ) / total.reshape(total.shape + (1,) * (values.ndim - 1))
+
+    values = values_from(pixel_start_list[0], pixel_end_list[0])
+
+    if out is None:
+        out = np.zeros((sub_end.shape[0],) + values.shape[1:], dtype=values.dtype)
+
+    out[pixel_start_list[0] : pixel_end_list[0]] = values
+
+    def chunk_from(pixel_start, pixel_end):
+        out[pixel_start:pixel_end] = values_from(pixel_start, pixel_end)
+
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(chunk_from, pixel_start_list[1:], pixel_end_list[1:]))
+    else:
+        for pixel_start, pixel_end in zip(pixel_start_list[1:], pixel_end_list[1:]):
+            chunk_from(pixel_start, pixel_end)
+
+    return out
@@ -0,0 +1,446 @@
+import numpy as np
+import scipy.fft
+import weakref
+from typing import Callable, Dict, Tuple, Union
+
+from autoconf import cached_property
+from autoconf import conf
+
+import autoarray as aa
+
+
+class ConvolverFFT:
+    def __init__(self, mask: aa.Mask2D, kernel: aa.Kernel2D):
+        """
+        Performs 2D convolution of masked images with a PSF kernel via a Fast Fourier Transform (FFT), using the
+        same API as the real-space **PyAutoArray** `Convolver` (e.g. `convolve_image`).
+
+        The cost of real-space convolution scales with the number of pixels in the mask multiplied by the number of
+        pixels in the kernel, whereas FFT convolution scales with the number of pixels in the mask's bounding box
+        (padded by the kernel) times its logarithm. FFT convolution is therefore faster for large kernels
+        (e.g. 41x41 PSFs of JWST or ground-based imaging).
+
+        Only the rectangular region of the image containing the mask, padded by half the kernel's shape on every
+        side such that it contains all pixels which blur light into the mask, is Fourier transformed. This region is
+        zero padded to a shape whose FFT is fast (see `scipy.fft.next_fast_len`) and large enough that the FFT's
+        circular convolution does not wrap light around the region's edges.
+
+        The FFT of the zero-padded kernel is computed once and stored, such that every convolution performs one
+        forward and one inverse FFT of the image.
+
+        The convolver does not store the mask and kernel objects, so that it can be cached for as long as they
+        exist (see `convolver_fft_from`).
+
+        Parameters
+        ----------
+        mask
+            The 2D mask of the images which are convolved, where `False` entries are unmasked.
+        kernel
+            The 2D PSF kernel the images are convolved with, which must have odd dimensions.
+        """
+        if kernel.shape_native[0] % 2 == 0 or kernel.shape_native[1] % 2 == 0:
+            raise aa.exc.KernelException("Kernel2D Kernel2D must be odd")
+
+        self.kernel_shape_native = kernel.shape_native
+        self.mask_2d = np.array(mask)
+
+        half_shape = (kernel.shape_native[0] // 2, kernel.shape_native[1] // 2)
+
+        image_indexes = np.argwhere(~self.mask_2d)
+
+        self.region_start = np.maximum(np.min(image_indexes, axis=0) - half_shape, 0)
+        region_end = np.minimum(
+            np.max(image_indexes, axis=0) + half_shape + 1, self.mask_2d.shape
+        )
+
+        self.fft_shape = tuple(
+            scipy.fft.next_fast_len(int(size), real=True)
+            for size in region_end - self.region_start + kernel.shape_native - 1
+        )
+
+        self.image_flat_indexes = self.flat_indexes_from(indexes=image_indexes)
+
+        self.convolved_flat_indexes = self.flat_indexes_from(
+            indexes=image_indexes + half_shape
+        )
+
+        self.kernel_fft = scipy.fft.rfft2(np.asarray(kernel.native), s=self.fft_shape)
+
+    def flat_indexes_from(self, indexes: np.ndarray) -> np.ndarray:
+        """
+        Returns the indexes of native 2D (y,x) pixel indexes of the mask in the flattened array which is Fourier
+        transformed.
+
+        Parameters
+        ----------
+        indexes
+            The native 2D (y,x) pixel indexes, of shape [total_pixels, 2].
+        """
+        indexes = indexes - self.region_start
+
+        return indexes[:, 0] * self.fft_shape[1] + indexes[:, 1]
+
+    @cached_property
+    def blurring_flat_indexes(self) -> np.ndarray:
+        """
+        The indexes of the blurring mask's pixels (pixels outside the mask whose light is blurred into it) in the
+        flattened array which is Fourier transformed.
+
+        This is only computed if an image is convolved with a blurring image, as masks which extend to the edge of
+        the image (e.g. the padded masks used for unmasked convolution) do not have a blurring mask.
+        """
+        blurring_mask = aa.util.mask_2d.blurring_mask_2d_from(
+            mask_2d=self.mask_2d,
+            kernel_shape_native=self.kernel_shape_native,
+        )
+
+        return self.flat_indexes_from(indexes=np.argwhere(~blurring_mask))
+
+    def convolved_flat_from(self, array_flat: np.ndarray) -> np.ndarray:
+        """
+        Convolves the flattened array which is Fourier transformed with the kernel, returning the values of the
+        convolved array in the mask.
+
+        The array may have additional dimensions after its first (e.g. the columns of a mapping matrix), in which
+        case every column is convolved by a single batched FFT.
+
+        Parameters
+        ----------
+        array_flat
+            The array which is convolved, of shape [fft_shape[0] * fft_shape[1], ...].
+        """
+        array_2d = array_flat.reshape(self.fft_shape + array_flat.shape[1:])
+
+        kernel_fft = self.kernel_fft.reshape(
+            self.kernel_fft.shape + (1,) * (array_flat.ndim - 1)
+        )
+
+        convolved_2d = scipy.fft.irfft2(
+            scipy.fft.rfft2(array_2d, axes=(0, 1)) * kernel_fft,
+            s=self.fft_shape,
+            axes=(0, 1),
+        )
+
+        return convolved_2d.reshape(array_flat.shape)[self.convolved_flat_indexes]
+
+    def convolved_image_from(
+        self, image: np.ndarray, blurring_image: np.ndarray
+    ) -> np.ndarray:
+        """
+        For a given 1D array and blurring array, convolve the two using this convolver, returning the convolved
+        image as a 1D ndarray which is not wrapped in an `Array2D`.
+
+        Parameters
+        ----------
+        image
+            1D array of the values which are to be blurred with the convolver's PSF.
+        blurring_image
+            1D array of the blurring values which blur into the array after PSF convolution.
+        """
+        array_flat = np.zeros(self.fft_shape[0] * self.fft_shape[1])
+
+        array_flat[self.image_flat_indexes] = image
+        array_flat[self.blurring_flat_indexes] = blurring_image
+
+        return self.convolved_flat_from(array_flat=array_flat)
+
+    def convolve_image(
+        self, image: aa.Array2D, blurring_image: aa.Array2D
+    ) -> aa.Array2D:
+        """
+        For a given 1D array and blurring array, convolve the two using this convolver.
+
+        Parameters
+        ----------
+        image
+            1D array of the values which are to be blurred with the convolver's PSF.
+        blurring_image
+            1D array of the blurring values which blur into the array after PSF convolution.
+        """
+        return aa.Array2D(
+            values=self.convolved_image_from(
+                image=np.asarray(image.slim),
+                blurring_image=np.asarray(blurring_image.slim),
+            ),
+            mask=image.mask,
+        )
+
+    def convolve_image_no_blurring(self, image: aa.Array2D) -> aa.Array2D:
+        """
+        For a given 1D array, convolve it using this convolver, where light outside the mask is not blurred into
+        the mask.
+
+        Parameters
+        ----------
+        image
+            1D array of the values which are to be blurred with the convolver's PSF.
+        """
+        array_flat = np.zeros(self.fft_shape[0] * self.fft_shape[1])
+
+        array_flat[self.image_flat_indexes] = np.asarray(image.slim)
+
+        return aa.Array2D(
+            values=self.convolved_flat_from(array_flat=array_flat), mask=image.mask
+        )
+
+    def convolve_mapping_matrix(self, mapping_matrix: np.ndarray) -> np.ndarray:
+        """
+        For a given inversion mapping matrix, convolve every column with the PSF kernel, using a single batched FFT
+        of all columns.
+
+        Parameters
+        ----------
+        mapping_matrix
+            The mapping matrix of shape [total_mask_pixels, total_columns].
+        """
+        array_flat = np.zeros(
+            (self.fft_shape[0] * self.fft_shape[1], mapping_matrix.shape[1])
+        )
+
+        array_flat[self.image_flat_indexes] = mapping_matrix
+
+        return self.convolved_flat_from(array_flat=array_flat)
+
+
+_mask_kernel_dict: Dict[
+    Tuple[int, int], Tuple[weakref.ref, weakref.ref, Dict[str, object]]
+] = {}
+
+
+def mask_kernel_value_from(
+    mask: aa.Mask2D, kernel: aa.Kernel2D, name: str, func: Callable
+) -> object:
+    """
+    Returns a value which only depends on a mask and kernel (e.g. their `ConvolverFFT`), which is computed by `func`
+    the first time it is requested and then reused for as long as the mask and kernel exist.
+
+    The mask and kernel of a dataset are the same objects every likelihood evaluation, thus these values are only
+    computed once per dataset.
+
+    Parameters
+    ----------
+    mask
+        The 2D mask of the images which are convolved.
+    kernel
+        The 2D PSF kernel the images are convolved with.
+    name
+        The name of the value (e.g. `convolver_fft`).
+    func
+        The function which computes the value.
+    """
+    key = (id(mask), id(kernel))
+
+    try:
+        mask_ref, kernel_ref, value_dict = _mask_kernel_dict[key]
+
+        if mask_ref() is not mask or kernel_ref() is not kernel:
+            raise KeyError(key)
+    except KeyError:
+        value_dict = {}
+
+        _mask_kernel_dict[key] = (weakref.ref(mask), weakref.ref(kernel), value_dict)
+        weakref.finalize(mask, _mask_kernel_dict.pop, key, None)
+        weakref.finalize(kernel, _mask_kernel_dict.pop, key, None)
+
+    try:
+        return value_dict[name]
+    except KeyError:
+        value = func()
+        value_dict[name] = value
+        return value
+
+
+def convolver_fft_from(mask: aa.Mask2D, kernel: aa.Kernel2D) -> ConvolverFFT:
+    """
+    Returns the `ConvolverFFT` of a mask and kernel, which is created the first time it is requested and then reused
+    for as long as the mask and kernel exist (see `mask_kernel_value_from`).
+
+    Parameters
+    ----------
+    mask
+        The 2D mask of the images which are convolved.
+    kernel
+        The 2D PSF kernel the images are convolved with.
+    """
+    return mask_kernel_value_from(
+        mask=mask,
+        kernel=kernel,
+        name="convolver_fft",
+        func=lambda: ConvolverFFT(mask=mask, kernel=kernel),
+    )
+
+
+def convolution_method() -> str:
+    """
+    Returns the method used to convolve images with a PSF, set via the `psf -> convolution` entry of the
+    `general.yaml` config, which is `real_space`, `fft` or `auto` (the default).
+    """
+    try:
+        return conf.instance["general"]["psf"]["convolution"]
+    except KeyError:
+        return "auto"
+
+
+def use_fft_from(mask: aa.Mask2D, kernel: aa.Kernel2D) -> bool:
+    """
+    Returns whether images in a mask are convolved with a kernel via an FFT, as opposed to real-space convolution.
+
+    If the `psf -> convolution` config entry is `auto`, the estimated costs of the two methods are compared:
+
+    - Real-space convolution sums the kernel over every pixel in the mask and its blurring region, which scales
+      as `total_pixels * total_kernel_pixels`.
+
+    - FFT convolution performs a forward and inverse FFT of the padded bounding box of the mask, which scales
+      as `fft_pixels * log2(fft_pixels)`, with a larger constant than real-space convolution.
+
+    The comparison is computed once per mask and kernel (see `mask_kernel_value_from`), as it is requested every
+    likelihood evaluation.
+
+    Parameters
+    ----------
+    mask
+        The 2D mask of the images which are convolved.
+    kernel
+        The 2D PSF kernel the images are convolved with.
+    """
+    method = convolution_method()
+
+    if method != "auto":
+        return method == "fft"
+
+    return mask_kernel_value_from(
+        mask=mask,
+        kernel=kernel,
+        name="use_fft",
+        func=lambda: fft_faster_from(mask=mask, kernel=kernel),
+    )
+
+
+def fft_faster_from(mask: aa.Mask2D, kernel: aa.Kernel2D) -> bool:
+    """
+    Returns whether the estimated cost of convolving images in a mask with a kernel via an FFT is lower than
+    real-space convolution (see `use_fft_from`).
+
+    Parameters
+    ----------
+    mask
+        The 2D mask of the images which are convolved.
+    kernel
+        The 2D PSF kernel the images are convolved with.
+    """
+    mask_2d = np.asarray(mask)
+
+    image_indexes = np.argwhere(~mask_2d)
+
+    if image_indexes.shape[0] == 0:
+        return False
+
+    fft_pixels = np.prod(
+        np.ptp(image_indexes, axis=0) + 2 * np.asarray(kernel.shape_native)
+    )
+
+    real_space_cost = (
+        image_indexes.shape[0] * kernel.shape_native[0] * kernel.shape_native[1]
+    )
+    fft_cost = 4.0 * fft_pixels * np.log2(fft_pixels)
+
+    return fft_cost < real_space_cost
+
+
+def convolver_from(dataset) -> Union[aa.Convolver, ConvolverFFT]:
+    """
+    Returns the convolver used to convolve images with the PSF of an imaging dataset, which is either the
+    dataset's real-space `Convolver` or a `ConvolverFFT` depending on which is estimated to be faster
+    (see `use_fft_from`).
+
+    If the dataset does not have a mask and PSF (e.g. it is a `DatasetInterface` which only has a convolver), its
+    convolver is returned.
+
+    Parameters
+    ----------
+    dataset
+        The imaging dataset whose PSF images are convolved with.
+    """
+    try:
+        mask, kernel = dataset.mask, dataset.psf
+    except AttributeError:
+        return dataset.convolver
+
+    if kernel is None or not use_fft_from(mask=mask, kernel=kernel):
+        return dataset.convolver
+
+    return convolver_fft_from(mask=mask, kernel=kernel)
+
+
+def convolved_image_from(
+    convolver: Union[aa.Convolver, ConvolverFFT],
+    image: np.ndarray,
+    blurring_image: np.ndarray,
+) -> np.ndarray:
+    """
+    Returns an image and blurring image convolved with a real-space `Convolver` or a `ConvolverFFT`, as a 1D ndarray
+    which is not wrapped in an `Array2D`.
+
+    This is used by the log likelihood function of an imaging fit (see
+    `autogalaxy.imaging.log_likelihood_buffers`), which only requires the values of the convolved image and not a
+    structure with a mask.
+
+    Parameters
+    ----------
+    convolver
+        The convolver which convolves the image with the PSF (see `convolver_from`).
+    image
+        1D array of the values which are to be blurred with the convolver's PSF.
+    blurring_image
+        1D array of the blurring values which blur into the array after PSF convolution.
+    """
+    if isinstance(convolver, ConvolverFFT):
+        return convolver.convolved_image_from(
+            image=image, blurring_image=blurring_image
+        )
+
+    return convolver.convolve_jit(
+        image_1d_array=image,
+        image_frame_1d_indexes=convolver.image_frame_1d_indexes,
+        image_frame_1d_kernels=convolver.image_frame_1d_kernels,
+        image_frame_1d_lengths=convolver.image_frame_1d_lengths,
+        blurring_1d_array=blurring_image,
+        blurring_frame_1d_indexes=convolver.blurring_frame_1d_indexes,
+        blurring_frame_1d_kernels=convolver.blurring_frame_1d_kernels,
+        blurring_frame_1d_lengths=convolver.blurring_frame_1d_lengths,
+    )
+
+
+def unmasked_blurred_array_from(
+    padded_array: aa.Array2D,
+    psf: aa.Kernel2D,
+    image_shape: Tuple[int, int],
+) -> aa.Array2D:
+    """
+    For a padded grid and psf, compute an unmasked blurred image from an unmasked unblurred image, which is
+    trimmed to the input image shape.
+
+    This uses FFT convolution if it is estimated to be faster (see `use_fft_from`) and the real-space convolution
+    of the padded mask's `unmasked_blurred_array_from` method otherwise.
+
+    Parameters
+    ----------
+    padded_array
+        The unmasked image evaluated on a padded grid, which is blurred.
+    psf
+        The PSF of the image used for convolution.
+    image_shape
+        The 2D shape of the image the blurred array is trimmed to.
+    """
+    mask = padded_array.mask
+
+    if not use_fft_from(mask=mask, kernel=psf):
+        return mask.unmasked_blurred_array_from(
+            padded_array=padded_array, psf=psf, image_shape=image_shape
+        )
+
+    blurred_array = convolver_fft_from(
+        mask=mask, kernel=psf
+    ).convolve_image_no_blurring(image=padded_array)
+
+    return mask.trimmed_array_from(padded_array=blurred_array, image_shape=image_shape)
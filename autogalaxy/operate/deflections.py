@@ -1,12 +1,14 @@
 from functools import wraps
 import logging
 import numpy as np
-from typing import List, Tuple, Union
+from typing import List, Optional, Tuple, Union
 
 from autoconf import conf
 
 import autoarray as aa
 
+from autogalaxy.operate import cache
+from autogalaxy.operate import chunk
 from autogalaxy.util.shear_field import ShearYX2D
 from autogalaxy.util.shear_field import ShearYX2DIrregular
 
@@ -110,6 +112,94 @@ class OperateDeflections:
     def __eq__(self, other):
         return self.__dict__ == other.__dict__ and self.__class__ is other.__class__
 
+    def deflections_yx_2d_via_cache_from(self, grid: aa.type.Grid2DLike):
+        """
+        Returns the 2D deflection angles of the mass object via its `deflections_yx_2d_from` function, which are
+        stored in the cache of the grid keyed by the mass object's fingerprint and reused if the same deflection
+        angles are requested again (e.g. for a galaxy whose parameters are fixed in a model-fit).
+
+        Caching is enabled via the `operate -> cache_size` entry of the `general.yaml` config (see
+        `autogalaxy.operate.cache`). Cached deflection angles are read-only.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y,x) coordinates where values of the deflection angles are evaluated.
+        """
+        return cache.value_from(
+            obj=self,
+            grid=grid,
+            name="deflections_yx_2d",
+            func=lambda: self.deflections_yx_2d_from(grid=grid),
+        )
+
+    def deflections_yx_2d_chunked_from(
+        self,
+        grid: aa.type.Grid2DLike,
+        out: Optional[np.ndarray] = None,
+        chunk_size: Optional[int] = None,
+        max_workers: int = 1,
+    ) -> np.ndarray:
+        """
+        Returns the 2D deflection angles of the mass object evaluated in chunks of the input grid's (y,x)
+        coordinates, such that the memory used for temporary arrays is bounded by the chunk size rather than the
+        size of the grid (see `autogalaxy.operate.chunk.values_chunked_from`).
+
+        The deflection angles are returned as an ndarray of shape [total_coordinates, 2] (or written to the
+        input `out` array, which may be memory-mapped), with no mask or other data structure.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y,x) coordinates where values of the deflection angles are evaluated.
+        out
+            The array of shape [total_coordinates, 2] the deflection angles are written to, which is created if not
+            input.
+        chunk_size
+            The number of coordinates evaluated per chunk, which is set via the `operate -> chunk_size` entry of
+            the `general.yaml` config if not input.
+        max_workers
+            The number of threads chunks are evaluated in.
+        """
+        return chunk.values_chunked_from(
+            func=lambda grid_chunk: self.deflections_yx_2d_from(grid=grid_chunk),
+            grid=grid,
+            out=out,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+        )
+
+    def potential_2d_chunked_from(
+        self,
+        grid: aa.type.Grid2DLike,
+        out: Optional[np.ndarray] = None,
+        chunk_size: Optional[int] = None,
+        max_workers: int = 1,
+    ) -> np.ndarray:
+        """
+        Returns the 2D lensing potential of the mass object evaluated in chunks of the input grid's (y,x)
+        coordinates, in the same way as `deflections_yx_2d_chunked_from`.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y,x) coordinates where values of the potential are evaluated.
+        out
+            The array of shape [total_coordinates] the potential is written to, which is created if not input.
+        chunk_size
+            The number of coordinates evaluated per chunk, which is set via the `operate -> chunk_size` entry of
+            the `general.yaml` config if not input.
+        max_workers
+            The number of threads chunks are evaluated in.
+        """
+        return chunk.values_chunked_from(
+            func=lambda grid_chunk: self.potential_2d_from(grid=grid_chunk),
+            grid=grid,
+            out=out,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+        )
+
     @precompute_jacobian
     def tangential_eigen_value_from(self, grid, jacobian=None) -> aa.Array2D:
         """
@@ -1,12 +1,17 @@
 from __future__ import annotations
 import numpy as np
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from autogalaxy.galaxy.galaxy import Galaxy
 
 import autoarray as aa
 
+from autogalaxy.operate import cache
+from autogalaxy.operate import chunk
+from autogalaxy.operate import convolver as convolver_util
+from autogalaxy.operate import transformer as transformer_util
+from autogalaxy.util import profiler
 from autogalaxy import exc
 
 
@@ -29,7 +34,119 @@ class OperateImage:
     def has(self, cls) -> bool:
         raise NotImplementedError
 
+    def image_2d_split_from(self, grid: aa.Grid2D) -> Tuple[aa.Array2D, aa.Array2D]:
+        """
+        Returns the 2D image of the light object split into two images: the image of all light profiles which are
+        not already operated on (e.g. which require PSF convolution) and the image of all light profiles which are
+        already operated on (e.g. `LightProfileOperated` objects).
+
+        By default this calls the `image_2d_from` function twice, with `operated_only=False` and `operated_only=True`.
+        Light objects (e.g. a `LightProfile`, `Galaxy`) override this function to evaluate each light profile once
+        and fill both images in a single pass over their light profiles.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y,x) coordinates of the (masked) grid, in its original geometric reference frame.
+        """
+        return (
+            self.image_2d_from(grid=grid, operated_only=False),
+            self.image_2d_from(grid=grid, operated_only=True),
+        )
+
+    def image_2d_via_cache_from(
+        self, grid: aa.type.Grid2DLike, operated_only: Optional[bool] = None
+    ) -> aa.Array2D:
+        """
+        Returns the 2D image of the light object via its `image_2d_from` function, which is stored in the cache of
+        the grid keyed by the light object's fingerprint and reused if the same image is requested again (e.g. for a
+        galaxy whose parameters are fixed in a model-fit).
+
+        Caching is enabled via the `operate -> cache_size` entry of the `general.yaml` config (see
+        `autogalaxy.operate.cache`). Cached images are read-only.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y,x) coordinates where values of the image are evaluated.
+        operated_only
+            Passed to the `image_2d_from` function, see `image_2d_from`.
+        """
+        return cache.value_from(
+            obj=self,
+            grid=grid,
+            name="image_2d",
+            args=(operated_only,),
+            func=lambda: self.image_2d_from(grid=grid, operated_only=operated_only),
+        )
+
+    def image_2d_split_via_cache_from(
+        self, grid: aa.Grid2D
+    ) -> Tuple[aa.Array2D, aa.Array2D]:
+        """
+        Returns the 2D image of the light object split into the images of light profiles which are not and are
+        already operated on via its `image_2d_split_from` function, which is cached in the same way as
+        `image_2d_via_cache_from`.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y,x) coordinates where values of the image are evaluated.
+        """
+        return cache.value_from(
+            obj=self,
+            grid=grid,
+            name="image_2d_split",
+            func=lambda: self.image_2d_split_from(grid=grid),
+        )
+
+    def image_2d_chunked_from(
+        self,
+        grid: aa.type.Grid2DLike,
+        operated_only: Optional[bool] = None,
+        out: Optional[np.ndarray] = None,
+        chunk_size: Optional[int] = None,
+        max_workers: int = 1,
+    ) -> np.ndarray:
+        """
+        Returns the 2D image of the light object evaluated in chunks of the input grid's (y,x) coordinates, such that
+        the memory used for temporary arrays is bounded by the chunk size rather than the size of the grid (see
+        `autogalaxy.operate.chunk.values_chunked_from`).
+
+        This is used for very large grids (e.g. an unmasked grid of a large mosaic with over sampling), where
+        evaluating `image_2d_from` on the whole grid can exhaust memory. If the grid is a `Grid2D`, the image is
+        evaluated on its over-sampled coordinates and binned, the same as `image_2d_from`.
+
+        The image is returned as a slim ndarray (or written to the input `out` array, which may be memory-mapped),
+        with no mask or other data structure.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y,x) coordinates where values of the image are evaluated.
+        operated_only
+            Passed to the `image_2d_from` function, see `image_2d_from`.
+        out
+            The array of shape [total_pixels] the image is written to, which is created if not input.
+        chunk_size
+            The number of (over-sampled) coordinates evaluated per chunk, which is set via the
+            `operate -> chunk_size` entry of the `general.yaml` config if not input.
+        max_workers
+            The number of threads chunks are evaluated in.
+        """
+        return chunk.values_chunked_from(
+            func=lambda grid_chunk: self.image_2d_from(
+                grid=grid_chunk, operated_only=operated_only
+            ),
+            grid=grid,
+            over_sample=True,
+            out=out,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+        )
+
     @aa.profile_func
+    @profiler.profile_stage("convolution")
     def _blurred_image_2d_from(
         self,
         image_2d: aa.Array2D,
@@ -38,20 +155,24 @@ class OperateImage:
         convolver: aa.Convolver,
     ) -> aa.Array2D:
         if psf is not None:
-            return psf.convolved_array_with_mask_from(
-                array=image_2d.native + blurring_image_2d.native,
-                mask=image_2d.mask,
+            if not convolver_util.use_fft_from(mask=image_2d.mask, kernel=psf):
+                return psf.convolved_array_with_mask_from(
+                    array=image_2d.native + blurring_image_2d.native,
+                    mask=image_2d.mask,
+                )
+
+            convolver = convolver_util.convolver_fft_from(
+                mask=image_2d.mask, kernel=psf
             )
 
-        elif convolver is not None:
+        if convolver is not None:
             return convolver.convolve_image(
                 image=image_2d, blurring_image=blurring_image_2d
             )
 
-        else:
-            raise exc.OperateException(
-                "A PSF or Convolver was not passed to the `blurred_image_2d_list_from()` function."
-            )
+        raise exc.OperateException(
+            "A PSF or Convolver was not passed to the `blurred_image_2d_list_from()` function."
+        )
 
     def blurred_image_2d_from(
         self,
@@ -83,7 +204,7 @@ class OperateImage:
             LightProfileOperated,
         )
 
-        image_2d_not_operated = self.image_2d_from(grid=grid, operated_only=False)
+        image_2d_not_operated, image_2d_operated = self.image_2d_split_from(grid=grid)
         blurring_image_2d_not_operated = self.image_2d_from(
             grid=blurring_grid, operated_only=False
         )
@@ -96,7 +217,6 @@ class OperateImage:
         )
 
         if self.has(cls=LightProfileOperated):
-            image_2d_operated = self.image_2d_from(grid=grid, operated_only=True)
             return blurred_image_2d + image_2d_operated
 
         return blurred_image_2d
@@ -149,22 +269,52 @@ class OperateImage:
         """
         padded_grid = grid.padded_grid_from(kernel_shape_native=psf.shape_native)
 
-        padded_image_2d_not_operated = self.image_2d_from(
-            grid=padded_grid, operated_only=False
+        padded_image_2d_not_operated, padded_image_2d_operated = (
+            self.image_2d_split_from(grid=padded_grid)
         )
 
-        padded_image_2d = padded_grid.mask.unmasked_blurred_array_from(
-            padded_array=padded_image_2d_not_operated,
+        return self.unmasked_blurred_image_2d_via_padded_from(
+            padded_image_2d_not_operated=padded_image_2d_not_operated,
+            padded_image_2d_operated=padded_image_2d_operated,
             psf=psf,
             image_shape=grid.mask.shape,
         )
 
-        padded_image_2d_operated = self.image_2d_from(
-            grid=padded_grid, operated_only=True
+    @staticmethod
+    def unmasked_blurred_image_2d_via_padded_from(
+        padded_image_2d_not_operated: aa.Array2D,
+        padded_image_2d_operated: aa.Array2D,
+        psf: aa.Kernel2D,
+        image_shape: Tuple[int, int],
+    ) -> aa.Array2D:
+        """
+        Returns an unmasked blurred image from the images of a light object already evaluated on a padded grid,
+        where the image of light profiles which are not already operated on is convolved with the PSF and the image
+        of light profiles which are (e.g. `LightProfileOperated` objects) is not. Both images are trimmed to the
+        input image shape.
+
+        This allows the padded images to be evaluated once and reused, for example by a fit which computes both the
+        unmasked blurred image of all galaxies and that of every individual galaxy for visualization.
+
+        Parameters
+        ----------
+        padded_image_2d_not_operated
+            The image of light profiles which are not already operated on, evaluated on the padded grid.
+        padded_image_2d_operated
+            The image of light profiles which are already operated on, evaluated on the padded grid.
+        psf
+            The PSF the light object 2D image is convolved with.
+        image_shape
+            The 2D shape of the (unpadded) grid the blurred image is trimmed to.
+        """
+        padded_image_2d = convolver_util.unmasked_blurred_array_from(
+            padded_array=padded_image_2d_not_operated,
+            psf=psf,
+            image_shape=image_shape,
         )
 
-        padded_image_2d_operated = padded_grid.mask.trimmed_array_from(
-            padded_array=padded_image_2d_operated, image_shape=grid.mask.shape
+        padded_image_2d_operated = padded_image_2d_operated.mask.trimmed_array_from(
+            padded_array=padded_image_2d_operated, image_shape=image_shape
         )
 
         return padded_image_2d + padded_image_2d_operated
@@ -203,7 +353,8 @@ class OperateImage:
                 shape_slim=(transformer.uv_wavelengths.shape[0],)
             )
 
-        return transformer.visibilities_from(image=image_2d)
+        with profiler.profile_block("fourier_transform"):
+            return transformer.visibilities_from(image=image_2d)
 
 
 class OperateImageList(OperateImage):
@@ -220,6 +371,28 @@ class OperateImageList(OperateImage):
     def image_2d_list_from(self, grid: aa.Grid2D, operated_only: Optional[bool] = None):
         raise NotImplementedError
 
+    def image_2d_split_list_from(
+        self, grid: aa.Grid2D
+    ) -> Tuple[List[aa.Array2D], List[aa.Array2D]]:
+        """
+        Returns the list of 2D images of the light object split into two lists: the images of light profiles which
+        are not already operated on (e.g. which require PSF convolution) and the images of light profiles which are
+        already operated on (e.g. `LightProfileOperated` objects).
+
+        By default this calls the `image_2d_list_from` function twice, with `operated_only=False`
+        and `operated_only=True`. Light objects (e.g. a `Galaxy`) override this function to evaluate each light
+        profile once and fill both lists in a single pass over their light profiles.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y,x) coordinates of the (masked) grid, in its original geometric reference frame.
+        """
+        return (
+            self.image_2d_list_from(grid=grid, operated_only=False),
+            self.image_2d_list_from(grid=grid, operated_only=True),
+        )
+
     def blurred_image_2d_list_from(
         self,
         grid: aa.Grid2D,
@@ -248,10 +421,8 @@ class OperateImageList(OperateImage):
             The 2D (y,x) coordinates neighboring the (masked) grid whose light is blurred into the image.
         """
 
-        image_2d_operated_list = self.image_2d_list_from(grid=grid, operated_only=True)
-
-        image_2d_not_operated_list = self.image_2d_list_from(
-            grid=grid, operated_only=False
+        image_2d_not_operated_list, image_2d_operated_list = (
+            self.image_2d_split_list_from(grid=grid)
         )
         blurring_image_2d_not_operated_list = self.image_2d_list_from(
             grid=blurring_grid, operated_only=False
@@ -263,6 +434,14 @@ class OperateImageList(OperateImage):
             image_2d_not_operated = image_2d_not_operated_list[i]
             blurring_image_2d_not_operated = blurring_image_2d_not_operated_list[i]
 
+            image_2d_operated = image_2d_operated_list[i]
+
+            if not np.any(image_2d_not_operated) and not np.any(
+                blurring_image_2d_not_operated
+            ):
+                blurred_image_2d_list.append(image_2d_operated)
+                continue
+
             blurred_image_2d = self._blurred_image_2d_from(
                 image_2d=image_2d_not_operated,
                 blurring_image_2d=blurring_image_2d_not_operated,
@@ -270,8 +449,6 @@ class OperateImageList(OperateImage):
                 convolver=convolver,
             )
 
-            image_2d_operated = image_2d_operated_list[i]
-
             blurred_image_2d_list.append(image_2d_operated + blurred_image_2d)
 
         return blurred_image_2d_list
@@ -302,18 +479,53 @@ class OperateImageList(OperateImage):
         """
         padded_grid = grid.padded_grid_from(kernel_shape_native=psf.shape_native)
 
-        padded_image_1d_list = self.image_2d_list_from(grid=padded_grid)
+        padded_image_2d_not_operated_list, padded_image_2d_operated_list = (
+            self.image_2d_split_list_from(grid=padded_grid)
+        )
 
-        unmasked_blurred_image_list = []
+        return self.unmasked_blurred_image_2d_list_via_padded_from(
+            padded_image_2d_not_operated_list=padded_image_2d_not_operated_list,
+            padded_image_2d_operated_list=padded_image_2d_operated_list,
+            psf=psf,
+            image_shape=grid.mask.shape,
+        )
 
-        for padded_image_1d in padded_image_1d_list:
-            unmasked_blurred_array_2d = padded_grid.mask.unmasked_blurred_array_from(
-                padded_array=padded_image_1d, psf=psf, image_shape=grid.mask.shape
-            )
+    @staticmethod
+    def unmasked_blurred_image_2d_list_via_padded_from(
+        padded_image_2d_not_operated_list: List[aa.Array2D],
+        padded_image_2d_operated_list: List[aa.Array2D],
+        psf: aa.Kernel2D,
+        image_shape: Tuple[int, int],
+    ) -> List[aa.Array2D]:
+        """
+        Returns the list of unmasked blurred images from the images of a light object already evaluated on a padded
+        grid, where every image is trimmed to the input image shape.
 
-            unmasked_blurred_image_list.append(unmasked_blurred_array_2d)
+        Unlike `unmasked_blurred_image_2d_via_padded_from`, the image of light profiles which are already operated on
+        (e.g. `LightProfileOperated` objects) is convolved with the PSF alongside the image of light profiles which
+        are not, such that every entry is the blurred image of all light profiles of that entry.
 
-        return unmasked_blurred_image_list
+        Parameters
+        ----------
+        padded_image_2d_not_operated_list
+            The images of light profiles which are not already operated on, evaluated on the padded grid.
+        padded_image_2d_operated_list
+            The images of light profiles which are already operated on, evaluated on the padded grid.
+        psf
+            The PSF the light object 2D images are convolved with.
+        image_shape
+            The 2D shape of the (unpadded) grid the blurred images are trimmed to.
+        """
+        return [
+            convolver_util.unmasked_blurred_array_from(
+                padded_array=padded_image_2d_not_operated + padded_image_2d_operated,
+                psf=psf,
+                image_shape=image_shape,
+            )
+            for padded_image_2d_not_operated, padded_image_2d_operated in zip(
+                padded_image_2d_not_operated_list, padded_image_2d_operated_list
+            )
+        ]
 
     def visibilities_list_from(
         self, grid: aa.Grid2D, transformer: aa.type.Transformer
@@ -333,6 +545,9 @@ class OperateImageList(OperateImage):
         `Galaxy` object with only mass profiles) the Fourier transformed is skipped for efficiency and a `Visibilities`
         object with all zeros is returned.
 
+        All images are Fourier transformed together via a single batched transform
+        (see `operate.transformer.visibilities_list_via_batch_from`).
+
         Parameters
         ----------
         grid
@@ -341,21 +556,9 @@ class OperateImageList(OperateImage):
             The **PyAutoArray** `Transformer` object describing how the 2D image is Fourier transformed to visiblities
             in the uv-plane.
         """
-        image_2d_list = self.image_2d_list_from(grid=grid)
-
-        visibilities_list = []
-
-        for image_2d in image_2d_list:
-            if not np.any(image_2d):
-                visibilities = aa.Visibilities.zeros(
-                    shape_slim=(transformer.uv_wavelengths.shape[0],)
-                )
-            else:
-                visibilities = transformer.visibilities_from(image=image_2d)
-
-            visibilities_list.append(visibilities)
-
-        return visibilities_list
+        return transformer_util.visibilities_list_via_batch_from(
+            image_2d_list=self.image_2d_list_from(grid=grid), transformer=transformer
+        )
 
 
 class OperateImageGalaxies(OperateImageList):
@@ -449,6 +652,9 @@ class OperateImageGalaxies(OperateImageList):
         `Galaxy` object with only mass profiles) the Fourier transformed is skipped for efficiency and a `Visibilities`
         object with all zeros is returned.
 
+        The images of all galaxies are Fourier transformed together via a single batched transform
+        (see `operate.transformer.visibilities_list_via_batch_from`).
+
         Parameters
         ----------
         grid
@@ -460,19 +666,8 @@ class OperateImageGalaxies(OperateImageList):
 
         galaxy_image_2d_dict = self.galaxy_image_2d_dict_from(grid=grid)
 
-        galaxy_visibilities_dict = {}
-
-        for galaxy_key in galaxy_image_2d_dict.keys():
-            image_2d = galaxy_image_2d_dict[galaxy_key]
-
-            if not np.any(image_2d):
-                visibilities = aa.Visibilities.zeros(
-                    shape_slim=(transformer.uv_wavelengths.shape[0],)
-                )
-
-            else:
-                visibilities = transformer.visibilities_from(image=image_2d)
-
-            galaxy_visibilities_dict[galaxy_key] = visibilities
+        visibilities_list = transformer_util.visibilities_list_via_batch_from(
+            image_2d_list=list(galaxy_image_2d_dict.values()), transformer=transformer
+        )
 
-        return galaxy_visibilities_dict
+        return dict(zip(galaxy_image_2d_dict.keys(), visibilities_list))
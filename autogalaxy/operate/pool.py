@@ -0,0 +1,106 @@
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional, Sequence
+
+from autoconf import conf
+
+from autogalaxy.util import profiler
+
+
+def pool_size() -> int:
+    """
+    Returns the number of threads galaxies and their light and mass profiles are evaluated in, set via
+    the `operate -> pool_size` entry of the `general.yaml` config.
+
+    If this entry is 1 (the default, or if it is not present) galaxies and profiles are evaluated sequentially.
+    """
+    try:
+        return conf.instance["general"]["operate"]["pool_size"] or 1
+    except KeyError:
+        return 1
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+_local = threading.local()
+
+
+def executor_from(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Returns the thread pool galaxies and profiles are evaluated in, which is created the first time it is requested
+    and reused by every evaluation, such that threads are not created for every likelihood evaluation.
+
+    Parameters
+    ----------
+    max_workers
+        The number of threads in the pool, where the pool is recreated if this changes.
+    """
+    global _executor
+
+    if _executor is None or _executor._max_workers != max_workers:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+
+        _executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="autogalaxy"
+        )
+
+    return _executor
+
+
+def is_active() -> bool:
+    """
+    Returns whether calls to `map_from` evaluate their function in the thread pool, which is the case if the pool
+    has more than one thread, the call is not already inside a thread of the pool and no `LikelihoodProfiler` is
+    active (whose call tree is built sequentially).
+    """
+    return (
+        pool_size() > 1
+        and not getattr(_local, "in_pool", False)
+        and not profiler.is_active()
+    )
+
+
+def _value_in_pool_from(func: Callable, *args):
+    _local.in_pool = True
+
+    try:
+        return func(*args)
+    finally:
+        _local.in_pool = False
+
+
+def map_from(func: Callable, *sequences: Sequence) -> Iterator:
+    """
+    Returns an iterator over the values of a function applied to every element of the input sequences, in the
+    same way as the built-in `map`, where the values are evaluated in a thread pool if it is active
+    (see `is_active`).
+
+    This is used to evaluate independent galaxies (e.g. in `Galaxies.image_2d_list_from`) and the independent light
+    and mass profiles of a galaxy in parallel. Their calculations are mostly NumPy array operations, which release
+    the GIL, so threads evaluate them in parallel without the overhead of copying galaxies and grids to other
+    processes.
+
+    Calls made inside a thread of the pool (e.g. a galaxy evaluating its profiles) are evaluated sequentially, such
+    that the threads of the pool never wait for other tasks of the pool.
+
+    Every task is run in a copy of the caller's context, so that context variables set by the caller (e.g. the
+    precision of a `profile_precision` context manager) apply to the values evaluated in the pool.
+
+    Parameters
+    ----------
+    func
+        The function which is evaluated for every element (e.g. the image of a galaxy).
+    sequences
+        The sequences whose elements are input into the function.
+    """
+    if len(sequences[0]) < 2 or not is_active():
+        return map(func, *sequences)
+
+    context = contextvars.copy_context()
+
+    return executor_from(max_workers=pool_size()).map(
+        lambda *args: context.copy().run(_value_in_pool_from, func, *args),
+        *sequences,
+    )
@@ -1,3 +1,5 @@
+import importlib
+
 from autofit.non_linear.plot.nest_plotters import NestPlotter
 from autofit.non_linear.plot.mcmc_plotters import MCMCPlotter
 from autofit.non_linear.plot.mle_plotters import MLEPlotter
@@ -76,20 +78,73 @@ from autogalaxy.plot.include.one_d import Include1D
 from autogalaxy.plot.include.two_d import Include2D
 from autogalaxy.plot.visuals.one_d import Visuals1D
 from autogalaxy.plot.visuals.two_d import Visuals2D
+from autogalaxy.plot.cache import PlotCache, plot_cache
 
-from autogalaxy.profiles.plot.light_profile_plotters import LightProfilePlotter
-from autogalaxy.profiles.plot.light_profile_plotters import LightProfilePDFPlotter
-from autogalaxy.profiles.plot.basis_plotters import BasisPlotter
-from autogalaxy.profiles.plot.mass_profile_plotters import MassProfilePlotter
-from autogalaxy.profiles.plot.mass_profile_plotters import MassProfilePDFPlotter
-from autogalaxy.galaxy.plot.galaxy_plotters import GalaxyPlotter
-from autogalaxy.galaxy.plot.galaxy_plotters import GalaxyPDFPlotter
-from autogalaxy.galaxy.plot.galaxies_plotters import GalaxiesPlotter
-from autogalaxy.quantity.plot.fit_quantity_plotters import FitQuantityPlotter
-from autogalaxy.imaging.plot.fit_imaging_plotters import FitImagingPlotter
-from autogalaxy.interferometer.plot.fit_interferometer_plotters import (
-    FitInterferometerPlotter,
-)
-from autogalaxy.galaxy.plot.galaxies_plotters import GalaxiesPlotter
-from autogalaxy.galaxy.plot.adapt_plotters import AdaptPlotter
-from autogalaxy.ellipse.plot.fit_ellipse_plotters import FitEllipsePlotter
+"""
+The plotters of **PyAutoGalaxy** objects, which are imported the first time they are accessed via the module
+`__getattr__` below (PEP 562), in the same way as the lazy attributes of `autogalaxy` itself.
+
+Every plotter module imports this package (e.g. for `MatPlot2D`), therefore importing them lazily means a plotter
+module can be imported directly (e.g. `from autogalaxy.imaging.plot.fit_imaging_plotters import FitImagingPlotter`)
+without this package importing it again while it is partially initialized.
+"""
+_lazy_attribute_dict = {
+    "LightProfilePlotter": (
+        "autogalaxy.profiles.plot.light_profile_plotters",
+        "LightProfilePlotter",
+    ),
+    "LightProfilePDFPlotter": (
+        "autogalaxy.profiles.plot.light_profile_plotters",
+        "LightProfilePDFPlotter",
+    ),
+    "BasisPlotter": ("autogalaxy.profiles.plot.basis_plotters", "BasisPlotter"),
+    "MassProfilePlotter": (
+        "autogalaxy.profiles.plot.mass_profile_plotters",
+        "MassProfilePlotter",
+    ),
+    "MassProfilePDFPlotter": (
+        "autogalaxy.profiles.plot.mass_profile_plotters",
+        "MassProfilePDFPlotter",
+    ),
+    "GalaxyPlotter": ("autogalaxy.galaxy.plot.galaxy_plotters", "GalaxyPlotter"),
+    "GalaxyPDFPlotter": ("autogalaxy.galaxy.plot.galaxy_plotters", "GalaxyPDFPlotter"),
+    "GalaxiesPlotter": ("autogalaxy.galaxy.plot.galaxies_plotters", "GalaxiesPlotter"),
+    "FitQuantityPlotter": (
+        "autogalaxy.quantity.plot.fit_quantity_plotters",
+        "FitQuantityPlotter",
+    ),
+    "FitImagingPlotter": (
+        "autogalaxy.imaging.plot.fit_imaging_plotters",
+        "FitImagingPlotter",
+    ),
+    "FitInterferometerPlotter": (
+        "autogalaxy.interferometer.plot.fit_interferometer_plotters",
+        "FitInterferometerPlotter",
+    ),
+    "AdaptPlotter": ("autogalaxy.galaxy.plot.adapt_plotters", "AdaptPlotter"),
+    "FitEllipsePlotter": (
+        "autogalaxy.ellipse.plot.fit_ellipse_plotters",
+        "FitEllipsePlotter",
+    ),
+}
+
+
+def __getattr__(name: str):
+    """
+    Imports a plotter (see `_lazy_attribute_dict`) the first time it is accessed, after which it is stored in the
+    module's namespace and this function is not called for it again.
+    """
+    try:
+        module_name, attribute_name = _lazy_attribute_dict[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), attribute_name)
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attribute_dict))
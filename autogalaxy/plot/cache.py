@@ -0,0 +1,145 @@
+import logging
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional, Tuple
+
+import autoarray as aa
+
+logger = logging.getLogger(__name__)
+
+
+class PlotCache:
+    def __init__(self):
+        """
+        Memoizes the quantities computed by plotters (e.g. the image, convergence, deflections and critical curves of
+        galaxies), such that every plotter used in one visualization pass shares the quantities computed by the
+        others.
+
+        Visualization of a model-fit creates many plotters (e.g. a `GalaxiesPlotter`, a `GalaxyPlotter` per galaxy,
+        a `FitImagingPlotter`) which plot the same galaxies on the same grid, and every figure of a plotter
+        extracts its visuals (e.g. the critical curves) again. Without memoization, each quantity is therefore
+        recomputed many times per visualization pass.
+
+        Quantities are keyed on the object they are computed from, the grid they are computed on and the name of the
+        quantity. A `Galaxies` object is keyed on the galaxies it contains, because plotters wrap the same galaxies in
+        new `Galaxies` objects. The objects and grids are referenced by the cache, so that their `id`s are not reused
+        while the cache exists.
+
+        The counters `total_computed` and `total_reused` give the number of quantities computed and the number of
+        recomputations avoided.
+        """
+        self._value_dict: Dict[Tuple, Tuple[object, object, object]] = {}
+
+        self.total_computed = 0
+        self.total_reused = 0
+
+    @staticmethod
+    def key_from(obj, grid: aa.type.Grid2DLike, quantity: str) -> Tuple:
+        """
+        Returns the key of a quantity in the cache.
+
+        Parameters
+        ----------
+        obj
+            The object the quantity is computed from (e.g. a `Galaxy`, `Galaxies`, `MassProfile`).
+        grid
+            The grid the quantity is computed on.
+        quantity
+            The name of the quantity (e.g. `convergence_2d`).
+        """
+        if isinstance(obj, list):
+            obj_key = tuple(id(obj_i) for obj_i in obj)
+        else:
+            obj_key = id(obj)
+
+        return obj_key, id(grid), quantity
+
+    def value_from(self, obj, grid: aa.type.Grid2DLike, quantity: str, func: Callable):
+        """
+        Returns a quantity from the cache, computing it via the input function if it is not in the cache.
+
+        Parameters
+        ----------
+        obj
+            The object the quantity is computed from (e.g. a `Galaxy`, `Galaxies`, `MassProfile`).
+        grid
+            The grid the quantity is computed on.
+        quantity
+            The name of the quantity (e.g. `convergence_2d`).
+        func
+            The function which computes the quantity if it is not in the cache.
+        """
+        key = self.key_from(obj=obj, grid=grid, quantity=quantity)
+
+        try:
+            value = self._value_dict[key][2]
+            self.total_reused += 1
+            return value
+        except KeyError:
+            pass
+
+        value = func()
+
+        self._value_dict[key] = (obj, grid, value)
+        self.total_computed += 1
+
+        return value
+
+
+_plot_cache: Optional[PlotCache] = None
+
+
+@contextmanager
+def plot_cache():
+    """
+    Context manager which activates a `PlotCache` for a visualization pass, such that all plotters used inside it
+    share the quantities they compute.
+
+    If a `PlotCache` is already active (e.g. the context manager is nested) the active cache is used.
+
+    For example:
+
+    with plot_cache() as cache:
+        GalaxiesPlotter(galaxies=galaxies, grid=grid).subplot_galaxies()
+        GalaxiesPlotter(galaxies=galaxies, grid=grid).figures_2d(convergence=True)
+
+    print(cache.total_reused)
+    """
+    global _plot_cache
+
+    if _plot_cache is not None:
+        yield _plot_cache
+        return
+
+    _plot_cache = PlotCache()
+
+    try:
+        yield _plot_cache
+    finally:
+        logger.debug(
+            f"PLOT CACHE - {_plot_cache.total_computed} quantities computed, "
+            f"{_plot_cache.total_reused} recomputations avoided."
+        )
+
+        _plot_cache = None
+
+
+def value_from(obj, grid: aa.type.Grid2DLike, quantity: str, func: Callable):
+    """
+    Returns a quantity computed by a plotter, via the active `PlotCache` if a visualization pass is being performed
+    inside the `plot_cache` context manager and by calling the input function otherwise.
+
+    Parameters
+    ----------
+    obj
+        The object the quantity is computed from (e.g. a `Galaxy`, `Galaxies`, `MassProfile`).
+    grid
+        The grid the quantity is computed on.
+    quantity
+        The name of the quantity (e.g. `convergence_2d`).
+    func
+        The function which computes the quantity.
+    """
+    if _plot_cache is None:
+        return func()
+
+    return _plot_cache.value_from(obj=obj, grid=grid, quantity=quantity, func=func)
@@ -5,6 +5,7 @@ import autoarray.plot as aplt
 
 from autogalaxy.imaging.fit_imaging import FitImaging
 from autogalaxy.plot.include.two_d import Include2D
+from autogalaxy.plot import cache as plot_cache_util
 from autogalaxy.plot.visuals.two_d import Visuals2D
 from autogalaxy.profiles.light.abstract import LightProfile
 from autogalaxy.profiles.mass.abstract.abstract import MassProfile
@@ -128,20 +129,33 @@ class GetVisuals2D(aplt.GetVisuals2D):
 
         tangential_critical_curves = self.get(
             "tangential_critical_curves",
-            mass_obj.tangential_critical_curve_list_from(grid=grid),
+            plot_cache_util.value_from(
+                obj=mass_obj,
+                grid=grid,
+                quantity="tangential_critical_curve_list",
+                func=lambda: mass_obj.tangential_critical_curve_list_from(grid=grid),
+            ),
             "tangential_critical_curves",
         )
 
         radial_critical_curves = None
 
-        radial_critical_curve_area_list = mass_obj.radial_critical_curve_area_list_from(
-            grid=grid
+        radial_critical_curve_area_list = plot_cache_util.value_from(
+            obj=mass_obj,
+            grid=grid,
+            quantity="radial_critical_curve_area_list",
+            func=lambda: mass_obj.radial_critical_curve_area_list_from(grid=grid),
         )
 
         if any([area > grid.pixel_scale for area in radial_critical_curve_area_list]):
             radial_critical_curves = self.get(
                 "radial_critical_curves",
-                mass_obj.radial_critical_curve_list_from(grid=grid),
+                plot_cache_util.value_from(
+                    obj=mass_obj,
+                    grid=grid,
+                    quantity="radial_critical_curve_list",
+                    func=lambda: mass_obj.radial_critical_curve_list_from(grid=grid),
+                ),
                 "radial_critical_curves",
             )
 
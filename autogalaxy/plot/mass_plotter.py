@@ -10,6 +10,7 @@ from autogalaxy.plot.visuals.two_d import Visuals2D
 from autogalaxy.plot.include.two_d import Include2D
 
 from autogalaxy.plot.abstract_plotters import Plotter
+from autogalaxy.plot import cache as plot_cache_util
 
 
 class MassPlotter(Plotter):
@@ -33,6 +34,23 @@ class MassPlotter(Plotter):
     def get_visuals_2d(self) -> Visuals2D:
         return self._get_visuals_2d()
 
+    def value_from(self, quantity: str):
+        """
+        Returns a quantity of the mass object computed on the plotter's grid (e.g. `convergence_2d` computed via
+        the `convergence_2d_from` method), via the active `PlotCache` if visualization uses one.
+
+        Parameters
+        ----------
+        quantity
+            The name of the quantity, which is computed via the mass object's method `{quantity}_from`.
+        """
+        return plot_cache_util.value_from(
+            obj=self.mass_obj,
+            grid=self.grid,
+            quantity=quantity,
+            func=lambda: getattr(self.mass_obj, f"{quantity}_from")(grid=self.grid),
+        )
+
     def figures_2d(
         self,
         convergence: bool = False,
@@ -65,7 +83,7 @@ class MassPlotter(Plotter):
         """
         if convergence:
             self.mat_plot_2d.plot_array(
-                array=self.mass_obj.convergence_2d_from(grid=self.grid),
+                array=self.value_from(quantity="convergence_2d"),
                 visuals_2d=self.get_visuals_2d(),
                 auto_labels=aplt.AutoLabels(
                     title=f"Convergence{title_suffix}",
@@ -76,7 +94,7 @@ class MassPlotter(Plotter):
 
         if potential:
             self.mat_plot_2d.plot_array(
-                array=self.mass_obj.potential_2d_from(grid=self.grid),
+                array=self.value_from(quantity="potential_2d"),
                 visuals_2d=self.get_visuals_2d(),
                 auto_labels=aplt.AutoLabels(
                     title=f"Potential{title_suffix}",
@@ -86,7 +104,7 @@ class MassPlotter(Plotter):
             )
 
         if deflections_y:
-            deflections = self.mass_obj.deflections_yx_2d_from(grid=self.grid)
+            deflections = self.value_from(quantity="deflections_yx_2d")
             deflections_y = aa.Array2D(
                 values=deflections.slim[:, 0], mask=self.grid.mask
             )
@@ -102,7 +120,7 @@ class MassPlotter(Plotter):
             )
 
         if deflections_x:
-            deflections = self.mass_obj.deflections_yx_2d_from(grid=self.grid)
+            deflections = self.value_from(quantity="deflections_yx_2d")
             deflections_x = aa.Array2D(
                 values=deflections.slim[:, 1], mask=self.grid.mask
             )
@@ -119,7 +137,7 @@ class MassPlotter(Plotter):
 
         if magnification:
             self.mat_plot_2d.plot_array(
-                array=self.mass_obj.magnification_2d_from(grid=self.grid),
+                array=self.value_from(quantity="magnification_2d"),
                 visuals_2d=self.get_visuals_2d(),
                 auto_labels=aplt.AutoLabels(
                     title=f"Magnification{title_suffix}",
@@ -1,8 +1,9 @@
 import numpy as np
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import autoarray as aa
 
+from autogalaxy.operate import cache
 from autogalaxy.profiles.light.abstract import LightProfile
 from autogalaxy.profiles.mass.abstract.abstract import MassProfile
 
@@ -46,6 +47,16 @@ class Basis(LightProfile, MassProfile):
         self.profile_list = profile_list
         self.regularization = regularization
 
+    @property
+    def fingerprint(self) -> Optional[Tuple]:
+        """
+        The fingerprint of the basis, which includes the fingerprints of its profiles.
+
+        Unlike other profiles it is not stored, because the parameters of the profiles in its `profile_list` can be
+        set without setting an attribute of the basis.
+        """
+        return cache.fingerprint_from(obj=self)
+
     @property
     def light_profile_list(self) -> List[LightProfile]:
         """
@@ -131,6 +142,33 @@ class Basis(LightProfile, MassProfile):
             for light_profile in self.light_profile_list
         ]
 
+    def image_2d_split_from(self, grid: aa.Grid2D) -> Tuple[aa.Array2D, aa.Array2D]:
+        """
+        Returns the summed image of all light profiles in the basis split into the image of light profiles which are
+        not already operated on and the image of light profiles which are, evaluating each light profile once.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates in the original reference frame of the grid.
+        """
+        image_2d_not_operated = np.zeros((grid.shape[0],))
+        image_2d_operated = np.zeros((grid.shape[0],))
+
+        for light_profile in self.light_profile_list:
+            if isinstance(light_profile, lp_linear.LightProfileLinear):
+                continue
+
+            image_2d_split = light_profile.image_2d_split_from(grid=grid)
+
+            image_2d_not_operated += np.asarray(image_2d_split[0])
+            image_2d_operated += np.asarray(image_2d_split[1])
+
+        return (
+            aa.Array2D(values=image_2d_not_operated, mask=grid.mask),
+            aa.Array2D(values=image_2d_operated, mask=grid.mask),
+        )
+
     def convergence_2d_from(self, grid: aa.type.Grid2DLike, **kwargs) -> aa.Array2D:
         """
         Returns the summed convergence of all mass profiles in the basis from a 2D grid of Cartesian (y,x) coordinates.
@@ -1,10 +1,48 @@
-from typing import Optional, Tuple, Type
+from functools import wraps
+from typing import Callable, Optional, Tuple, Type
 
 import numpy as np
 
 import autoarray as aa
 
 from autogalaxy import convert
+from autogalaxy.operate import cache
+from autogalaxy.profiles import precision
+from autogalaxy.util import profiler
+
+
+def derived_property(func: Callable) -> property:
+    """
+    A property of a profile which is derived only from its parameters (e.g. the `axis_ratio` computed from
+    its `ell_comps`), which is computed once per profile instance and then stored.
+
+    Profiles are evaluated many times with the same parameters (e.g. the Hessian and critical curve calculations
+    evaluate a mass profile's deflection angles dozens of times), therefore storing these quantities removes the
+    overhead of recomputing them on every evaluation.
+
+    Values are stored in the `_derived_dict` slot of the `GeometryProfile` class, which is not part of the profile's
+    `__dict__` and therefore does not change how profiles are compared, output or serialized. The stored values are
+    reset whenever any attribute of the profile is set, ensuring they are always consistent with its parameters.
+
+    Values are keyed by the qualified name of the decorated function, so that a child class which overrides a
+    derived property and calls its parent's version stores both values separately.
+
+    Parameters
+    ----------
+    func
+        A function of the profile which computes a quantity from its parameters.
+
+    Returns
+    -------
+        A property whose value is computed once and stored.
+    """
+    key = func.__qualname__
+
+    @wraps(func)
+    def wrapper(obj):
+        return obj._derived_value_from(key=key, func=lambda: func(obj))
+
+    return property(wrapper)
 
 
 class GeometryProfile:
@@ -17,12 +55,75 @@ class GeometryProfile:
         The (y,x) arc-second coordinates of the profile centre.
     """
 
+    __slots__ = ("__dict__", "_derived_dict")
+
     def __init__(self, centre: Tuple[float, float] = (0.0, 0.0)):
         self.centre = centre
 
+    def __setattr__(self, name, value):
+        """
+        Set an attribute of the profile, resetting any quantities stored via the `derived_property` decorator
+        so they are recomputed using the profile's new parameters.
+        """
+        object.__setattr__(self, name, value)
+
+        if name != "_derived_dict":
+            object.__setattr__(self, "_derived_dict", None)
+
+    def _derived_value_from(self, key, func: Callable):
+        """
+        Returns a quantity derived only from the profile's parameters, which is computed via the input function the
+        first time it is requested and then stored in the `_derived_dict` slot until any attribute of the profile
+        is set (see the `derived_property` decorator).
+
+        Parameters
+        ----------
+        key
+            The key the quantity is stored under, which includes any inputs the quantity depends on.
+        func
+            A function which computes the quantity.
+        """
+        try:
+            derived_dict = self._derived_dict
+        except AttributeError:
+            derived_dict = None
+
+        if derived_dict is None:
+            derived_dict = {}
+            object.__setattr__(self, "_derived_dict", derived_dict)
+
+        try:
+            return derived_dict[key]
+        except KeyError:
+            value = func()
+            derived_dict[key] = value
+            return value
+
+    def __getstate__(self):
+        """
+        The state of a profile used for pickling and serialization is its `__dict__`, meaning quantities stored via
+        the `derived_property` decorator are not output and are recomputed after loading.
+        """
+        return self.__dict__
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
     def __hash__(self):
         return id(self)
 
+    @derived_property
+    def fingerprint(self) -> Optional[Tuple]:
+        """
+        The fingerprint of the profile, a tuple of its class and parameter values which is the same for every
+        profile of the same class with the same parameters (see `autogalaxy.operate.cache.fingerprint_from`).
+
+        Unlike the profile's hash, which is its identity, this is used as a key to cache values computed from the
+        profile's parameters (e.g. its image) across different profile instances. It is computed once and reset
+        whenever a parameter of the profile is set.
+        """
+        return cache.fingerprint_from(obj=self)
+
     def __repr__(self):
         return "{}\n{}".format(
             self.__class__.__name__,
@@ -128,6 +229,7 @@ class SphProfile(GeometryProfile):
         cos_theta, sin_theta = self.angle_to_profile_grid_from(grid_angles=grid_angles)
         return np.multiply(radius[:, None], np.vstack((sin_theta, cos_theta)).T)
 
+    @profiler.profile_stage("transform")
     @aa.grid_dec.to_grid
     def transformed_to_reference_frame_grid_from(self, grid, **kwargs):
         """
@@ -135,12 +237,14 @@ class SphProfile(GeometryProfile):
 
         This performs a translation to the profile's `centre`.
 
+        The transformed grid is cast to the precision profiles are evaluated in (see `autogalaxy.profiles.precision`).
+
         Parameters
         ----------
         grid
             The (y, x) coordinates in the original reference frame of the grid.
         """
-        return np.subtract(grid, self.centre)
+        return precision.array_from(array=np.subtract(grid, self.centre))
 
     @aa.grid_dec.to_grid
     def transformed_from_reference_frame_grid_from(self, grid, **kwargs):
@@ -209,14 +313,14 @@ class EllProfile(SphProfile):
 
         self.ell_comps = ell_comps
 
-    @property
+    @derived_property
     def axis_ratio(self) -> float:
         """
         The ratio of the minor-axis to major-axis (b/a) of the ellipse defined by profile (0.0 > q > 1.0).
         """
         return convert.axis_ratio_from(ell_comps=self.ell_comps)
 
-    @property
+    @derived_property
     def angle(self) -> float:
         """
         The position angle in degrees of the major-axis of the ellipse defined by profile, defined counter clockwise
@@ -224,7 +328,7 @@ class EllProfile(SphProfile):
         """
         return convert.angle_from(ell_comps=self.ell_comps)
 
-    @property
+    @derived_property
     def angle_radians(self) -> float:
         """
         The position angle in radians of the major-axis of the ellipse defined by profile, defined counter clockwise
@@ -232,11 +336,11 @@ class EllProfile(SphProfile):
         """
         return np.radians(self.angle)
 
-    @property
+    @derived_property
     def _cos_angle(self) -> float:
         return self._cos_and_sin_to_x_axis()[0]
 
-    @property
+    @derived_property
     def _sin_angle(self) -> float:
         return self._cos_and_sin_to_x_axis()[1]
 
@@ -287,8 +391,10 @@ class EllProfile(SphProfile):
         if angle is None:
             angle = self.angle
 
-        return aa.util.geometry.transform_grid_2d_from_reference_frame(
-            grid_2d=grid, centre=(0.0, 0.0), angle=angle
+        return precision.array_from(
+            array=aa.util.geometry.transform_grid_2d_from_reference_frame(
+                grid_2d=grid, centre=(0.0, 0.0), angle=angle
+            )
         )
 
     @aa.grid_dec.to_array
@@ -333,6 +439,7 @@ class EllProfile(SphProfile):
 
         return np.multiply(np.sqrt(self.axis_ratio), grid_radii).view(np.ndarray)
 
+    @profiler.profile_stage("transform")
     @aa.grid_dec.to_grid
     def transformed_to_reference_frame_grid_from(
         self, grid: aa.type.Grid2DLike, **kwargs
@@ -342,6 +449,8 @@ class EllProfile(SphProfile):
 
         This includes a translation to the profile's `centre` and a rotation using its `angle`.
 
+        The transformed grid is cast to the precision profiles are evaluated in (see `autogalaxy.profiles.precision`).
+
         Parameters
         ----------
         grid
@@ -349,8 +458,10 @@ class EllProfile(SphProfile):
         """
         if self.__class__.__name__.endswith("Sph"):
             return super().transformed_to_reference_frame_grid_from(grid=grid)
-        return aa.util.geometry.transform_grid_2d_to_reference_frame(
-            grid_2d=grid, centre=self.centre, angle=self.angle
+        return precision.array_from(
+            array=aa.util.geometry.transform_grid_2d_to_reference_frame(
+                grid_2d=grid, centre=self.centre, angle=self.angle
+            )
         )
 
     @aa.grid_dec.to_grid
@@ -1,6 +1,6 @@
 import numpy as np
 from scipy.integrate import quad
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple, Union
 
 import autoarray as aa
 
@@ -64,6 +64,196 @@ class LightProfile(EllProfile, OperateImage):
         """
         raise NotImplementedError()
 
+    def _image_2d_fused_from(
+        self, grid: np.ndarray, radial_minimum: float
+    ) -> np.ndarray:
+        """
+        Returns the light profile's 2D image from a 2D grid of Cartesian (y,x) coordinates in the original reference
+        frame of the grid, using a numba-compiled kernel from the module `fused_util.py` which performs the coordinate
+        transform, radial minimum relocation and profile evaluation in one pass.
+
+        This is used instead of `image_2d_from` when fused kernels are enabled in the `general.yaml` config (see the
+        `fused_kernel` decorator).
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates in the original reference frame of the grid, as an ndarray.
+        radial_minimum
+            The minimum radial distance from the centre of the profile a coordinate is evaluated at.
+        """
+        raise NotImplementedError()
+
+    def _fused_geometry_dict_from(self, radial_minimum: float) -> Dict[str, float]:
+        """
+        Returns the geometric quantities of the light profile input into every fused kernel in the
+        module `fused_util.py`.
+
+        Spherical profiles are only translated to their centre, therefore their rotation angle is zero.
+
+        Parameters
+        ----------
+        radial_minimum
+            The minimum radial distance from the centre of the profile a coordinate is evaluated at.
+        """
+        if self.__class__.__name__.endswith("Sph"):
+            cos_angle, sin_angle = 1.0, 0.0
+        else:
+            cos_angle, sin_angle = self._cos_angle, self._sin_angle
+
+        return {
+            "centre_y": float(self.centre[0]),
+            "centre_x": float(self.centre[1]),
+            "cos_angle": float(cos_angle),
+            "sin_angle": float(sin_angle),
+            "axis_ratio": float(self.axis_ratio),
+            "radial_minimum": float(radial_minimum),
+        }
+
+    def truncation_radius_from(self, tolerance: float) -> Optional[float]:
+        """
+        Returns a conservative estimate of the radius from the light profile's `centre` beyond which its surface
+        brightness is below an input tolerance, which is used to truncate its image (see the `truncate` decorator).
+
+        The image is evaluated along the major and minor axes of the profile at logarithmically spaced radii, and the
+        first sampled radius beyond the last radius where the image is above the tolerance on either axis is returned.
+        Provided the surface brightness decreases monotonically with radius, every coordinate outside a circle of this
+        radius has a surface brightness below the tolerance.
+
+        If the image is above the tolerance at the largest sampled radius, the profile is not compact and `None` is
+        returned, meaning it is not truncated.
+
+        The radius is computed once per tolerance and stored until the parameters of the profile change.
+
+        Parameters
+        ----------
+        tolerance
+            The surface brightness below which the light profile is truncated.
+        """
+
+        def func():
+            radii = np.geomspace(1.0e-4, 1.0e3, 300)
+
+            grid = np.concatenate(
+                (
+                    np.stack((np.zeros(radii.shape[0]), radii), axis=1),
+                    np.stack((radii, np.zeros(radii.shape[0])), axis=1),
+                )
+            )
+
+            grid = self.transformed_from_reference_frame_grid_from(
+                grid=aa.Grid2DIrregular(values=grid)
+            )
+
+            image = np.asarray(self.image_2d_from(grid=grid)).reshape(2, -1)
+
+            above_tolerance = np.max(np.abs(image), axis=0) >= tolerance
+
+            if above_tolerance[-1]:
+                return None
+
+            if not np.any(above_tolerance):
+                return float(radii[0])
+
+            return float(radii[np.nonzero(above_tolerance)[0][-1] + 1])
+
+        return self._derived_value_from(
+            key=("truncation_radius_from", tolerance), func=func
+        )
+
+    def image_2d_truncated_from(
+        self,
+        grid: aa.Grid2D,
+        tolerance: float,
+        operated_only: Optional[bool] = None,
+    ) -> Tuple[Union[np.ndarray, slice], np.ndarray]:
+        """
+        Returns the light profile's 2D image evaluated only in the pixels of a `Grid2D` within its truncation radius
+        (see `truncation_radius_from`), as the indexes of these pixels and the image values in them.
+
+        The pixels are found using the spatial index of the grid (see `autogalaxy.util.spatial_index`), where the
+        truncation radius is extended by half the diagonal of a pixel so that every pixel with an over-sampled
+        coordinate inside the truncation radius is included. The image is evaluated on the over-sampled coordinates
+        of these pixels only and binned to the pixels.
+
+        This is used by galaxies to sum the images of many compact light profiles in a wide field, where the cost of
+        evaluating each light profile and adding it to the image scales with the number of pixels near the light
+        profile, not the total number of pixels in the grid.
+
+        If the light profile is not truncated (e.g. its image is not decorated with the `truncate` decorator or its
+        image is above the tolerance at all radii) its image is evaluated on every pixel and a slice over all pixels
+        is returned as the indexes.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates where values of the image are evaluated.
+        tolerance
+            The surface brightness below which the light profile is truncated.
+        operated_only
+            Passed to the `image_2d_from` function of the light profile.
+        """
+        from autogalaxy.util import spatial_index
+
+        radius = None
+
+        if getattr(self.image_2d_from, "truncatable", False):
+            radius = self.truncation_radius_from(tolerance=tolerance)
+
+        if radius is None:
+            return slice(None), np.asarray(
+                self.image_2d_from(grid=grid, operated_only=operated_only)
+            )
+
+        grid_spatial_index = spatial_index.spatial_index_from(grid=grid)
+
+        indexes = grid_spatial_index.indexes_within_radius_from(
+            grid=grid.array,
+            centre=self.centre,
+            radius=radius + np.sqrt(2.0) * max(grid.pixel_scales) / 2.0,
+        )
+
+        if indexes.shape[0] == 0:
+            return indexes, np.zeros(shape=(0,))
+
+        over_sampled_indexes, start = grid_spatial_index.over_sampled_indexes_from(
+            indexes=indexes
+        )
+
+        image = self.image_2d_from(
+            grid=aa.Grid2DIrregular(values=grid.over_sampled[over_sampled_indexes]),
+            operated_only=operated_only,
+        )
+
+        return (
+            indexes,
+            np.add.reduceat(np.asarray(image), start)
+            / grid_spatial_index.over_sample_total[indexes],
+        )
+
+    def image_2d_split_from(self, grid: aa.Grid2D) -> Tuple[aa.Array2D, aa.Array2D]:
+        """
+        Returns the light profile's 2D image split into the image of a light profile which is not already operated on
+        and the image of a light profile which is (e.g. a `LightProfileOperated` object), one of which is an array of
+        zeros.
+
+        The image is evaluated once, and whether it is already operated on is determined by the light profile's class.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates in the original reference frame of the grid.
+        """
+        from autogalaxy.profiles.light.operated import LightProfileOperated
+
+        image_2d = self.image_2d_from(grid=grid)
+        image_2d_zeros = aa.Array2D(values=np.zeros((grid.shape[0],)), mask=grid.mask)
+
+        if isinstance(self, LightProfileOperated):
+            return image_2d_zeros, image_2d
+
+        return image_2d, image_2d_zeros
+
     def image_2d_via_radii_from(self, grid_radii: np.ndarray) -> np.ndarray:
         """
         Returns the light profile's 2D image from a 1D grid of coordinates which are the radial distance of each
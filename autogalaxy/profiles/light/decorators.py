@@ -2,8 +2,14 @@ import numpy as np
 from functools import wraps
 from typing import Optional, Union
 
+from autoconf import conf
+
 import autoarray as aa
 
+from autogalaxy.profiles import precision
+from autogalaxy.profiles.light import fused_util
+from autogalaxy.util import spatial_index
+
 
 def check_operated_only(func):
     """
@@ -70,3 +76,172 @@ def check_operated_only(func):
         return np.zeros((grid.shape[0],))
 
     return wrapper
+
+
+def fused_kernel(func):
+    """
+    Checks whether standard light profiles are set to evaluate their image via the numba-compiled kernels in the
+    module `fused_util.py`, which is controlled by the `profiles -> fused_kernels` entry of the `general.yaml` config.
+
+    If they are, the input grid is passed directly to the light profile's fused kernel, which performs the coordinate
+    transform, radial minimum relocation and profile evaluation in one pass. The remaining decorators of the function
+    (e.g. `transform`, `relocate_to_radial_minimum`) are therefore skipped.
+
+    The image computed by a fused kernel is cast to the precision profiles are evaluated in (see
+    `autogalaxy.profiles.precision`).
+
+    Parameters
+    ----------
+    func
+        A function which evaluates a light profile's image, that is bypassed if fused kernels are used.
+
+    Returns
+    -------
+        A function that returns a 2D image.
+    """
+
+    @wraps(func)
+    def wrapper(
+        obj,
+        grid: aa.type.Grid1D2DLike,
+        operated_only: Optional[bool] = None,
+        *args,
+        **kwargs
+    ) -> Union[aa.Array2D, np.ndarray]:
+        """
+        This decorator checks if fused kernels are enabled and, if so, evaluates the light profile's image via its
+        `_image_2d_fused_from` method.
+
+        If the grid has already been transformed to the profile's reference frame, or the profile does not have an
+        entry in the `radial_minimum` section of the `grids.yaml` config, the standard calculation is used.
+
+        Parameters
+        ----------
+        obj
+            A light profile with an `_image_2d_fused_from` function which evaluates its image via a fused kernel.
+        grid
+            A grid_like object of (y,x) coordinates on which the function values are evaluated.
+        operated_only
+            Passed through to the decorated function, and not used by fused kernels.
+
+        Returns
+        -------
+            The 2D image, evaluated via a fused kernel or the standard calculation.
+        """
+        if kwargs.get("is_transformed") or not fused_util.fused_kernels_enabled():
+            return func(obj, grid, operated_only, *args, **kwargs)
+
+        try:
+            radial_minimum = conf.instance["grids"]["radial_minimum"]["radial_minimum"][
+                obj.__class__.__name__
+            ]
+        except KeyError:
+            return func(obj, grid, operated_only, *args, **kwargs)
+
+        return precision.array_from(
+            array=obj._image_2d_fused_from(
+                grid=np.asarray(grid), radial_minimum=radial_minimum
+            )
+        )
+
+    return wrapper
+
+
+def truncation_tolerance() -> Optional[float]:
+    """
+    Returns the surface brightness below which standard light profiles are truncated when their image is evaluated
+    on a `Grid2D`, which is set by the `profiles -> truncation_tolerance` entry of the `general.yaml` config.
+
+    If this entry is `None` (or not present) light profiles are not truncated.
+    """
+    try:
+        return conf.instance["general"]["profiles"]["truncation_tolerance"]
+    except KeyError:
+        return None
+
+
+def truncate(func):
+    """
+    Checks whether standard light profiles are set to be truncated, which is controlled by
+    the `profiles -> truncation_tolerance` entry of the `general.yaml` config.
+
+    If they are, the light profile computes the radius beyond which its surface brightness is below the tolerance
+    (see `LightProfile.truncation_radius_from`) and its image is only evaluated at the (y,x) coordinates inside this
+    radius, which are found using the spatial index of the grid (see `autogalaxy.util.spatial_index`). All other
+    coordinates are assigned an image value of zero.
+
+    For compact light profiles in a wide field (e.g. many small `extra_galaxies`) this means the image of each
+    profile is only evaluated on the small fraction of the grid where it has non-negligible emission.
+
+    Truncation is only applied to the over-sampled grid of a `Grid2D`, which the `over_sample` decorator passes to
+    the function as an `ndarray`. Other grids (e.g. a `Grid2DIrregular`) are always evaluated in full.
+
+    The decorated function is marked as `truncatable`, which is used by `LightProfile.image_2d_truncated_from` to
+    check whether the light profile's surface brightness decreases monotonically with radius, such that its
+    truncation radius can be trusted.
+
+    Parameters
+    ----------
+    func
+        A function which evaluates a light profile's image, which is evaluated only inside the truncation radius.
+
+    Returns
+    -------
+        A function that returns a 2D image.
+    """
+
+    @wraps(func)
+    def wrapper(
+        obj,
+        grid: aa.type.Grid1D2DLike,
+        operated_only: Optional[bool] = None,
+        *args,
+        **kwargs
+    ) -> Union[aa.Array2D, np.ndarray]:
+        """
+        This decorator checks if light profiles are truncated and, if so, evaluates the light profile's image only
+        at the coordinates inside its truncation radius, scattering the result into an array of zeros.
+
+        Parameters
+        ----------
+        obj
+            A light profile with a `truncation_radius_from` function which computes the radius it is truncated at.
+        grid
+            A grid_like object of (y,x) coordinates on which the function values are evaluated.
+        operated_only
+            Passed through to the decorated function.
+
+        Returns
+        -------
+            The 2D image, which is zero outside the light profile's truncation radius.
+        """
+        if not isinstance(grid, np.ndarray) or kwargs.get("is_transformed"):
+            return func(obj, grid, operated_only, *args, **kwargs)
+
+        tolerance = truncation_tolerance()
+
+        if tolerance is None:
+            return func(obj, grid, operated_only, *args, **kwargs)
+
+        radius = obj.truncation_radius_from(tolerance=tolerance)
+
+        if radius is None:
+            return func(obj, grid, operated_only, *args, **kwargs)
+
+        index = spatial_index.spatial_index_from(grid=grid).indexes_within_radius_from(
+            grid=grid, centre=obj.centre, radius=radius
+        )
+
+        if index.shape[0] == grid.shape[0]:
+            return func(obj, grid, operated_only, *args, **kwargs)
+
+        image = np.zeros(shape=(grid.shape[0],), dtype=precision.dtype())
+
+        if index.shape[0] > 0:
+            image[index] = func(obj, grid[index], operated_only, *args, **kwargs)
+
+        return image
+
+    wrapper.truncatable = True
+
+    return wrapper
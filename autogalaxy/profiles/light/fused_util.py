@@ -0,0 +1,382 @@
+"""
+Numba-compiled kernels which evaluate the image of a standard light profile in a single pass over a grid.
+
+The default evaluation of a light profile's `image_2d_from` method goes through the decorator stack of
+**PyAutoArray** (`transform`, `relocate_to_radial_minimum`) and then evaluates the profile via a chain of NumPy
+operations (`np.multiply`, `np.power`, `np.exp`). Each step allocates a temporary array the size of the (often
+over-sampled) grid.
+
+The kernels in this module instead loop over every (y,x) coordinate once, performing the translation and rotation
+to the profile's reference frame, the radial minimum relocation, the elliptical radius calculation and the profile
+evaluation without creating any intermediate arrays.
+
+Fused kernels are disabled by default and are switched on globally via the `general.yaml` config:
+
+profiles:
+  fused_kernels: true
+"""
+
+import numpy as np
+from typing import Tuple
+
+from autoconf import conf
+
+import autoarray as aa
+
+
+def fused_kernels_enabled() -> bool:
+    """
+    Returns whether standard light profiles evaluate their image via the fused kernels in this module, which is set
+    by the `profiles -> fused_kernels` entry of the `general.yaml` config.
+    """
+    try:
+        return conf.instance["general"]["profiles"]["fused_kernels"]
+    except KeyError:
+        return False
+
+
+@aa.util.numba.jit()
+def elliptical_coordinates_from(
+    y: float,
+    x: float,
+    centre_y: float,
+    centre_x: float,
+    cos_angle: float,
+    sin_angle: float,
+    radial_minimum: float,
+) -> Tuple[float, float]:
+    """
+    Transform a single (y,x) coordinate to the reference frame of a profile, by translating it to the profile's
+    centre and rotating it by the profile's angle, and relocate it to the radial minimum if it is within this radius
+    of the centre.
+
+    This matches the behaviour of the **PyAutoArray** `transform` and `relocate_to_radial_minimum` decorators.
+
+    Parameters
+    ----------
+    y
+        The y coordinate in the original reference frame of the grid.
+    x
+        The x coordinate in the original reference frame of the grid.
+    centre_y
+        The y coordinate of the profile centre.
+    centre_x
+        The x coordinate of the profile centre.
+    cos_angle
+        The cosine of the profile's position angle.
+    sin_angle
+        The sine of the profile's position angle.
+    radial_minimum
+        The minimum radial distance from the centre a coordinate can be evaluated at.
+    """
+    shifted_y = y - centre_y
+    shifted_x = x - centre_x
+
+    transformed_y = shifted_y * cos_angle - shifted_x * sin_angle
+    transformed_x = shifted_x * cos_angle + shifted_y * sin_angle
+
+    radius = np.sqrt(transformed_y**2 + transformed_x**2)
+
+    if radius == 0.0:
+        return radial_minimum, radial_minimum
+
+    if radius < radial_minimum:
+        scale = radial_minimum / radius
+        return transformed_y * scale, transformed_x * scale
+
+    return transformed_y, transformed_x
+
+
+@aa.util.numba.jit()
+def elliptical_radius_from(
+    grid: np.ndarray,
+    index: int,
+    centre_y: float,
+    centre_x: float,
+    cos_angle: float,
+    sin_angle: float,
+    axis_ratio: float,
+    radial_minimum: float,
+) -> float:
+    """
+    Returns the elliptical radius :math: (x^2 + (y^2/q^2))^0.5 of the (y,x) coordinate at `index` of the input grid,
+    after it has been transformed to the reference frame of the profile.
+
+    Parameters
+    ----------
+    grid
+        The (y,x) coordinates in the original reference frame of the grid, as an ndarray of shape [total_coordinates, 2].
+    index
+        The index of the coordinate on the grid whose elliptical radius is computed.
+    axis_ratio
+        The axis-ratio of the profile's ellipse.
+    """
+    y, x = elliptical_coordinates_from(
+        grid[index, 0],
+        grid[index, 1],
+        centre_y,
+        centre_x,
+        cos_angle,
+        sin_angle,
+        radial_minimum,
+    )
+
+    return np.sqrt(x**2 + (y / axis_ratio) ** 2)
+
+
+@aa.util.numba.jit()
+def sersic_image_2d_from(
+    grid: np.ndarray,
+    centre_y: float,
+    centre_x: float,
+    cos_angle: float,
+    sin_angle: float,
+    axis_ratio: float,
+    radial_minimum: float,
+    intensity: float,
+    effective_radius: float,
+    sersic_index: float,
+    sersic_constant: float,
+) -> np.ndarray:
+    """
+    Returns the image of a Sersic light profile evaluated on every (y,x) coordinate of an input grid, computing the
+    coordinate transform, eccentric radius and profile value in one pass.
+    """
+    image = np.zeros(grid.shape[0])
+
+    sqrt_axis_ratio = np.sqrt(axis_ratio)
+    inverse_sersic_index = 1.0 / sersic_index
+
+    for i in range(grid.shape[0]):
+        radius = sqrt_axis_ratio * elliptical_radius_from(
+            grid,
+            i,
+            centre_y,
+            centre_x,
+            cos_angle,
+            sin_angle,
+            axis_ratio,
+            radial_minimum,
+        )
+
+        image[i] = intensity * np.exp(
+            -sersic_constant
+            * (((radius / effective_radius) ** inverse_sersic_index) - 1.0)
+        )
+
+    return image
+
+
+@aa.util.numba.jit()
+def sersic_core_image_2d_from(
+    grid: np.ndarray,
+    centre_y: float,
+    centre_x: float,
+    cos_angle: float,
+    sin_angle: float,
+    axis_ratio: float,
+    radial_minimum: float,
+    intensity_prime: float,
+    effective_radius: float,
+    sersic_index: float,
+    sersic_constant: float,
+    radius_break: float,
+    gamma: float,
+    alpha: float,
+) -> np.ndarray:
+    """
+    Returns the image of a cored-Sersic light profile evaluated on every (y,x) coordinate of an input grid, computing
+    the coordinate transform, eccentric radius and profile value in one pass.
+    """
+    image = np.zeros(grid.shape[0])
+
+    sqrt_axis_ratio = np.sqrt(axis_ratio)
+    radius_break_alpha = radius_break**alpha
+    effective_radius_alpha = effective_radius**alpha
+
+    for i in range(grid.shape[0]):
+        radius = sqrt_axis_ratio * elliptical_radius_from(
+            grid,
+            i,
+            centre_y,
+            centre_x,
+            cos_angle,
+            sin_angle,
+            axis_ratio,
+            radial_minimum,
+        )
+
+        image[i] = (
+            intensity_prime
+            * (1.0 + (radius_break / radius) ** alpha) ** (gamma / alpha)
+            * np.exp(
+                -sersic_constant
+                * (
+                    ((radius**alpha + radius_break_alpha) / effective_radius_alpha)
+                    ** (1.0 / (alpha * sersic_index))
+                )
+            )
+        )
+
+    return image
+
+
+@aa.util.numba.jit()
+def gaussian_image_2d_from(
+    grid: np.ndarray,
+    centre_y: float,
+    centre_x: float,
+    cos_angle: float,
+    sin_angle: float,
+    axis_ratio: float,
+    radial_minimum: float,
+    intensity: float,
+    sigma: float,
+) -> np.ndarray:
+    """
+    Returns the image of a Gaussian light profile evaluated on every (y,x) coordinate of an input grid, computing the
+    coordinate transform, eccentric radius and profile value in one pass.
+    """
+    image = np.zeros(grid.shape[0])
+
+    sqrt_axis_ratio = np.sqrt(axis_ratio)
+    sigma_scaled = sigma / sqrt_axis_ratio
+
+    for i in range(grid.shape[0]):
+        radius = sqrt_axis_ratio * elliptical_radius_from(
+            grid,
+            i,
+            centre_y,
+            centre_x,
+            cos_angle,
+            sin_angle,
+            axis_ratio,
+            radial_minimum,
+        )
+
+        image[i] = intensity * np.exp(-0.5 * (radius / sigma_scaled) ** 2)
+
+    return image
+
+
+@aa.util.numba.jit()
+def moffat_image_2d_from(
+    grid: np.ndarray,
+    centre_y: float,
+    centre_x: float,
+    cos_angle: float,
+    sin_angle: float,
+    axis_ratio: float,
+    radial_minimum: float,
+    intensity: float,
+    alpha: float,
+    beta: float,
+) -> np.ndarray:
+    """
+    Returns the image of a Moffat light profile evaluated on every (y,x) coordinate of an input grid, computing the
+    coordinate transform, eccentric radius and profile value in one pass.
+    """
+    image = np.zeros(grid.shape[0])
+
+    sqrt_axis_ratio = np.sqrt(axis_ratio)
+    alpha_scaled = alpha / sqrt_axis_ratio
+
+    for i in range(grid.shape[0]):
+        radius = sqrt_axis_ratio * elliptical_radius_from(
+            grid,
+            i,
+            centre_y,
+            centre_x,
+            cos_angle,
+            sin_angle,
+            axis_ratio,
+            radial_minimum,
+        )
+
+        image[i] = intensity * (1.0 + (radius / alpha_scaled) ** 2) ** (-beta)
+
+    return image
+
+
+@aa.util.numba.jit()
+def chameleon_image_2d_from(
+    grid: np.ndarray,
+    centre_y: float,
+    centre_x: float,
+    cos_angle: float,
+    sin_angle: float,
+    axis_ratio: float,
+    radial_minimum: float,
+    intensity: float,
+    core_radius_0: float,
+    core_radius_1: float,
+) -> np.ndarray:
+    """
+    Returns the image of a Chameleon light profile evaluated on every (y,x) coordinate of an input grid, computing
+    the coordinate transform, elliptical radius and profile value in one pass.
+    """
+    image = np.zeros(grid.shape[0])
+
+    axis_ratio_factor = (1.0 + axis_ratio) ** 2.0
+    core_0 = (4.0 * core_radius_0**2.0) / axis_ratio_factor
+    core_1 = (4.0 * core_radius_1**2.0) / axis_ratio_factor
+    normalization = intensity / (1.0 + axis_ratio)
+
+    for i in range(grid.shape[0]):
+        radius = elliptical_radius_from(
+            grid,
+            i,
+            centre_y,
+            centre_x,
+            cos_angle,
+            sin_angle,
+            axis_ratio,
+            radial_minimum,
+        )
+
+        radius_squared = radius**2
+
+        image[i] = normalization * (
+            1.0 / np.sqrt(radius_squared + core_0)
+            - 1.0 / np.sqrt(radius_squared + core_1)
+        )
+
+    return image
+
+
+@aa.util.numba.jit()
+def eff_image_2d_from(
+    grid: np.ndarray,
+    centre_y: float,
+    centre_x: float,
+    cos_angle: float,
+    sin_angle: float,
+    axis_ratio: float,
+    radial_minimum: float,
+    intensity: float,
+    effective_radius: float,
+    eta: float,
+) -> np.ndarray:
+    """
+    Returns the image of an Elson, Fall and Freeman (EFF) light profile evaluated on every (y,x) coordinate of an
+    input grid, computing the coordinate transform, eccentric radius and profile value in one pass.
+    """
+    image = np.zeros(grid.shape[0])
+
+    sqrt_axis_ratio = np.sqrt(axis_ratio)
+
+    for i in range(grid.shape[0]):
+        radius = sqrt_axis_ratio * elliptical_radius_from(
+            grid,
+            i,
+            centre_y,
+            centre_x,
+            cos_angle,
+            sin_angle,
+            axis_ratio,
+            radial_minimum,
+        )
+
+        image[i] = intensity * (1.0 + (radius / effective_radius) ** 2) ** (-eta)
+
+    return image
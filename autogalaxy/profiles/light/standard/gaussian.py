@@ -4,8 +4,11 @@ from typing import Optional, Tuple
 import autoarray as aa
 
 from autogalaxy.profiles.light.abstract import LightProfile
+from autogalaxy.profiles.light import fused_util
 from autogalaxy.profiles.light.decorators import (
     check_operated_only,
+    fused_kernel,
+    truncate,
 )
 
 
@@ -69,9 +72,21 @@ class Gaussian(LightProfile):
             ),
         )
 
+    def _image_2d_fused_from(
+        self, grid: np.ndarray, radial_minimum: float
+    ) -> np.ndarray:
+        return fused_util.gaussian_image_2d_from(
+            grid=grid,
+            **self._fused_geometry_dict_from(radial_minimum=radial_minimum),
+            intensity=self._intensity,
+            sigma=self.sigma,
+        )
+
     @aa.over_sample
     @aa.grid_dec.to_array
     @check_operated_only
+    @truncate
+    @fused_kernel
     @aa.grid_dec.transform
     @aa.grid_dec.relocate_to_radial_minimum
     def image_2d_from(
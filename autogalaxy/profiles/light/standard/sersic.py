@@ -3,9 +3,13 @@ from typing import Optional, Tuple
 
 import autoarray as aa
 
+from autogalaxy.profiles.geometry_profiles import derived_property
 from autogalaxy.profiles.light.abstract import LightProfile
+from autogalaxy.profiles.light import fused_util
 from autogalaxy.profiles.light.decorators import (
     check_operated_only,
+    fused_kernel,
+    truncate,
 )
 
 
@@ -39,7 +43,7 @@ class AbstractSersic(LightProfile):
         self.effective_radius = effective_radius
         self.sersic_index = sersic_index
 
-    @property
+    @derived_property
     def elliptical_effective_radius(self) -> float:
         """
         The `effective_radius` of a Sersic light profile is defined as the circular effective radius, which is the
@@ -52,7 +56,7 @@ class AbstractSersic(LightProfile):
         """
         return self.effective_radius / np.sqrt(self.axis_ratio)
 
-    @property
+    @derived_property
     def sersic_constant(self) -> float:
         """
         A parameter derived from Sersic index which ensures that effective radius contains 50% of the profile's
@@ -144,9 +148,23 @@ class Sersic(AbstractSersic, LightProfile):
             ),
         )
 
+    def _image_2d_fused_from(
+        self, grid: np.ndarray, radial_minimum: float
+    ) -> np.ndarray:
+        return fused_util.sersic_image_2d_from(
+            grid=grid,
+            **self._fused_geometry_dict_from(radial_minimum=radial_minimum),
+            intensity=self._intensity,
+            effective_radius=self.effective_radius,
+            sersic_index=self.sersic_index,
+            sersic_constant=self.sersic_constant,
+        )
+
     @aa.over_sample
     @aa.grid_dec.to_array
     @check_operated_only
+    @truncate
+    @fused_kernel
     @aa.grid_dec.transform
     @aa.grid_dec.relocate_to_radial_minimum
     def image_2d_from(
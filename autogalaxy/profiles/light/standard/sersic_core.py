@@ -1,6 +1,8 @@
 import numpy as np
 from typing import Tuple
 
+from autogalaxy.profiles.geometry_profiles import derived_property
+from autogalaxy.profiles.light import fused_util
 from autogalaxy.profiles.light.standard.sersic import Sersic
 
 
@@ -52,7 +54,7 @@ class SersicCore(Sersic):
         self.alpha = alpha
         self.gamma = gamma
 
-    @property
+    @derived_property
     def intensity_prime(self) -> float:
         """
         Overall intensity normalisation in the rescaled cored Sersic light profile.
@@ -114,6 +116,21 @@ class SersicCore(Sersic):
             ),
         )
 
+    def _image_2d_fused_from(
+        self, grid: np.ndarray, radial_minimum: float
+    ) -> np.ndarray:
+        return fused_util.sersic_core_image_2d_from(
+            grid=grid,
+            **self._fused_geometry_dict_from(radial_minimum=radial_minimum),
+            intensity_prime=self.intensity_prime,
+            effective_radius=self.effective_radius,
+            sersic_index=self.sersic_index,
+            sersic_constant=self.sersic_constant,
+            radius_break=self.radius_break,
+            gamma=self.gamma,
+            alpha=self.alpha,
+        )
+
 
 class SersicCoreSph(SersicCore):
     def __init__(
@@ -4,6 +4,7 @@ from typing import Tuple
 
 import autoarray as aa
 
+from autogalaxy.profiles.geometry_profiles import derived_property
 from autogalaxy.profiles.mass.abstract.abstract import MassProfile
 from autogalaxy.cosmology.lensing import LensingCosmology
 from autogalaxy.cosmology.wrap import Planck15
@@ -333,6 +334,6 @@ class AbstractgNFW(MassProfile, DarkProfile, MassProfileMGE):
             * (radius_at_200_kpc**3.0)
         )
 
-    @property
+    @derived_property
     def ellipticity_rescale(self):
         return 1.0 - ((1.0 - self.axis_ratio) / 2.0)
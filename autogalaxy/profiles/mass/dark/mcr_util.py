@@ -2,18 +2,90 @@ from astropy import units
 
 import numpy as np
 import warnings
+import weakref
+from scipy.interpolate import RectBivariateSpline
+from typing import Dict, Optional, Tuple
 
+from autogalaxy.cosmology.lensing import LensingCosmology
 from autogalaxy.cosmology.wrap import Planck15
 
+"""
+The maximum number of (redshift_object, redshift_source) pairs whose cosmological quantities are cached per
+cosmology, above which the cache is cleared (e.g. if the redshifts are free parameters of a model).
+"""
+conversion_cache_size = 1000
 
-def kappa_s_and_scale_radius_for_duffy(mass_at_200, redshift_object, redshift_source):
+_planck15: Optional[Planck15] = None
+
+_conversion_dict: Dict[int, Tuple[weakref.ref, Dict]] = {}
+
+_ludlow_concentration_spline: Optional[RectBivariateSpline] = None
+
+"""
+The range and number of the log10 masses and ln(1 + redshift) values of the Ludlow concentration table, which
+interpolates the colossus concentrations to a fractional precision of ~1e-4.
+"""
+ludlow_log10_mass_range = (4.0, 17.0)
+ludlow_log_redshift_range = (0.0, np.log(11.0))
+ludlow_table_shape = (201, 261)
+
+
+def planck15() -> Planck15:
     """
-    Computes the AutoGalaxy NFW parameters (kappa_s, scale_radius) for an NFW halo of the given
-    mass, enforcing the Duffy '08 mass-concentration relation.
+    Returns the `Planck15` cosmology used for the mass-concentration relations, which is created once and reused
+    so that its cached cosmological quantities are reused.
+    """
+    global _planck15
 
-    Interprets mass as *`M_{200c}`*, not `M_{200m}`.
+    if _planck15 is None:
+        _planck15 = Planck15()
+
+    return _planck15
+
+
+def cosmology_quantities_from(
+    redshift_object: float,
+    redshift_source: float,
+    cosmology: Optional[LensingCosmology] = None,
+) -> Tuple[float, float, float]:
+    """
+    Returns the cosmological quantities used to convert the mass of an NFW halo to its `kappa_s` and `scale_radius`:
+    the critical density of the Universe at the halo's redshift (solMass / kpc^3), the critical surface density
+    between the halo and source redshifts (solMass / kpc^2) and the kpc per arcsecond at the halo's redshift.
+
+    These only depend on the redshifts and cosmology, so they are computed once for every pair of redshifts and
+    cosmology and then reused, such that creating a mass-concentration profile for every sample of a model-fit does
+    not repeat the astropy distance calculations.
+
+    Parameters
+    ----------
+    redshift_object
+        The redshift of the halo.
+    redshift_source
+        The redshift of the source galaxy, which the critical surface density is computed for.
+    cosmology
+        The cosmology the quantities are computed for, which is `Planck15` if not input.
     """
-    cosmology = Planck15()
+    if cosmology is None:
+        cosmology = planck15()
+
+    key = id(cosmology)
+
+    try:
+        cosmology_ref, quantities_dict = _conversion_dict[key]
+
+        if cosmology_ref() is not cosmology:
+            raise KeyError
+    except KeyError:
+        quantities_dict = {}
+
+        _conversion_dict[key] = (weakref.ref(cosmology), quantities_dict)
+        weakref.finalize(cosmology, _conversion_dict.pop, key, None)
+
+    try:
+        return quantities_dict[(redshift_object, redshift_source)]
+    except KeyError:
+        pass
 
     cosmic_average_density = (
         cosmology.critical_density(redshift_object).to(units.solMass / units.kpc**3)
@@ -27,6 +99,110 @@ def kappa_s_and_scale_radius_for_duffy(mass_at_200, redshift_object, redshift_so
 
     kpc_per_arcsec = cosmology.kpc_per_arcsec_from(redshift=redshift_object)
 
+    if len(quantities_dict) >= conversion_cache_size:
+        quantities_dict.clear()
+
+    quantities = (cosmic_average_density, critical_surface_density, kpc_per_arcsec)
+
+    quantities_dict[(redshift_object, redshift_source)] = quantities
+
+    return quantities
+
+
+def ludlow_concentration_spline() -> RectBivariateSpline:
+    """
+    Returns a spline interpolating the log10 concentration of the Ludlow '16 mass-concentration relation (computed
+    via colossus for the `planck15` cosmology) as a function of ln(1 + redshift) and log10 `M_{200c}` (solMass).
+
+    The table is computed via colossus once, the first time a Ludlow concentration is requested, which removes the
+    cost of solving for the concentration via colossus every time a profile is created.
+    """
+    global _ludlow_concentration_spline
+
+    if _ludlow_concentration_spline is not None:
+        return _ludlow_concentration_spline
+
+    from colossus.cosmology import cosmology as col_cosmology
+    from colossus.halo.concentration import concentration as col_concentration
+
+    warnings.filterwarnings("ignore")
+
+    col_cosmo = col_cosmology.setCosmology("planck15")
+
+    log_redshifts = np.linspace(*ludlow_log_redshift_range, ludlow_table_shape[0])
+    log10_masses = np.linspace(*ludlow_log10_mass_range, ludlow_table_shape[1])
+
+    log10_concentrations = np.array(
+        [
+            np.log10(
+                col_concentration(
+                    10.0**log10_masses * col_cosmo.h,
+                    "200c",
+                    np.exp(log_redshift) - 1.0,
+                    model="ludlow16",
+                )
+            )
+            for log_redshift in log_redshifts
+        ]
+    )
+
+    _ludlow_concentration_spline = RectBivariateSpline(
+        log_redshifts, log10_masses, log10_concentrations
+    )
+
+    return _ludlow_concentration_spline
+
+
+def ludlow_concentration_from(mass_at_200: float, redshift_object: float) -> float:
+    """
+    Returns the concentration of an NFW halo of mass `M_{200c}` given by the Ludlow '16 mass-concentration relation,
+    interpolated from the table of `ludlow_concentration_spline`.
+
+    Masses and redshifts outside the table are computed via colossus directly.
+
+    Parameters
+    ----------
+    mass_at_200
+        The mass of the halo (`M_{200c}`) in solar masses.
+    redshift_object
+        The redshift of the halo.
+    """
+    log10_mass = np.log10(mass_at_200)
+    log_redshift = np.log(1.0 + redshift_object)
+
+    if (
+        ludlow_log10_mass_range[0] <= log10_mass <= ludlow_log10_mass_range[1]
+        and ludlow_log_redshift_range[0] <= log_redshift <= ludlow_log_redshift_range[1]
+    ):
+        return 10.0 ** float(ludlow_concentration_spline().ev(log_redshift, log10_mass))
+
+    from colossus.cosmology import cosmology as col_cosmology
+    from colossus.halo.concentration import concentration as col_concentration
+
+    warnings.filterwarnings("ignore")
+
+    col_cosmo = col_cosmology.setCosmology("planck15")
+
+    return col_concentration(
+        mass_at_200 * col_cosmo.h, "200c", redshift_object, model="ludlow16"
+    )
+
+
+def kappa_s_and_scale_radius_for_duffy(mass_at_200, redshift_object, redshift_source):
+    """
+    Computes the AutoGalaxy NFW parameters (kappa_s, scale_radius) for an NFW halo of the given
+    mass, enforcing the Duffy '08 mass-concentration relation.
+
+    Interprets mass as *`M_{200c}`*, not `M_{200m}`.
+    """
+    (
+        cosmic_average_density,
+        critical_surface_density,
+        kpc_per_arcsec,
+    ) = cosmology_quantities_from(
+        redshift_object=redshift_object, redshift_source=redshift_source
+    )
+
     radius_at_200 = (
         mass_at_200 / (200.0 * cosmic_average_density * (4.0 * np.pi / 3.0))
     ) ** (
@@ -64,33 +240,20 @@ def kappa_s_and_scale_radius_for_ludlow(
 
     Interprets mass as *`M_{200c}`*, not `M_{200m}`.
     """
-    from colossus.cosmology import cosmology as col_cosmology
-    from colossus.halo.concentration import concentration as col_concentration
-
-    warnings.filterwarnings("ignore")
-
-    cosmology = Planck15()
-
-    col_cosmo = col_cosmology.setCosmology("planck15")
-    m_input = mass_at_200 * col_cosmo.h
-    concentration = col_concentration(
-        m_input, "200c", redshift_object, model="ludlow16"
+    concentration = ludlow_concentration_from(
+        mass_at_200=mass_at_200, redshift_object=redshift_object
     )
 
     concentration = 10.0 ** (np.log10(concentration) + scatter_sigma * 0.15)
 
-    cosmic_average_density = (
-        cosmology.critical_density(redshift_object).to(units.solMass / units.kpc**3)
-    ).value
-
-    critical_surface_density = (
-        cosmology.critical_surface_density_between_redshifts_solar_mass_per_kpc2_from(
-            redshift_0=redshift_object, redshift_1=redshift_source
-        )
+    (
+        cosmic_average_density,
+        critical_surface_density,
+        kpc_per_arcsec,
+    ) = cosmology_quantities_from(
+        redshift_object=redshift_object, redshift_source=redshift_source
     )
 
-    kpc_per_arcsec = cosmology.kpc_per_arcsec_from(redshift=redshift_object)
-
     radius_at_200 = (
         mass_at_200 / (200.0 * cosmic_average_density * (4.0 * np.pi / 3.0))
     ) ** (
@@ -5,6 +5,7 @@ from typing import List, Tuple
 
 import autoarray as aa
 
+from autogalaxy.profiles.geometry_profiles import derived_property
 from autogalaxy.profiles.mass.abstract.abstract import MassProfile
 from autogalaxy.profiles.mass.abstract.mge import (
     MassProfileMGE,
@@ -325,7 +326,7 @@ class AbstractSersic(MassProfile, MassProfileMGE, MassProfileCSE, StellarProfile
             sample_points=sample_points,
         )
 
-    @property
+    @derived_property
     def sersic_constant(self):
         """A parameter derived from Sersic index which ensures that effective radius contains 50% of the profile's
         total integrated light.
@@ -339,11 +340,11 @@ class AbstractSersic(MassProfile, MassProfileMGE, MassProfileCSE, StellarProfile
             - (2194697.0 / (30690717750.0 * self.sersic_index**4))
         )
 
-    @property
+    @derived_property
     def ellipticity_rescale(self):
         return 1.0 - ((1.0 - self.axis_ratio) / 2.0)
 
-    @property
+    @derived_property
     def elliptical_effective_radius(self):
         """
         The effective_radius of a Sersic light profile is defined as the circular effective radius. This is the \
@@ -3,6 +3,7 @@ from typing import Tuple
 
 import autoarray as aa
 
+from autogalaxy.profiles.geometry_profiles import derived_property
 from autogalaxy.profiles.mass.stellar.sersic import Sersic
 
 
@@ -125,7 +126,7 @@ class SersicCore(Sersic):
             func=core_sersic_2D, radii_min=radii_min, radii_max=radii_max
         )
 
-    @property
+    @derived_property
     def intensity_prime(self):
         """Overall intensity normalisation in the rescaled Core-Sersic light profiles (electrons per second)"""
         return (
@@ -5,6 +5,7 @@ from typing import Tuple
 
 import autoarray as aa
 
+from autogalaxy.profiles.geometry_profiles import derived_property
 from autogalaxy.profiles.mass.abstract.abstract import MassProfile
 
 
@@ -39,7 +40,7 @@ class PowerLawCore(MassProfile):
         self.slope = slope
         self.core_radius = core_radius
 
-    @property
+    @derived_property
     def einstein_radius_rescaled(self):
         """
         Rescale the einstein radius by slope and axis_ratio, to reduce its degeneracy with other mass-profiles
@@ -178,7 +179,7 @@ class PowerLawCore(MassProfile):
             (1 - (1 - axis_ratio**2) * u) ** (npow + 0.5)
         )
 
-    @property
+    @derived_property
     def ellipticity_rescale(self):
         return (1.0 + self.axis_ratio) / 2.0
 
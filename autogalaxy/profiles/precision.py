@@ -0,0 +1,112 @@
+"""
+Controls the floating point precision light and mass profiles are evaluated in.
+
+By default every profile is evaluated in double precision (`float64`). Evaluating profiles in single precision
+(`float32`) halves the memory traffic of every array operation performed on a grid, which is significant for
+over-sampled grids where every image pixel is evaluated at many sub-pixel coordinates.
+
+In single precision mode, the grid is cast to `float32` after it is transformed to the reference frame of each
+profile, so that the coordinate translation and rotation are performed in double precision. Every subsequent
+calculation (e.g. elliptical radii, the image of a light profile, the deflection angles of a mass profile) is
+then performed in single precision.
+
+The quantities which sum over every pixel of a fit, for example the `chi_squared` and `noise_normalization`, are
+always computed in double precision. This is because the data and noise-map of a dataset are double precision,
+meaning the residuals of a single precision model image are promoted to double precision by NumPy.
+
+The precision is set globally via the `general.yaml` config:
+
+profiles:
+  precision: float32
+
+Or for a specific calculation via the `profile_precision` context manager:
+
+with ag.profile_precision("float32"):
+    fit = ag.FitImaging(dataset=dataset, galaxies=galaxies)
+
+The precision set by the context manager is stored in a `ContextVar`, such that it only applies to the thread (or
+asyncio task) which entered it and a fit performed in another thread at the same time is not affected. The thread
+pool galaxies are evaluated in (see `operate.pool`) runs every task in a copy of the caller's context, so the
+galaxies of a fit are evaluated in the precision of the thread performing the fit.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+import numpy as np
+
+from autoconf import conf
+
+_precision: ContextVar[Optional[np.dtype]] = ContextVar(
+    "profile_precision", default=None
+)
+
+
+def dtype() -> np.dtype:
+    """
+    Returns the dtype light and mass profiles are currently evaluated in, which is the precision of the
+    innermost `profile_precision` context manager if one is active and the `profiles -> precision` entry of
+    the `general.yaml` config otherwise.
+    """
+    profile_dtype = _precision.get()
+
+    if profile_dtype is not None:
+        return profile_dtype
+
+    try:
+        return np.dtype(conf.instance["general"]["profiles"]["precision"])
+    except KeyError:
+        return np.dtype("float64")
+
+
+def array_from(array: np.ndarray) -> np.ndarray:
+    """
+    Returns an array cast to the precision profiles are currently evaluated in.
+
+    No copy is made if the array is already in this precision.
+
+    Parameters
+    ----------
+    array
+        The array (e.g. a grid of (y,x) coordinates transformed to a profile's reference frame) which is cast.
+    """
+    profile_dtype = dtype()
+
+    if array.dtype == profile_dtype or not np.issubdtype(array.dtype, np.floating):
+        return array
+
+    return array.astype(profile_dtype)
+
+
+@contextmanager
+def profile_precision(precision: str):
+    """
+    Context manager which evaluates all light and mass profiles in the input precision, overriding
+    the `profiles -> precision` entry of the `general.yaml` config.
+
+    For example, the following fit evaluates its light profile images in single precision, but computes its
+    `chi_squared` and `noise_normalization` in double precision:
+
+    with ag.profile_precision("float32"):
+        fit = ag.FitImaging(dataset=dataset, galaxies=galaxies)
+        log_likelihood = fit.log_likelihood
+
+    Parameters
+    ----------
+    precision
+        The precision profiles are evaluated in, which is either "float32" or "float64".
+    """
+    profile_dtype = np.dtype(precision)
+
+    if profile_dtype not in (np.dtype("float32"), np.dtype("float64")):
+        raise ValueError(
+            f"The profile precision must be float32 or float64, but {precision} was input."
+        )
+
+    token = _precision.set(profile_dtype)
+
+    try:
+        yield
+    finally:
+        _precision.reset(token)
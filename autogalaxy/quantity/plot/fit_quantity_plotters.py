@@ -1,7 +1,5 @@
 import autoarray as aa
 
-from autoarray.fit.plot.fit_imaging_plotters import FitImagingPlotterMeta
-
 from autogalaxy.quantity.fit_quantity import FitQuantity
 
 from autogalaxy.plot.abstract_plotters import Plotter
@@ -9,6 +7,8 @@ from autogalaxy.plot.mat_plot.two_d import MatPlot2D
 from autogalaxy.plot.visuals.two_d import Visuals2D
 from autogalaxy.plot.include.two_d import Include2D
 
+from autoarray.fit.plot.fit_imaging_plotters import FitImagingPlotterMeta
+
 
 # TODO : Ew, this is a mass, but it works. Clean up one day!
 
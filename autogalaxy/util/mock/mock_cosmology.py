@@ -46,3 +46,24 @@ class MockCosmology(Planck15):
 
     def critical_density(self, z):
         return Value(value=self.cosmic_average_density)
+
+    def arcsec_per_kpc_from(self, redshift):
+        return self.arcsec_per_kpc
+
+    def kpc_per_arcsec_from(self, redshift):
+        return self.kpc_per_arcsec
+
+    def lensing_distances_in_kpc_from(self, redshift_0, redshift_1):
+        return (
+            1.0,
+            1.0,
+            self.angular_diameter_distance_z1z2(z1=redshift_0, z2=redshift_1).value,
+        )
+
+    def critical_surface_density_between_redshifts_from(self, redshift_0, redshift_1):
+        return (
+            self.critical_surface_density_between_redshifts_solar_mass_per_kpc2_from(
+                redshift_0=redshift_0, redshift_1=redshift_1
+            )
+            * self.kpc_per_arcsec**2.0
+        )
@@ -0,0 +1,341 @@
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from os import path
+from typing import Callable, Dict, List, Optional
+
+
+class ProfileNode:
+    def __init__(self, name: str):
+        """
+        A node of the call tree of a `LikelihoodProfiler`, which stores the total time spent in (and the peak memory
+        allocated by) a stage of the log likelihood function, for example the evaluation of a light profile, and
+        the stages it calls as its children.
+
+        Parameters
+        ----------
+        name
+            The name of the stage, which is its label in the call tree and flamegraph.
+        """
+        self.name = name
+
+        self.time = 0.0
+        self.memory = 0
+        self.calls = 0
+
+        self.children: Dict[str, ProfileNode] = {}
+
+    def child_from(self, name: str) -> "ProfileNode":
+        """
+        Returns the child node of a stage called by this stage, which is created the first time it is called.
+
+        Parameters
+        ----------
+        name
+            The name of the stage.
+        """
+        try:
+            return self.children[name]
+        except KeyError:
+            child = ProfileNode(name=name)
+            self.children[name] = child
+            return child
+
+    @property
+    def self_time(self) -> float:
+        """
+        The time spent in this stage which is not spent in any of its children.
+        """
+        return max(self.time - sum(child.time for child in self.children.values()), 0.0)
+
+    @property
+    def dict(self) -> Dict:
+        """
+        The call tree starting at this node as a nested dictionary, which is output as a .json file.
+        """
+        return {
+            "name": self.name,
+            "time": self.time,
+            "self_time": self.self_time,
+            "memory": self.memory,
+            "calls": self.calls,
+            "children": [child.dict for child in self.children.values()],
+        }
+
+    def folded_list_from(self, prefix: str = "") -> List[str]:
+        """
+        Returns the call tree starting at this node in the folded (collapsed) stack format read by flamegraph tools
+        (e.g. `flamegraph.pl`, `speedscope`, `inferno`).
+
+        Every line is the `;` separated names of a stage and all stages which called it, followed by the self time
+        of the stage in microseconds.
+
+        Parameters
+        ----------
+        prefix
+            The folded names of the stages which called this stage.
+        """
+        stack = f"{prefix};{self.name}" if prefix else self.name
+
+        folded_list = [f"{stack} {int(round(self.self_time * 1.0e6))}"]
+
+        for child in self.children.values():
+            folded_list += child.folded_list_from(prefix=stack)
+
+        return folded_list
+
+
+class LikelihoodProfiler:
+    def __init__(
+        self, name: str = "log_likelihood_function", trace_memory: bool = True
+    ):
+        """
+        Profiles the log likelihood function hierarchically, attributing its run time (and the peak memory it
+        allocates) to a call tree of its stages: for example the fit, every galaxy, every light or mass profile
+        of a galaxy, the transform of the grid to a profile's reference frame, PSF convolution, Fourier transforms
+        and the steps of an inversion.
+
+        Stages are profiled when the profiler is active (inside a `with profiler:` block) via the `profile_block`
+        context manager and `profile_stage` decorator, which are placed at these stages of the source code and do
+        nothing when no profiler is active.
+
+        The call tree is output as a .json file and as a folded stack file, which is read by flamegraph tools
+        to visualize where the log likelihood function spends its time.
+
+        Parameters
+        ----------
+        name
+            The name of the root of the call tree.
+        trace_memory
+            If `True`, the peak memory allocated by every stage is measured via `tracemalloc`, which slows down the
+            profiled code.
+        """
+        self.root = ProfileNode(name=name)
+        self.trace_memory = trace_memory
+
+        self._node_list = [self.root]
+        self._peak_list = [0]
+
+    def __enter__(self) -> "LikelihoodProfiler":
+        global _profiler
+
+        if self.trace_memory:
+            tracemalloc.start()
+
+        _profiler = self
+        self._start = self._block_start()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        global _profiler
+
+        self._block_end(node=self.root, start=self._start)
+
+        _profiler = None
+
+        if self.trace_memory:
+            tracemalloc.stop()
+
+    def _block_start(self):
+        if not self.trace_memory:
+            return time.perf_counter(), 0
+
+        current, peak = tracemalloc.get_traced_memory()
+
+        self._peak_list[-1] = max(self._peak_list[-1], peak)
+        self._peak_list.append(0)
+
+        tracemalloc.reset_peak()
+
+        return time.perf_counter(), current
+
+    def _block_end(self, node: ProfileNode, start):
+        start_time, start_memory = start
+
+        node.time += time.perf_counter() - start_time
+        node.calls += 1
+
+        if not self.trace_memory:
+            return
+
+        peak = max(self._peak_list.pop(), tracemalloc.get_traced_memory()[1])
+
+        node.memory = max(node.memory, peak - start_memory)
+
+        if self._peak_list:
+            self._peak_list[-1] = max(self._peak_list[-1], peak)
+
+    @contextmanager
+    def block(self, name: str):
+        """
+        Profiles the code inside the context manager as a stage of the call tree, which is a child of the stage
+        currently being profiled.
+
+        If the stage currently being profiled has the same name (e.g. a method which calls the same method of its
+        parent class) the code is profiled as part of that stage.
+
+        Parameters
+        ----------
+        name
+            The name of the stage.
+        """
+        parent = self._node_list[-1]
+
+        if parent.name == name:
+            yield
+            return
+
+        node = parent.child_from(name=name)
+
+        self._node_list.append(node)
+        start = self._block_start()
+
+        try:
+            yield
+        finally:
+            self._block_end(node=node, start=start)
+            self._node_list.pop()
+
+    def output_to(self, file_path: str):
+        """
+        Outputs the call tree to the folder `file_path` as the file `profile_tree.json` and as the folded stack
+        file `profile.folded`, which can be opened by flamegraph tools (e.g. `flamegraph.pl profile.folded`).
+
+        Parameters
+        ----------
+        file_path
+            The folder the files are output to (e.g. the `profile_path` of a model-fit).
+        """
+        os.makedirs(file_path, exist_ok=True)
+
+        with open(path.join(file_path, "profile_tree.json"), "w+") as f:
+            json.dump(self.root.dict, f, indent=4)
+
+        with open(path.join(file_path, "profile.folded"), "w+") as f:
+            f.write("\n".join(self.root.folded_list_from()) + "\n")
+
+
+_profiler: Optional[LikelihoodProfiler] = None
+
+_null_context = nullcontext()
+
+
+def is_active() -> bool:
+    """
+    Returns whether a `LikelihoodProfiler` is active, in which case code which is otherwise evaluated in parallel
+    (see `autogalaxy.operate.pool`) is evaluated sequentially so that its stages are profiled in order.
+    """
+    return _profiler is not None
+
+
+def profile_block(*name_list):
+    """
+    Returns a context manager which profiles the code inside it as a stage of the active `LikelihoodProfiler`, or
+    which does nothing if no profiler is active.
+
+    The name of the stage is the input names joined by `_`, which is only performed when a profiler is active
+    such that profiling has negligible overhead when it is not used.
+
+    Parameters
+    ----------
+    name_list
+        The names (e.g. `"galaxy"` and its index) which are joined to give the name of the stage.
+    """
+    if _profiler is None:
+        return _null_context
+
+    return _profiler.block(name="_".join(str(name) for name in name_list))
+
+
+def profile_profile_block(galaxy, profile):
+    """
+    Returns a context manager which profiles the evaluation of a light or mass profile of a galaxy as a stage of
+    the active `LikelihoodProfiler`, or which does nothing if no profiler is active.
+
+    The stage is named after the attribute of the galaxy the profile is (e.g. `bulge`) and its class.
+
+    Parameters
+    ----------
+    galaxy
+        The galaxy containing the profile.
+    profile
+        The light or mass profile which is evaluated.
+    """
+    if _profiler is None:
+        return _null_context
+
+    name = next(
+        (key for key, value in galaxy.__dict__.items() if value is profile), "profile"
+    )
+
+    return _profiler.block(name=f"{name} ({profile.__class__.__name__})")
+
+
+_inversion_step_list = [
+    "data_vector",
+    "curvature_matrix",
+    "regularization_matrix",
+    "curvature_reg_matrix",
+    "reconstruction",
+    "mapped_reconstructed_data",
+    "log_det_curvature_reg_matrix_term",
+    "log_det_regularization_matrix_term",
+]
+
+
+def profile_inversion_steps(inversion):
+    """
+    Profiles the steps of an inversion (the data vector, curvature matrix, regularization matrix, reconstruction,
+    etc.) as stages of the active `LikelihoodProfiler`, or does nothing if no profiler is active.
+
+    The steps of an inversion are cached properties computed lazily when the log likelihood is computed, such that
+    they cannot be profiled where they are called. This function therefore computes them in the order they depend on
+    one another when the inversion is created, with every step profiled as its own stage. The log likelihood then
+    uses the cached values.
+
+    If a step raises an exception (e.g. a reconstruction which fails), no further steps are computed and the
+    exception is raised when the log likelihood computes the step again.
+
+    Parameters
+    ----------
+    inversion
+        The inversion whose steps are profiled.
+    """
+    if _profiler is None:
+        return
+
+    for step in _inversion_step_list:
+        with _profiler.block(name=step):
+            try:
+                getattr(inversion, step)
+            except Exception:
+                return
+
+
+def profile_stage(name: str) -> Callable:
+    """
+    Decorator which profiles every call to a function as a stage of the active `LikelihoodProfiler`, or which
+    calls the function directly if no profiler is active.
+
+    Parameters
+    ----------
+    name
+        The name of the stage (e.g. `transform`).
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _profiler is None:
+                return func(*args, **kwargs)
+
+            with _profiler.block(name=name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
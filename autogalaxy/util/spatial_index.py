@@ -0,0 +1,239 @@
+import numpy as np
+import weakref
+from typing import Dict, Optional, Tuple, Union
+
+import autoarray as aa
+
+
+class SpatialIndex:
+    def __init__(
+        self,
+        grid: np.ndarray,
+        over_sample_size: Optional[np.ndarray] = None,
+        points_per_cell: int = 16,
+    ):
+        """
+        A spatial index of a grid of (y,x) coordinates, which bins every coordinate into a uniform 2D array of
+        rectangular cells spanning the grid's extent.
+
+        If the grid is the (y,x) pixel centres of a `Grid2D`, its over sampling size in every pixel can be input,
+        such that the indexes of the over-sampled coordinates in any set of pixels can be computed (see
+        `over_sampled_indexes_from`).
+
+        The index stores only the cell of every coordinate and not the coordinates themselves, so that it does not
+        keep the grid it indexes in memory.
+
+        The coordinates are sorted by the cell they are in, such that all coordinates in a row of cells are stored
+        contiguously. This means the coordinates inside a rectangular region (e.g. the bounding box of a compact
+        light profile) are found by slicing one contiguous block of indexes per row of cells the region overlaps,
+        without checking every coordinate on the grid.
+
+        Parameters
+        ----------
+        grid
+            The (y,x) coordinates which are indexed, of shape [total_coordinates, 2].
+        over_sample_size
+            The over sampling size of every pixel of the grid, where the over-sampled coordinates of each pixel are
+            stored contiguously in the over-sampled grid.
+        points_per_cell
+            The average number of coordinates in each cell, which sets the number of cells for a uniform grid.
+        """
+        grid = np.asarray(grid)
+
+        if over_sample_size is not None:
+            self.over_sample_total = np.square(np.asarray(over_sample_size)).astype(
+                "int"
+            )
+            self.over_sample_start = (
+                np.cumsum(self.over_sample_total) - self.over_sample_total
+            )
+
+        total_points = grid.shape[0]
+
+        self.y_min, self.x_min = np.min(grid, axis=0)
+        y_max, x_max = np.max(grid, axis=0)
+
+        total_cells = max(int(np.sqrt(total_points / points_per_cell)), 1)
+
+        self.shape = (total_cells, total_cells)
+        self.cell_size = (
+            max((y_max - self.y_min) / total_cells, np.finfo(float).eps),
+            max((x_max - self.x_min) / total_cells, np.finfo(float).eps),
+        )
+
+        cell_y, cell_x = self.cell_indexes_from(grid=grid)
+
+        cell_index = cell_y * self.shape[1] + cell_x
+
+        self.sort_index = np.argsort(cell_index, kind="stable")
+        self.cell_start = np.searchsorted(
+            cell_index[self.sort_index], np.arange(self.shape[0] * self.shape[1] + 1)
+        )
+
+    def cell_indexes_from(self, grid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the (y,x) indexes of the cells every input coordinate is in, where coordinates outside the
+        extent of the indexed grid are assigned to the nearest edge cell.
+
+        Parameters
+        ----------
+        grid
+            The (y,x) coordinates whose cell indexes are computed, of shape [total_coordinates, 2].
+        """
+        cell_y = np.floor((grid[:, 0] - self.y_min) / self.cell_size[0]).astype("int")
+        cell_x = np.floor((grid[:, 1] - self.x_min) / self.cell_size[1]).astype("int")
+
+        return (
+            np.clip(cell_y, 0, self.shape[0] - 1),
+            np.clip(cell_x, 0, self.shape[1] - 1),
+        )
+
+    def indexes_in_box_from(
+        self, centre: Tuple[float, float], half_width: float
+    ) -> np.ndarray:
+        """
+        Returns the (sorted) indexes of all coordinates in the cells which overlap a square box, which includes every
+        coordinate inside the box and some coordinates just outside it.
+
+        Parameters
+        ----------
+        centre
+            The (y,x) centre of the box.
+        half_width
+            The half-width of the box, such that it spans `centre - half_width` to `centre + half_width` in both
+            dimensions.
+        """
+        corners = np.array(
+            [
+                [centre[0] - half_width, centre[1] - half_width],
+                [centre[0] + half_width, centre[1] + half_width],
+            ]
+        )
+
+        y_max = self.y_min + self.shape[0] * self.cell_size[0]
+        x_max = self.x_min + self.shape[1] * self.cell_size[1]
+
+        if (
+            corners[1, 0] < self.y_min
+            or corners[1, 1] < self.x_min
+            or corners[0, 0] > y_max
+            or corners[0, 1] > x_max
+        ):
+            return np.zeros(shape=(0,), dtype="int")
+
+        (y_0, y_1), (x_0, x_1) = self.cell_indexes_from(grid=corners)
+
+        index_list = [
+            self.sort_index[
+                self.cell_start[y * self.shape[1] + x_0] : self.cell_start[
+                    y * self.shape[1] + x_1 + 1
+                ]
+            ]
+            for y in range(y_0, y_1 + 1)
+        ]
+
+        return np.sort(np.concatenate(index_list))
+
+    def indexes_within_radius_from(
+        self, grid: np.ndarray, centre: Tuple[float, float], radius: float
+    ) -> np.ndarray:
+        """
+        Returns the (sorted) indexes of all coordinates within a circular radius of a centre, by first finding the
+        coordinates in the cells overlapping the circle's bounding box and then removing those outside the circle.
+
+        Parameters
+        ----------
+        grid
+            The (y,x) coordinates the spatial index was created from.
+        centre
+            The (y,x) centre of the circle.
+        radius
+            The radius of the circle.
+        """
+        index = self.indexes_in_box_from(centre=centre, half_width=radius)
+
+        distances_squared = np.sum(
+            np.square(np.asarray(grid)[index] - np.asarray(centre)), axis=1
+        )
+
+        return index[distances_squared <= radius**2]
+
+    def over_sampled_indexes_from(
+        self, indexes: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the indexes of every over-sampled coordinate in a set of pixels of the grid, alongside the index
+        in this array where the over-sampled coordinates of each pixel start.
+
+        The latter is used to bin values evaluated on the over-sampled coordinates back to the pixels,
+        via `np.add.reduceat`.
+
+        Parameters
+        ----------
+        indexes
+            The indexes of the pixels whose over-sampled coordinates are returned.
+        """
+        over_sample_total = self.over_sample_total[indexes]
+
+        start = np.cumsum(over_sample_total) - over_sample_total
+
+        over_sampled_indexes = np.repeat(
+            self.over_sample_start[indexes] - start, over_sample_total
+        ) + np.arange(np.sum(over_sample_total))
+
+        return over_sampled_indexes, start
+
+
+_spatial_index_dict: Dict[Tuple[int, bool], Tuple[weakref.ref, SpatialIndex]] = {}
+
+
+def spatial_index_from(
+    grid: Union[np.ndarray, aa.Grid2D, aa.Grid2DIrregular],
+) -> SpatialIndex:
+    """
+    Returns the spatial index of a grid, which is created the first time it is requested for that grid and then
+    reused for as long as the grid exists.
+
+    Grids (e.g. the grids of a dataset) are evaluated by many galaxies and profiles every likelihood evaluation,
+    thus reusing their spatial index means it is only created once per grid.
+
+    For a `Grid2D`, the index is of its (y,x) pixel centres and includes its over sampling (see
+    `SpatialIndex.over_sampled_indexes_from`). It is stored for as long as the grid's over-sampled coordinates exist,
+    such that the same grid with different over sampling has a different index.
+
+    For an `ndarray` (e.g. the over-sampled coordinates of a `Grid2D` passed to a light profile by the
+    `over_sample` decorator) or `Grid2DIrregular`, the index is of every coordinate.
+
+    Parameters
+    ----------
+    grid
+        The (y,x) coordinates which are indexed.
+    """
+    if isinstance(grid, aa.Grid2D):
+        array = grid.over_sampled
+    elif isinstance(grid, np.ndarray):
+        array = grid
+    else:
+        array = grid.array
+
+    key = (id(array), isinstance(grid, aa.Grid2D))
+
+    try:
+        array_ref, spatial_index = _spatial_index_dict[key]
+
+        if array_ref() is array:
+            return spatial_index
+    except KeyError:
+        pass
+
+    if isinstance(grid, aa.Grid2D):
+        spatial_index = SpatialIndex(
+            grid=grid.array, over_sample_size=np.asarray(grid.over_sample_size)
+        )
+    else:
+        spatial_index = SpatialIndex(grid=array)
+
+    _spatial_index_dict[key] = (weakref.ref(array), spatial_index)
+    weakref.finalize(array, _spatial_index_dict.pop, key, None)
+
+    return spatial_index
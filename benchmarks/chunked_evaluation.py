@@ -0,0 +1,83 @@
+"""
+Benchmark comparing the run time and peak memory of evaluating the image and deflection angles of a galaxy on a large
+unmasked grid with over sampling (e.g. a mosaic), using three calculations:
+
+- Whole Grid: the `image_2d_from` and `deflections_yx_2d_from` functions are evaluated on the whole grid, such that
+  every temporary array of every profile is the size of the grid.
+
+- Chunked: the `image_2d_chunked_from` and `deflections_yx_2d_chunked_from` functions evaluate the grid in chunks
+  of coordinates (see `autogalaxy.operate.chunk`), such that temporary arrays are the size of a chunk.
+
+- Chunked Threads: the same as Chunked, but the chunks are evaluated in a pool of threads.
+
+The peak memory is the largest memory allocated during the calculation, measured via `tracemalloc`, which does not
+include the grid itself.
+
+Run this script from the repository root:
+
+python benchmarks/chunked_evaluation.py
+"""
+
+from typing import Callable, Dict
+
+import autogalaxy as ag
+
+from timing import peak_memory_from, run_time_from
+
+repeats = 1
+
+shape_native = (1000, 1000)
+over_sample_size = 2
+max_workers = 4
+
+
+def benchmark_dict() -> Dict[str, Callable]:
+    """
+    Returns the benchmarks of the image and deflection angles of the galaxy evaluated on the whole grid, in chunks
+    and in chunks evaluated by `max_workers` threads.
+    """
+    grid = ag.Grid2D.uniform(
+        shape_native=shape_native,
+        pixel_scales=0.05,
+        over_sample_size=over_sample_size,
+    )
+    grid.over_sampled
+
+    galaxy = ag.Galaxy(
+        redshift=0.5,
+        bulge=ag.lp.Sersic(ell_comps=(0.1, 0.2), intensity=1.0, effective_radius=2.0),
+        disk=ag.lp.Exponential(
+            ell_comps=(0.2, 0.1), intensity=0.5, effective_radius=5.0
+        ),
+        mass=ag.mp.Isothermal(ell_comps=(0.1, 0.0), einstein_radius=2.0),
+    )
+
+    return {
+        "chunked_evaluation.whole_grid": lambda: (
+            galaxy.image_2d_from(grid=grid),
+            galaxy.deflections_yx_2d_from(grid=grid),
+        ),
+        "chunked_evaluation.chunked": lambda: (
+            galaxy.image_2d_chunked_from(grid=grid),
+            galaxy.deflections_yx_2d_chunked_from(grid=grid),
+        ),
+        "chunked_evaluation.chunked_threads": lambda: (
+            galaxy.image_2d_chunked_from(grid=grid, max_workers=max_workers),
+            galaxy.deflections_yx_2d_chunked_from(grid=grid, max_workers=max_workers),
+        ),
+    }
+
+
+if __name__ == "__main__":
+    print(
+        f"Grid of shape {shape_native} with over sample size {over_sample_size}, "
+        f"{max_workers} threads.\n"
+    )
+
+    for name, func in benchmark_dict().items():
+        run_time = run_time_from(func=func, repeats=repeats)
+        peak_memory = peak_memory_from(func=func)
+
+        print(
+            f"{name.split('.')[-1] + ':':<17} {run_time:.3f} s, peak memory {peak_memory:.1f} MB"
+        )
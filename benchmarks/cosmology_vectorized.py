@@ -0,0 +1,92 @@
+"""
+Benchmark comparing the run time of computing the critical surface density and kpc per arcsecond of a population of
+strong lenses (e.g. for forecasting a survey), with 10^5 lens and source redshift pairs, using three calculations:
+
+- Scalar Loop: every method of the cosmology is called once per lens, with float redshifts. This is timed on a
+  subsample of the lenses and extrapolated to the full population, as looping over every lens is slow.
+
+- Array: every method is called once with arrays of all lens and source redshifts, such that the distances of all
+  unique redshifts are computed via a single astropy call.
+
+- Array Tabulated: the same as Array, but the cosmology's distances are interpolated from a table (see
+  `LensingCosmology.tabulate_distances`).
+
+Run this script from the repository root:
+
+python benchmarks/cosmology_vectorized.py
+"""
+
+from typing import Callable, Dict
+
+import numpy as np
+
+import autogalaxy as ag
+
+from timing import run_time_from
+
+repeats = 3
+
+total_lenses = 100000
+total_lenses_loop = 1000
+
+
+def loop_from(cosmology, redshift_0, redshift_1):
+    for z0, z1 in zip(redshift_0, redshift_1):
+        cosmology.critical_surface_density_between_redshifts_from(
+            redshift_0=z0, redshift_1=z1
+        )
+        cosmology.kpc_per_arcsec_from(redshift=z0)
+
+
+def array_from(cosmology, redshift_0, redshift_1):
+    cosmology.critical_surface_density_between_redshifts_from(
+        redshift_0=redshift_0, redshift_1=redshift_1
+    )
+    cosmology.kpc_per_arcsec_from(redshift=redshift_0)
+
+
+def benchmark_dict() -> Dict[str, Callable]:
+    """
+    Returns the benchmarks of the distances of the lens and source redshifts, where the scalar loop is over the
+    subsample of `total_lenses_loop` lenses.
+    """
+    rng = np.random.default_rng(seed=1)
+
+    redshift_lens = rng.uniform(0.1, 1.5, total_lenses)
+    redshift_source = redshift_lens + rng.uniform(0.2, 3.0, total_lenses)
+
+    cosmology = ag.cosmology.Planck15()
+    cosmology_tabulated = ag.cosmology.Planck15().tabulate_distances()
+
+    return {
+        "cosmology_vectorized.scalar_loop": lambda: loop_from(
+            cosmology=cosmology,
+            redshift_0=redshift_lens[:total_lenses_loop],
+            redshift_1=redshift_source[:total_lenses_loop],
+        ),
+        "cosmology_vectorized.array": lambda: array_from(
+            cosmology=cosmology, redshift_0=redshift_lens, redshift_1=redshift_source
+        ),
+        "cosmology_vectorized.array_tabulated": lambda: array_from(
+            cosmology=cosmology_tabulated,
+            redshift_0=redshift_lens,
+            redshift_1=redshift_source,
+        ),
+        "cosmology_vectorized.tabulate": lambda: ag.cosmology.Planck15().tabulate_distances(),
+    }
+
+
+if __name__ == "__main__":
+    run_time_dict = {
+        name.split(".")[-1]: run_time_from(func=func, repeats=repeats)
+        for name, func in benchmark_dict().items()
+    }
+
+    print(f"{total_lenses} lens and source redshift pairs, {repeats} repeats.\n")
+    print(
+        f"Scalar Loop (s, extrapolated): "
+        f"{run_time_dict['scalar_loop'] * total_lenses / total_lenses_loop:.4f}"
+    )
+    print(f"Array (s):                     {run_time_dict['array']:.4f}")
+    print(f"Array Tabulated (s):           {run_time_dict['array_tabulated']:.4f}")
+    print(f"Tabulation, once (s):          {run_time_dict['tabulate']:.4f}")
@@ -0,0 +1,110 @@
+"""
+Benchmark comparing the run time of evaluating the image of a crowded field of galaxies (e.g. a group or cluster
+with many `extra_galaxies`) using three calculations:
+
+- Full: every light profile is evaluated on every over-sampled coordinate of the grid.
+
+- Truncated: every light profile is only evaluated on the over-sampled coordinates inside its truncation radius,
+  but the image of every light profile is still over-sample binned and summed over every pixel of the grid.
+
+- Spatial Index: every light profile is only evaluated in, binned in and added to the pixels inside its truncation
+  radius, which are found via the spatial index of the grid (see `autogalaxy/util/spatial_index.py`).
+
+Run this script from the repository root:
+
+python benchmarks/galaxies_spatial_index.py
+"""
+
+from typing import Callable, Dict
+
+import numpy as np
+
+import autogalaxy as ag
+
+from autogalaxy.galaxy import galaxies as galaxies_module
+from autogalaxy.galaxy import galaxy as galaxy_module
+from autogalaxy.profiles.light import decorators
+
+from timing import func_with_attributes_from, run_time_from
+
+repeats = 5
+
+
+def benchmark_dict() -> Dict[str, Callable]:
+    """
+    Returns the benchmarks of the image of 50 galaxies with a compact bulge and disk, scattered over a 400 x 400 grid,
+    for every calculation.
+
+    The truncation tolerance of the light profiles, and whether galaxies use the spatial index of the grid, are set
+    for every call of a benchmark.
+    """
+    grid = ag.Grid2D.uniform(
+        shape_native=(400, 400), pixel_scales=0.05, over_sample_size=2
+    )
+
+    rng = np.random.default_rng(seed=1)
+
+    galaxies = ag.Galaxies(
+        galaxies=[
+            ag.Galaxy(
+                redshift=0.5,
+                bulge=ag.lp.Sersic(
+                    centre=tuple(rng.uniform(-9.0, 9.0, 2)),
+                    ell_comps=(0.1, 0.05),
+                    intensity=0.1,
+                    effective_radius=0.1,
+                    sersic_index=1.5,
+                ),
+                disk=ag.lp.Exponential(
+                    centre=tuple(rng.uniform(-9.0, 9.0, 2)),
+                    intensity=0.05,
+                    effective_radius=0.2,
+                ),
+            )
+            for i in range(50)
+        ]
+    )
+
+    def image_2d_from(tolerance, spatial_index: bool) -> Callable:
+        return func_with_attributes_from(
+            func=lambda: galaxies.image_2d_from(grid=grid),
+            attribute_list=[
+                (decorators, "truncation_tolerance", lambda: tolerance),
+                (
+                    galaxy_module,
+                    "truncation_tolerance",
+                    lambda: tolerance if spatial_index else None,
+                ),
+                (
+                    galaxies_module,
+                    "truncation_tolerance",
+                    lambda: tolerance if spatial_index else None,
+                ),
+            ],
+        )
+
+    return {
+        "galaxies_spatial_index.full": image_2d_from(
+            tolerance=None, spatial_index=False
+        ),
+        "galaxies_spatial_index.truncated": image_2d_from(
+            tolerance=1.0e-6, spatial_index=False
+        ),
+        "galaxies_spatial_index.spatial_index": image_2d_from(
+            tolerance=1.0e-6, spatial_index=True
+        ),
+    }
+
+
+if __name__ == "__main__":
+    run_time_dict = {
+        name.split(".")[-1]: run_time_from(func=func, repeats=repeats)
+        for name, func in benchmark_dict().items()
+    }
+
+    print(
+        f"50 galaxies on a 400 x 400 grid with over sample size 2, {repeats} repeats.\n"
+    )
+    print(f"Full (s):          {run_time_dict['full']:.4f}")
+    print(f"Truncated (s):     {run_time_dict['truncated']:.4f}")
+    print(f"Spatial Index (s): {run_time_dict['spatial_index']:.4f}")
@@ -0,0 +1,100 @@
+"""
+Benchmark comparing the run time of the log likelihood of a `FitImaging` where one galaxy's parameters change every
+likelihood evaluation and the other galaxies' parameters are fixed (e.g. the extra galaxies of a model-fit which were
+fitted in an earlier search), with and without caching the images of galaxies (see `autogalaxy.operate.cache`).
+
+- No Cache: the image of every galaxy is evaluated every likelihood evaluation, which is the default behaviour.
+
+- Cache: the images of galaxies are cached per grid keyed by their fingerprint, such that only the galaxy whose
+  parameters change is evaluated (caching is enabled via the `operate -> cache_size` entry of the `general.yaml`
+  config).
+
+Galaxies are created for every likelihood evaluation of a model-fit, therefore the galaxies are created inside the
+timed function.
+
+Run this script from the repository root:
+
+python benchmarks/galaxy_cache.py
+"""
+
+import itertools
+from typing import Callable, Dict
+
+import numpy as np
+
+import autogalaxy as ag
+
+from autogalaxy.operate import cache
+
+from timing import func_with_attributes_from, run_time_from
+
+repeats = 50
+
+total_galaxies_fixed = 10
+
+
+def benchmark_dict() -> Dict[str, Callable]:
+    """
+    Returns the benchmarks of the log likelihood of the fit with and without caching, where every call uses the
+    next intensity of the galaxy whose parameters change.
+    """
+    mask = ag.Mask2D.circular(shape_native=(101, 101), pixel_scales=0.1, radius=4.5)
+
+    dataset = ag.Imaging(
+        data=ag.Array2D.ones(shape_native=mask.shape_native, pixel_scales=0.1),
+        noise_map=ag.Array2D.ones(shape_native=mask.shape_native, pixel_scales=0.1),
+        psf=ag.Kernel2D.from_gaussian(
+            shape_native=(11, 11), pixel_scales=0.1, sigma=0.1, normalize=True
+        ),
+    ).apply_mask(mask=mask)
+
+    rng = np.random.default_rng(seed=1)
+
+    centre_list = rng.uniform(-4.0, 4.0, (total_galaxies_fixed, 2))
+
+    intensity_iter = itertools.cycle(rng.uniform(0.5, 1.5, repeats + 1))
+
+    def fit_from():
+        galaxies = [
+            ag.Galaxy(
+                redshift=0.5,
+                bulge=ag.lp.Sersic(
+                    centre=tuple(centre_list[i]), intensity=0.1, effective_radius=0.3
+                ),
+            )
+            for i in range(total_galaxies_fixed)
+        ]
+
+        intensity = next(intensity_iter)
+
+        galaxies.append(
+            ag.Galaxy(
+                redshift=0.5,
+                bulge=ag.lp.Sersic(intensity=intensity, effective_radius=1.0),
+                disk=ag.lp.Exponential(intensity=intensity, effective_radius=2.0),
+            )
+        )
+
+        return ag.FitImaging(dataset=dataset, galaxies=galaxies).figure_of_merit
+
+    return {
+        "galaxy_cache.no_cache": func_with_attributes_from(
+            func=fit_from, attribute_list=[(cache, "cache_size", lambda: 0)]
+        ),
+        "galaxy_cache.cache": func_with_attributes_from(
+            func=fit_from, attribute_list=[(cache, "cache_size", lambda: 100)]
+        ),
+    }
+
+
+if __name__ == "__main__":
+    run_time_dict = {
+        name.split(".")[-1]: run_time_from(func=func, repeats=repeats)
+        for name, func in benchmark_dict().items()
+    }
+
+    print(
+        f"{total_galaxies_fixed} fixed galaxies and 1 free galaxy, {repeats} repeats.\n"
+    )
+    print(f"Likelihood, No Cache (s): {run_time_dict['no_cache']:.5f}")
+    print(f"Likelihood, Cache (s):    {run_time_dict['cache']:.5f}")
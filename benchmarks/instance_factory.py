@@ -0,0 +1,82 @@
+"""
+Benchmark comparing the run time of creating the galaxies of a model from a vector of parameters (which is performed
+for every likelihood evaluation of a model-fit) using two calculations:
+
+- PyAutoFit: the instance is created via the model's `instance_from_vector` method, which creates every galaxy and
+  profile via its `__init__`.
+
+- Instance Factory: the parameters of a single instance are updated in place (see `InstanceFactory`).
+
+In both cases the galaxies are then created from the instance via the analysis, and the run time of the log
+likelihood function for the same instance is shown for comparison.
+
+Run this script from the repository root:
+
+python benchmarks/instance_factory.py
+"""
+
+from typing import Callable, Dict
+
+import autofit as af
+import autogalaxy as ag
+
+from timing import run_time_from
+
+repeats = 200
+
+
+def benchmark_dict() -> Dict[str, Callable]:
+    """
+    Returns the benchmarks of creating the galaxies of the model via PyAutoFit and the instance factory, and of the
+    log likelihood function.
+    """
+    mask = ag.Mask2D.circular(shape_native=(41, 41), pixel_scales=0.1, radius=1.5)
+
+    dataset = ag.Imaging(
+        data=ag.Array2D.ones(shape_native=mask.shape_native, pixel_scales=0.1),
+        noise_map=ag.Array2D.ones(shape_native=mask.shape_native, pixel_scales=0.1),
+        psf=ag.Kernel2D.from_gaussian(
+            shape_native=(3, 3), pixel_scales=0.1, sigma=0.1, normalize=True
+        ),
+    ).apply_mask(mask=mask)
+
+    analysis = ag.AnalysisImaging(dataset=dataset)
+
+    model = af.Collection(
+        galaxies=af.Collection(
+            galaxy=af.Model(
+                ag.Galaxy, redshift=0.5, bulge=ag.lp.Sersic, disk=ag.lp.Exponential
+            ),
+            galaxy_1=af.Model(ag.Galaxy, redshift=0.5, bulge=ag.lp.Gaussian),
+        )
+    )
+
+    vector = model.vector_from_unit_vector(unit_vector=[0.4] * model.prior_count)
+
+    instance_factory = ag.InstanceFactory(model=model)
+
+    return {
+        "instance_factory.autofit": lambda: analysis.galaxies_via_instance_from(
+            instance=model.instance_from_vector(vector=vector)
+        ),
+        "instance_factory.instance_factory": lambda: analysis.galaxies_via_instance_from(
+            instance=instance_factory.instance_from_vector(vector=vector)
+        ),
+        "instance_factory.log_likelihood": lambda: analysis.log_likelihood_function(
+            instance=instance_factory.instance_from_vector(vector=vector)
+        ),
+    }
+
+
+if __name__ == "__main__":
+    run_time_dict = {
+        name.split(".")[-1]: run_time_from(func=func, repeats=repeats)
+        for name, func in benchmark_dict().items()
+    }
+
+    print(f"Model with 19 parameters, {repeats} repeats.\n")
+    print(f"Construction, PyAutoFit (s):        {run_time_dict['autofit']:.6f}")
+    print(
+        f"Construction, Instance Factory (s): {run_time_dict['instance_factory']:.6f}"
+    )
+    print(f"Log Likelihood Function (s):        {run_time_dict['log_likelihood']:.6f}")
@@ -0,0 +1,68 @@
+"""
+Benchmark comparing the run time of Fourier transforming the images of many galaxies to visibilities, by calling
+the transformer once per galaxy image and by transforming all images together via the batched transform in
+`autogalaxy/operate/transformer.py`.
+
+Run this script from the repository root:
+
+python benchmarks/interferometer_batched_transform.py
+"""
+
+from typing import Callable, Dict
+
+import numpy as np
+
+import autogalaxy as ag
+
+from autogalaxy.operate import transformer as transformer_util
+
+from timing import run_time_from
+
+repeats = 5
+
+total_visibilities = 200000
+total_galaxies = 8
+
+
+def benchmark_dict() -> Dict[str, Callable]:
+    """
+    Returns the benchmarks of transforming the images of the galaxies one at a time and via the batched transform.
+    """
+    mask = ag.Mask2D.circular(shape_native=(128, 128), pixel_scales=0.05, radius=3.0)
+
+    grid = ag.Grid2D.from_mask(mask=mask)
+
+    uv_wavelengths = (
+        np.random.default_rng(1).normal(size=(total_visibilities, 2)) * 1.0e5
+    )
+
+    transformer = ag.TransformerNUFFT(
+        uv_wavelengths=uv_wavelengths, real_space_mask=mask
+    )
+
+    image_2d_list = [
+        ag.lp.Sersic(centre=(0.1 * i, -0.1 * i), intensity=1.0).image_2d_from(grid=grid)
+        for i in range(total_galaxies)
+    ]
+
+    return {
+        "interferometer_batched_transform.per_image": lambda: [
+            transformer.visibilities_from(image=image_2d) for image_2d in image_2d_list
+        ],
+        "interferometer_batched_transform.batched": lambda: transformer_util.visibilities_list_via_batch_from(
+            image_2d_list=image_2d_list, transformer=transformer
+        ),
+    }
+
+
+if __name__ == "__main__":
+    run_time_dict = {
+        name.split(".")[-1]: run_time_from(func=func, repeats=repeats)
+        for name, func in benchmark_dict().items()
+    }
+
+    print(
+        f"{total_galaxies} galaxy images, {total_visibilities} visibilities, {repeats} repeats.\n"
+    )
+    print(f"Per Image Transforms = {run_time_dict['per_image']:.4f}s")
+    print(f"Batched Transform = {run_time_dict['batched']:.4f}s")
@@ -0,0 +1,102 @@
+"""
+Benchmark comparing the run time of the chi-squared of a fit to an interferometer dataset with many visibilities,
+computed by Fourier transforming the model image to the uv-plane via a `TransformerNUFFT` and computed in real space
+via the dirty image and dirty beam of `autogalaxy/interferometer/image_plane_chi_squared.py`.
+
+Run this script from the repository root:
+
+python benchmarks/interferometer_image_plane_chi_squared.py
+"""
+
+from typing import Callable, Dict
+
+import numpy as np
+
+import autogalaxy as ag
+
+from autogalaxy.interferometer.image_plane_chi_squared import ImagePlaneChiSquared
+
+from timing import run_time_from
+
+repeats = 5
+
+total_visibilities = 200000
+
+
+def benchmark_dict() -> Dict[str, Callable]:
+    """
+    Returns the benchmarks of the chi-squared computed via the NUFFT and in the image plane, and of the image plane
+    chi-squared's setup, which is performed once per dataset.
+    """
+    mask = ag.Mask2D.circular(shape_native=(128, 128), pixel_scales=0.05, radius=3.0)
+
+    rng = np.random.default_rng(1)
+
+    dataset = ag.Interferometer(
+        data=ag.Visibilities(
+            visibilities=rng.normal(size=total_visibilities)
+            + 1j * rng.normal(size=total_visibilities)
+        ),
+        noise_map=ag.VisibilitiesNoiseMap.full(
+            shape_slim=(total_visibilities,), fill_value=2.0
+        ),
+        uv_wavelengths=rng.normal(size=(total_visibilities, 2)) * 1.0e5,
+        real_space_mask=mask,
+        transformer_class=ag.TransformerNUFFT,
+    )
+
+    image = ag.lp.Sersic(centre=(0.1, -0.1), intensity=1.0).image_2d_from(
+        grid=ag.Grid2D.from_mask(mask=mask)
+    )
+
+    image_plane_chi_squared = ImagePlaneChiSquared(dataset=dataset)
+
+    data = np.asarray(dataset.data)
+    noise_map = np.asarray(dataset.noise_map)
+
+    def nufft_chi_squared() -> float:
+        residual_map = data - np.asarray(
+            dataset.transformer.visibilities_from(image=image)
+        )
+
+        return np.sum(
+            (residual_map.real / noise_map.real) ** 2
+            + (residual_map.imag / noise_map.imag) ** 2
+        )
+
+    return {
+        "interferometer_image_plane_chi_squared.setup": lambda: ImagePlaneChiSquared(
+            dataset=dataset
+        ),
+        "interferometer_image_plane_chi_squared.nufft": nufft_chi_squared,
+        "interferometer_image_plane_chi_squared.image_plane": lambda: image_plane_chi_squared.chi_squared_from(
+            image=image
+        ),
+    }
+
+
+if __name__ == "__main__":
+    func_dict = benchmark_dict()
+
+    run_time_dict = {
+        name.split(".")[-1]: run_time_from(func=func, repeats=repeats)
+        for name, func in func_dict.items()
+    }
+
+    chi_squared_dict = {
+        name.split(".")[-1]: func()
+        for name, func in func_dict.items()
+        if not name.endswith("setup")
+    }
+
+    print(f"{total_visibilities} visibilities, {repeats} repeats.\n")
+    print(
+        f"Image Plane Chi Squared Setup (once per dataset) = {run_time_dict['setup']:.4f}s\n"
+    )
+    print(
+        f"NUFFT Chi Squared = {run_time_dict['nufft']:.4f}s ({chi_squared_dict['nufft']:.6e})"
+    )
+    print(
+        f"Image Plane Chi Squared = {run_time_dict['image_plane']:.4f}s "
+        f"({chi_squared_dict['image_plane']:.6e})"
+    )
@@ -0,0 +1,90 @@
+"""
+Microbenchmark comparing the run time of every standard light profile's `image_2d_from` method using the default
+NumPy calculation and the numba-compiled fused kernels in `autogalaxy/profiles/light/fused_util.py`.
+
+The image of each light profile is evaluated on an over-sampled 2D grid, representative of a galaxy-scale imaging
+dataset.
+
+Run this script from the repository root:
+
+python benchmarks/light_profiles_fused.py
+"""
+
+from typing import Callable, Dict
+
+import autogalaxy as ag
+
+from autogalaxy.profiles.light import fused_util
+
+from timing import func_with_attributes_from, run_time_from
+
+repeats = 20
+
+
+def benchmark_dict() -> Dict[str, Callable]:
+    """
+    Returns the benchmarks of the image of every light profile, with fused kernels switched off (`numpy`) and on
+    (`fused`).
+
+    Fused kernels are normally switched on via the `general.yaml` config, which every benchmark overrides so both
+    calculations can be compared in one run.
+    """
+    grid = ag.Grid2D.uniform(
+        shape_native=(150, 150), pixel_scales=0.05, over_sample_size=4
+    )
+
+    light_profile_list = [
+        ag.lp.Sersic(centre=(0.1, 0.2), ell_comps=(0.2, -0.1), sersic_index=2.5),
+        ag.lp.Exponential(centre=(0.1, 0.2), ell_comps=(0.2, -0.1)),
+        ag.lp.DevVaucouleurs(centre=(0.1, 0.2), ell_comps=(0.2, -0.1)),
+        ag.lp.SersicCore(centre=(0.1, 0.2), ell_comps=(0.2, -0.1)),
+        ag.lp.Gaussian(centre=(0.1, 0.2), ell_comps=(0.2, -0.1)),
+        ag.lp.Moffat(centre=(0.1, 0.2), ell_comps=(0.2, -0.1)),
+        ag.lp.Chameleon(centre=(0.1, 0.2), ell_comps=(0.2, -0.1)),
+        ag.lp.ElsonFreeFall(centre=(0.1, 0.2), ell_comps=(0.2, -0.1)),
+    ]
+
+    benchmark_dict = {}
+
+    for light_profile in light_profile_list:
+        for method, fused_kernels in [("numpy", False), ("fused", True)]:
+            benchmark_dict[
+                f"light_profiles_fused.{light_profile.__class__.__name__}.{method}"
+            ] = func_with_attributes_from(
+                func=lambda light_profile=light_profile: light_profile.image_2d_from(
+                    grid=grid
+                ),
+                attribute_list=[
+                    (
+                        fused_util,
+                        "fused_kernels_enabled",
+                        lambda fused_kernels=fused_kernels: fused_kernels,
+                    )
+                ],
+            )
+
+    return benchmark_dict
+
+
+if __name__ == "__main__":
+    run_time_dict = {
+        name: run_time_from(func=func, repeats=repeats)
+        for name, func in benchmark_dict().items()
+    }
+
+    print(f"150 x 150 grid with over sample size 4, {repeats} repeats.\n")
+    print(f"{'Light Profile':<20}{'NumPy (s)':>14}{'Fused (s)':>14}{'Speed Up':>12}")
+
+    for name in run_time_dict:
+        if not name.endswith(".numpy"):
+            continue
+
+        run_time = run_time_dict[name]
+        run_time_fused = run_time_dict[name.replace(".numpy", ".fused")]
+
+        print(
+            f"{name.split('.')[1]:<20}"
+            f"{run_time:>14.5f}"
+            f"{run_time_fused:>14.5f}"
+            f"{run_time / run_time_fused:>12.2f}"
+        )
@@ -0,0 +1,80 @@
+"""
+Benchmark comparing the run time of evaluating the images of many compact light profiles in a wide field, with
+and without truncation (see the `truncate` decorator in `autogalaxy/profiles/light/decorators.py`).
+
+This is representative of a fit including many small `extra_galaxies`, where every profile only has
+non-negligible emission over a small fraction of the image.
+
+Run this script from the repository root:
+
+python benchmarks/light_profiles_truncated.py
+"""
+
+from typing import Callable, Dict
+
+import numpy as np
+
+import autogalaxy as ag
+
+from autogalaxy.profiles.light import decorators
+
+from timing import func_with_attributes_from, run_time_from
+
+repeats = 5
+
+
+def benchmark_dict() -> Dict[str, Callable]:
+    """
+    Returns the benchmarks of the images of 30 compact light profiles scattered over a 400 x 400 grid, without
+    truncation (`full`) and with a truncation tolerance of 1.0e-6 (`truncated`).
+    """
+    grid = ag.Grid2D.uniform(
+        shape_native=(400, 400), pixel_scales=0.05, over_sample_size=2
+    )
+
+    rng = np.random.default_rng(seed=1)
+
+    light_profile_list = [
+        ag.lp.Sersic(
+            centre=tuple(rng.uniform(-9.0, 9.0, 2)),
+            ell_comps=(0.1, 0.05),
+            intensity=0.1,
+            effective_radius=0.1,
+            sersic_index=1.5,
+        )
+        for i in range(30)
+    ]
+
+    def image_2d_list_from():
+        return [
+            light_profile.image_2d_from(grid=grid)
+            for light_profile in light_profile_list
+        ]
+
+    return {
+        f"light_profiles_truncated.{name}": func_with_attributes_from(
+            func=image_2d_list_from,
+            attribute_list=[
+                (
+                    decorators,
+                    "truncation_tolerance",
+                    lambda tolerance=tolerance: tolerance,
+                )
+            ],
+        )
+        for name, tolerance in [("full", None), ("truncated", 1.0e-6)]
+    }
+
+
+if __name__ == "__main__":
+    run_time_dict = {
+        name.split(".")[-1]: run_time_from(func=func, repeats=repeats)
+        for name, func in benchmark_dict().items()
+    }
+
+    print(
+        f"30 light profiles on a 400 x 400 grid with over sample size 2, {repeats} repeats.\n"
+    )
+    print(f"Full (s):      {run_time_dict['full']:.4f}")
+    print(f"Truncated (s): {run_time_dict['truncated']:.4f}")
+    print(f"Speed Up:      {run_time_dict['full'] / run_time_dict['truncated']:.2f}")
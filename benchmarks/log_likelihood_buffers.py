@@ -0,0 +1,112 @@
+"""
+Benchmark comparing the run time, peak memory and number of **PyAutoArray** structures (e.g. `Array2D`) created by the
+log likelihood function of an `AnalysisImaging`, fitting galaxies with a bulge and disk to an imaging dataset, using
+two calculations:
+
+- Fit Imaging: a `FitImaging` is created, whose quantities (e.g. the blurred image, model data, residual-map and
+  chi-squared-map) are each created as an `Array2D`.
+
+- Buffers: the images of the galaxies are added to arrays allocated once per dataset (and thread) and the log
+  likelihood is computed in place (see `autogalaxy.imaging.log_likelihood_buffers`).
+
+The peak memory is the largest memory allocated during a call to the log likelihood function, measured via
+`tracemalloc`.
+
+Run this script from the repository root:
+
+python benchmarks/log_likelihood_buffers.py
+"""
+
+from typing import Callable, Dict
+
+import autofit as af
+import autogalaxy as ag
+
+from autoarray.abstract_ndarray import AbstractNDArray
+
+from timing import func_with_attributes_from, peak_memory_from, run_time_from
+
+repeats = 10
+
+
+def benchmark_dict() -> Dict[str, Callable]:
+    """
+    Returns the benchmarks of the log likelihood function of an analysis which creates a `FitImaging`
+    (`fit_imaging`) and which uses the buffers (`buffers`).
+    """
+    mask = ag.Mask2D.circular(shape_native=(151, 151), pixel_scales=0.1, radius=7.0)
+
+    dataset = ag.Imaging(
+        data=ag.Array2D.ones(shape_native=mask.shape_native, pixel_scales=0.1),
+        noise_map=ag.Array2D.ones(shape_native=mask.shape_native, pixel_scales=0.1),
+        psf=ag.Kernel2D.from_gaussian(
+            shape_native=(11, 11), pixel_scales=0.1, sigma=0.1, normalize=True
+        ),
+    ).apply_mask(mask=mask)
+
+    model = af.Collection(
+        galaxies=af.Collection(
+            galaxy=ag.Galaxy(
+                redshift=0.5,
+                bulge=ag.lp.Sersic(ell_comps=(0.1, 0.0), effective_radius=0.5),
+                disk=ag.lp.Exponential(ell_comps=(0.0, 0.1), effective_radius=1.5),
+            ),
+            satellite=ag.Galaxy(
+                redshift=0.5,
+                bulge=ag.lp.Sersic(centre=(1.0, 1.0), effective_radius=0.2),
+            ),
+        )
+    )
+
+    instance = model.instance_from_unit_vector([])
+
+    benchmark_dict = {}
+
+    for name, use_log_likelihood_buffers in [
+        ("fit_imaging", False),
+        ("buffers", True),
+    ]:
+        analysis = ag.AnalysisImaging(
+            dataset=dataset, use_log_likelihood_buffers=use_log_likelihood_buffers
+        )
+
+        benchmark_dict[f"log_likelihood_buffers.{name}"] = (
+            lambda analysis=analysis: analysis.log_likelihood_function(
+                instance=instance
+            )
+        )
+
+    return benchmark_dict
+
+
+def total_structures_from(func: Callable) -> int:
+    """
+    Returns the number of structures (e.g. `Array2D`) created by a call to the input function.
+    """
+    structure_list = []
+
+    init = AbstractNDArray.__init__
+
+    def counted_init(self, *args, **kwargs):
+        structure_list.append(type(self))
+        init(self, *args, **kwargs)
+
+    func_with_attributes_from(
+        func=func, attribute_list=[(AbstractNDArray, "__init__", counted_init)]
+    )()
+
+    return len(structure_list)
+
+
+if __name__ == "__main__":
+    print(f"{repeats} repeats.\n")
+
+    for name, func in benchmark_dict().items():
+        run_time = run_time_from(func=func, repeats=repeats)
+        peak_memory = peak_memory_from(func=func)
+        total_structures = total_structures_from(func=func)
+
+        print(
+            f"{name.split('.')[-1] + ':':<13} {run_time:.4f} s, peak memory {peak_memory:.1f} MB, "
+            f"{total_structures} structures, log likelihood {func():.6f}"
+        )
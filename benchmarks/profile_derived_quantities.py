@@ -0,0 +1,112 @@
+"""
+Microbenchmark showing the per-call overhead removed by storing the derived quantities of profiles (e.g.
+`axis_ratio`, `angle`, `sersic_constant`, `einstein_radius_rescaled`) via the `derived_property` decorator in
+`autogalaxy/profiles/geometry_profiles.py`.
+
+For small grids the cost of evaluating a profile is dominated by Python overhead rather than NumPy arithmetic, so
+each profile is evaluated on a 5x5 grid, representative of the repeated evaluations performed by the Hessian and
+critical curve calculations.
+
+The "Recomputed" column resets the stored quantities before every call, reproducing the behaviour of profiles
+before derived quantities were stored.
+
+Every benchmark times `total_calls` calls, as a single call is too short to time reliably.
+
+Run this script from the repository root:
+
+python benchmarks/profile_derived_quantities.py
+"""
+
+from typing import Callable, Dict
+
+import autogalaxy as ag
+
+from timing import run_time_from
+
+repeats = 5
+
+total_calls = 2000
+
+
+def calls_from(func, profile, reset: bool) -> Callable:
+    """
+    Returns a function which calls `func` `total_calls` times, optionally resetting the profile's stored derived
+    quantities before every call.
+    """
+
+    def calls():
+        for i in range(total_calls):
+            if reset:
+                object.__setattr__(profile, "_derived_dict", None)
+            func()
+
+    return calls
+
+
+def benchmark_dict() -> Dict[str, Callable]:
+    """
+    Returns the benchmarks of every call with the derived quantities recomputed (`recomputed`) and stored (`stored`).
+    """
+    grid = ag.Grid2DIrregular(
+        values=[(0.1 * i, 0.2 * j) for i in range(5) for j in range(5)]
+    )
+
+    sersic = ag.lp.Sersic(centre=(0.1, 0.2), ell_comps=(0.2, -0.1), sersic_index=2.5)
+    sersic_core = ag.lp.SersicCore(centre=(0.1, 0.2), ell_comps=(0.2, -0.1))
+    power_law = ag.mp.PowerLaw(centre=(0.1, 0.2), ell_comps=(0.2, -0.1), slope=2.2)
+    isothermal = ag.mp.Isothermal(centre=(0.1, 0.2), ell_comps=(0.2, -0.1))
+
+    call_dict = {
+        "Sersic.sersic_constant": (sersic, lambda: sersic.sersic_constant),
+        "Sersic.axis_ratio": (sersic, lambda: sersic.axis_ratio),
+        "Sersic.image_2d_from": (sersic, lambda: sersic.image_2d_from(grid=grid)),
+        "SersicCore.image_2d_from": (
+            sersic_core,
+            lambda: sersic_core.image_2d_from(grid=grid),
+        ),
+        "PowerLaw.einstein_radius_rescaled": (
+            power_law,
+            lambda: power_law.einstein_radius_rescaled,
+        ),
+        "PowerLaw.deflections_yx_2d_from": (
+            power_law,
+            lambda: power_law.deflections_yx_2d_from(grid=grid),
+        ),
+        "Isothermal.deflections_yx_2d_from": (
+            isothermal,
+            lambda: isothermal.deflections_yx_2d_from(grid=grid),
+        ),
+        "Isothermal.hessian_from": (
+            isothermal,
+            lambda: isothermal.hessian_from(grid=grid),
+        ),
+    }
+
+    return {
+        f"profile_derived_quantities.{name}.{method}": calls_from(
+            func=func, profile=profile, reset=reset
+        )
+        for name, (profile, func) in call_dict.items()
+        for method, reset in [("recomputed", True), ("stored", False)]
+    }
+
+
+if __name__ == "__main__":
+    run_time_dict = {
+        name: run_time_from(func=func, repeats=repeats) / total_calls
+        for name, func in benchmark_dict().items()
+    }
+
+    print(f"Grid of 25 coordinates, {total_calls} calls, {repeats} repeats.\n")
+    print(f"{'Call':<38}{'Recomputed (us)':>18}{'Stored (us)':>14}")
+
+    for name in run_time_dict:
+        if not name.endswith(".recomputed"):
+            continue
+
+        run_time = run_time_dict[name]
+        run_time_stored = run_time_dict[name.replace(".recomputed", ".stored")]
+
+        call = name.split(".", 1)[1].rsplit(".", 1)[0]
+
+        print(f"{call:<38}{1e6 * run_time:>18.2f}{1e6 * run_time_stored:>14.2f}")
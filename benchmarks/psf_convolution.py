@@ -0,0 +1,89 @@
+"""
+Benchmark comparing the run time of convolving the image of a galaxy with PSFs of increasing size, using the
+real-space `Convolver` of **PyAutoArray** and the FFT convolver in `autogalaxy/operate/convolver.py`.
+
+The "Auto" column shows which method is selected when the `psf -> convolution` entry of the `general.yaml` config
+is `auto`.
+
+Run this script from the repository root:
+
+python benchmarks/psf_convolution.py
+"""
+
+from typing import Callable, Dict
+
+import autogalaxy as ag
+
+from autogalaxy.operate import convolver as convolver_util
+
+from timing import run_time_from
+
+repeats = 20
+
+size_list = [3, 5, 7, 11, 21, 41, 61]
+
+
+def benchmark_dict() -> Dict[str, Callable]:
+    """
+    Returns the benchmarks of convolving the galaxy's image with every PSF size, using the real-space convolver
+    (`real_space`) and the FFT convolver (`fft`).
+    """
+    mask = ag.Mask2D.circular(shape_native=(200, 200), pixel_scales=0.05, radius=3.0)
+
+    grid = ag.Grid2D.from_mask(mask=mask)
+
+    galaxy = ag.Galaxy(
+        redshift=0.5, bulge=ag.lp.Sersic(ell_comps=(0.1, 0.05), intensity=1.0)
+    )
+
+    image_2d = galaxy.image_2d_from(grid=grid)
+
+    benchmark_dict = {}
+
+    for size in size_list:
+        psf = ag.Kernel2D.from_gaussian(
+            shape_native=(size, size), pixel_scales=0.05, sigma=0.02 * size
+        )
+
+        blurring_grid = grid.blurring_grid_via_kernel_shape_from(
+            kernel_shape_native=psf.shape_native
+        )
+        blurring_image_2d = galaxy.image_2d_from(grid=blurring_grid)
+
+        for method, convolver in [
+            ("real_space", ag.Convolver(mask=mask, kernel=psf)),
+            ("fft", convolver_util.convolver_fft_from(mask=mask, kernel=psf)),
+        ]:
+            benchmark_dict[f"psf_convolution.{size}x{size}.{method}"] = (
+                lambda convolver=convolver, blurring_image_2d=blurring_image_2d: convolver.convolve_image(
+                    image=image_2d, blurring_image=blurring_image_2d
+                )
+            )
+
+    return benchmark_dict
+
+
+if __name__ == "__main__":
+    run_time_dict = {
+        name: run_time_from(func=func, repeats=repeats)
+        for name, func in benchmark_dict().items()
+    }
+
+    mask = ag.Mask2D.circular(shape_native=(200, 200), pixel_scales=0.05, radius=3.0)
+
+    print(f"Mask with {mask.pixels_in_mask} pixels, {repeats} repeats.\n")
+    print(f"{'PSF':<10}{'Real Space (ms)':>18}{'FFT (ms)':>12}{'Auto':>8}")
+
+    for size in size_list:
+        psf = ag.Kernel2D.from_gaussian(
+            shape_native=(size, size), pixel_scales=0.05, sigma=0.02 * size
+        )
+
+        run_time = run_time_dict[f"psf_convolution.{size}x{size}.real_space"]
+        run_time_fft = run_time_dict[f"psf_convolution.{size}x{size}.fft"]
+
+        method = "fft" if convolver_util.use_fft_from(mask=mask, kernel=psf) else "real"
+
+        print(
+            f"{f'{size}x{size}':<10}{1e3 * run_time:>18.3f}{1e3 * run_time_fft:>12.3f}{method:>8}"
+        )
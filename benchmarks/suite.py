@@ -0,0 +1,533 @@
+"""
+Benchmark suite timing the calculations which dominate the run time of modeling, so that performance regressions are
+caught by comparing against stored baseline run times.
+
+The suite times:
+
+- The image of every light profile in `ag.lp`.
+- The deflection angles of every mass profile in `ag.mp`.
+- The log likelihood of a `FitImaging`, `FitInterferometer` and `FitEllipse` to datasets simulated via the
+  `SimulatorImaging` and `SimulatorInterferometer`.
+- Loading fits via the aggregator from the results of a (mock) model-fit.
+- Importing `autogalaxy` in a new Python process, and accessing its lazily imported attributes (e.g. `ag.plot`).
+- The calculations compared by every other benchmark script in `benchmarks` (e.g. `psf_convolution`), whose
+  benchmarks are in a group named after the script.
+
+Every benchmark is called once before it is timed (so numba functions are compiled) and its run time is the minimum
+over the repeats, which is less sensitive to other processes running than the average.
+
+Run times are compared to the baselines stored in `benchmarks/baselines.json`, and a benchmark whose run time exceeds
+its baseline by more than the threshold is reported as a regression, in which case the script exits with status 1.
+Baselines are machine specific, so they should be saved (via `--save`) on the machine used for comparison before a
+change is made.
+
+Run this script from the repository root:
+
+python benchmarks/suite.py
+
+python benchmarks/suite.py --save
+
+python benchmarks/suite.py --filter mass_profile --threshold 1.5
+
+The filter is matched against the name of every benchmark, which starts with the name of its group, so it selects
+either a group (e.g. `--filter mass_profile`) or the benchmarks of a profile across every group (e.g.
+`--filter Sersic`).
+"""
+
+import argparse
+import inspect
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from os import path
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from autoconf import conf
+from autoconf.conf import with_config
+import autofit as af
+import autogalaxy as ag
+
+from autofit.non_linear.samples import Sample
+
+import chunked_evaluation
+import cosmology_vectorized
+import galaxies_spatial_index
+import galaxy_cache
+import instance_factory
+import interferometer_batched_transform
+import interferometer_image_plane_chi_squared
+import light_profiles_fused
+import light_profiles_truncated
+import log_likelihood_buffers
+import profile_derived_quantities
+import psf_convolution
+import thread_pool
+from timing import run_time_from
+
+baseline_file = path.join(path.dirname(path.abspath(__file__)), "baselines.json")
+
+"""
+Profiles whose calculations use numerical integration at every (y,x) coordinate, which are benchmarked on a
+smaller grid so the suite runs in a reasonable time.
+"""
+slow_profile_list = ["PowerLawCore", "IsothermalCore"]
+
+"""
+Profiles which cannot be created with default parameters, paired with the parameters used to create them.
+"""
+profile_kwargs_dict = {
+    "ShapeletPolarSph": {"n": 2, "m": 0},
+    "ShapeletPolar": {"n": 2, "m": 0},
+    "ShapeletCartesianSph": {"n_y": 2, "n_x": 1},
+    "ShapeletCartesian": {"n_y": 2, "n_x": 1},
+    "ShapeletExponentialSph": {"n": 2, "m": 0},
+    "ShapeletExponential": {"n": 2, "m": 0},
+}
+
+
+def profile_cls_list_from(module) -> List[type]:
+    """
+    Returns every profile class of a module of profiles (e.g. `ag.lp`), omitting abstract base classes.
+    """
+    return [
+        cls
+        for name, cls in vars(module).items()
+        if inspect.isclass(cls) and not inspect.isabstract(cls)
+        if cls.__name__ not in ["LightProfile", "MassProfile", "InputDeflections"]
+    ]
+
+
+def light_profile_benchmark_dict() -> Dict[str, Callable]:
+    """
+    Returns the benchmarks of the image of every light profile, computed on a 100 x 100 grid.
+    """
+    grid = ag.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+
+    benchmark_dict = {}
+
+    for cls in profile_cls_list_from(module=ag.lp):
+        light_profile = cls(**profile_kwargs_dict.get(cls.__name__, {}))
+
+        benchmark_dict[f"light_profile.{cls.__name__}"] = (
+            lambda light_profile=light_profile: light_profile.image_2d_from(grid=grid)
+        )
+
+    return benchmark_dict
+
+
+def mass_profile_benchmark_dict() -> Dict[str, Callable]:
+    """
+    Returns the benchmarks of the deflection angles of every mass profile, computed on a 100 x 100 grid (or a
+    10 x 10 grid for profiles which perform numerical integration).
+
+    The `InputDeflections` profile is benchmarked interpolating the deflection angles of an `Isothermal` profile.
+    """
+    grid = ag.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+    grid_slow = ag.Grid2D.uniform(shape_native=(10, 10), pixel_scales=0.5)
+
+    benchmark_dict = {}
+
+    for cls in profile_cls_list_from(module=ag.mp):
+        mass_profile = cls()
+
+        grid_profile = grid_slow if cls.__name__ in slow_profile_list else grid
+
+        benchmark_dict[f"mass_profile.{cls.__name__}"] = (
+            lambda mass_profile=mass_profile, grid_profile=grid_profile: mass_profile.deflections_yx_2d_from(
+                grid=grid_profile
+            )
+        )
+
+    deflections = ag.mp.Isothermal(einstein_radius=1.0).deflections_yx_2d_from(
+        grid=grid
+    )
+
+    input_deflections = ag.mp.InputDeflections(
+        deflections_y=ag.Array2D(values=deflections.slim[:, 0], mask=grid.mask),
+        deflections_x=ag.Array2D(values=deflections.slim[:, 1], mask=grid.mask),
+        image_plane_grid=grid,
+    )
+
+    grid_interp = ag.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.045)
+
+    benchmark_dict["mass_profile.InputDeflections"] = (
+        lambda: input_deflections.deflections_yx_2d_from(grid=grid_interp)
+    )
+
+    return benchmark_dict
+
+
+def galaxies_from() -> List[ag.Galaxy]:
+    """
+    Returns the galaxies of the datasets fitted by the fit benchmarks: a bulge and disk galaxy and a satellite.
+    """
+    return [
+        ag.Galaxy(
+            redshift=0.5,
+            bulge=ag.lp.Sersic(
+                centre=(0.0, 0.0),
+                ell_comps=(0.1, 0.05),
+                intensity=1.0,
+                effective_radius=0.8,
+                sersic_index=4.0,
+            ),
+            disk=ag.lp.Exponential(
+                centre=(0.0, 0.0),
+                ell_comps=(0.2, -0.1),
+                intensity=0.5,
+                effective_radius=1.6,
+            ),
+        ),
+        ag.Galaxy(
+            redshift=0.5,
+            bulge=ag.lp.SersicSph(
+                centre=(1.0, 1.0), intensity=0.2, effective_radius=0.2
+            ),
+        ),
+    ]
+
+
+def imaging_from() -> ag.Imaging:
+    """
+    Returns a masked imaging dataset (100 x 100 pixels, circular 3.0" mask, 11 x 11 PSF) of the benchmark galaxies,
+    simulated via the `SimulatorImaging`.
+    """
+    grid = ag.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.1)
+
+    psf = ag.Kernel2D.from_gaussian(
+        shape_native=(11, 11), sigma=0.1, pixel_scales=grid.pixel_scales
+    )
+
+    simulator = ag.SimulatorImaging(
+        exposure_time=300.0,
+        psf=psf,
+        background_sky_level=0.1,
+        add_poisson_noise_to_data=True,
+        noise_seed=1,
+    )
+
+    dataset = simulator.via_galaxies_from(galaxies=galaxies_from(), grid=grid)
+
+    mask = ag.Mask2D.circular(
+        shape_native=dataset.shape_native,
+        pixel_scales=dataset.pixel_scales,
+        radius=3.0,
+    )
+
+    return dataset.apply_mask(mask=mask)
+
+
+def interferometer_from() -> ag.Interferometer:
+    """
+    Returns an interferometer dataset of 10000 visibilities of the benchmark galaxies, simulated via the
+    `SimulatorInterferometer` and fitted using a `TransformerNUFFT`.
+    """
+    real_space_mask = ag.Mask2D.circular(
+        shape_native=(100, 100), pixel_scales=0.1, radius=3.0
+    )
+
+    uv_wavelengths = np.random.default_rng(seed=1).normal(size=(10000, 2)) * 1.0e5
+
+    simulator = ag.SimulatorInterferometer(
+        uv_wavelengths=uv_wavelengths,
+        exposure_time=300.0,
+        noise_sigma=0.1,
+        transformer_class=ag.TransformerNUFFT,
+        noise_seed=1,
+    )
+
+    dataset = simulator.via_galaxies_from(
+        galaxies=galaxies_from(),
+        grid=ag.Grid2D.from_mask(mask=real_space_mask),
+    )
+
+    return ag.Interferometer(
+        data=dataset.data,
+        noise_map=dataset.noise_map,
+        uv_wavelengths=uv_wavelengths,
+        real_space_mask=real_space_mask,
+        transformer_class=ag.TransformerNUFFT,
+    )
+
+
+def fit_benchmark_dict() -> Dict[str, Callable]:
+    """
+    Returns the benchmarks of the log likelihood of a `FitImaging`, `FitInterferometer` and `FitEllipse`, where the
+    imaging and interferometer fits use the galaxies which simulated the data.
+    """
+    imaging = imaging_from()
+    interferometer = interferometer_from()
+
+    galaxies = galaxies_from()
+
+    ellipse = ag.Ellipse(centre=(0.0, 0.0), ell_comps=(0.1, 0.05), major_axis=1.0)
+
+    return {
+        "fit.imaging": lambda: ag.FitImaging(
+            dataset=imaging, galaxies=galaxies
+        ).figure_of_merit,
+        "fit.interferometer": lambda: ag.FitInterferometer(
+            dataset=interferometer, galaxies=galaxies
+        ).figure_of_merit,
+        "fit.ellipse": lambda: ag.FitEllipse(
+            dataset=imaging, ellipse=ellipse
+        ).figure_of_merit,
+    }
+
+
+@with_config(
+    "general",
+    "output",
+    "samples_to_csv",
+    value=True,
+)
+def mock_model_fit_to(result_path: str):
+    """
+    Outputs the results of a mock search fitting a bulge model to the imaging dataset to `result_path`, as they are
+    output by a model-fit.
+    """
+    model = af.Collection(
+        galaxies=af.Collection(
+            galaxy=af.Model(ag.Galaxy, redshift=0.5, bulge=ag.lp.Sersic),
+        ),
+    )
+
+    sample_list = Sample.from_lists(
+        model=model,
+        parameter_lists=[model.prior_count * [0.5], model.prior_count * [1.0]],
+        log_likelihood_list=[1.0, 2.0],
+        log_prior_list=[0.0, 0.0],
+        weight_list=[0.0, 1.0],
+    )
+
+    samples = ag.m.MockSamples(
+        model=model,
+        prior_means=[1.0] * model.prior_count,
+        sample_list=sample_list,
+    )
+
+    search = ag.m.MockSearch(
+        samples=samples, result=ag.m.MockResult(model=model, samples=samples)
+    )
+    search.paths = af.DirectoryPaths(path_prefix=path.basename(result_path))
+    search.fit(model=model, analysis=ag.AnalysisImaging(dataset=imaging_from()))
+
+
+def aggregator_benchmark_dict(output_path: str) -> Dict[str, Callable]:
+    """
+    Returns the benchmarks of loading the results of a model-fit via the aggregator, where the model-fit is a mock
+    search whose results are output to `output_path`.
+
+    The mock search is configured via the unit test config files, which are loaded for the rest of the script, so
+    the aggregator benchmarks are run last.
+
+    The benchmarks time loading the output folder into a new database aggregator and creating the galaxies and maximum
+    likelihood fit of the model-fit.
+    """
+    conf.instance.push(
+        new_path=path.join(
+            path.dirname(path.dirname(path.abspath(__file__))),
+            "test_autogalaxy",
+            "config",
+        ),
+        output_path=output_path,
+    )
+
+    result_path = path.join(output_path, "benchmark")
+
+    mock_model_fit_to(result_path=result_path)
+
+    database_file = path.join(output_path, "benchmark.sqlite")
+
+    def aggregator_from():
+        if path.exists(database_file):
+            os.remove(database_file)
+
+        agg = af.Aggregator.from_database(filename=database_file)
+        agg.add_directory(directory=result_path)
+        return agg
+
+    agg = aggregator_from()
+
+    return {
+        "aggregator.add_directory": aggregator_from,
+        "aggregator.galaxies": lambda: list(
+            ag.agg.GalaxiesAgg(aggregator=agg).max_log_likelihood_gen_from()
+        ),
+        "aggregator.fit_imaging": lambda: list(
+            ag.agg.FitImagingAgg(aggregator=agg).max_log_likelihood_gen_from()
+        ),
+    }
+
+
+def import_in_new_process(statement: str):
+    """
+    Runs an import statement in a new Python process, such that none of the modules it imports are already imported.
+
+    The run time of an import benchmark therefore includes the start up time of the Python interpreter, which is the
+    same for every benchmark and is the import time a short job (e.g. a cluster worker) pays.
+    """
+    subprocess.run(
+        [sys.executable, "-c", statement],
+        check=True,
+        cwd=path.dirname(path.dirname(path.abspath(__file__))),
+    )
+
+
+def import_benchmark_dict() -> Dict[str, Callable]:
+    """
+    Returns the benchmarks of importing `autogalaxy`, and of then accessing the attributes of its API which are
+    imported lazily (plotting and the aggregator).
+    """
+    return {
+        "import.autogalaxy": lambda: import_in_new_process(
+            statement="import autogalaxy"
+        ),
+        "import.autogalaxy.plot": lambda: import_in_new_process(
+            statement="import autogalaxy as ag; ag.plot"
+        ),
+        "import.autogalaxy.agg": lambda: import_in_new_process(
+            statement="import autogalaxy as ag; ag.agg"
+        ),
+    }
+
+
+def report_from(
+    run_time_dict: Dict[str, float], baseline_dict: Dict[str, float], threshold: float
+) -> Tuple[List[str], List[str]]:
+    """
+    Returns the lines of a report comparing the run time of every benchmark to its baseline, and the names of the
+    benchmarks whose run time exceeds their baseline by more than the `threshold` factor.
+    """
+    line_list = [
+        f"{'Benchmark':<72}{'Baseline (ms)':>15}{'Current (ms)':>15}{'Ratio':>8}  Status"
+    ]
+
+    regression_list = []
+
+    for name, run_time in run_time_dict.items():
+        baseline = baseline_dict.get(name)
+
+        if baseline is None:
+            line_list.append(
+                f"{name:<72}{'-':>15}{run_time * 1.0e3:>15.3f}{'-':>8}  new"
+            )
+            continue
+
+        ratio = run_time / baseline
+
+        if ratio > threshold:
+            status = "REGRESSION"
+            regression_list.append(name)
+        elif ratio < 1.0 / threshold:
+            status = "faster"
+        else:
+            status = "ok"
+
+        line_list.append(
+            f"{name:<72}{baseline * 1.0e3:>15.3f}{run_time * 1.0e3:>15.3f}{ratio:>8.2f}  {status}"
+        )
+
+    return line_list, regression_list
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--save",
+        action="store_true",
+        help="Save the run times as the baselines, instead of comparing against them.",
+    )
+    parser.add_argument(
+        "--filter",
+        default="",
+        help="Only run benchmarks whose name contains this string (e.g. `fit.` or `Sersic`).",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="The ratio of run time to baseline above which a benchmark is a regression.",
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    run_time_dict = {}
+
+    with tempfile.TemporaryDirectory() as output_path:
+        for benchmark_dict_func in [
+            light_profile_benchmark_dict,
+            mass_profile_benchmark_dict,
+            fit_benchmark_dict,
+            *[
+                module.benchmark_dict
+                for module in [
+                    light_profiles_fused,
+                    profile_derived_quantities,
+                    light_profiles_truncated,
+                    galaxies_spatial_index,
+                    psf_convolution,
+                    interferometer_batched_transform,
+                    interferometer_image_plane_chi_squared,
+                    cosmology_vectorized,
+                    instance_factory,
+                    galaxy_cache,
+                    chunked_evaluation,
+                    thread_pool,
+                    log_likelihood_buffers,
+                ]
+            ],
+            import_benchmark_dict,
+            lambda: aggregator_benchmark_dict(output_path=output_path),
+        ]:
+            for name, func in benchmark_dict_func().items():
+                if args.filter in name:
+                    run_time_dict[name] = run_time_from(func=func, repeats=args.repeats)
+
+    if args.save:
+        baseline_dict = {}
+
+        if path.exists(baseline_file):
+            with open(baseline_file) as f:
+                baseline_dict = json.load(f)["run_time_dict"]
+
+        baseline_dict.update(run_time_dict)
+
+        with open(baseline_file, "w+") as f:
+            json.dump(
+                {
+                    "machine": platform.platform(),
+                    "python": platform.python_version(),
+                    "run_time_dict": baseline_dict,
+                },
+                f,
+                indent=4,
+            )
+
+        print(f"Saved {len(run_time_dict)} baselines to {baseline_file}.")
+        sys.exit(0)
+
+    baseline_dict = {}
+
+    if path.exists(baseline_file):
+        with open(baseline_file) as f:
+            baseline_dict = json.load(f)["run_time_dict"]
+
+    line_list, regression_list = report_from(
+        run_time_dict=run_time_dict,
+        baseline_dict=baseline_dict,
+        threshold=args.threshold,
+    )
+
+    print("\n".join(line_list))
+
+    if regression_list:
+        print(
+            f"\n{len(regression_list)} benchmarks are more than {args.threshold}x slower than their baseline."
+        )
+        sys.exit(1)
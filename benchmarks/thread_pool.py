@@ -0,0 +1,111 @@
+"""
+Benchmark comparing the run time of the log likelihood of a `FitImaging` of a group-scale scene, with many galaxies
+which each have a bulge, disk and mass profile, with the galaxies and their profiles evaluated sequentially and in a
+thread pool (see `autogalaxy.operate.pool`).
+
+- Sequential: galaxies and profiles are evaluated one after another, which is the default behaviour.
+
+- Thread Pool: galaxies are evaluated in parallel in a pool of threads (set via the `operate -> pool_size` entry
+  of the `general.yaml` config).
+
+The deflection angles of the galaxies on the same grid are also timed, as used by the ray-tracing of a group-scale
+lens in **PyAutoLens**.
+
+The speed up of the thread pool depends on the number of CPU cores available, which is printed.
+
+Run this script from the repository root:
+
+python benchmarks/thread_pool.py
+"""
+
+import os
+from typing import Callable, Dict
+
+import numpy as np
+
+import autogalaxy as ag
+
+from autogalaxy.operate import pool
+
+from timing import func_with_attributes_from, run_time_from
+
+repeats = 10
+
+total_galaxies = 24
+pool_size = 4
+
+
+def benchmark_dict() -> Dict[str, Callable]:
+    """
+    Returns the benchmarks of the log likelihood and deflection angles of the galaxies, evaluated sequentially
+    (`sequential`) and in a pool of `pool_size` threads (`pool`).
+    """
+    mask = ag.Mask2D.circular(shape_native=(151, 151), pixel_scales=0.1, radius=7.0)
+
+    dataset = ag.Imaging(
+        data=ag.Array2D.ones(shape_native=mask.shape_native, pixel_scales=0.1),
+        noise_map=ag.Array2D.ones(shape_native=mask.shape_native, pixel_scales=0.1),
+        psf=ag.Kernel2D.from_gaussian(
+            shape_native=(11, 11), pixel_scales=0.1, sigma=0.1, normalize=True
+        ),
+    ).apply_mask(mask=mask)
+
+    centre_list = np.random.default_rng(seed=1).uniform(-6.0, 6.0, (total_galaxies, 2))
+
+    galaxies = ag.Galaxies(
+        galaxies=[
+            ag.Galaxy(
+                redshift=0.5,
+                bulge=ag.lp.Sersic(
+                    centre=tuple(centre), ell_comps=(0.1, 0.0), effective_radius=0.5
+                ),
+                disk=ag.lp.Exponential(
+                    centre=tuple(centre), ell_comps=(0.0, 0.1), effective_radius=1.5
+                ),
+                mass=ag.mp.Isothermal(
+                    centre=tuple(centre), ell_comps=(0.05, 0.0), einstein_radius=0.3
+                ),
+            )
+            for centre in centre_list
+        ]
+    )
+
+    func_dict = {
+        "likelihood": lambda: ag.FitImaging(
+            dataset=dataset, galaxies=galaxies
+        ).figure_of_merit,
+        "deflections": lambda: galaxies.deflections_yx_2d_from(grid=dataset.grids.lp),
+    }
+
+    return {
+        f"thread_pool.{name}.{method}": func_with_attributes_from(
+            func=func,
+            attribute_list=[(pool, "pool_size", lambda size=size: size)],
+        )
+        for name, func in func_dict.items()
+        for method, size in [("sequential", 1), ("pool", pool_size)]
+    }
+
+
+if __name__ == "__main__":
+    run_time_dict = {
+        name: run_time_from(func=func, repeats=repeats)
+        for name, func in benchmark_dict().items()
+    }
+
+    print(
+        f"{total_galaxies} galaxies, {repeats} repeats, "
+        f"{pool_size} threads, {os.cpu_count()} CPU cores.\n"
+    )
+    print(
+        f"Likelihood, Sequential (s):   {run_time_dict['thread_pool.likelihood.sequential']:.4f}"
+    )
+    print(
+        f"Likelihood, Thread Pool (s):  {run_time_dict['thread_pool.likelihood.pool']:.4f}"
+    )
+    print(
+        f"Deflections, Sequential (s):  {run_time_dict['thread_pool.deflections.sequential']:.4f}"
+    )
+    print(
+        f"Deflections, Thread Pool (s): {run_time_dict['thread_pool.deflections.pool']:.4f}"
+    )
@@ -0,0 +1,68 @@
+"""
+Functions shared by the benchmarks, which time a calculation and measure the memory it allocates.
+
+Every benchmark script (e.g. `benchmarks/psf_convolution.py`) has a `benchmark_dict` function returning the
+calculations it times, which are run by `benchmarks/suite.py` and compared against stored baselines, and can also be
+run on its own to print a comparison of the calculations:
+
+python benchmarks/psf_convolution.py
+"""
+
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+
+def run_time_from(func: Callable, repeats: int) -> float:
+    """
+    Returns the minimum time of `repeats` calls to `func`, after a first call which is not timed.
+    """
+    func()
+
+    run_time_list = []
+
+    for i in range(repeats):
+        start = time.perf_counter()
+        func()
+        run_time_list.append(time.perf_counter() - start)
+
+    return min(run_time_list)
+
+
+def peak_memory_from(func: Callable) -> float:
+    """
+    Returns the peak memory (in MB) allocated by a call to `func`, measured via `tracemalloc`.
+    """
+    tracemalloc.start()
+
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1.0e6
+    finally:
+        tracemalloc.stop()
+
+
+def func_with_attributes_from(
+    func: Callable, attribute_list: List[Tuple[object, str, object]]
+) -> Callable:
+    """
+    Returns a function which calls `func` with every attribute in `attribute_list`, given as (object, name, value)
+    tuples, set to its value and restores the attributes afterwards.
+
+    This is used to time a calculation with a config function of a module (e.g. `pool.pool_size`) overridden, without
+    the override changing the other benchmarks of the suite.
+    """
+
+    def func_with_attributes():
+        value_list = [getattr(obj, name) for obj, name, value in attribute_list]
+
+        for obj, name, value in attribute_list:
+            setattr(obj, name, value)
+
+        try:
+            return func()
+        finally:
+            for (obj, name, _), value in zip(attribute_list, value_list):
+                setattr(obj, name, value)
+
+    return func_with_attributes
@@ -1,3 +1,4 @@
+import multiprocessing
 import pytest
 import numpy as np
 from os import path
@@ -40,3 +41,62 @@ def test__instance_with_associated_adapt_images_from(masked_imaging_7x7):
     assert adapt_images.galaxy_image_dict[galaxies.source].native == pytest.approx(
         2.0 * np.ones((3, 3)), 1.0e-4
     )
+
+
+class MockVisualizer(af.Visualizer):
+    @staticmethod
+    def visualize(analysis, paths, instance, during_analysis):
+        if during_analysis:
+            analysis.started_event.set()
+            analysis.release_event.wait()
+
+        with open(path.join(paths, f"{instance}_{during_analysis}"), "w") as f:
+            f.write(str(analysis.title_prefix))
+
+
+class MockAnalysisImaging(ag.AnalysisImaging):
+    Visualizer = MockVisualizer
+
+
+def test__visualize__in_background__stale_requests_dropped(
+    masked_imaging_7x7, tmp_path, monkeypatch
+):
+    from autogalaxy.analysis import visualizer_worker as visualizer_worker_util
+
+    analysis = MockAnalysisImaging(dataset=masked_imaging_7x7, title_prefix="prefix")
+
+    context = multiprocessing.get_context("spawn")
+
+    analysis.started_event = context.Event()
+    analysis.release_event = context.Event()
+
+    analysis.visualize(paths=str(tmp_path), instance="inline", during_analysis=False)
+
+    assert (tmp_path / "inline_False").read_text() == "prefix"
+
+    monkeypatch.setattr(visualizer_worker_util, "visualize_in_background", lambda: True)
+
+    analysis.visualize(paths=str(tmp_path), instance=0, during_analysis=True)
+
+    visualizer_worker = visualizer_worker_util.visualizer_worker_from(analysis=analysis)
+
+    assert analysis.started_event.wait(timeout=300.0)
+
+    for instance in range(1, 5):
+        analysis.visualize(paths=str(tmp_path), instance=instance, during_analysis=True)
+
+    assert visualizer_worker.total_dropped == 3
+
+    analysis.release_event.set()
+
+    visualizer_worker_util.close_visualizer_worker(analysis=analysis)
+
+    assert sorted(file.name for file in tmp_path.iterdir()) == [
+        "0_True",
+        "4_True",
+        "inline_False",
+    ]
+
+    analysis.visualize(paths=str(tmp_path), instance=5, during_analysis=False)
+
+    assert (tmp_path / "5_False").read_text() == "prefix"
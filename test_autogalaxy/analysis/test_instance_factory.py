@@ -0,0 +1,91 @@
+import pytest
+
+import autofit as af
+import autogalaxy as ag
+
+from autogalaxy.analysis.instance_factory import InstanceFactory, is_equal
+
+
+def test__instance_from_vector__same_as_autofit(masked_imaging_7x7):
+    model = af.Collection(
+        galaxies=af.Collection(
+            galaxy=af.Model(
+                ag.Galaxy,
+                redshift=0.5,
+                bulge=ag.lp.Sersic,
+                disk=ag.lp.Exponential,
+                mass=ag.mp.Isothermal,
+            ),
+            galaxy_1=af.Model(ag.Galaxy, redshift=0.5, bulge=ag.lp.Sersic),
+        )
+    )
+
+    model.galaxies.galaxy_1.bulge.centre = model.galaxies.galaxy.bulge.centre
+    model.galaxies.galaxy.disk.centre_0 = 0.1
+
+    instance_factory = InstanceFactory(model=model)
+
+    assert instance_factory.in_place is True
+
+    analysis = ag.AnalysisImaging(dataset=masked_imaging_7x7)
+
+    for unit_value in [0.1, 0.45, 0.8]:
+        vector = model.vector_from_unit_vector(
+            unit_vector=[unit_value] * model.prior_count
+        )
+
+        instance = instance_factory.instance_from_vector(vector=vector)
+
+        assert instance is instance_factory.instance
+        assert is_equal(instance, model.instance_from_vector(vector=vector))
+        assert instance.galaxies.galaxy.disk.centre[0] == 0.1
+        assert analysis.log_likelihood_function(instance=instance) == pytest.approx(
+            analysis.log_likelihood_function(
+                instance=model.instance_from_vector(vector=vector)
+            ),
+            1.0e-8,
+        )
+
+
+def test__instance_from_vector__prior_limits():
+    model = af.Collection(galaxy=af.Model(ag.Galaxy, redshift=0.5, bulge=ag.lp.Sersic))
+
+    instance_factory = InstanceFactory(model=model)
+
+    vector = model.physical_values_from_prior_medians
+
+    vector[2] = 2.0
+
+    with pytest.raises(af.exc.PriorLimitException):
+        instance_factory.instance_from_vector(vector=vector)
+
+    instance = instance_factory.instance_from_vector(
+        vector=vector, ignore_prior_limits=True
+    )
+
+    assert instance.galaxy.bulge.ell_comps[0] == 2.0
+
+
+def test__attributes_computed_in_init__instances_via_autofit():
+    model = af.Collection(
+        galaxy=af.Model(
+            ag.Galaxy,
+            redshift=0.5,
+            pixelization=af.Model(
+                ag.Pixelization,
+                mesh=ag.mesh.Rectangular,
+                regularization=ag.reg.Constant,
+            ),
+        )
+    )
+
+    instance_factory = InstanceFactory(model=model)
+
+    assert instance_factory.in_place is False
+
+    vector = model.vector_from_unit_vector(unit_vector=[0.3] * model.prior_count)
+
+    instance = instance_factory.instance_from_vector(vector=vector)
+
+    assert instance is not instance_factory.instance
+    assert is_equal(instance, model.instance_from_vector(vector=vector))
@@ -1,6 +1,8 @@
 import pytest
 import numpy as np
 
+import autogalaxy as ag
+
 
 def test__arcsec_to_kpc_conversion(Planck15):
     arcsec_per_kpc = Planck15.arcsec_per_kpc_from(redshift=0.1)
@@ -78,3 +80,162 @@ def test__velocity_dispersion_from(Planck15):
     )
 
     assert velocity_dispersion == pytest.approx(np.sqrt(2) * 249.03449, 1.0e-4)
+
+
+@pytest.mark.parametrize(
+    "cosmology_cls, kwargs",
+    [
+        (ag.cosmology.Planck15, {}),
+        (ag.cosmology.LambdaCDMWrap, {"Om0": 0.3, "Ode0": 0.6}),
+    ],
+)
+def test__tabulate_distances__same_as_astropy(cosmology_cls, kwargs):
+    cosmology = cosmology_cls(**kwargs)
+
+    redshift_0 = np.array([0.05, 0.3, 0.5, 1.0, 2.0])
+    redshift_1 = np.array([0.2, 1.0, 2.5, 1.5, 6.0])
+
+    tabulated = cosmology_cls(**kwargs).tabulate_distances(redshift_max=8.0)
+
+    assert tabulated.distance_table is not None
+    assert cosmology.distance_table is None
+
+    for redshift in redshift_1:
+        assert tabulated.kpc_per_arcsec_from(redshift=redshift) == pytest.approx(
+            cosmology.kpc_per_arcsec_from(redshift=redshift), 1.0e-7
+        )
+        assert tabulated.arcsec_per_kpc_from(redshift=redshift) == pytest.approx(
+            cosmology.arcsec_per_kpc_from(redshift=redshift), 1.0e-7
+        )
+
+    for z0, z1 in zip(redshift_0, redshift_1):
+        assert tabulated.angular_diameter_distance_between_redshifts_in_kpc_from(
+            redshift_0=z0, redshift_1=z1
+        ) == pytest.approx(
+            cosmology.angular_diameter_distance_between_redshifts_in_kpc_from(
+                redshift_0=z0, redshift_1=z1
+            ),
+            1.0e-7,
+        )
+        assert tabulated.critical_surface_density_between_redshifts_solar_mass_per_kpc2_from(
+            redshift_0=z0, redshift_1=z1
+        ) == pytest.approx(
+            cosmology.critical_surface_density_between_redshifts_solar_mass_per_kpc2_from(
+                redshift_0=z0, redshift_1=z1
+            ),
+            1.0e-7,
+        )
+
+    assert tabulated.scaling_factor_between_redshifts_from(
+        redshift_0=0.5, redshift_1=1.0, redshift_final=2.0
+    ) == pytest.approx(
+        cosmology.scaling_factor_between_redshifts_from(
+            redshift_0=0.5, redshift_1=1.0, redshift_final=2.0
+        ),
+        1.0e-7,
+    )
+
+    distances = tabulated.angular_diameter_distance_between_redshifts_in_kpc_from(
+        redshift_0=redshift_0, redshift_1=redshift_1
+    )
+
+    assert distances.shape == (5,)
+    assert distances == pytest.approx(
+        cosmology.angular_diameter_distance_z1z2(redshift_0, redshift_1)
+        .to("kpc")
+        .value,
+        1.0e-7,
+    )
+
+
+def test__tabulate_distances__redshift_outside_table__raises_exception():
+    cosmology = ag.cosmology.Planck15().tabulate_distances(redshift_max=3.0)
+
+    with pytest.raises(ag.exc.CosmologyException):
+        cosmology.kpc_per_arcsec_from(redshift=3.5)
+
+
+@pytest.mark.parametrize(
+    "cosmology_cls, kwargs",
+    [
+        (ag.cosmology.Planck15, {}),
+        (ag.cosmology.LambdaCDMWrap, {"Om0": 0.3, "Ode0": 0.6}),
+    ],
+)
+@pytest.mark.parametrize("tabulate", [False, True])
+def test__array_redshifts__same_as_scalar_redshifts(cosmology_cls, kwargs, tabulate):
+    cosmology = cosmology_cls(**kwargs)
+
+    if tabulate:
+        cosmology.tabulate_distances(redshift_max=8.0)
+
+    redshift_0 = np.array([[0.05, 0.3, 0.5], [1.0, 2.0, 0.5]])
+    redshift_1 = np.array([[0.2, 1.0, 2.5], [1.5, 6.0, 2.5]])
+    redshift_final = redshift_1 + 1.0
+
+    for func in [
+        cosmology.arcsec_per_kpc_from,
+        cosmology.kpc_per_arcsec_from,
+        cosmology.angular_diameter_distance_to_earth_in_kpc_from,
+        cosmology.cosmic_average_density_from,
+        cosmology.cosmic_average_density_solar_mass_per_kpc3_from,
+    ]:
+        values = func(redshift=redshift_1)
+
+        assert values.shape == (2, 3)
+        assert isinstance(func(redshift=0.5), float)
+
+        for value, redshift in zip(values.ravel(), redshift_1.ravel()):
+            assert value == pytest.approx(func(redshift=redshift), 1.0e-10)
+
+    for func in [
+        cosmology.angular_diameter_distance_between_redshifts_in_kpc_from,
+        cosmology.critical_surface_density_between_redshifts_from,
+        cosmology.critical_surface_density_between_redshifts_solar_mass_per_kpc2_from,
+    ]:
+        values = func(redshift_0=redshift_0, redshift_1=redshift_1)
+
+        assert values.shape == (2, 3)
+        assert isinstance(func(redshift_0=0.5, redshift_1=1.0), float)
+
+        for value, z0, z1 in zip(
+            values.ravel(), redshift_0.ravel(), redshift_1.ravel()
+        ):
+            assert value == pytest.approx(func(redshift_0=z0, redshift_1=z1), 1.0e-10)
+
+    values = cosmology.scaling_factor_between_redshifts_from(
+        redshift_0=redshift_0, redshift_1=redshift_1, redshift_final=redshift_final
+    )
+
+    for value, z0, z1, zf in zip(
+        values.ravel(), redshift_0.ravel(), redshift_1.ravel(), redshift_final.ravel()
+    ):
+        assert value == pytest.approx(
+            cosmology.scaling_factor_between_redshifts_from(
+                redshift_0=z0, redshift_1=z1, redshift_final=zf
+            ),
+            1.0e-10,
+        )
+
+    values = cosmology.velocity_dispersion_from(
+        redshift_0=redshift_0, redshift_1=redshift_1, einstein_radius=1.5
+    )
+
+    for value, z0, z1 in zip(values.ravel(), redshift_0.ravel(), redshift_1.ravel()):
+        assert value == pytest.approx(
+            cosmology.velocity_dispersion_from(
+                redshift_0=z0, redshift_1=z1, einstein_radius=1.5
+            ),
+            1.0e-10,
+        )
+
+    distances = cosmology.angular_diameter_distance_between_redshifts_in_kpc_from(
+        redshift_0=redshift_0, redshift_1=redshift_1
+    )
+
+    assert distances == pytest.approx(
+        cosmology.angular_diameter_distance_z1z2(redshift_0, redshift_1)
+        .to("kpc")
+        .value,
+        1.0e-7,
+    )
@@ -79,3 +79,42 @@ def test__galaxies_sub_plot_output(
 
     plotter.subplot_galaxy_images()
     assert path.join(plot_path, "subplot_galaxy_images.png") in plot_patch.paths
+
+
+def test__plot_cache__quantities_shared_across_plotters(
+    galaxies_x2_7x7,
+    grid_2d_7x7,
+    include_2d_all,
+    plot_path,
+    plot_patch,
+):
+    def figures_2d():
+        plotter = aplt.GalaxiesPlotter(
+            galaxies=galaxies_x2_7x7,
+            grid=grid_2d_7x7,
+            include_2d=include_2d_all,
+            mat_plot_2d=aplt.MatPlot2D(output=aplt.Output(plot_path, format="png")),
+        )
+
+        plotter.figures_2d(
+            image=True, convergence=True, deflections_y=True, deflections_x=True
+        )
+
+    with aplt.plot_cache() as cache:
+        figures_2d()
+
+        total_computed = cache.total_computed
+
+        assert total_computed > 0
+        assert cache.total_reused > 0
+
+        figures_2d()
+
+        assert cache.total_computed == total_computed
+
+        with aplt.plot_cache() as cache_nested:
+            assert cache_nested is cache
+
+    with aplt.plot_cache() as cache_new:
+        assert cache_new is not cache
+        assert cache_new.total_computed == 0
@@ -48,6 +48,61 @@ def test__image_2d_from(grid_2d_7x7, gal_x1_lp):
     assert image == pytest.approx(g0_image + g1_image, 1.0e-4)
 
 
+def test__image_2d_from__truncated_light_profiles(monkeypatch):
+    from autogalaxy.galaxy import galaxies as galaxies_module
+    from autogalaxy.galaxy import galaxy as galaxy_module
+
+    grid = ag.Grid2D.uniform(
+        shape_native=(40, 40), pixel_scales=0.1, over_sample_size=2
+    )
+
+    galaxies = ag.Galaxies(
+        galaxies=[
+            ag.Galaxy(
+                redshift=0.5,
+                bulge=ag.lp.Sersic(
+                    centre=(0.5, -0.5),
+                    ell_comps=(0.2, 0.1),
+                    intensity=1.0,
+                    effective_radius=0.1,
+                    sersic_index=1.0,
+                ),
+                disk=ag.lp.Gaussian(centre=(0.5, -0.5), intensity=0.5, sigma=0.1),
+            ),
+            ag.Galaxy(
+                redshift=0.5,
+                bulge=ag.lp.Sersic(
+                    centre=(-1.0, 1.0), intensity=1.0, effective_radius=0.1
+                ),
+            ),
+            ag.Galaxy(
+                redshift=0.5, bulge=ag.lp.Sersic(centre=(10.0, 10.0), intensity=1.0)
+            ),
+        ]
+    )
+
+    image = galaxies.image_2d_from(grid=grid)
+    image_galaxy = galaxies[0].image_2d_from(grid=grid)
+
+    monkeypatch.setattr(galaxies_module, "truncation_tolerance", lambda: 1.0e-4)
+    monkeypatch.setattr(galaxy_module, "truncation_tolerance", lambda: 1.0e-4)
+
+    image_truncated = galaxies.image_2d_from(grid=grid)
+
+    assert isinstance(image_truncated, ag.Array2D)
+    assert np.max(np.abs(image_truncated - image)) < 4.0e-4
+    assert image_truncated.native[15, 15] == pytest.approx(image.native[15, 15], 1.0e-4)
+
+    image_galaxy_truncated = galaxies[0].image_2d_from(grid=grid)
+
+    assert np.max(np.abs(image_galaxy_truncated - image_galaxy)) < 2.0e-4
+    assert np.sum(image_galaxy_truncated == 0.0) > 1000
+
+    image_truncated = galaxies.image_2d_from(grid=grid, operated_only=True)
+
+    assert (image_truncated == np.zeros(shape=(1600,))).all()
+
+
 def test__image_2d_list_from(grid_2d_7x7):
     # Overwrite one value so intensity in each pixel is different
     grid_2d_7x7[5] = np.array([2.0, 2.0])
@@ -1,4 +1,6 @@
+import json
 from os import path
+from types import SimpleNamespace
 
 import autofit as af
 import autogalaxy as ag
@@ -39,6 +41,75 @@ def test__figure_of_merit__matches_correct_fit_given_galaxy_profiles(
     assert fit.log_likelihood == fit_figure_of_merit
 
 
+def test__log_likelihood_function__inversion__galaxies_created_once(
+    masked_imaging_7x7, monkeypatch
+):
+    pixelization = ag.Pixelization(
+        mesh=ag.mesh.Rectangular(shape=(3, 3)),
+        regularization=ag.reg.Constant(coefficient=1.0),
+    )
+
+    galaxy = ag.Galaxy(redshift=0.5, pixelization=pixelization)
+
+    model = af.Collection(galaxies=af.Collection(galaxy=galaxy))
+
+    instance = model.instance_from_unit_vector([])
+
+    analysis = ag.AnalysisImaging(dataset=masked_imaging_7x7)
+
+    figure_of_merit = analysis.fit_from(instance=instance).figure_of_merit
+
+    call_list = []
+
+    galaxies_via_instance_from = analysis.galaxies_via_instance_from
+
+    def counted_galaxies_via_instance_from(**kwargs):
+        call_list.append(kwargs["instance"])
+        return galaxies_via_instance_from(**kwargs)
+
+    monkeypatch.setattr(
+        analysis, "galaxies_via_instance_from", counted_galaxies_via_instance_from
+    )
+
+    assert analysis.log_likelihood_function(instance=instance) == figure_of_merit
+    assert call_list == [instance]
+
+
+def test__log_likelihood_function__fit_from_overridden__override_used(
+    masked_imaging_7x7,
+):
+    class MockAnalysisImaging(ag.AnalysisImaging):
+        def fit_from(self, instance, **kwargs):
+            return SimpleNamespace(figure_of_merit=1.0)
+
+    galaxy = ag.Galaxy(redshift=0.5, light=ag.lp.Sersic(intensity=0.1))
+
+    model = af.Collection(galaxies=af.Collection(galaxy=galaxy))
+
+    analysis = MockAnalysisImaging(dataset=masked_imaging_7x7)
+
+    assert (
+        analysis.log_likelihood_function(instance=model.instance_from_unit_vector([]))
+        == 1.0
+    )
+
+
+def test__likelihood_profiler_from__profiles_figure_of_merit_from(
+    masked_imaging_7x7,
+):
+    galaxy = ag.Galaxy(redshift=0.5, light=ag.lp.Sersic(intensity=0.1))
+
+    model = af.Collection(galaxies=af.Collection(galaxy=galaxy))
+
+    analysis = ag.AnalysisImaging(dataset=masked_imaging_7x7)
+
+    profiler = analysis.likelihood_profiler_from(
+        instance=model.instance_from_unit_vector([]), trace_memory=False
+    )
+
+    assert list(profiler.root.children) == ["figure_of_merit_from"]
+
+
 def test__profile_log_likelihood_function(masked_imaging_7x7):
     pixelization = ag.Pixelization(
         mesh=ag.mesh.Rectangular(shape=(3, 3)),
@@ -59,3 +130,38 @@ def test__profile_log_likelihood_function(masked_imaging_7x7):
 
     assert "regularization_term_0" in run_time_dict
     assert "log_det_regularization_matrix_term_0" in run_time_dict
+
+
+def test__profile_log_likelihood_function__outputs_files_once(
+    masked_imaging_7x7, tmp_path, monkeypatch
+):
+    galaxy = ag.Galaxy(redshift=0.5, light=ag.lp.Sersic(intensity=0.1))
+
+    model = af.Collection(galaxies=af.Collection(galaxy=galaxy))
+
+    instance = model.instance_from_unit_vector([])
+
+    analysis = ag.AnalysisImaging(dataset=masked_imaging_7x7)
+
+    output_name_list = []
+
+    for name in ["output_profiling_info", "output_likelihood_profiler"]:
+
+        def output(name=name, func=getattr(analysis, name), **kwargs):
+            if kwargs["paths"] is not None:
+                output_name_list.append(name)
+
+            func(**kwargs)
+
+        monkeypatch.setattr(analysis, name, output)
+
+    analysis.profile_log_likelihood_function(
+        instance=instance, paths=SimpleNamespace(profile_path=str(tmp_path))
+    )
+
+    assert output_name_list == ["output_profiling_info", "output_likelihood_profiler"]
+
+    with open(path.join(tmp_path, "info_dict.json")) as f:
+        assert json.load(f)["psf_shape_2d"] == [3, 3]
+
+    assert path.exists(path.join(tmp_path, "profile_tree.json"))
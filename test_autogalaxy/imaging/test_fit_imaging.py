@@ -164,6 +164,59 @@ def test__fit_figure_of_merit(
     assert fit.figure_of_merit == pytest.approx(-130242.56, 1.0e-4)
 
 
+def test__fit_figure_of_merit__profile_precision_float32(masked_imaging_7x7):
+    g0 = ag.Galaxy(
+        redshift=0.5,
+        bulge=ag.lp.Sersic(
+            centre=(0.05, 0.1), ell_comps=(0.1, 0.2), intensity=1.0, sersic_index=3.0
+        ),
+        disk=ag.lp.Exponential(ell_comps=(-0.1, 0.1), intensity=0.5),
+    )
+
+    fit = ag.FitImaging(dataset=masked_imaging_7x7, galaxies=[g0])
+
+    with ag.profile_precision("float32"):
+        fit_float32 = ag.FitImaging(dataset=masked_imaging_7x7, galaxies=[g0])
+
+        assert fit_float32.residual_map.dtype == np.float64
+        assert fit_float32.chi_squared == pytest.approx(fit.chi_squared, 1.0e-5)
+        assert fit_float32.noise_normalization == fit.noise_normalization
+        assert fit_float32.figure_of_merit == pytest.approx(
+            fit.figure_of_merit, 1.0e-5
+        )
+
+
+def test__fit_figure_of_merit__total_only(masked_imaging_7x7):
+    g0 = ag.Galaxy(
+        redshift=0.5,
+        bulge=ag.lp.Sersic(centre=(0.05, 0.1), intensity=1.0),
+        psf_bulge=ag.lp_operated.Gaussian(intensity=0.5),
+    )
+    g1 = ag.Galaxy(
+        redshift=0.5,
+        disk=ag.lp.Exponential(ell_comps=(-0.1, 0.1), intensity=0.5),
+        bulge=ag.lp_linear.Sersic(centre=(0.1, 0.1)),
+    )
+    g2 = ag.Galaxy(redshift=0.5)
+
+    fit = ag.FitImaging(dataset=masked_imaging_7x7, galaxies=[g0, g1, g2])
+    fit_per_galaxy = ag.FitImaging(
+        dataset=masked_imaging_7x7, galaxies=[g0, g1, g2], total_only=False
+    )
+
+    assert fit_per_galaxy.blurred_image == pytest.approx(
+        fit.blurred_image.array, 1.0e-8
+    )
+    assert fit_per_galaxy.figure_of_merit == pytest.approx(
+        fit.figure_of_merit, 1.0e-8
+    )
+
+    for galaxy in [g0, g1, g2]:
+        assert fit_per_galaxy.galaxy_model_image_dict[galaxy] == pytest.approx(
+            fit.galaxy_model_image_dict[galaxy].array, 1.0e-8
+        )
+
+
 def test__fit__model_dataset__sky___handles_special_behaviour(masked_imaging_7x7):
     g0 = ag.Galaxy(
         redshift=0.5,
@@ -417,7 +470,11 @@ def test__subtracted_images_of_galaxies_list(masked_imaging_7x7_no_blur):
 
 
 def test___unmasked_blurred_images(masked_imaging_7x7):
-    g0 = ag.Galaxy(redshift=0.5, bulge=ag.lp.Sersic(intensity=1.0))
+    g0 = ag.Galaxy(
+        redshift=0.5,
+        bulge=ag.lp.Sersic(intensity=1.0),
+        psf_bulge=ag.lp_operated.Gaussian(intensity=0.5),
+    )
 
     g1 = ag.Galaxy(redshift=0.5, bulge=ag.lp.Sersic(intensity=1.0))
 
@@ -447,6 +504,62 @@ def test___unmasked_blurred_images(masked_imaging_7x7):
     ).all()
 
 
+def test___unmasked_blurred_images__padded_images_evaluated_once(
+    masked_imaging_7x7, monkeypatch
+):
+    g0 = ag.Galaxy(redshift=0.5, bulge=ag.lp.Sersic(intensity=1.0))
+
+    g1 = ag.Galaxy(
+        redshift=0.5,
+        bulge=ag.lp_operated.Gaussian(intensity=1.0),
+        disk=ag.lp.Exponential(intensity=0.5),
+    )
+
+    galaxies = ag.Galaxies(galaxies=[g0, g1])
+
+    unmasked_blurred_image_via_galaxies = galaxies.unmasked_blurred_image_2d_from(
+        grid=masked_imaging_7x7.grids.lp, psf=masked_imaging_7x7.psf
+    )
+    unmasked_blurred_image_list_via_galaxies = (
+        galaxies.unmasked_blurred_image_2d_list_from(
+            grid=masked_imaging_7x7.grids.lp, psf=masked_imaging_7x7.psf
+        )
+    )
+
+    fit = ag.FitImaging(dataset=masked_imaging_7x7, galaxies=[g0, g1])
+
+    image_2d_split_from = ag.Galaxy.image_2d_split_from
+
+    grid_list = []
+
+    def image_2d_split_counted_from(self, grid):
+        grid_list.append(grid)
+        return image_2d_split_from(self, grid=grid)
+
+    monkeypatch.setattr(ag.Galaxy, "image_2d_split_from", image_2d_split_counted_from)
+
+    unmasked_blurred_image = fit.unmasked_blurred_image
+    unmasked_blurred_image_of_galaxies_list = (
+        fit.unmasked_blurred_image_of_galaxies_list
+    )
+
+    assert fit.unmasked_blurred_image is unmasked_blurred_image
+    assert len(grid_list) == 2
+    assert grid_list[0] is grid_list[1]
+
+    assert unmasked_blurred_image == pytest.approx(
+        unmasked_blurred_image_via_galaxies.array, 1.0e-8
+    )
+
+    for unmasked_blurred_image_of_galaxy, unmasked_blurred_image_via_galaxy in zip(
+        unmasked_blurred_image_of_galaxies_list,
+        unmasked_blurred_image_list_via_galaxies,
+    ):
+        assert unmasked_blurred_image_of_galaxy == pytest.approx(
+            unmasked_blurred_image_via_galaxy.array, 1.0e-8
+        )
+
+
 def test__light_profile_linear__intensity_dict(masked_imaging_7x7):
     linear_light_0 = ag.lp_linear.Sersic(sersic_index=1.0)
     linear_light_1 = ag.lp_linear.Sersic(sersic_index=4.0)
@@ -0,0 +1,173 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+import autofit as af
+import autogalaxy as ag
+
+from autoarray.abstract_ndarray import AbstractNDArray
+
+from autogalaxy.imaging.log_likelihood_buffers import (
+    log_likelihood_buffers_from,
+    use_log_likelihood_buffers_from,
+)
+from autogalaxy.operate import convolver
+
+
+@pytest.fixture(name="galaxies")
+def make_galaxies():
+    return ag.Galaxies(
+        galaxies=[
+            ag.Galaxy(
+                redshift=0.5,
+                bulge=ag.lp.Sersic(centre=(0.1, 0.0), intensity=1.0),
+                disk=ag.lp.Exponential(ell_comps=(0.1, 0.0), intensity=2.0),
+            ),
+            ag.Galaxy(
+                redshift=0.5,
+                bulge=ag.lp.Sersic(centre=(-0.1, 0.1), intensity=0.5),
+                psf_bulge=ag.lp_operated.Gaussian(intensity=0.5),
+            ),
+        ]
+    )
+
+
+@pytest.mark.parametrize("convolution", ["real_space", "fft"])
+def test__log_likelihood_from__same_as_fit_imaging(
+    monkeypatch, convolution, galaxies, masked_imaging_7x7
+):
+    monkeypatch.setattr(convolver, "convolution_method", lambda: convolution)
+
+    dataset_model = ag.DatasetModel(background_sky_level=0.5)
+
+    log_likelihood_buffers = log_likelihood_buffers_from(dataset=masked_imaging_7x7)
+
+    for galaxies, dataset_model in [
+        (galaxies, None),
+        (galaxies, dataset_model),
+        (ag.Galaxies(galaxies=galaxies[1:]), dataset_model),
+        (ag.Galaxies(galaxies=[ag.Galaxy(redshift=0.5)]), None),
+    ]:
+        fit = ag.FitImaging(
+            dataset=masked_imaging_7x7, galaxies=galaxies, dataset_model=dataset_model
+        )
+
+        assert log_likelihood_buffers.log_likelihood_from(
+            dataset=masked_imaging_7x7, galaxies=galaxies, dataset_model=dataset_model
+        ) == pytest.approx(fit.figure_of_merit, 1.0e-10)
+
+    assert log_likelihood_buffers_from(
+        dataset=masked_imaging_7x7
+    ) is log_likelihood_buffers_from(dataset=masked_imaging_7x7)
+
+
+def test__log_likelihood_from__threads_use_separate_buffers(masked_imaging_7x7):
+    galaxies_list = [
+        ag.Galaxies(
+            galaxies=[
+                ag.Galaxy(
+                    redshift=0.5, bulge=ag.lp.Sersic(centre=(0.1 * i, 0.0), intensity=i)
+                )
+            ]
+        )
+        for i in range(1, 9)
+    ]
+
+    log_likelihood_buffers = log_likelihood_buffers_from(dataset=masked_imaging_7x7)
+
+    def log_likelihood_from(galaxies):
+        return log_likelihood_buffers.log_likelihood_from(
+            dataset=masked_imaging_7x7, galaxies=galaxies
+        )
+
+    log_likelihood_list = [
+        log_likelihood_from(galaxies=galaxies) for galaxies in galaxies_list
+    ]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for _ in range(5):
+            assert list(executor.map(log_likelihood_from, galaxies_list)) == (
+                log_likelihood_list
+            )
+
+    assert len(set(log_likelihood_list)) == len(galaxies_list)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        chi_squared_map = executor.submit(
+            lambda: log_likelihood_buffers.chi_squared_map
+        ).result()
+
+    assert chi_squared_map is not log_likelihood_buffers.chi_squared_map
+
+
+def test__use_log_likelihood_buffers_from(
+    galaxies, masked_imaging_7x7, masked_imaging_covariance_7x7
+):
+    assert use_log_likelihood_buffers_from(
+        dataset=masked_imaging_7x7, galaxies=galaxies
+    )
+    assert not use_log_likelihood_buffers_from(
+        dataset=masked_imaging_7x7,
+        galaxies=galaxies,
+        dataset_model=ag.DatasetModel(grid_offset=(0.1, 0.0)),
+    )
+    assert not use_log_likelihood_buffers_from(
+        dataset=masked_imaging_covariance_7x7, galaxies=galaxies
+    )
+    assert not use_log_likelihood_buffers_from(
+        dataset=masked_imaging_7x7,
+        galaxies=ag.Galaxies(
+            galaxies=[ag.Galaxy(redshift=0.5, bulge=ag.lp_linear.Sersic())]
+        ),
+    )
+
+
+def test__log_likelihood_function__creates_fewer_structures(
+    monkeypatch, galaxies, masked_imaging_7x7
+):
+    model = af.Collection(
+        galaxies=af.Collection(galaxy_0=galaxies[0], galaxy_1=galaxies[1])
+    )
+
+    instance = model.instance_from_unit_vector([])
+
+    init = AbstractNDArray.__init__
+
+    structure_list = []
+
+    def counted_init(self, *args, **kwargs):
+        structure_list.append(type(self))
+        init(self, *args, **kwargs)
+
+    monkeypatch.setattr(AbstractNDArray, "__init__", counted_init)
+
+    log_likelihood_list = []
+    total_structures_list = []
+
+    for use_log_likelihood_buffers in [False, True]:
+        analysis = ag.AnalysisImaging(
+            dataset=masked_imaging_7x7,
+            use_log_likelihood_buffers=use_log_likelihood_buffers,
+        )
+
+        analysis.log_likelihood_function(instance=instance)
+
+        structure_list.clear()
+
+        log_likelihood_list.append(analysis.log_likelihood_function(instance=instance))
+        total_structures_list.append(len(structure_list))
+
+    assert log_likelihood_list[1] == pytest.approx(log_likelihood_list[0], 1.0e-10)
+
+    # The only structures the buffers create are the over-sample binned images of the light profiles, one for every
+    # light profile on the image grid and one for every light profile which is not operated on the blurring grid.
+
+    total_light_profiles = len(galaxies.cls_list_from(cls=ag.LightProfile))
+    total_light_profiles_not_operated = total_light_profiles - len(
+        galaxies.cls_list_from(cls=ag.lp_operated.LightProfileOperated)
+    )
+
+    assert total_structures_list[1] == 7
+    assert total_structures_list[1] == (
+        total_light_profiles + total_light_profiles_not_operated
+    )
+    assert total_structures_list[1] < total_structures_list[0]
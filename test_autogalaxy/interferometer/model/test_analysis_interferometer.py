@@ -1,4 +1,5 @@
 from os import path
+import pytest
 
 import autofit as af
 import autogalaxy as ag
@@ -40,6 +41,25 @@ def test__fit_figure_of_merit__matches_correct_fit_given_galaxy_profiles(
     assert fit.log_likelihood == fit_figure_of_merit
 
 
+def test__fit_from__total_only(interferometer_7):
+    galaxy = ag.Galaxy(redshift=0.5, light=ag.lp.Sersic(intensity=0.1))
+
+    model = af.Collection(galaxies=af.Collection(galaxy=galaxy))
+
+    analysis = ag.AnalysisInterferometer(dataset=interferometer_7)
+
+    instance = model.instance_from_unit_vector([])
+
+    fit = analysis.fit_from(instance=instance)
+    fit_not_total_only = analysis.fit_from(instance=instance, total_only=False)
+
+    assert fit.total_only is True
+    assert fit_not_total_only.total_only is False
+    assert fit_not_total_only.figure_of_merit == pytest.approx(
+        fit.figure_of_merit, 1.0e-4
+    )
+
+
 def test__profile_log_likelihood_function(interferometer_7):
     pixelization = ag.Pixelization(
         mesh=ag.mesh.Rectangular(shape=(3, 3)),
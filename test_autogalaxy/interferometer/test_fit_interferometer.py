@@ -108,6 +108,85 @@ def test__fit_figure_of_merit(interferometer_7):
     assert fit.figure_of_merit == pytest.approx(-35.16806296, 1.0e-4)
 
 
+def test__fit_figure_of_merit__profile_precision_float32(interferometer_7):
+    g0 = ag.Galaxy(
+        redshift=0.5,
+        bulge=ag.lp.Sersic(
+            centre=(0.05, 0.1), ell_comps=(0.1, 0.2), intensity=1.0, sersic_index=3.0
+        ),
+    )
+
+    fit = ag.FitInterferometer(dataset=interferometer_7, galaxies=[g0])
+
+    with ag.profile_precision("float32"):
+        fit_float32 = ag.FitInterferometer(dataset=interferometer_7, galaxies=[g0])
+
+        assert fit_float32.chi_squared == pytest.approx(fit.chi_squared, 1.0e-5)
+        assert fit_float32.noise_normalization == fit.noise_normalization
+        assert fit_float32.figure_of_merit == pytest.approx(
+            fit.figure_of_merit, 1.0e-5
+        )
+
+
+def test__fit_figure_of_merit__total_only(interferometer_7):
+    g0 = ag.Galaxy(redshift=0.5, bulge=ag.lp.Sersic(centre=(0.05, 0.1), intensity=1.0))
+    g1 = ag.Galaxy(
+        redshift=0.5,
+        disk=ag.lp.Exponential(ell_comps=(-0.1, 0.1), intensity=0.5),
+        bulge=ag.lp_linear.Sersic(centre=(0.1, 0.1)),
+    )
+    g2 = ag.Galaxy(redshift=0.5)
+
+    fit = ag.FitInterferometer(dataset=interferometer_7, galaxies=[g0, g1, g2])
+    fit_per_galaxy = ag.FitInterferometer(
+        dataset=interferometer_7, galaxies=[g0, g1, g2], total_only=False
+    )
+
+    assert fit_per_galaxy.profile_visibilities == pytest.approx(
+        fit.profile_visibilities.array, 1.0e-8
+    )
+    assert fit_per_galaxy.figure_of_merit == pytest.approx(
+        fit.figure_of_merit, 1.0e-8
+    )
+
+    for galaxy in [g0, g1, g2]:
+        assert fit_per_galaxy.galaxy_model_visibilities_dict[
+            galaxy
+        ] == pytest.approx(fit.galaxy_model_visibilities_dict[galaxy].array, 1.0e-8)
+
+
+def test__fit_figure_of_merit__use_image_plane_chi_squared(interferometer_7):
+    g0 = ag.Galaxy(redshift=0.5, bulge=ag.lp.Sersic(centre=(0.05, 0.1), intensity=1.0))
+    g1 = ag.Galaxy(
+        redshift=0.5, disk=ag.lp.Exponential(ell_comps=(-0.1, 0.1), intensity=0.5)
+    )
+
+    fit = ag.FitInterferometer(dataset=interferometer_7, galaxies=[g0, g1])
+    fit_image_plane = ag.FitInterferometer(
+        dataset=interferometer_7,
+        galaxies=[g0, g1],
+        use_image_plane_chi_squared=True,
+    )
+
+    assert fit_image_plane.chi_squared == pytest.approx(fit.chi_squared, 1.0e-8)
+    assert fit_image_plane.figure_of_merit == pytest.approx(
+        fit.figure_of_merit, 1.0e-8
+    )
+
+    g1_linear = ag.Galaxy(redshift=0.5, disk=ag.lp_linear.Exponential())
+
+    fit = ag.FitInterferometer(dataset=interferometer_7, galaxies=[g0, g1_linear])
+    fit_image_plane = ag.FitInterferometer(
+        dataset=interferometer_7,
+        galaxies=[g0, g1_linear],
+        use_image_plane_chi_squared=True,
+    )
+
+    assert fit_image_plane.figure_of_merit == pytest.approx(
+        fit.figure_of_merit, 1.0e-8
+    )
+
+
 def test___fit_figure_of_merit__different_settings(
     interferometer_7, interferometer_7_lop
 ):
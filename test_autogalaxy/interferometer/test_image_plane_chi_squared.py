@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+import autogalaxy as ag
+
+from autogalaxy.interferometer.image_plane_chi_squared import (
+    ImagePlaneChiSquared,
+    image_plane_chi_squared_from,
+)
+
+
+@pytest.mark.parametrize("unequal_noise", [False, True])
+def test__chi_squared_from__same_as_dft_chi_squared(unequal_noise):
+    rng = np.random.default_rng(1)
+
+    mask = ag.Mask2D.circular(
+        shape_native=(16, 14), pixel_scales=0.1, radius=0.5, centre=(0.1, -0.1)
+    )
+
+    if unequal_noise:
+        noise_map = ag.VisibilitiesNoiseMap(
+            visibilities=rng.uniform(1.0, 3.0, 100) + 1j * rng.uniform(1.0, 3.0, 100)
+        )
+    else:
+        noise_map = ag.VisibilitiesNoiseMap.full(shape_slim=(100,), fill_value=2.0)
+
+    dataset = ag.Interferometer(
+        data=ag.Visibilities(
+            visibilities=rng.normal(size=100) + 1j * rng.normal(size=100)
+        ),
+        noise_map=noise_map,
+        uv_wavelengths=rng.normal(size=(100, 2)) * 1.0e5,
+        real_space_mask=mask,
+        transformer_class=ag.TransformerDFT,
+    )
+
+    image = ag.lp.Sersic(
+        centre=(0.05, -0.1), ell_comps=(0.1, 0.2), intensity=3.0
+    ).image_2d_from(grid=ag.Grid2D.from_mask(mask=mask))
+
+    residual_map = np.asarray(dataset.data) - np.asarray(
+        dataset.transformer.visibilities_from(image=image)
+    )
+
+    chi_squared = np.sum(
+        (residual_map.real / np.asarray(noise_map).real) ** 2
+        + (residual_map.imag / np.asarray(noise_map).imag) ** 2
+    )
+
+    image_plane_chi_squared = ImagePlaneChiSquared(
+        dataset=dataset, visibilities_chunk=30
+    )
+
+    assert image_plane_chi_squared.use_sum_term is unequal_noise
+    assert image_plane_chi_squared.chi_squared_from(image=image) == pytest.approx(
+        chi_squared, 1.0e-8
+    )
+    assert image_plane_chi_squared_from(
+        dataset=dataset
+    ) is image_plane_chi_squared_from(dataset=dataset)
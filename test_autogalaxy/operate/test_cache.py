@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+import autogalaxy as ag
+
+from autogalaxy.operate import cache
+
+
+def test__bounded_cache__least_recently_used_value_removed():
+    bounded_cache = cache.BoundedCache(max_size=2)
+
+    assert bounded_cache.value_from(key="a", func=lambda: 1) == 1
+    assert bounded_cache.value_from(key="b", func=lambda: 2) == 2
+    assert bounded_cache.value_from(key="a", func=lambda: 3) == 1
+    assert bounded_cache.value_from(key="c", func=lambda: 4) == 4
+
+    assert len(bounded_cache) == 2
+    assert "a" in bounded_cache
+    assert "b" not in bounded_cache
+
+    assert bounded_cache.value_from(key="b", func=lambda: 5) == 5
+
+
+def test__fingerprint__same_for_same_parameters():
+    sersic_0 = ag.lp.Sersic(centre=(0.1, 0.2), intensity=1.0)
+    sersic_1 = ag.lp.Sersic(centre=(0.1, 0.2), intensity=1.0)
+
+    assert sersic_0.fingerprint == sersic_1.fingerprint
+    assert hash(sersic_0.fingerprint) == hash(sersic_1.fingerprint)
+
+    assert sersic_0.fingerprint != ag.lp.SersicSph(centre=(0.1, 0.2)).fingerprint
+
+    sersic_1.intensity = 2.0
+
+    assert sersic_0.fingerprint != sersic_1.fingerprint
+
+    galaxy_0 = ag.Galaxy(redshift=0.5, bulge=sersic_0)
+    galaxy_1 = ag.Galaxy(redshift=0.5, bulge=sersic_1)
+
+    assert galaxy_0.fingerprint == ag.Galaxy(redshift=0.5, bulge=sersic_0).fingerprint
+    assert galaxy_0.fingerprint != galaxy_1.fingerprint
+
+    sersic_1.intensity = 1.0
+
+    assert galaxy_0.fingerprint == galaxy_1.fingerprint
+    assert (
+        ag.Galaxies(galaxies=[galaxy_0]).fingerprint
+        == ag.Galaxies(galaxies=[galaxy_1]).fingerprint
+    )
+
+    basis = ag.lp_basis.Basis(profile_list=[sersic_1])
+    fingerprint = basis.fingerprint
+
+    sersic_1.intensity = 2.0
+
+    assert basis.fingerprint != fingerprint
+
+
+def test__fingerprint__none_if_attribute_has_no_fingerprint():
+    galaxy = ag.Galaxy(
+        redshift=0.5,
+        bulge=ag.lp.Sersic(),
+        pixelization=ag.Pixelization(
+            mesh=ag.mesh.Rectangular(), regularization=ag.reg.Constant()
+        ),
+    )
+
+    assert galaxy.fingerprint is None
+    assert ag.Galaxies(galaxies=[galaxy]).fingerprint is None
+
+
+def test__galaxies__image_and_deflections_cached(monkeypatch, grid_2d_7x7):
+    galaxies = ag.Galaxies(
+        galaxies=[
+            ag.Galaxy(redshift=0.5, bulge=ag.lp.Sersic(intensity=1.0)),
+            ag.Galaxy(
+                redshift=0.5,
+                bulge=ag.lp.Exponential(intensity=2.0),
+                mass=ag.mp.Isothermal(einstein_radius=1.0),
+            ),
+        ]
+    )
+
+    image = galaxies.image_2d_from(grid=grid_2d_7x7)
+    image_split = galaxies.image_2d_split_from(grid=grid_2d_7x7)
+    deflections = galaxies.deflections_yx_2d_from(grid=grid_2d_7x7)
+
+    monkeypatch.setattr(cache, "cache_size", lambda: 10)
+
+    assert galaxies.image_2d_from(grid=grid_2d_7x7) == pytest.approx(image.array)
+
+    grid_cache = cache.grid_cache_from(grid=grid_2d_7x7)
+
+    assert len(grid_cache) == 2
+
+    galaxies[1].bulge.intensity = 3.0
+
+    image_cached = galaxies.image_2d_from(grid=grid_2d_7x7)
+
+    assert len(grid_cache) == 3
+    assert image_cached != pytest.approx(image.array)
+
+    galaxies[1].bulge.intensity = 2.0
+
+    assert galaxies.image_2d_from(grid=grid_2d_7x7) == pytest.approx(image.array)
+    assert len(grid_cache) == 3
+
+    image_split_cached = galaxies.image_2d_split_from(grid=grid_2d_7x7)
+
+    assert image_split_cached[0] == pytest.approx(image_split[0].array)
+    assert image_split_cached[1] == pytest.approx(image_split[1].array)
+
+    assert galaxies.deflections_yx_2d_from(grid=grid_2d_7x7) == pytest.approx(
+        deflections.array
+    )
+    assert galaxies.deflections_yx_2d_from(grid=grid_2d_7x7) == pytest.approx(
+        deflections.array
+    )
+    assert len(grid_cache) == 7
+
+    galaxy_image = galaxies[0].image_2d_via_cache_from(grid=grid_2d_7x7)
+
+    with pytest.raises(ValueError):
+        np.asarray(galaxy_image)[0] = 1.0
+
+    cache.clear()
+
+    assert len(grid_cache) == 0
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+import autogalaxy as ag
+
+from autogalaxy.operate import chunk
+
+
+@pytest.fixture(name="galaxy")
+def make_galaxy():
+    return ag.Galaxy(
+        redshift=0.5,
+        bulge=ag.lp.Sersic(centre=(0.1, 0.2), ell_comps=(0.1, 0.2), intensity=1.0),
+        disk=ag.lp.Exponential(intensity=2.0),
+        mass=ag.mp.Isothermal(ell_comps=(0.05, 0.0), einstein_radius=1.0),
+        shear=ag.mp.ExternalShear(gamma_1=0.01),
+    )
+
+
+def test__chunk_indexes_from():
+    pixel_start, pixel_end = chunk.chunk_indexes_from(
+        sub_end=np.cumsum(np.array([1, 4, 9, 1, 1, 16, 1])), chunk_size=5
+    )
+
+    assert (pixel_start == np.array([0, 2, 4, 5])).all()
+    assert (pixel_end == np.array([2, 4, 5, 7])).all()
+
+
+def test__image_2d_chunked_from__same_as_image_2d_from(galaxy, tmp_path):
+    mask = ag.Mask2D.circular(shape_native=(21, 21), pixel_scales=0.1, radius=0.8)
+
+    grid = ag.Grid2D.from_mask(
+        mask=mask,
+        over_sample_size=ag.util.over_sample.over_sample_size_via_radial_bins_from(
+            grid=ag.Grid2D.from_mask(mask=mask),
+            sub_size_list=[8, 4, 1],
+            radial_list=[0.3, 0.6],
+        ),
+    )
+
+    image = galaxy.image_2d_from(grid=grid)
+
+    image_chunked = galaxy.image_2d_chunked_from(grid=grid, chunk_size=100)
+
+    assert image_chunked == pytest.approx(image.array, 1.0e-10)
+
+    out = np.lib.format.open_memmap(
+        tmp_path / "image.npy", mode="w+", shape=(grid.shape[0],)
+    )
+
+    image_chunked = ag.Galaxies(galaxies=[galaxy]).image_2d_chunked_from(
+        grid=grid, out=out, chunk_size=100, max_workers=2
+    )
+
+    assert image_chunked is out
+    assert np.load(tmp_path / "image.npy") == pytest.approx(image.array, 1.0e-10)
+
+
+def test__deflections_and_potential_chunked_from__same_as_unchunked(galaxy):
+    grid = ag.Grid2D.uniform(shape_native=(21, 21), pixel_scales=0.1)
+
+    deflections_chunked = galaxy.deflections_yx_2d_chunked_from(
+        grid=grid, chunk_size=50, max_workers=2
+    )
+
+    assert deflections_chunked.shape == (441, 2)
+    assert deflections_chunked == pytest.approx(
+        galaxy.deflections_yx_2d_from(grid=grid).array, 1.0e-10
+    )
+
+    potential_chunked = galaxy.potential_2d_chunked_from(grid=grid, chunk_size=50)
+
+    assert potential_chunked == pytest.approx(
+        galaxy.potential_2d_from(grid=grid).array, 1.0e-10
+    )
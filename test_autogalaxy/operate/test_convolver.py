@@ -0,0 +1,196 @@
+import numpy as np
+import pytest
+
+import autogalaxy as ag
+
+from autogalaxy.operate import convolver as convolver_util
+
+
+@pytest.fixture(name="mask_and_kernel")
+def make_mask_and_kernel():
+    mask = ag.Mask2D.circular(shape_native=(30, 30), pixel_scales=0.1, radius=1.0)
+
+    kernel = ag.Kernel2D.no_mask(
+        values=np.random.default_rng(1).random((5, 7)), pixel_scales=0.1
+    )
+
+    return mask, kernel
+
+
+def test__convolver_fft__convolve_image__same_as_real_space(mask_and_kernel):
+    mask, kernel = mask_and_kernel
+
+    convolver = ag.Convolver(mask=mask, kernel=kernel)
+    convolver_fft = convolver_util.ConvolverFFT(mask=mask, kernel=kernel)
+
+    rng = np.random.default_rng(2)
+
+    image = ag.Array2D(values=rng.random(mask.pixels_in_mask), mask=mask)
+
+    blurring_mask = mask.derive_mask.blurring_from(
+        kernel_shape_native=kernel.shape_native
+    )
+    blurring_image = ag.Array2D(
+        values=rng.random(blurring_mask.pixels_in_mask), mask=blurring_mask
+    )
+
+    assert convolver_fft.convolve_image(
+        image=image, blurring_image=blurring_image
+    ) == pytest.approx(
+        convolver.convolve_image(image=image, blurring_image=blurring_image).array,
+        1.0e-10,
+    )
+    assert convolver_fft.convolve_image_no_blurring(image=image) == pytest.approx(
+        convolver.convolve_image_no_blurring(image=image).array, 1.0e-10
+    )
+
+    mapping_matrix = rng.random((mask.pixels_in_mask, 3))
+
+    assert convolver_fft.convolve_mapping_matrix(
+        mapping_matrix=mapping_matrix
+    ) == pytest.approx(
+        convolver.convolve_mapping_matrix(mapping_matrix=mapping_matrix), 1.0e-10
+    )
+
+
+def test__convolver_fft_from__cached_per_mask_and_kernel(mask_and_kernel):
+    mask, kernel = mask_and_kernel
+
+    convolver_fft = convolver_util.convolver_fft_from(mask=mask, kernel=kernel)
+
+    assert convolver_util.convolver_fft_from(mask=mask, kernel=kernel) is convolver_fft
+
+    kernel_3x3 = ag.Kernel2D.no_blur(pixel_scales=0.1)
+
+    assert (
+        convolver_util.convolver_fft_from(mask=mask, kernel=kernel_3x3)
+        is not convolver_fft
+    )
+
+
+def test__use_fft_from(monkeypatch):
+    mask = ag.Mask2D.circular(shape_native=(100, 100), pixel_scales=0.1, radius=3.0)
+
+    assert not convolver_util.use_fft_from(
+        mask=mask, kernel=ag.Kernel2D.no_blur(pixel_scales=0.1)
+    )
+    assert convolver_util.use_fft_from(
+        mask=mask, kernel=ag.Kernel2D.ones(shape_native=(21, 21), pixel_scales=0.1)
+    )
+
+    monkeypatch.setattr(convolver_util, "convolution_method", lambda: "fft")
+
+    assert convolver_util.use_fft_from(
+        mask=mask, kernel=ag.Kernel2D.no_blur(pixel_scales=0.1)
+    )
+
+
+def test__use_fft_from__auto__computed_once_per_mask_and_kernel(monkeypatch):
+    mask = ag.Mask2D.circular(shape_native=(100, 100), pixel_scales=0.1, radius=3.0)
+    kernel = ag.Kernel2D.ones(shape_native=(21, 21), pixel_scales=0.1)
+
+    call_list = []
+
+    fft_faster_from = convolver_util.fft_faster_from
+
+    def counted_fft_faster_from(mask, kernel):
+        call_list.append(kernel.shape_native)
+        return fft_faster_from(mask=mask, kernel=kernel)
+
+    monkeypatch.setattr(convolver_util, "fft_faster_from", counted_fft_faster_from)
+
+    assert convolver_util.use_fft_from(mask=mask, kernel=kernel)
+    assert convolver_util.use_fft_from(mask=mask, kernel=kernel)
+    assert not convolver_util.use_fft_from(
+        mask=mask, kernel=ag.Kernel2D.no_blur(pixel_scales=0.1)
+    )
+
+    assert call_list == [(21, 21), (3, 3)]
+
+
+def test__fit_imaging_and_unmasked_blurred_image__fft_same_as_real_space(
+    masked_imaging_7x7, monkeypatch
+):
+    galaxy = ag.Galaxy(
+        redshift=0.5,
+        bulge=ag.lp.Sersic(centre=(0.05, 0.1), intensity=1.0),
+        disk=ag.lp_linear.Exponential(ell_comps=(-0.1, 0.1)),
+    )
+
+    monkeypatch.setattr(convolver_util, "convolution_method", lambda: "real_space")
+
+    fit = ag.FitImaging(dataset=masked_imaging_7x7, galaxies=[galaxy])
+
+    assert isinstance(fit.convolver, ag.Convolver)
+
+    figure_of_merit = fit.figure_of_merit
+    unmasked_blurred_image = galaxy.unmasked_blurred_image_2d_from(
+        grid=masked_imaging_7x7.grids.lp, psf=masked_imaging_7x7.psf
+    )
+
+    monkeypatch.setattr(convolver_util, "convolution_method", lambda: "fft")
+
+    fit = ag.FitImaging(dataset=masked_imaging_7x7, galaxies=[galaxy])
+
+    assert isinstance(fit.convolver, convolver_util.ConvolverFFT)
+    assert fit.figure_of_merit == pytest.approx(figure_of_merit, 1.0e-8)
+
+    assert galaxy.unmasked_blurred_image_2d_from(
+        grid=masked_imaging_7x7.grids.lp, psf=masked_imaging_7x7.psf
+    ) == pytest.approx(unmasked_blurred_image.array, 1.0e-8)
+
+
+@pytest.mark.parametrize("use_w_tilde", [False, True])
+def test__fit_imaging__large_psf_with_inversion__fft_same_as_real_space(
+    use_w_tilde, monkeypatch
+):
+    mask = ag.Mask2D.circular(shape_native=(40, 40), pixel_scales=0.1, radius=1.5)
+
+    dataset = ag.Imaging(
+        data=ag.Array2D.ones(shape_native=(40, 40), pixel_scales=0.1),
+        noise_map=ag.Array2D.ones(shape_native=(40, 40), pixel_scales=0.1),
+        psf=ag.Kernel2D.from_gaussian(
+            shape_native=(21, 21), pixel_scales=0.1, sigma=0.3, normalize=True
+        ),
+    ).apply_mask(mask=mask)
+
+    pixelization = ag.Pixelization(
+        mesh=ag.mesh.Rectangular(shape=(5, 5)),
+        regularization=ag.reg.Constant(coefficient=1.0),
+    )
+
+    galaxies_list = [
+        [ag.Galaxy(redshift=0.5, pixelization=pixelization)],
+        [
+            ag.Galaxy(
+                redshift=0.5,
+                bulge=ag.lp_linear.Sersic(),
+                disk=ag.lp.Exponential(ell_comps=(-0.1, 0.1)),
+            )
+        ],
+        [
+            ag.Galaxy(redshift=0.5, bulge=ag.lp_linear.Sersic()),
+            ag.Galaxy(redshift=0.5, pixelization=pixelization),
+        ],
+    ]
+
+    settings_inversion = ag.SettingsInversion(use_w_tilde=use_w_tilde)
+
+    monkeypatch.setattr(convolver_util, "convolution_method", lambda: "real_space")
+
+    figure_of_merit_list = [
+        ag.FitImaging(
+            dataset=dataset, galaxies=galaxies, settings_inversion=settings_inversion
+        ).figure_of_merit
+        for galaxies in galaxies_list
+    ]
+
+    monkeypatch.setattr(convolver_util, "convolution_method", lambda: "auto")
+
+    for galaxies, figure_of_merit in zip(galaxies_list, figure_of_merit_list):
+        fit = ag.FitImaging(
+            dataset=dataset, galaxies=galaxies, settings_inversion=settings_inversion
+        )
+
+        assert isinstance(fit.convolver, convolver_util.ConvolverFFT)
+        assert fit.figure_of_merit == pytest.approx(figure_of_merit, 1.0e-8)
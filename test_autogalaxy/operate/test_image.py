@@ -67,6 +67,81 @@ def test__blurred_image_2d_from(
     )
 
 
+def test__image_2d_split_from(grid_2d_7x7):
+    light_not_operated = ag.lp.Sersic(intensity=1.0)
+    light_operated = ag.lp_operated.Gaussian(intensity=1.0)
+    basis = ag.lp_basis.Basis(
+        profile_list=[
+            ag.lp.Gaussian(intensity=2.0, sigma=0.5),
+            ag.lp_operated.Gaussian(intensity=3.0, sigma=0.5),
+        ]
+    )
+
+    galaxy_0 = ag.Galaxy(
+        redshift=0.5, light=light_not_operated, light_operated=light_operated
+    )
+    galaxy_1 = ag.Galaxy(redshift=0.5, bulge=basis)
+    galaxies = ag.Galaxies(galaxies=[galaxy_0, galaxy_1])
+
+    for light_obj in [light_not_operated, light_operated, basis, galaxy_0, galaxies]:
+        image_2d_not_operated, image_2d_operated = light_obj.image_2d_split_from(
+            grid=grid_2d_7x7
+        )
+
+        assert image_2d_not_operated.native == pytest.approx(
+            light_obj.image_2d_from(grid=grid_2d_7x7, operated_only=False).native,
+            1.0e-8,
+        )
+        assert image_2d_operated.native == pytest.approx(
+            light_obj.image_2d_from(grid=grid_2d_7x7, operated_only=True).native,
+            1.0e-8,
+        )
+
+    for light_obj in [galaxy_0, galaxies]:
+        (
+            image_2d_not_operated_list,
+            image_2d_operated_list,
+        ) = light_obj.image_2d_split_list_from(grid=grid_2d_7x7)
+
+        for image_2d_split, image_2d in zip(
+            image_2d_not_operated_list,
+            light_obj.image_2d_list_from(grid=grid_2d_7x7, operated_only=False),
+        ):
+            assert image_2d_split == pytest.approx(image_2d, 1.0e-8)
+
+        for image_2d_split, image_2d in zip(
+            image_2d_operated_list,
+            light_obj.image_2d_list_from(grid=grid_2d_7x7, operated_only=True),
+        ):
+            assert image_2d_split == pytest.approx(image_2d, 1.0e-8)
+
+
+def test__image_2d_split_from__evaluates_each_light_profile_once(
+    grid_2d_7x7, monkeypatch
+):
+    light_not_operated = ag.lp.Sersic(intensity=1.0)
+
+    galaxy = ag.Galaxy(
+        redshift=0.5,
+        light=light_not_operated,
+        light_operated=ag.lp_operated.Gaussian(intensity=1.0),
+    )
+
+    call_list = []
+
+    image_2d_from = ag.lp.Sersic.image_2d_from
+
+    def image_2d_from_counted(self, grid, *args, **kwargs):
+        call_list.append(self)
+        return image_2d_from(self, grid, *args, **kwargs)
+
+    monkeypatch.setattr(ag.lp.Sersic, "image_2d_from", image_2d_from_counted)
+
+    galaxy.image_2d_split_from(grid=grid_2d_7x7)
+
+    assert call_list == [light_not_operated]
+
+
 def test__x1_galaxies__padded_image__compare_to_galaxy_images_using_padded_grid_stack(
     grid_2d_7x7,
 ):
@@ -276,6 +351,50 @@ def test__unmasked_blurred_image_2d_list_from():
     )
 
 
+def test__unmasked_blurred_image_2d_list_from__operated_profiles_blurred():
+    psf = ag.Kernel2D.no_mask(
+        values=(np.array([[0.0, 3.0, 0.0], [0.0, 1.0, 2.0], [0.0, 0.0, 0.0]])),
+        pixel_scales=1.0,
+    )
+
+    mask = ag.Mask2D(
+        mask=[[True, True, True], [True, False, True], [True, True, True]],
+        pixel_scales=1.0,
+    )
+
+    grid = ag.Grid2D.from_mask(mask=mask)
+
+    lp = ag.lp.Sersic(intensity=1.0)
+    lp_operated = ag.lp_operated.Gaussian(intensity=2.0)
+
+    padded_grid = grid.padded_grid_from(kernel_shape_native=psf.shape_native)
+
+    manual_blurred_image_0 = lp.image_2d_from(grid=padded_grid)
+    manual_blurred_image_0 += lp_operated.image_2d_from(grid=padded_grid)
+    manual_blurred_image_0 = psf.convolved_array_from(array=manual_blurred_image_0)
+
+    manual_blurred_image_1 = lp_operated.image_2d_from(grid=padded_grid)
+    manual_blurred_image_1 = psf.convolved_array_from(array=manual_blurred_image_1)
+
+    galaxies = ag.Galaxies(
+        galaxies=[
+            ag.Galaxy(redshift=0.5, lp=lp, lp_operated=lp_operated),
+            ag.Galaxy(redshift=0.5, lp_operated=lp_operated),
+        ]
+    )
+
+    unmasked_blurred_image_2d_list = galaxies.unmasked_blurred_image_2d_list_from(
+        grid=grid, psf=psf
+    )
+
+    assert unmasked_blurred_image_2d_list[0].native == pytest.approx(
+        manual_blurred_image_0.native[1:4, 1:4], 1.0e-4
+    )
+    assert unmasked_blurred_image_2d_list[1].native == pytest.approx(
+        manual_blurred_image_1.native[1:4, 1:4], 1.0e-4
+    )
+
+
 def test__visibilities_list_from(grid_2d_7x7, transformer_7x7_7):
     lp_0 = ag.lp.Sersic(intensity=1.0)
     lp_1 = ag.lp.Sersic(intensity=2.0)
@@ -0,0 +1,111 @@
+import threading
+
+import numpy as np
+import pytest
+
+import autogalaxy as ag
+
+from autogalaxy.util import profiler
+from autogalaxy.operate import pool
+from autogalaxy.profiles import precision
+
+
+@pytest.fixture(name="galaxies")
+def make_galaxies():
+    return ag.Galaxies(
+        galaxies=[
+            ag.Galaxy(
+                redshift=0.5,
+                bulge=ag.lp.Sersic(centre=(0.1 * i, 0.0), intensity=1.0),
+                disk=ag.lp.Exponential(intensity=2.0),
+                psf_bulge=ag.lp_operated.Gaussian(intensity=0.5),
+                mass=ag.mp.Isothermal(centre=(0.0, 0.1 * i), einstein_radius=1.0),
+                shear=ag.mp.ExternalShear(gamma_1=0.01),
+            )
+            for i in range(4)
+        ]
+    )
+
+
+def test__map_from():
+    assert pool.is_active() is False
+    assert list(pool.map_from(lambda x, y: x * y, [1, 2, 3], [4, 5, 6])) == [
+        4,
+        10,
+        18,
+    ]
+
+
+def test__map_from__nested_calls_in_pool_are_sequential(monkeypatch):
+    monkeypatch.setattr(pool, "pool_size", lambda: 2)
+
+    assert pool.is_active() is True
+
+    def is_active_in_thread_from(value):
+        return (
+            pool.is_active(),
+            threading.current_thread().name.startswith("autogalaxy"),
+        )
+
+    assert (
+        list(pool.map_from(is_active_in_thread_from, [1, 2, 3])) == [(False, True)] * 3
+    )
+
+    with profiler.LikelihoodProfiler():
+        assert pool.is_active() is False
+
+
+def test__map_from__values_in_pool_use_caller_precision(monkeypatch):
+    monkeypatch.setattr(pool, "pool_size", lambda: 2)
+
+    with ag.profile_precision("float32"):
+        assert (
+            list(pool.map_from(lambda value: precision.dtype(), [1, 2, 3]))
+            == [np.float32] * 3
+        )
+
+    assert (
+        list(pool.map_from(lambda value: precision.dtype(), [1, 2, 3]))
+        == [np.float64] * 3
+    )
+
+
+def test__galaxies__same_with_thread_pool(monkeypatch, galaxies, grid_2d_7x7):
+    image_2d_list = galaxies.image_2d_list_from(grid=grid_2d_7x7)
+    image_2d_split = galaxies.image_2d_split_from(grid=grid_2d_7x7)
+    galaxy_image_2d_dict = galaxies.galaxy_image_2d_dict_from(grid=grid_2d_7x7)
+    deflections = galaxies.deflections_yx_2d_from(grid=grid_2d_7x7)
+
+    monkeypatch.setattr(pool, "pool_size", lambda: 3)
+
+    for image_2d, image_2d_pool in zip(
+        image_2d_list, galaxies.image_2d_list_from(grid=grid_2d_7x7)
+    ):
+        assert image_2d_pool == pytest.approx(image_2d.array, 1.0e-10)
+
+    image_2d_split_pool = galaxies.image_2d_split_from(grid=grid_2d_7x7)
+
+    assert image_2d_split_pool[0] == pytest.approx(image_2d_split[0].array, 1.0e-10)
+    assert image_2d_split_pool[1] == pytest.approx(image_2d_split[1].array, 1.0e-10)
+
+    galaxy_image_2d_dict_pool = galaxies.galaxy_image_2d_dict_from(grid=grid_2d_7x7)
+
+    for galaxy in galaxies:
+        assert galaxy_image_2d_dict_pool[galaxy] == pytest.approx(
+            galaxy_image_2d_dict[galaxy].array, 1.0e-10
+        )
+
+    assert galaxies.deflections_yx_2d_from(grid=grid_2d_7x7) == pytest.approx(
+        deflections.array, 1.0e-10
+    )
+
+    galaxy = galaxies[0]
+
+    assert galaxy.image_2d_split_from(grid=grid_2d_7x7)[0] == pytest.approx(
+        ag.Galaxies(galaxies=[galaxy]).image_2d_split_from(grid=grid_2d_7x7)[0].array,
+        1.0e-10,
+    )
+    assert galaxy.deflections_yx_2d_from(grid=grid_2d_7x7) == pytest.approx(
+        ag.Galaxies(galaxies=[galaxy]).deflections_yx_2d_from(grid=grid_2d_7x7).array,
+        1.0e-10,
+    )
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+import autogalaxy as ag
+
+from autogalaxy.operate import transformer as transformer_util
+
+
+@pytest.mark.parametrize("transformer_class", [ag.TransformerDFT, ag.TransformerNUFFT])
+def test__visibilities_list_via_batch_from(transformer_class):
+    mask = ag.Mask2D.circular(shape_native=(20, 20), pixel_scales=0.1, radius=0.8)
+
+    uv_wavelengths = np.random.default_rng(1).normal(size=(50, 2)) * 1.0e5
+
+    transformer = transformer_class(uv_wavelengths=uv_wavelengths, real_space_mask=mask)
+
+    grid = ag.Grid2D.from_mask(mask=mask)
+
+    image_2d_list = [
+        ag.lp.Sersic(centre=(0.1, 0.1), intensity=1.0).image_2d_from(grid=grid),
+        ag.Array2D(values=np.zeros(mask.pixels_in_mask), mask=mask),
+        ag.lp.Gaussian(ell_comps=(0.1, 0.2), intensity=2.0).image_2d_from(grid=grid),
+    ]
+
+    visibilities_list = transformer_util.visibilities_list_via_batch_from(
+        image_2d_list=image_2d_list, transformer=transformer
+    )
+
+    assert isinstance(visibilities_list[0], ag.Visibilities)
+    assert visibilities_list[0] == pytest.approx(
+        transformer.visibilities_from(image=image_2d_list[0]).array, 1.0e-8
+    )
+    assert (visibilities_list[1] == 0.0 + 0.0j).all()
+    assert visibilities_list[2] == pytest.approx(
+        transformer.visibilities_from(image=image_2d_list[2]).array, 1.0e-8
+    )
@@ -5,6 +5,7 @@ from typing import Optional
 import autoarray as aa
 import autogalaxy as ag
 
+from autogalaxy.profiles.light import decorators
 from autogalaxy.profiles.light.decorators import (
     check_operated_only,
 )
@@ -52,3 +53,34 @@ def test__decorator_changes_behaviour_correctly():
 
     image_2d = lp.image_2d_from(grid=grid, operated_only=False)
     assert image_2d == pytest.approx(np.zeros(shape=(9,)), 1.0e-4)
+
+
+def test__truncate__image_only_evaluated_inside_truncation_radius(monkeypatch):
+    grid = ag.Grid2D.uniform(shape_native=(40, 40), pixel_scales=0.1, over_sample_size=2)
+
+    light_profile = ag.lp.Sersic(
+        centre=(0.5, -0.5),
+        ell_comps=(0.2, 0.1),
+        intensity=1.0,
+        effective_radius=0.1,
+        sersic_index=1.0,
+    )
+
+    image = light_profile.image_2d_from(grid=grid)
+
+    monkeypatch.setattr(decorators, "truncation_tolerance", lambda: 1.0e-4)
+
+    image_truncated = light_profile.image_2d_from(grid=grid)
+
+    radius = light_profile.truncation_radius_from(tolerance=1.0e-4)
+
+    assert radius < 1.0
+    assert (image_truncated.array[image.array > 1.0e-4] > 0.0).all()
+    assert np.max(np.abs(image_truncated.array - image.array)) < 1.0e-4
+    assert np.sum(image_truncated.array == 0.0) > 1000
+
+    image_irregular = light_profile.image_2d_from(
+        grid=ag.Grid2DIrregular(values=[(5.0, 5.0)])
+    )
+
+    assert image_irregular.array[0] > 0.0
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+import autogalaxy as ag
+
+from autogalaxy.profiles.light import fused_util
+
+
+grid = ag.Grid2DIrregular(
+    [[0.1, 0.2], [1.0, 1.0], [-2.0, 0.5], [3.0, -3.0], [0.0, 0.0], [0.0, 1e-10]]
+)
+
+light_profile_list = [
+    ag.lp.Sersic(
+        centre=(0.1, 0.2), ell_comps=(0.2, -0.1), intensity=2.0, sersic_index=2.5
+    ),
+    ag.lp.SersicSph(centre=(0.1, 0.2), intensity=2.0, sersic_index=2.5),
+    ag.lp.Exponential(centre=(0.1, 0.2), ell_comps=(0.1, 0.3), intensity=2.0),
+    ag.lp.DevVaucouleurs(centre=(0.1, 0.2), ell_comps=(0.1, 0.3), intensity=2.0),
+    ag.lp.SersicCore(centre=(0.1, 0.2), ell_comps=(0.2, -0.1), intensity=2.0),
+    ag.lp.ExponentialCore(centre=(0.1, 0.2), ell_comps=(0.2, -0.1), intensity=2.0),
+    ag.lp.Gaussian(centre=(0.1, 0.2), ell_comps=(-0.3, 0.1), intensity=2.0),
+    ag.lp.GaussianSph(centre=(0.1, 0.2), intensity=2.0, sigma=0.5),
+    ag.lp.Moffat(centre=(0.1, 0.2), ell_comps=(0.2, 0.2), intensity=2.0),
+    ag.lp.Chameleon(centre=(0.1, 0.2), ell_comps=(0.2, -0.1), intensity=2.0),
+    ag.lp.ChameleonSph(centre=(0.1, 0.2), intensity=2.0),
+    ag.lp.ElsonFreeFall(centre=(0.1, 0.2), ell_comps=(0.2, -0.1), intensity=2.0),
+    ag.lp_linear.Sersic(centre=(0.1, 0.2), ell_comps=(0.2, -0.1)),
+]
+
+
+@pytest.mark.parametrize("light_profile", light_profile_list)
+def test__image_2d_fused_from__same_as_image_2d_from(light_profile, monkeypatch):
+    image = light_profile.image_2d_from(grid=grid)
+
+    monkeypatch.setattr(fused_util, "fused_kernels_enabled", lambda: True)
+
+    image_fused = light_profile.image_2d_from(grid=grid)
+
+    assert image_fused.array == pytest.approx(image.array, 1.0e-8)
+
+
+def test__image_2d_from__fused_kernels_enabled__uses_fused_kernels(monkeypatch):
+    grid_2d = ag.Grid2D.uniform(
+        shape_native=(5, 5), pixel_scales=0.3, over_sample_size=2
+    )
+
+    lp = ag.lp.Sersic(
+        centre=(0.1, 0.2), ell_comps=(0.2, -0.1), intensity=2.0, sersic_index=2.5
+    )
+
+    image = lp.image_2d_from(grid=grid_2d)
+
+    monkeypatch.setattr(fused_util, "fused_kernels_enabled", lambda: True)
+
+    image_fused = lp.image_2d_from(grid=grid_2d)
+
+    assert isinstance(image_fused, ag.Array2D)
+    assert image_fused.native == pytest.approx(image.native, 1.0e-8)
+
+    image_fused = lp.image_2d_from(grid=grid_2d, operated_only=True)
+
+    assert (image_fused == np.zeros(shape=(25,))).all()
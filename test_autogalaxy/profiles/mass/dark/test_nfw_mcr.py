@@ -3,6 +3,8 @@ import pytest
 
 import autogalaxy as ag
 
+from autogalaxy.profiles.mass.dark import mcr_util
+
 grid = ag.Grid2DIrregular([[1.0, 1.0], [2.0, 2.0], [3.0, 3.0], [2.0, 4.0]])
 
 
@@ -233,3 +235,50 @@ def test__same_as_above_but_generalized_elliptical():
     deflections = nfw_kappa_s.deflections_yx_2d_from(grid=grid)
 
     assert (deflections_ludlow == deflections).all()
+
+
+def test__ludlow_concentration_from__same_as_colossus():
+    from colossus.cosmology import cosmology as col_cosmology
+    from colossus.halo.concentration import concentration as col_concentration
+
+    col_cosmo = col_cosmology.setCosmology("planck15")
+
+    for mass_at_200, redshift_object in [(1.0e9, 0.6), (3.0e11, 0.1), (1.0e14, 2.5)]:
+        concentration = col_concentration(
+            mass_at_200 * col_cosmo.h, "200c", redshift_object, model="ludlow16"
+        )
+
+        assert mcr_util.ludlow_concentration_from(
+            mass_at_200=mass_at_200, redshift_object=redshift_object
+        ) == pytest.approx(concentration, 1.0e-4)
+
+    assert mcr_util.ludlow_concentration_from(
+        mass_at_200=1.0e18, redshift_object=0.5
+    ) == pytest.approx(
+        col_concentration(1.0e18 * col_cosmo.h, "200c", 0.5, model="ludlow16"), 1.0e-8
+    )
+
+
+def test__cosmology_quantities_from__reused_for_same_redshifts():
+    cosmology = ag.cosmology.Planck15()
+
+    quantities = mcr_util.cosmology_quantities_from(
+        redshift_object=0.6, redshift_source=2.5, cosmology=cosmology
+    )
+
+    assert quantities[2] == pytest.approx(
+        cosmology.kpc_per_arcsec_from(redshift=0.6), 1.0e-8
+    )
+
+    assert (
+        mcr_util.cosmology_quantities_from(
+            redshift_object=0.6, redshift_source=2.5, cosmology=cosmology
+        )
+        is quantities
+    )
+    assert (
+        mcr_util.cosmology_quantities_from(
+            redshift_object=0.6, redshift_source=2.5, cosmology=ag.cosmology.Planck15()
+        )
+        is not quantities
+    )
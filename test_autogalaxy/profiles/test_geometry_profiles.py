@@ -243,3 +243,26 @@ def test__elliptical__transform_grids_with_mapped_centres():
     )
 
     assert (grid1 == grid2).all()
+
+
+def test__derived_property__stored_and_reset_when_parameters_change():
+    profile = geometry_profiles.EllProfile(ell_comps=(0.0, 0.333333))
+
+    assert profile.axis_ratio == pytest.approx(0.5, 1.0e-4)
+    assert profile._derived_dict["EllProfile.axis_ratio"] == profile.axis_ratio
+
+    profile.ell_comps = (0.0, 0.0)
+
+    assert profile._derived_dict is None
+    assert profile.axis_ratio == pytest.approx(1.0, 1.0e-4)
+
+
+def test__derived_property__not_in_dict_or_state():
+    profile = geometry_profiles.EllProfile(ell_comps=(0.0, 0.333333))
+    profile_no_derived = geometry_profiles.EllProfile(ell_comps=(0.0, 0.333333))
+
+    profile.axis_ratio
+
+    assert "_derived_dict" not in profile.__dict__
+    assert profile.__getstate__() == profile_no_derived.__getstate__()
+    assert profile == profile_no_derived
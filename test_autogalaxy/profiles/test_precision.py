@@ -0,0 +1,98 @@
+import threading
+
+import numpy as np
+import pytest
+
+import autogalaxy as ag
+
+from autogalaxy.profiles import precision
+
+grid = ag.Grid2DIrregular([[0.1, 0.2], [1.0, 1.0], [-2.0, 0.5], [3.0, -3.0]])
+
+
+def test__dtype__default_and_profile_precision_context():
+    assert precision.dtype() == np.float64
+
+    with ag.profile_precision("float32"):
+        assert precision.dtype() == np.float32
+
+        with ag.profile_precision("float64"):
+            assert precision.dtype() == np.float64
+
+        assert precision.dtype() == np.float32
+
+    assert precision.dtype() == np.float64
+
+    with pytest.raises(ValueError):
+        with ag.profile_precision("float16"):
+            pass
+
+
+def test__profile_precision_context__only_applies_to_its_thread():
+    entered = threading.Event()
+    checked = threading.Event()
+
+    dtype_list = []
+
+    def dtype_in_context():
+        with ag.profile_precision("float32"):
+            entered.set()
+            checked.wait(timeout=60.0)
+            dtype_list.append(precision.dtype())
+
+    thread = threading.Thread(target=dtype_in_context)
+    thread.start()
+
+    assert entered.wait(timeout=60.0)
+    assert precision.dtype() == np.float64
+
+    checked.set()
+    thread.join()
+
+    assert dtype_list == [np.float32]
+
+
+def test__array_from():
+    array = np.array([1.0, 2.0])
+
+    assert precision.array_from(array=array) is array
+
+    with ag.profile_precision("float32"):
+        assert precision.array_from(array=array).dtype == np.float32
+        assert precision.array_from(array=np.array([1, 2])).dtype == np.int64
+
+
+@pytest.mark.parametrize(
+    "light_profile",
+    [
+        ag.lp.Sersic(centre=(0.1, 0.2), ell_comps=(0.2, -0.1), intensity=2.0),
+        ag.lp.SersicSph(centre=(0.1, 0.2), intensity=2.0),
+        ag.lp.Gaussian(centre=(0.1, 0.2), ell_comps=(-0.3, 0.1), intensity=2.0),
+    ],
+)
+def test__image_2d_from__float32(light_profile):
+    image = light_profile.image_2d_from(grid=grid)
+
+    with ag.profile_precision("float32"):
+        image_float32 = light_profile.image_2d_from(grid=grid)
+
+    assert image_float32.dtype == np.float32
+    assert image_float32.array == pytest.approx(image.array, 1.0e-5)
+
+
+@pytest.mark.parametrize(
+    "mass_profile",
+    [
+        ag.mp.Isothermal(centre=(0.1, 0.2), ell_comps=(0.2, -0.1)),
+        ag.mp.NFW(centre=(0.1, 0.2), ell_comps=(0.1, 0.1)),
+        ag.mp.PowerLaw(centre=(0.1, 0.2), ell_comps=(0.2, -0.1), slope=2.2),
+    ],
+)
+def test__deflections_yx_2d_from__float32(mass_profile):
+    deflections = mass_profile.deflections_yx_2d_from(grid=grid)
+
+    with ag.profile_precision("float32"):
+        deflections_float32 = mass_profile.deflections_yx_2d_from(grid=grid)
+
+    assert deflections_float32.dtype == np.float32
+    assert deflections_float32.array == pytest.approx(deflections.array, 1.0e-4)
@@ -0,0 +1,48 @@
+import subprocess
+import sys
+from os import path
+
+import pytest
+
+import autogalaxy as ag
+
+
+def output_in_new_process_from(statement: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+        cwd=path.dirname(path.dirname(path.abspath(__file__))),
+    ).stdout
+
+
+def test__lazy_attributes__all_importable():
+    for name, (module_name, attribute_name) in ag._lazy_attribute_dict.items():
+        assert getattr(ag, name) is not None
+        assert name in dir(ag)
+
+    assert ag.FitImaging is ag.imaging.fit_imaging.FitImaging
+    assert ag.plot.FitImagingPlotter is not None
+
+
+def test__import_autogalaxy__heavy_submodules_not_imported():
+    output = output_in_new_process_from(
+        statement="import sys; import autogalaxy; "
+        "print(sorted(name for name in ['autogalaxy.plot', 'autogalaxy.aggregator', 'autogalaxy.gui.scribbler'] "
+        "if name in sys.modules))"
+    )
+
+    assert output.strip().split("\n")[-1] == "[]"
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import autogalaxy as ag; ag.AnalysisImaging",
+        "import autogalaxy as ag; ag.AnalysisQuantity",
+        "from autogalaxy.imaging.plot.fit_imaging_plotters import FitImagingPlotter",
+    ],
+)
+def test__lazy_attribute_or_plotter_imported_first__no_circular_import(statement):
+    output_in_new_process_from(statement=statement)
@@ -0,0 +1,57 @@
+import json
+from contextlib import nullcontext
+from os import path
+
+import autogalaxy as ag
+
+from autogalaxy.util import profiler as profiler_util
+
+
+def test__likelihood_profiler__call_tree_per_galaxy_and_profile(
+    masked_imaging_7x7, tmp_path
+):
+    galaxy_0 = ag.Galaxy(redshift=0.5, bulge=ag.lp.Sersic(intensity=1.0))
+    galaxy_1 = ag.Galaxy(
+        redshift=0.5,
+        bulge=ag.lp.Sersic(intensity=2.0),
+        disk=ag.lp.Exponential(intensity=1.0),
+    )
+
+    with profiler_util.LikelihoodProfiler() as profiler:
+        with profiler.block(name="figure_of_merit"):
+            fit = ag.FitImaging(
+                dataset=masked_imaging_7x7, galaxies=[galaxy_0, galaxy_1]
+            )
+            fit.figure_of_merit
+
+    figure_of_merit = profiler.root.children["figure_of_merit"]
+
+    galaxy_node_0 = figure_of_merit.child_from("galaxy_0")
+    galaxy_node_1 = figure_of_merit.child_from("galaxy_1")
+
+    assert "bulge (Sersic)" in galaxy_node_0.children
+    assert "bulge (Sersic)" in galaxy_node_1.children
+    assert "disk (Exponential)" in galaxy_node_1.children
+    assert "transform" in galaxy_node_1.children["disk (Exponential)"].children
+    assert "convolution" in figure_of_merit.children
+
+    assert profiler.root.time >= figure_of_merit.time > 0.0
+    assert figure_of_merit.memory > 0
+
+    profiler.output_to(file_path=str(tmp_path))
+
+    with open(path.join(tmp_path, "profile_tree.json")) as f:
+        assert json.load(f)["children"][0]["name"] == "figure_of_merit"
+
+    with open(path.join(tmp_path, "profile.folded")) as f:
+        folded_list = f.read().splitlines()
+
+    assert (
+        "log_likelihood_function;figure_of_merit;galaxy_1;disk (Exponential);transform"
+        in [line.rsplit(" ", 1)[0] for line in folded_list]
+    )
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in folded_list)
+
+
+def test__profile_block__does_nothing_without_profiler():
+    assert isinstance(profiler_util.profile_block("galaxy", 0), nullcontext)
@@ -0,0 +1,55 @@
+import numpy as np
+
+import autogalaxy as ag
+
+from autogalaxy.util import spatial_index
+
+
+def test__indexes_within_radius_from__same_as_brute_force():
+    grid = ag.Grid2D.uniform(shape_native=(40, 40), pixel_scales=0.1)
+
+    index = spatial_index.SpatialIndex(grid=grid.array)
+
+    for centre, radius in [((0.0, 0.0), 0.5), ((1.3, -0.8), 0.35), ((-1.9, 1.9), 1.0)]:
+        distances = np.sqrt(np.sum(np.square(grid.array - np.array(centre)), axis=1))
+
+        assert (
+            index.indexes_within_radius_from(
+                grid=grid.array, centre=centre, radius=radius
+            )
+            == np.nonzero(distances <= radius)[0]
+        ).all()
+
+    assert index.indexes_in_box_from(centre=(10.0, 10.0), half_width=1.0).shape == (0,)
+
+
+def test__spatial_index_from__reused_for_same_grid():
+    grid = ag.Grid2D.uniform(shape_native=(10, 10), pixel_scales=0.1)
+
+    index = spatial_index.spatial_index_from(grid=grid)
+
+    assert spatial_index.spatial_index_from(grid=grid) is index
+
+    index_over_sampled = spatial_index.spatial_index_from(grid=grid.over_sampled)
+
+    assert index_over_sampled is not index
+    assert (
+        spatial_index.spatial_index_from(grid=grid.over_sampled) is index_over_sampled
+    )
+
+
+def test__over_sampled_indexes_from():
+    grid = ag.Grid2D.uniform(
+        shape_native=(3, 3),
+        pixel_scales=1.0,
+        over_sample_size=np.array([1, 2, 1, 1, 3, 1, 1, 1, 1]),
+    )
+
+    index = spatial_index.spatial_index_from(grid=grid)
+
+    over_sampled_indexes, start = index.over_sampled_indexes_from(
+        indexes=np.array([1, 4])
+    )
+
+    assert (over_sampled_indexes == np.array([1, 2, 3, 4] + list(range(7, 16)))).all()
+    assert (start == np.array([0, 4])).all()